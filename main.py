@@ -1,16 +1,22 @@
 """
 SecurePass Manager - Moderner Passwort-Manager mit verschlüsselten Datenbanken
 Entry Point der Anwendung
+
+Beim Start wird nur importiert, was der Auswahl-Dialog braucht. Login-Dialog
+und Hauptfenster (mit allen Dialogen, Audit, Stärke-Bewertung usw.) werden
+erst geladen, wenn sie angezeigt werden (siehe tests/test_startup_imports.py).
+
+Mit --startup-timeline[=PFAD] oder SECUREPASS_STARTUP_TIMELINE=PFAD werden die
+Start-Phasen bis zum ersten Zeichnen des Hauptfensters als JSON geschrieben
+(Chrome-Trace bei Endung ".trace.json", siehe StartupTimeline).
 """
 import sys
 import logging
 from pathlib import Path
+from src.testing.performance import startup_timeline
 from PyQt6.QtWidgets import QApplication
-from src.core.database import DatabaseManager
 from src.core.settings import app_settings
 from src.gui.database_selector import DatabaseSelectorDialog
-from src.gui.login_dialog import LoginDialog
-from src.gui.main_window import MainWindow
 from src.gui.themes import theme
 
 
@@ -43,19 +49,25 @@ def setup_logging():
 
 def main():
     """Hauptfunktion - Startet die Anwendung"""
+    argv = startup_timeline.configure(sys.argv)
+    startup_timeline.mark("imports_done")
+
     # Logging initialisieren
     logger = setup_logging()
 
     # Erstelle QApplication
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
     app.setApplicationName("SecurePass Manager")
     app.setOrganizationName("SecurePass")
+    startup_timeline.mark("qapplication_created")
 
     # Wende Theme an
     theme.apply_theme(app)
+    startup_timeline.mark("theme_applied")
 
     # === SCHRITT 1: Datenbank auswählen ===
     selector_dialog = DatabaseSelectorDialog()
+    startup_timeline.mark_on_first_paint(selector_dialog, "selector_shown")
 
     if selector_dialog.exec() != DatabaseSelectorDialog.DialogCode.Accepted:
         # Benutzer hat abgebrochen
@@ -67,6 +79,7 @@ def main():
         sys.exit(0)
 
     # === SCHRITT 2: Login mit Master-Passwort ===
+    from src.gui.login_dialog import LoginDialog
     login_dialog = LoginDialog(database_path)
 
     if login_dialog.exec() != LoginDialog.DialogCode.Accepted:
@@ -78,15 +91,18 @@ def main():
     if not master_password:
         sys.exit(0)
 
-    # === SCHRITT 3: Öffne Datenbank ===
+    # === SCHRITT 3: Datenbank (bereits im Login-Worker geöffnet) ===
     try:
-        db_manager = DatabaseManager(database_path, master_password)
+        db_manager = login_dialog.get_database_manager()
 
         # Speichere als letzte verwendete Datenbank
         app_settings.set_last_database(database_path)
 
         # === SCHRITT 4: Zeige Hauptfenster ===
+        from src.gui.main_window import MainWindow
         main_window = MainWindow(db_manager)
+        startup_timeline.mark("main_window_constructed")
+        startup_timeline.mark_on_first_paint(main_window, "first_paint", finish=True)
         main_window.show()
 
         # Starte Event-Loop
@@ -1,23 +1,210 @@
 """
 Master-Passwort-Verwaltung mit Argon2id Hashing
+
+Die Argon2-Parameter werden einmal pro Rechner kalibriert: gewählt werden die
+stärksten Parameter, die (mit allen Kernen) in die Ziel-Entsperrzeit passen.
+Das Ergebnis wird in den Anwendungs-Einstellungen gespeichert. Die Parameter
+stehen im Hash selbst bzw. im Header der Tresor-Datei; Hashes, die die
+Kalibrierung als Ganzes übertrifft, werden nach erfolgreichem Login
+transparent erneuert. Kalibriert wird beim Erstellen eines Tresors oder im
+Leerlauf nach dem Entsperren, nie während des Entsperrens selbst.
 """
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+import os
+import time
+import logging
+from typing import NamedTuple, Optional
+from argon2 import PasswordHasher, Type, extract_parameters
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
+from argon2.low_level import hash_secret_raw
+
+logger = logging.getLogger(__name__)
+
+# Ziel-Dauer einer Entsperrung; sie umfasst zwei Argon2-Durchläufe
+# (Hash-Prüfung und Key-Encryption-Key der Tresor-Datei)
+TARGET_UNLOCK_MS = 500
+KDF_RUNS_PER_UNLOCK = 2
+
+MAX_MEMORY_COST = 1024 * 1024  # 1 GB (in KiB)
+MAX_PARALLELISM = 16
+
+# Einstellungs-Schlüssel des Kalibrierungsergebnisses
+CALIBRATION_SETTINGS_KEY = "argon2_calibration"
+
+
+class Argon2Parameters(NamedTuple):
+    """Argon2id-Kostenparameter"""
+    time_cost: int  # Anzahl der Iterationen
+    memory_cost: int  # Speicher in KiB
+    parallelism: int  # Anzahl paralleler Lanes
+
+    def is_at_least(self, other: "Argon2Parameters") -> bool:
+        """Prüft ob kein Parameter unter dem Wert von `other` liegt"""
+        return all(own >= theirs for own, theirs in zip(self, other))
+
+    def is_stronger_than(self, other: "Argon2Parameters") -> bool:
+        """
+        Prüft ob die Parameter `other` als Ganzes übertreffen
+
+        Kein Wert darf kleiner und mindestens einer muss größer sein. Parameter
+        zweier Rechner, die sich in verschiedene Richtungen unterscheiden
+        (z.B. mehr Speicher, aber weniger Lanes), gelten nicht als stärker -
+        so wird nie herabgestuft und nicht zwischen Rechnern hin- und hergewechselt.
+        """
+        return self != other and self.is_at_least(other)
+
+
+# Untergrenze (bisherige feste Parameter), wird nie unterschritten
+DEFAULT_PARAMETERS = Argon2Parameters(time_cost=2, memory_cost=65536, parallelism=4)
+
+
+def _measure(parameters: Argon2Parameters) -> float:
+    """Misst die Dauer eines Argon2id-Durchlaufs in Millisekunden"""
+    start = time.perf_counter()
+    hash_secret_raw(
+        secret=b"securepass-calibration",
+        salt=os.urandom(16),
+        time_cost=parameters.time_cost,
+        memory_cost=parameters.memory_cost,
+        parallelism=parameters.parallelism,
+        hash_len=32,
+        type=Type.ID,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def calibrate_parameters(target_ms: float = TARGET_UNLOCK_MS / KDF_RUNS_PER_UNLOCK,
+                         max_memory_cost: int = MAX_MEMORY_COST) -> Argon2Parameters:
+    """
+    Ermittelt die stärksten Argon2id-Parameter für eine Ziel-Dauer
+
+    Nutzt alle verfügbaren Kerne als Lanes, verdoppelt zuerst den Speicher
+    (bis max_memory_cost) und erhöht danach die Iterationen, solange ein
+    Durchlauf in target_ms passt. Die Untergrenze DEFAULT_PARAMETERS wird
+    auch auf langsamen Rechnern nicht unterschritten.
+
+    Args:
+        target_ms: Ziel-Dauer eines Durchlaufs in Millisekunden
+        max_memory_cost: Obergrenze für den Speicher in KiB
+
+    Returns:
+        Kalibrierte Parameter
+    """
+    parallelism = min(max(os.cpu_count() or 1, DEFAULT_PARAMETERS.parallelism), MAX_PARALLELISM)
+    parameters = DEFAULT_PARAMETERS._replace(parallelism=parallelism)
+    elapsed = _measure(parameters)
+
+    # Speicher verdoppeln, solange der nächste Schritt (≈ doppelte Zeit) passt
+    while elapsed * 2 <= target_ms and parameters.memory_cost * 2 <= max_memory_cost:
+        parameters = parameters._replace(memory_cost=parameters.memory_cost * 2)
+        elapsed = _measure(parameters)
+
+    # Restliches Budget in Iterationen (Zeit wächst linear mit time_cost)
+    if elapsed < target_ms:
+        time_cost = int(parameters.time_cost * target_ms / max(elapsed, 1e-3))
+        parameters = parameters._replace(time_cost=max(time_cost, parameters.time_cost))
+
+    logger.info(f"Argon2 kalibriert: {parameters} ({elapsed:.0f} ms vor Iterations-Anpassung)")
+    return parameters
 
 
 class MasterPasswordManager:
     """Verwaltet das Master-Passwort mit Argon2id Hashing"""
 
-    def __init__(self):
-        # Argon2id PasswordHasher mit sicheren Standard-Parametern
+    def __init__(self, parameters: Argon2Parameters = DEFAULT_PARAMETERS):
+        self.set_parameters(parameters)
+
+    def set_parameters(self, parameters: Argon2Parameters):
+        """
+        Setzt die Parameter für neue Hashes
+
+        Args:
+            parameters: Argon2id-Parameter
+        """
+        self.parameters = parameters
+        # Argon2id PasswordHasher
         self.ph = PasswordHasher(
-            time_cost=2,  # Anzahl der Iterationen
-            memory_cost=65536,  # 64 MB Speicher
-            parallelism=4,  # 4 parallele Threads
+            time_cost=parameters.time_cost,
+            memory_cost=parameters.memory_cost,
+            parallelism=parameters.parallelism,
             hash_len=32,  # 32 Bytes Hash-Länge
             salt_len=16,  # 16 Bytes Salt-Länge
         )
 
+    def load_calibration(self, settings=None, calibrate: bool = True) -> Optional[Argon2Parameters]:
+        """
+        Lädt die kalibrierten Parameter dieses Rechners
+
+        Die Kalibrierung wird wiederholt, wenn sich Kernanzahl oder Ziel-Dauer
+        geändert haben. Mit calibrate=False (beim Entsperren) wird nur eine
+        gespeicherte Kalibrierung verwendet; fehlt sie, bleiben die bisherigen
+        Parameter gesetzt.
+
+        Args:
+            settings: AppSettings-Instanz (Standard: globale Einstellungen)
+            calibrate: Fehlende Kalibrierung sofort messen
+
+        Returns:
+            Kalibrierte Parameter (auch für neue Hashes gesetzt) oder None,
+            wenn keine Kalibrierung vorliegt und calibrate=False ist
+        """
+        parameters = self.stored_calibration(settings)
+        if parameters is None:
+            if not calibrate:
+                return None
+            return self.save_calibration(calibrate_parameters(), settings)
+
+        self.set_parameters(parameters)
+        return parameters
+
+    @staticmethod
+    def stored_calibration(settings=None) -> Optional[Argon2Parameters]:
+        """
+        Gibt die gespeicherte Kalibrierung zurück, falls sie für diesen Rechner gilt
+
+        Args:
+            settings: AppSettings-Instanz (Standard: globale Einstellungen)
+
+        Returns:
+            Parameter oder None (fehlt, anderer Rechner oder unter der Untergrenze)
+        """
+        if settings is None:
+            from ..core.settings import app_settings
+            settings = app_settings
+
+        stored = settings.get(CALIBRATION_SETTINGS_KEY) or {}
+        if stored.get("cpu_count") != os.cpu_count() or stored.get("target_ms") != TARGET_UNLOCK_MS:
+            return None
+        try:
+            parameters = Argon2Parameters(
+                int(stored["time_cost"]), int(stored["memory_cost"]), int(stored["parallelism"])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        return parameters if parameters.is_at_least(DEFAULT_PARAMETERS) else None
+
+    def save_calibration(self, parameters: Argon2Parameters, settings=None) -> Argon2Parameters:
+        """
+        Speichert ein Kalibrierungsergebnis und setzt es für neue Hashes
+
+        Args:
+            parameters: Ergebnis von calibrate_parameters()
+            settings: AppSettings-Instanz (Standard: globale Einstellungen)
+
+        Returns:
+            Die gespeicherten Parameter
+        """
+        if settings is None:
+            from ..core.settings import app_settings
+            settings = app_settings
+
+        settings.set(CALIBRATION_SETTINGS_KEY, {
+            **parameters._asdict(),
+            "cpu_count": os.cpu_count(),
+            "target_ms": TARGET_UNLOCK_MS,
+        })
+        self.set_parameters(parameters)
+        return parameters
+
     def hash_password(self, password: str) -> str:
         """
         Hasht ein Passwort mit Argon2id
@@ -59,6 +246,45 @@ class MasterPasswordManager:
         """
         return self.ph.check_needs_rehash(hash_value)
 
+    def needs_upgrade(self, hash_value: str) -> bool:
+        """
+        Prüft, ob die aktuellen Parameter den Hash als Ganzes übertreffen
+
+        Anders als check_needs_rehash() wird nie herabgestuft: Hashes von einem
+        schnelleren Rechner oder mit in einzelnen Werten höheren Parametern
+        bleiben erhalten (siehe Argon2Parameters.is_stronger_than).
+
+        Args:
+            hash_value: Der gespeicherte Argon2-Hash
+
+        Returns:
+            True wenn der Hash mit den aktuellen Parametern neu erstellt werden sollte
+        """
+        try:
+            stored = extract_parameters(hash_value)
+        except InvalidHashError:
+            return True
+        if stored.type != Type.ID:
+            return True
+        return self.parameters.is_stronger_than(
+            Argon2Parameters(stored.time_cost, stored.memory_cost, stored.parallelism)
+        )
+
+    def upgrade_hash(self, password: str, hash_value: str) -> Optional[str]:
+        """
+        Erstellt nach erfolgreicher Prüfung einen stärkeren Hash, falls nötig
+
+        Args:
+            password: Das bereits verifizierte Passwort
+            hash_value: Der gespeicherte Argon2-Hash
+
+        Returns:
+            Neuer Hash oder None, wenn der gespeicherte Hash ausreicht
+        """
+        if not self.needs_upgrade(hash_value):
+            return None
+        return self.hash_password(password)
+
 
 # Globale Instanz
 master_password_manager = MasterPasswordManager()
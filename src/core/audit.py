@@ -0,0 +1,283 @@
+"""
+Passwort-Audit für den gesamten Tresor
+
+Entschlüsselt die Einträge in Batches auf einem Prozess-Pool (alle Kerne, da
+Entschlüsselung und Stärke-Bewertung CPU-gebunden sind), bewertet die Stärke,
+findet wiederverwendete Passwörter, markiert alte Passwörter und prüft - falls
+ein lokaler Corpus konfiguriert ist - auf bekannte Datenlecks.
+
+Ergebnisse werden pro Eintrag anhand von updated_at gecached: ein erneuter
+Lauf entschlüsselt nur neue oder geänderte Einträge.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .encryption import EncryptionManager, encryption_manager
+from ..password.strength import password_strength_checker, WEAK_SCORE_THRESHOLD
+from ..password.breach import BreachCorpus, breach_checker
+
+logger = logging.getLogger(__name__)
+
+# (ID, updated_at, verschlüsseltes Passwort) - siehe DatabaseManager.get_entries_for_audit
+AuditRow = Tuple[int, int, bytes]
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class AuditResult(NamedTuple):
+    """Ergebnis für einen einzelnen Eintrag"""
+    entry_id: int
+    updated_at: int
+    strength_score: Optional[int]  # None = nicht entschlüsselbar
+    fingerprint: Optional[str]
+    breach_count: int = 0
+
+
+class AuditReport(NamedTuple):
+    """Zusammenfassung eines Audit-Laufs"""
+    total: int
+    audited: int  # in diesem Lauf entschlüsselt (Rest aus dem Cache)
+    weak_ids: List[int]
+    reused_groups: List[List[int]]
+    old_ids: List[int]
+    failed_ids: List[int]
+    breached_ids: List[int]
+    duration: float
+    cancelled: bool
+
+
+# Zustand in Worker-Prozessen (gesetzt durch _init_worker)
+_worker_encryption: Optional[EncryptionManager] = None
+_worker_corpus: Optional[BreachCorpus] = None
+
+
+def _init_worker(session_key: bytes, corpus_path: Optional[str] = None):
+    """Initialisiert einen Worker-Prozess mit Session-Key und Datenleck-Corpus"""
+    global _worker_encryption, _worker_corpus
+    _worker_encryption = EncryptionManager()
+    _worker_encryption.set_session_key(session_key)
+    _worker_corpus = BreachCorpus(corpus_path) if corpus_path else None
+
+
+def _audit_batch(batch: Sequence[AuditRow],
+                 manager: Optional[EncryptionManager] = None,
+                 corpus: Optional[BreachCorpus] = None) -> List[AuditResult]:
+    """
+    Entschlüsselt und bewertet einen Batch von Einträgen
+
+    Args:
+        batch: Zeilen (ID, updated_at, Token)
+        manager: EncryptionManager; None = Worker-Prozess-Instanz
+        corpus: Datenleck-Corpus; None = Worker-Prozess-Instanz (falls vorhanden)
+
+    Returns:
+        Ein AuditResult pro Zeile
+    """
+    if manager is None:
+        manager, corpus = _worker_encryption, _worker_corpus
+    results = []
+
+    decrypted = []
+    for entry_id, updated_at, token in batch:
+        try:
+            decrypted.append((entry_id, updated_at, manager.decrypt(token)))
+        except Exception:
+            results.append(AuditResult(entry_id, updated_at, None, None))
+
+    estimates = password_strength_checker.estimate_many(password for _, _, password in decrypted)
+    for (entry_id, updated_at, password), estimate in zip(decrypted, estimates):
+        results.append(AuditResult(
+            entry_id,
+            updated_at,
+            estimate.percentage,
+            manager.fingerprint(password),
+            corpus.lookup(password) if corpus is not None else 0
+        ))
+
+    return results
+
+
+class PasswordAuditEngine:
+    """Parallele Sicherheits-Prüfung aller Passwörter mit Ergebnis-Cache"""
+
+    BATCH_SIZE = 256
+    # Unterhalb dieser Anzahl lohnt sich der Start von Worker-Prozessen nicht
+    PARALLEL_THRESHOLD = 1024
+
+    def __init__(self, max_age_days: int = 365, max_workers: Optional[int] = None):
+        """
+        Initialisiert die Audit-Engine
+
+        Args:
+            max_age_days: Passwörter ohne Änderung seit so vielen Tagen gelten als alt
+            max_workers: Anzahl Worker-Prozesse (None = alle Kerne)
+        """
+        self.max_age_days = max_age_days
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._cache: Dict[int, AuditResult] = {}
+        # Corpus, mit dem die gecachten Ergebnisse erstellt wurden
+        self._corpus_path: Optional[str] = None
+
+    def clear_cache(self):
+        """Verwirft alle gecachten Ergebnisse (z.B. beim Sperren)"""
+        self._cache.clear()
+
+    def run(self, rows: Sequence[AuditRow],
+            progress_callback: Optional[ProgressCallback] = None,
+            cancel_event: Optional[threading.Event] = None) -> AuditReport:
+        """
+        Führt das Audit aus (blockierend - aus einem Worker-Thread aufrufen)
+
+        Args:
+            rows: Alle Einträge als (ID, updated_at, Token)
+            progress_callback: Wird mit (erledigt, gesamt) aufgerufen
+            cancel_event: Abbruch-Signal
+
+        Returns:
+            AuditReport (bei Abbruch mit den bis dahin vorliegenden Ergebnissen)
+
+        Raises:
+            RuntimeError: Wenn der Tresor gesperrt ist
+        """
+        start_time = time.perf_counter()
+        session_key = encryption_manager.export_session_key()
+
+        # Neuer oder entfernter Corpus: Datenleck-Ergebnisse sind ungültig
+        corpus_path = breach_checker.corpus_path()
+        if corpus_path != self._corpus_path:
+            self._cache.clear()
+            self._corpus_path = corpus_path
+
+        # Gelöschte Einträge aus dem Cache entfernen
+        current_ids = {row[0] for row in rows}
+        for entry_id in [entry_id for entry_id in self._cache if entry_id not in current_ids]:
+            del self._cache[entry_id]
+
+        pending = [row for row in rows if self._is_stale(row)]
+        batches = [pending[i:i + self.BATCH_SIZE] for i in range(0, len(pending), self.BATCH_SIZE)]
+        progress = _Progress(len(pending), progress_callback)
+
+        cancelled = False
+        if len(pending) >= self.PARALLEL_THRESHOLD and self.max_workers > 1:
+            try:
+                cancelled = self._run_parallel(batches, session_key, corpus_path, progress, cancel_event)
+            except BrokenProcessPool as e:
+                logger.warning(f"Worker-Prozesse nicht verfügbar, Audit läuft seriell weiter: {e}")
+                batches = [batch for batch in batches if any(self._is_stale(row) for row in batch)]
+                cancelled = self._run_serial(batches, progress, cancel_event)
+        else:
+            cancelled = self._run_serial(batches, progress, cancel_event)
+
+        report = self._build_report(rows, progress.done, time.perf_counter() - start_time, cancelled)
+        logger.info(
+            f"Passwort-Audit: {report.total} Einträge, {report.audited} entschlüsselt, "
+            f"{len(report.weak_ids)} schwach, {len(report.reused_groups)} Reuse-Gruppen, "
+            f"{len(report.breached_ids)} in Datenlecks "
+            f"({report.duration:.2f}s)"
+        )
+        return report
+
+    def _is_stale(self, row: AuditRow) -> bool:
+        """Prüft ob ein Eintrag (neu) entschlüsselt werden muss"""
+        cached = self._cache.get(row[0])
+        return cached is None or cached.updated_at != row[1]
+
+    def _store(self, results: List[AuditResult]):
+        """Übernimmt Batch-Ergebnisse in den Cache"""
+        for result in results:
+            self._cache[result.entry_id] = result
+
+    def _run_serial(self, batches, progress, cancel_event) -> bool:
+        """Bewertet die Batches im aufrufenden Thread; gibt True bei Abbruch zurück"""
+        for batch in batches:
+            if cancel_event is not None and cancel_event.is_set():
+                return True
+            self._store(_audit_batch(batch, encryption_manager, breach_checker.get_corpus()))
+            progress.advance(len(batch))
+        return False
+
+    def _run_parallel(self, batches, session_key: bytes, corpus_path: Optional[str],
+                      progress, cancel_event) -> bool:
+        """Verteilt die Batches auf Worker-Prozesse; gibt True bei Abbruch zurück"""
+        # "spawn" statt fork: ein geforkter Qt-Prozess ist nicht sicher
+        context = multiprocessing.get_context("spawn")
+        workers = min(self.max_workers, len(batches))
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(session_key, corpus_path)) as executor:
+            futures = [executor.submit(_audit_batch, batch) for batch in batches]
+
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    return True
+
+                results = future.result()
+                self._store(results)
+                progress.advance(len(results))
+
+        return False
+
+    def _build_report(self, rows: Sequence[AuditRow], audited: int,
+                      duration: float, cancelled: bool) -> AuditReport:
+        """Fasst die gecachten Ergebnisse aller aktuellen Einträge zusammen"""
+        old_cutoff = int(time.time()) - self.max_age_days * 86400
+        weak_ids, old_ids, failed_ids, breached_ids = [], [], [], []
+        by_fingerprint: Dict[str, List[int]] = {}
+
+        for entry_id, updated_at, _token in rows:
+            if updated_at is not None and updated_at < old_cutoff:
+                old_ids.append(entry_id)
+
+            result = self._cache.get(entry_id)
+            if result is None or result.updated_at != updated_at:
+                continue  # Abgebrochen bevor der Eintrag geprüft wurde
+            if result.strength_score is None:
+                failed_ids.append(entry_id)
+                continue
+            if result.strength_score < WEAK_SCORE_THRESHOLD:
+                weak_ids.append(entry_id)
+            if result.breach_count:
+                breached_ids.append(entry_id)
+            by_fingerprint.setdefault(result.fingerprint, []).append(entry_id)
+
+        reused_groups = sorted(
+            (ids for ids in by_fingerprint.values() if len(ids) > 1),
+            key=len, reverse=True
+        )
+
+        return AuditReport(
+            total=len(rows),
+            audited=audited,
+            weak_ids=weak_ids,
+            reused_groups=reused_groups,
+            old_ids=old_ids,
+            failed_ids=failed_ids,
+            breached_ids=breached_ids,
+            duration=duration,
+            cancelled=cancelled
+        )
+
+
+class _Progress:
+    """Zählt erledigte Einträge und meldet den Fortschritt"""
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback]):
+        self.total = total
+        self.done = 0
+        self.callback = callback
+        self._report()
+
+    def advance(self, count: int):
+        self.done += count
+        self._report()
+
+    def _report(self):
+        if self.callback:
+            self.callback(self.done, self.total)
@@ -4,46 +4,79 @@ Datenbank-Manager für verschlüsselte Datenbank-Dateien
 Arbeitet mit DatabaseFile zusammen, um verschlüsselte .spdb Dateien zu verwalten.
 """
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from ..auth.master_password import master_password_manager
 from .models import Category, PasswordEntry
-from .database_file import DatabaseFile
+from .database_file import DatabaseFile, OperationCancelled, WrongPasswordError
+
+# Aktueller Zeitpunkt als Unix-Epoch (Format der Zeitstempel-Spalten)
+NOW_EPOCH_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+SECONDS_PER_DAY = 86400
+
+# Stufe nach dem Entschlüsseln: SQLite öffnen und Migrations ausführen
+STAGE_OPEN = "open"
+
+# Blockgröße für das schrittweise Laden der Einträge
+ENTRY_CHUNK_SIZE = 200
+
+# Themen für Änderungs-Benachrichtigungen
+CHANGE_ENTRIES = "entries"
+CHANGE_CATEGORIES = "categories"
 
 
 class DatabaseManager:
     """Verwaltet alle Datenbankoperationen mit verschlüsselten Dateien"""
 
-    def __init__(self, encrypted_db_path: str, master_password: str):
+    def __init__(self, encrypted_db_path: str, master_password: str,
+                 progress_callback: Optional[Callable[[str], None]] = None,
+                 db_file: Optional[DatabaseFile] = None):
         """
         Initialisiert die Datenbankverbindung
 
+        Die Verbindung darf in einem Worker-Thread geöffnet und danach an den
+        UI-Thread übergeben werden (nie gleichzeitig aus mehreren Threads nutzen).
+
         Args:
             encrypted_db_path: Pfad zur verschlüsselten .spdb Datei
             master_password: Master-Passwort zum Entschlüsseln
+            progress_callback: Wird vor jeder Stufe aufgerufen (STAGE_* aus
+                               database_file bzw. STAGE_OPEN)
+            db_file: Bereits vorbereitete DatabaseFile-Instanz für denselben Pfad
         """
         self.encrypted_db_path = encrypted_db_path
         self.master_password = master_password
-        self.db_file = DatabaseFile(encrypted_db_path, master_password)
+        self.db_file = db_file or DatabaseFile(encrypted_db_path, master_password)
         self.temp_db_path: Optional[str] = None
         self.conn: Optional[sqlite3.Connection] = None
+        self._change_listeners: List[Callable[[str], None]] = []
 
         # Öffne verschlüsselte Datenbank
-        self._open_encrypted_database()
+        self._open_encrypted_database(progress_callback)
 
-    def _open_encrypted_database(self):
+    def _open_encrypted_database(self, progress_callback: Optional[Callable[[str], None]] = None):
         """Öffnet und entschlüsselt die Datenbank"""
         try:
             # Entschlüssele Datenbank zu temporärer Datei
-            self.temp_db_path = self.db_file.open_database(self.master_password)
+            self.temp_db_path = self.db_file.open_database(self.master_password, progress_callback)
 
-            # Verbinde mit temporärer Datenbank
-            self.conn = sqlite3.connect(self.temp_db_path)
+            if progress_callback:
+                progress_callback(STAGE_OPEN)
+
+            # Verbinde mit temporärer Datenbank (Übergabe Worker -> UI-Thread erlaubt)
+            self.conn = sqlite3.connect(self.temp_db_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row
 
             # Führe Migrations für bestehende Datenbanken aus
             self._run_migrations()
 
+        except (OperationCancelled, WrongPasswordError):
+            self.close()
+            raise
         except ValueError as e:
             raise ValueError(f"Fehler beim Öffnen der Datenbank: {str(e)}")
         except Exception as e:
@@ -65,6 +98,119 @@ class DatabaseManager:
             # Speichere in verschlüsselte Datei
             self.save_changes()
 
+        # Migration 2: Zeitstempel als INTEGER-Epoch statt Text (2026-10-19)
+        cursor.execute("PRAGMA table_info(password_entries)")
+        column_types = {row[1]: row[2].upper() for row in cursor.fetchall()}
+
+        if column_types.get('created_at') != 'INTEGER':
+            self._migrate_entry_timestamps_to_epoch(cursor)
+            self.conn.commit()
+            self.save_changes()
+
+        # Migration 3: Auswertungs-Spalten für Stärke und Wiederverwendung (2026-10-19)
+        cursor.execute("PRAGMA table_info(password_entries)")
+        entry_columns = [row[1] for row in cursor.fetchall()]
+
+        if 'strength_score' not in entry_columns:
+            cursor.execute("ALTER TABLE password_entries ADD COLUMN strength_score INTEGER")
+            cursor.execute("ALTER TABLE password_entries ADD COLUMN reuse_fingerprint TEXT")
+            self.conn.commit()
+            self.save_changes()
+
+        # Migration 4: Metadaten-Tabelle (2026-10-19)
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'vault_meta'")
+        if cursor.fetchone() is None:
+            cursor.execute(DatabaseFile.VAULT_META_SCHEMA)
+            self.conn.commit()
+            self.save_changes()
+
+        # Migration 5: TOTP-Secret pro Eintrag (2026-10-19)
+        cursor.execute("PRAGMA table_info(password_entries)")
+        if 'encrypted_totp' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE password_entries ADD COLUMN encrypted_totp BLOB")
+            self.conn.commit()
+            self.save_changes()
+
+        # Migration 6: Vorheriges Passwort für Rückgängig nach Erneuerung (2026-10-19)
+        cursor.execute("PRAGMA table_info(password_entries)")
+        if 'previous_password' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE password_entries ADD COLUMN previous_password BLOB")
+            self.conn.commit()
+            self.save_changes()
+
+        # Indizes für Bereichsabfragen (idempotent)
+        for index_sql in DatabaseFile.PASSWORD_ENTRIES_INDEXES:
+            cursor.execute(index_sql)
+        self.conn.commit()
+
+    def _migrate_entry_timestamps_to_epoch(self, cursor: sqlite3.Cursor):
+        """
+        Baut password_entries mit INTEGER-Zeitstempeln neu auf
+
+        SQLite kann Spaltentypen nicht ändern, daher wird die Tabelle kopiert.
+        Die alten Werte sind CURRENT_TIMESTAMP-Texte in UTC.
+        """
+        cursor.execute(DatabaseFile.PASSWORD_ENTRIES_SCHEMA.format(table="password_entries_new"))
+        cursor.execute(f"""
+            INSERT INTO password_entries_new
+            (id, category_id, name, username, encrypted_password, encrypted_notes,
+             website_url, created_at, updated_at)
+            SELECT id, category_id, name, username, encrypted_password, encrypted_notes,
+                   website_url,
+                   COALESCE(CAST(strftime('%s', created_at) AS INTEGER), {NOW_EPOCH_SQL}),
+                   COALESCE(CAST(strftime('%s', updated_at) AS INTEGER),
+                            CAST(strftime('%s', created_at) AS INTEGER), {NOW_EPOCH_SQL})
+            FROM password_entries
+        """)
+        cursor.execute("DROP TABLE password_entries")
+        cursor.execute("ALTER TABLE password_entries_new RENAME TO password_entries")
+
+    @property
+    def data_key(self) -> Optional[bytes]:
+        """Datenschlüssel des Tresors (Session-Key für den EncryptionManager)"""
+        return self.db_file.data_key
+
+    def upgrade_kdf(self, kdf_params: dict) -> bool:
+        """
+        Verschlüsselt den Datenschlüssel mit stärkeren Argon2id-Parametern neu
+
+        Nur wenn kdf_params die Header-Parameter als Ganzes übertreffen.
+
+        Args:
+            kdf_params: Kalibrierte Parameter (time_cost, memory_cost, parallelism)
+
+        Returns:
+            True wenn der Header erneuert wurde
+        """
+        if not self.db_file.needs_rewrap(kdf_params):
+            return False
+        self.db_file.rewrap_data_key(
+            self.master_password, {name: kdf_params[name] for name in DatabaseFile.KDF_PARAMS}
+        )
+        return True
+
+    def change_master_password(self, old_password: str, new_password: str):
+        """
+        Ändert das Master-Passwort
+
+        Der Datenschlüssel wird mit dem neuen Passwort neu verschlüsselt und
+        der gespeicherte Passwort-Hash ersetzt, sonst schlägt die Prüfung beim
+        nächsten Entsperren fehl. Nicht gespeicherte Änderungen werden dabei
+        mit dem neuen Header geschrieben.
+
+        Args:
+            old_password: Aktuelles Master-Passwort
+            new_password: Neues Master-Passwort
+
+        Raises:
+            WrongPasswordError: Wenn altes Passwort falsch ist
+        """
+        # Hash vorab berechnen, damit nach dem Umschlüsseln nichts Teures mehr fehlschlägt
+        new_hash = master_password_manager.hash_password(new_password)
+        self.db_file.change_master_password(old_password, new_password)
+        self.master_password = new_password
+        self.save_master_password_hash(new_hash)
+
     def save_changes(self):
         """Speichert Änderungen zurück in die verschlüsselte Datei"""
         if self.conn:
@@ -85,6 +231,29 @@ class DatabaseManager:
         if self.db_file:
             self.db_file.close_database()
 
+    # ==================== CHANGE EVENTS ====================
+
+    def add_change_listener(self, callback: Callable[[str], None]):
+        """
+        Registriert einen Listener für Datenänderungen
+
+        Args:
+            callback: Wird nach jeder Änderung mit dem Thema aufgerufen
+                      (CHANGE_ENTRIES oder CHANGE_CATEGORIES)
+        """
+        if callback not in self._change_listeners:
+            self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback: Callable[[str], None]):
+        """Entfernt einen registrierten Listener"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _notify_change(self, topic: str):
+        """Benachrichtigt alle Listener über eine Änderung"""
+        for callback in list(self._change_listeners):
+            callback(topic)
+
     # ==================== USER MANAGEMENT ====================
 
     def has_master_password(self) -> bool:
@@ -105,14 +274,13 @@ class DatabaseManager:
         """Speichert den Master-Passwort-Hash"""
         cursor = self.conn.cursor()
 
-        # Lösche alte Hashes
-        cursor.execute("DELETE FROM users")
-
-        # Füge neuen Hash ein
-        cursor.execute(
-            "INSERT INTO users (password_hash) VALUES (?)",
-            (password_hash,)
-        )
+        # Vorhandenen Benutzer aktualisieren (TOTP-Secret bleibt erhalten)
+        cursor.execute("UPDATE users SET password_hash = ?", (password_hash,))
+        if cursor.rowcount == 0:
+            cursor.execute(
+                "INSERT INTO users (password_hash) VALUES (?)",
+                (password_hash,)
+            )
 
         self.conn.commit()
         # Speichere auch in verschlüsselte Datei
@@ -147,6 +315,25 @@ class DatabaseManager:
         secret = self.get_totp_secret()
         return secret is not None and len(secret) > 0
 
+    # ==================== VAULT META ====================
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Gibt einen Metadaten-Wert des Tresors zurück (None wenn nicht gesetzt)"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT value FROM vault_meta WHERE key = ?", (key,))
+        result = cursor.fetchone()
+        return result['value'] if result else None
+
+    def set_meta(self, key: str, value: str):
+        """Setzt einen Metadaten-Wert des Tresors"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "INSERT OR REPLACE INTO vault_meta (key, value) VALUES (?, ?)",
+            (key, value)
+        )
+        self.conn.commit()
+        self.save_changes()
+
     # ==================== CATEGORY MANAGEMENT ====================
 
     def get_all_categories(self) -> List[Category]:
@@ -200,6 +387,7 @@ class DatabaseManager:
         )
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_CATEGORIES)
         return cursor.lastrowid
 
     def update_category(self, category_id: int, name: str, color: str):
@@ -211,6 +399,7 @@ class DatabaseManager:
         )
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_CATEGORIES)
 
     def delete_category(self, category_id: int):
         """
@@ -222,6 +411,8 @@ class DatabaseManager:
         cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_CATEGORIES)
+        self._notify_change(CHANGE_ENTRIES)
 
     # ==================== PASSWORD ENTRY MANAGEMENT ====================
 
@@ -230,7 +421,7 @@ class DatabaseManager:
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT * FROM password_entries
-            ORDER BY updated_at DESC
+            ORDER BY updated_at DESC, id DESC
         """)
 
         entries = []
@@ -240,6 +431,63 @@ class DatabaseManager:
 
         return entries
 
+    def open_read_only_connection(self) -> sqlite3.Connection:
+        """
+        Öffnet eine zusätzliche Nur-Lese-Verbindung zur entschlüsselten Datenbank
+
+        Für Hintergrund-Threads, die lesen sollen, während der UI-Thread die
+        Hauptverbindung weiter benutzt.
+
+        Returns:
+            Neue Verbindung (row_factory = sqlite3.Row), muss vom Aufrufer geschlossen werden
+        """
+        if not self.temp_db_path:
+            raise ValueError("Datenbank ist nicht geöffnet")
+        conn = sqlite3.connect(f"{Path(self.temp_db_path).as_uri()}?mode=ro", uri=True,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def iter_password_entry_chunks(self, chunk_size: int = ENTRY_CHUNK_SIZE,
+                                   cancel_event: Optional[threading.Event] = None
+                                   ) -> Iterator[List[PasswordEntry]]:
+        """
+        Liest alle Einträge blockweise über eine eigene Nur-Lese-Verbindung
+
+        Reihenfolge wie get_all_password_entries(). Zuerst werden nur die IDs
+        in Anzeigereihenfolge gelesen (reiner Index-Scan), danach jeder Block
+        mit einer eigenen Abfrage über seine IDs. Zwischen den Blöcken wird so
+        keine Lesesperre gehalten und Schreibzugriffe über die Hauptverbindung
+        müssen nicht warten; danach gelöschte Einträge fehlen einfach.
+
+        Args:
+            chunk_size: Anzahl Einträge pro Block (höchstens 999, SQLite-Limit für Parameter)
+            cancel_event: Gesetztes Event beendet das Lesen vor dem nächsten Block
+
+        Yields:
+            Listen von PasswordEntry
+        """
+        conn = self.open_read_only_connection()
+        try:
+            ids = [row[0] for row in conn.execute(
+                "SELECT id FROM password_entries ORDER BY updated_at DESC, id DESC"
+            )]
+
+            for start in range(0, len(ids), chunk_size):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                chunk_ids = ids[start:start + chunk_size]
+                placeholders = ",".join("?" * len(chunk_ids))
+                rows = conn.execute(
+                    f"SELECT * FROM password_entries WHERE id IN ({placeholders})", chunk_ids
+                ).fetchall()
+
+                position = {entry_id: index for index, entry_id in enumerate(chunk_ids)}
+                rows.sort(key=lambda row: position[row['id']])
+                yield [self._row_to_password_entry(row) for row in rows]
+        finally:
+            conn.close()
+
     def get_password_entries_by_category(self, category_id: int) -> List[PasswordEntry]:
         """Gibt alle Einträge einer Kategorie zurück"""
         cursor = self.conn.cursor()
@@ -282,6 +530,144 @@ class DatabaseManager:
 
         return entries
 
+    def get_recent_password_entries(self, limit: int = 5) -> List[PasswordEntry]:
+        """
+        Gibt die zuletzt erstellten Einträge zurück (Index auf created_at)
+
+        Args:
+            limit: Maximale Anzahl
+
+        Returns:
+            Einträge, neueste zuerst
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM password_entries
+            ORDER BY created_at DESC
+            LIMIT ?
+        """, (limit,))
+
+        return [self._row_to_password_entry(row) for row in cursor.fetchall()]
+
+    def count_password_entries_created_since(self, days: int) -> int:
+        """Zählt Einträge, die in den letzten N Tagen erstellt wurden"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM password_entries WHERE created_at >= ?",
+            (self._cutoff_epoch(days),)
+        )
+        return cursor.fetchone()[0]
+
+    def get_password_entries_changed_since(self, days: int) -> List[PasswordEntry]:
+        """
+        Gibt alle Einträge zurück, die in den letzten N Tagen geändert wurden
+
+        Args:
+            days: Zeitraum in Tagen
+
+        Returns:
+            Einträge, zuletzt geänderte zuerst
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM password_entries
+            WHERE updated_at >= ?
+            ORDER BY updated_at DESC
+        """, (self._cutoff_epoch(days),))
+
+        return [self._row_to_password_entry(row) for row in cursor.fetchall()]
+
+    def get_oldest_password_entries(self, limit: int = 10) -> List[PasswordEntry]:
+        """
+        Gibt die Einträge zurück, deren Passwort am längsten nicht geändert wurde
+
+        Args:
+            limit: Maximale Anzahl
+
+        Returns:
+            Einträge, älteste zuerst
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM password_entries
+            ORDER BY updated_at ASC
+            LIMIT ?
+        """, (limit,))
+
+        return [self._row_to_password_entry(row) for row in cursor.fetchall()]
+
+    def count_password_entries(self) -> int:
+        """Zählt alle Passwort-Einträge"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM password_entries")
+        return cursor.fetchone()[0]
+
+    def count_categories(self) -> int:
+        """Zählt alle Kategorien"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM categories")
+        return cursor.fetchone()[0]
+
+    def count_password_entries_per_category(self) -> List[Tuple[Category, int]]:
+        """
+        Zählt die Einträge pro Kategorie mit einer Aggregat-Abfrage
+
+        Returns:
+            Liste von (Kategorie, Anzahl), nach Kategorie-Name sortiert
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT c.id, c.name, c.color, COUNT(e.id) AS entry_count
+            FROM categories c
+            LEFT JOIN password_entries e ON e.category_id = c.id
+            GROUP BY c.id
+            ORDER BY c.name
+        """)
+
+        return [
+            (Category(id=row['id'], name=row['name'], color=row['color'] or '#808080'),
+             row['entry_count'])
+            for row in cursor.fetchall()
+        ]
+
+    def get_encrypted_passwords(self) -> List[Tuple[int, bytes]]:
+        """Gibt (ID, verschlüsseltes Passwort) aller Einträge zurück, ohne Modelle zu bauen"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, encrypted_password FROM password_entries")
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def count_password_entries_by_age(self, boundaries_days: Sequence[int]) -> List[int]:
+        """
+        Zählt Einträge nach Alter der letzten Änderung
+
+        Args:
+            boundaries_days: Aufsteigende Grenzen in Tagen, z.B. (30, 180, 365)
+
+        Returns:
+            Anzahl pro Bucket: [< 30 Tage, 30-180, 180-365, >= 365]
+        """
+        cutoffs = [self._cutoff_epoch(days) for days in boundaries_days]
+        if not cutoffs:
+            return [self.count_password_entries()]
+
+        # Bucket i: cutoffs[i] <= updated_at < cutoffs[i-1]
+        cases = ["SUM(CASE WHEN updated_at >= ? THEN 1 ELSE 0 END)"]
+        params: List[int] = [cutoffs[0]]
+        for newer, older in zip(cutoffs, cutoffs[1:]):
+            cases.append("SUM(CASE WHEN updated_at >= ? AND updated_at < ? THEN 1 ELSE 0 END)")
+            params.extend([older, newer])
+        cases.append("SUM(CASE WHEN updated_at < ? THEN 1 ELSE 0 END)")
+        params.append(cutoffs[-1])
+
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {', '.join(cases)} FROM password_entries", params)
+        return [count or 0 for count in cursor.fetchone()]
+
+    @staticmethod
+    def _cutoff_epoch(days: int) -> int:
+        """Epoch-Sekunden für 'vor N Tagen'"""
+        return int(time.time()) - days * SECONDS_PER_DAY
+
     def get_password_entry_by_id(self, entry_id: int) -> Optional[PasswordEntry]:
         """Gibt einen Passwort-Eintrag anhand der ID zurück"""
         cursor = self.conn.cursor()
@@ -306,30 +692,38 @@ class DatabaseManager:
 
         cursor.execute("""
             INSERT INTO password_entries
-            (category_id, name, username, encrypted_password, encrypted_notes, website_url)
-            VALUES (?, ?, ?, ?, ?, ?)
+            (category_id, name, username, encrypted_password, encrypted_notes, website_url,
+             strength_score, reuse_fingerprint, encrypted_totp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             entry.category_id,
             entry.name,
             entry.username,
             entry.encrypted_password,
             entry.encrypted_notes,
-            entry.website_url
+            entry.website_url,
+            entry.strength_score,
+            entry.reuse_fingerprint,
+            entry.encrypted_totp
         ))
 
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
         return cursor.lastrowid
 
     def update_password_entry(self, entry: PasswordEntry):
         """Aktualisiert einen bestehenden Passwort-Eintrag"""
         cursor = self.conn.cursor()
 
-        cursor.execute("""
+        # Nach einer manuellen Änderung ist ein gesichertes Passwort veraltet
+        cursor.execute(f"""
             UPDATE password_entries
             SET category_id = ?, name = ?, username = ?,
                 encrypted_password = ?, encrypted_notes = ?, website_url = ?,
-                updated_at = CURRENT_TIMESTAMP
+                strength_score = ?, reuse_fingerprint = ?, encrypted_totp = ?,
+                previous_password = NULL,
+                updated_at = {NOW_EPOCH_SQL}
             WHERE id = ?
         """, (
             entry.category_id,
@@ -338,11 +732,96 @@ class DatabaseManager:
             entry.encrypted_password,
             entry.encrypted_notes,
             entry.website_url,
+            entry.strength_score,
+            entry.reuse_fingerprint,
+            entry.encrypted_totp,
             entry.id
         ))
 
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
+
+    def update_passwords(self, updates: Sequence[Tuple[int, bytes, int, str]]):
+        """
+        Ersetzt die Passwörter mehrerer Einträge in einer Transaktion
+
+        Das bisherige Passwort bleibt in previous_password erhalten, bis es mit
+        restore_previous_passwords() zurückgeholt oder mit
+        clear_previous_passwords() verworfen wird. Die Datei wird nur einmal
+        neu verschlüsselt, unabhängig von der Anzahl.
+
+        Args:
+            updates: Liste von (ID, verschlüsseltes Passwort, strength_score, reuse_fingerprint)
+        """
+        if not updates:
+            return
+
+        cursor = self.conn.cursor()
+        # Rechte Seiten sehen die alten Werte - encrypted_password wird vorher gesichert
+        cursor.executemany(f"""
+            UPDATE password_entries
+            SET previous_password = encrypted_password,
+                encrypted_password = ?, strength_score = ?, reuse_fingerprint = ?,
+                updated_at = {NOW_EPOCH_SQL}
+            WHERE id = ?
+        """, [(token, score, fingerprint, entry_id) for entry_id, token, score, fingerprint in updates])
+
+        self.conn.commit()
+        self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
+
+    def restore_previous_passwords(self, entry_ids: Sequence[int]) -> int:
+        """
+        Stellt das vor der letzten Erneuerung gespeicherte Passwort wieder her
+
+        Score und Fingerprint werden geleert und vom Backfill neu berechnet.
+        Einträge ohne gesichertes Passwort bleiben unverändert.
+
+        Args:
+            entry_ids: IDs der Einträge
+
+        Returns:
+            Anzahl wiederhergestellter Einträge
+        """
+        if not entry_ids:
+            return 0
+
+        cursor = self.conn.cursor()
+        cursor.executemany(f"""
+            UPDATE password_entries
+            SET encrypted_password = previous_password, previous_password = NULL,
+                strength_score = NULL, reuse_fingerprint = NULL,
+                updated_at = {NOW_EPOCH_SQL}
+            WHERE id = ? AND previous_password IS NOT NULL
+        """, [(entry_id,) for entry_id in entry_ids])
+        restored = cursor.rowcount
+
+        self.conn.commit()
+        self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
+        return restored
+
+    def clear_previous_passwords(self, entry_ids: Sequence[int]):
+        """
+        Verwirft die vor der letzten Erneuerung gespeicherten Passwörter
+
+        Die Einträge selbst bleiben unverändert, updated_at wird nicht angepasst.
+
+        Args:
+            entry_ids: IDs der Einträge
+        """
+        if not entry_ids:
+            return
+
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            UPDATE password_entries SET previous_password = NULL
+            WHERE id = ? AND previous_password IS NOT NULL
+        """, [(entry_id,) for entry_id in entry_ids])
+
+        self.conn.commit()
+        self.save_changes()
 
     def delete_password_entry(self, entry_id: int):
         """Löscht einen Passwort-Eintrag"""
@@ -350,6 +829,7 @@ class DatabaseManager:
         cursor.execute("DELETE FROM password_entries WHERE id = ?", (entry_id,))
         self.conn.commit()
         self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
 
     def _row_to_password_entry(self, row: sqlite3.Row) -> PasswordEntry:
         """Konvertiert eine Datenbank-Zeile zu einem PasswordEntry-Objekt"""
@@ -362,8 +842,94 @@ class DatabaseManager:
             encrypted_notes=row['encrypted_notes'],
             website_url=row['website_url'],
             created_at=row['created_at'],
-            updated_at=row['updated_at']
+            updated_at=row['updated_at'],
+            strength_score=row['strength_score'],
+            reuse_fingerprint=row['reuse_fingerprint'],
+            encrypted_totp=row['encrypted_totp']
+        )
+
+    # ==================== PASSWORD ANALYTICS ====================
+
+    def count_weak_password_entries(self, threshold: int) -> int:
+        """
+        Zählt schwache Passwörter über den Index auf strength_score
+
+        Args:
+            threshold: Scores unterhalb dieses Werts gelten als schwach
+
+        Returns:
+            Anzahl schwacher Einträge (Einträge ohne Score zählen nicht)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM password_entries WHERE strength_score < ?",
+            (threshold,)
         )
+        return cursor.fetchone()[0]
+
+    def get_reused_password_groups(self) -> List[Tuple[str, int]]:
+        """
+        Gruppiert Einträge mit gleichem Passwort über den Reuse-Fingerprint
+
+        Returns:
+            Liste von (Fingerprint, Anzahl) für alle Gruppen mit mehr als einem Eintrag
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT reuse_fingerprint, COUNT(*) AS entry_count
+            FROM password_entries
+            WHERE reuse_fingerprint IS NOT NULL
+            GROUP BY reuse_fingerprint
+            HAVING COUNT(*) > 1
+            ORDER BY entry_count DESC
+        """)
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def get_password_entries_by_fingerprint(self, fingerprint: str) -> List[PasswordEntry]:
+        """Gibt alle Einträge zurück, die dasselbe Passwort verwenden"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT * FROM password_entries
+            WHERE reuse_fingerprint = ?
+            ORDER BY name
+        """, (fingerprint,))
+        return [self._row_to_password_entry(row) for row in cursor.fetchall()]
+
+    def get_entries_for_audit(self) -> List[Tuple[int, int, bytes]]:
+        """Gibt (ID, updated_at, verschlüsseltes Passwort) aller Einträge zurück"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, updated_at, encrypted_password FROM password_entries")
+        return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
+    def get_entries_missing_analytics(self) -> List[Tuple[int, bytes]]:
+        """Gibt (ID, verschlüsseltes Passwort) aller Einträge ohne Score oder Fingerprint zurück"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT id, encrypted_password FROM password_entries
+            WHERE strength_score IS NULL OR reuse_fingerprint IS NULL
+        """)
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def update_password_analytics(self, analytics: Sequence[Tuple[int, int, str]]):
+        """
+        Speichert Score und Fingerprint für mehrere Einträge in einer Transaktion
+
+        updated_at bleibt unverändert, da sich das Passwort selbst nicht ändert.
+
+        Args:
+            analytics: Liste von (ID, strength_score, reuse_fingerprint)
+        """
+        if not analytics:
+            return
+
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "UPDATE password_entries SET strength_score = ?, reuse_fingerprint = ? WHERE id = ?",
+            [(score, fingerprint, entry_id) for entry_id, score, fingerprint in analytics]
+        )
+        self.conn.commit()
+        self.save_changes()
+        self._notify_change(CHANGE_ENTRIES)
 
     def __del__(self):
         """Destruktor - stellt sicher, dass die Datenbank geschlossen wird"""
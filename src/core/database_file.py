@@ -3,25 +3,116 @@ Verschlüsseltes Datenbank-Datei Format
 
 Erstellt und liest verschlüsselte .spdb (SecurePass Database) Dateien.
 Die gesamte SQLite-Datenbank wird verschlüsselt in einer einzigen Datei gespeichert.
+
+Format V2 (Envelope-Verschlüsselung):
+    SECUREPASS_DB_V2 | Header-Länge (4 Byte, big-endian) | Header (JSON) | Fernet-Token
+
+Die Datenbank und alle Feld-Tokens sind mit einem zufälligen Datenschlüssel
+verschlüsselt. Der Header enthält die KDF-Parameter und den Datenschlüssel,
+verschlüsselt mit dem aus dem Master-Passwort abgeleiteten Key-Encryption-Key
+(Argon2id). Eine Passwort-Änderung verschlüsselt daher nur die 32 Bytes des
+Datenschlüssels neu.
+
+Format V1 (SHA256 des Master-Passworts als Schlüssel) wird weiterhin gelesen
+und beim ersten Öffnen nach V2 migriert.
 """
 import os
+import json
+import struct
 import sqlite3
 import tempfile
 import logging
 from pathlib import Path
-from typing import Optional
-from cryptography.fernet import Fernet
+from typing import Callable, Optional, Tuple
+from cryptography.fernet import Fernet, InvalidToken
 import hashlib
 import base64
 
 logger = logging.getLogger(__name__)
 
+# Stufen beim Öffnen (für Fortschrittsanzeigen, siehe open_database)
+STAGE_READ = "read"
+STAGE_DERIVE = "derive"
+STAGE_DECRYPT = "decrypt"
+
+
+class OperationCancelled(Exception):
+    """Vorgang wurde über den Fortschritts-Callback abgebrochen"""
+
+
+class WrongPasswordError(ValueError):
+    """
+    Das Master-Passwort ist falsch
+
+    Unterklasse von ValueError für bestehende Aufrufer; beschädigte Dateien,
+    ungültige Header oder unbekannte Versionen melden weiterhin ValueError.
+    """
+
 
 class DatabaseFile:
     """Verwaltet verschlüsselte Datenbank-Dateien"""
 
     FILE_EXTENSION = ".spdb"
-    FILE_HEADER = b"SECUREPASS_DB_V1"
+    FILE_HEADER = b"SECUREPASS_DB_V2"
+    LEGACY_FILE_HEADER = b"SECUREPASS_DB_V1"
+
+    # Standard-Parameter für den Key-Encryption-Key (Argon2id). Sie werden im
+    # Header gespeichert; geöffnete Dateien behalten ihre Parameter, bis sie
+    # per rewrap_data_key() erhöht werden.
+    KDF_PARAMS = {
+        "time_cost": 2,
+        "memory_cost": 65536,  # 64 MB
+        "parallelism": 4,
+    }
+    KDF_SALT_LENGTH = 16
+    DATA_KEY_LENGTH = 32
+
+    # Spalten mit Feld-Tokens (werden bei der V1-Migration neu verschlüsselt)
+    TOKEN_COLUMNS = (
+        ("password_entries", ("encrypted_password", "encrypted_notes", "encrypted_totp",
+                              "previous_password")),
+        ("users", ("totp_secret",)),
+    )
+
+    # Passwort-Einträge: Zeitstempel als Unix-Epoch (INTEGER, UTC) für
+    # indizierte Bereichsabfragen. {table} erlaubt Tabellen-Rebuilds in Migrations.
+    # strength_score/reuse_fingerprint werden beim Speichern aus dem Klartext
+    # berechnet, damit Auswertungen ohne Entschlüsselung auskommen.
+    # previous_password hält das zuletzt ersetzte Passwort (Rückgängig bei Erneuerung).
+    PASSWORD_ENTRIES_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            username TEXT,
+            encrypted_password BLOB NOT NULL,
+            encrypted_notes BLOB,
+            website_url TEXT,
+            strength_score INTEGER,
+            reuse_fingerprint TEXT,
+            encrypted_totp BLOB,
+            previous_password BLOB,
+            created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+            updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+            FOREIGN KEY (category_id) REFERENCES categories (id)
+        )
+    """
+
+    PASSWORD_ENTRIES_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS idx_entries_created_at ON password_entries (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_entries_updated_at ON password_entries (updated_at)",
+        "CREATE INDEX IF NOT EXISTS idx_entries_category ON password_entries (category_id)",
+        "CREATE INDEX IF NOT EXISTS idx_entries_strength ON password_entries (strength_score)",
+        "CREATE INDEX IF NOT EXISTS idx_entries_fingerprint ON password_entries (reuse_fingerprint)",
+    )
+
+    # Schlüssel/Wert-Metadaten des Tresors (z.B. Version der Stärke-Bewertung)
+    VAULT_META_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vault_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """
 
     def __init__(self, file_path: str, master_password: Optional[str] = None):
         """
@@ -34,10 +125,17 @@ class DatabaseFile:
         self.file_path = Path(file_path)
         self.master_password = master_password
         self.temp_db_path: Optional[Path] = None
+        # Datenschlüssel (roh, 32 Byte) und Header der geöffneten Datei
+        self.data_key: Optional[bytes] = None
+        self._header: Optional[dict] = None
+        # Parameter für das nächste Verschlüsseln des Datenschlüssels
+        self.kdf_params = dict(self.KDF_PARAMS)
+        # Vorab gelesener Dateiinhalt (siehe preload)
+        self._preloaded: Optional[Tuple[Tuple[int, int], bytes, Optional[dict], bytes]] = None
 
     def _derive_key_from_password(self, password: str) -> bytes:
         """
-        Leitet einen Verschlüsselungsschlüssel aus dem Passwort ab
+        Leitet den Schlüssel einer V1-Datei aus dem Passwort ab (nur Legacy)
 
         Args:
             password: Das Master-Passwort
@@ -49,14 +147,187 @@ class DatabaseFile:
         hash_bytes = hashlib.sha256(password.encode()).digest()
         return base64.urlsafe_b64encode(hash_bytes)
 
-    def create_new(self, master_password: str):
+    @staticmethod
+    def _derive_kek(password: str, header: dict) -> bytes:
+        """
+        Leitet den Key-Encryption-Key mit den Parametern aus dem Header ab
+
+        Args:
+            password: Das Master-Passwort
+            header: Datei-Header mit Salt und Argon2id-Parametern
+
+        Returns:
+            Fernet-Key (Base64)
+        """
+        # Erst beim Entsperren laden, der Auswahl-Dialog braucht argon2 nicht
+        from argon2.low_level import hash_secret_raw, Type
+
+        raw = hash_secret_raw(
+            secret=password.encode(),
+            salt=base64.b64decode(header["salt"]),
+            time_cost=header["time_cost"],
+            memory_cost=header["memory_cost"],
+            parallelism=header["parallelism"],
+            hash_len=32,
+            type=Type.ID,
+        )
+        return base64.urlsafe_b64encode(raw)
+
+    def _wrap_data_key(self, data_key: bytes, password: str) -> dict:
+        """
+        Verschlüsselt den Datenschlüssel mit einem neuen Salt
+
+        Args:
+            data_key: Roher Datenschlüssel
+            password: Master-Passwort
+
+        Returns:
+            Header mit KDF-Parametern und verschlüsseltem Datenschlüssel
+        """
+        header = {
+            "kdf": "argon2id",
+            "salt": base64.b64encode(os.urandom(self.KDF_SALT_LENGTH)).decode("ascii"),
+            **self.kdf_params,
+        }
+        kek = Fernet(self._derive_kek(password, header))
+        header["wrapped_key"] = kek.encrypt(data_key).decode("ascii")
+        return header
+
+    def _unwrap_data_key(self, header: dict, password: str) -> bytes:
+        """
+        Entschlüsselt den Datenschlüssel aus dem Header
+
+        Raises:
+            WrongPasswordError: Wenn das Passwort falsch ist
+            ValueError: Wenn der Header beschädigt ist
+        """
+        try:
+            kek = Fernet(self._derive_kek(password, header))
+            data_key = kek.decrypt(header["wrapped_key"].encode("ascii"))
+        except InvalidToken:
+            # Authentifizierung des Schlüssels fehlgeschlagen
+            raise WrongPasswordError("Falsches Master-Passwort")
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Beschädigter Datei-Header")
+        if len(data_key) != self.DATA_KEY_LENGTH:
+            raise ValueError("Beschädigter Datei-Header")
+        return data_key
+
+    def _read_header(self, f) -> Tuple[bytes, Optional[dict]]:
+        """
+        Liest Format-Kennung und Header aus einer geöffneten Datei
+
+        Returns:
+            (Kennung, Header oder None bei V1)
+
+        Raises:
+            ValueError: Bei unbekanntem Format
+        """
+        magic = f.read(len(self.FILE_HEADER))
+        if magic == self.LEGACY_FILE_HEADER:
+            return magic, None
+        if magic != self.FILE_HEADER:
+            raise ValueError("Ungültiges Dateiformat")
+
+        length_bytes = f.read(4)
+        if len(length_bytes) != 4:
+            raise ValueError("Ungültiges Dateiformat")
+        (length,) = struct.unpack(">I", length_bytes)
+        try:
+            header = json.loads(f.read(length).decode("utf-8"))
+        except ValueError:
+            raise ValueError("Ungültiges Dateiformat")
+        return magic, header
+
+    def _read_file(self) -> Tuple[bytes, Optional[dict], bytes]:
+        """
+        Liest Format-Kennung, Header und verschlüsselte Daten
+
+        Returns:
+            (Kennung, Header oder None bei V1, Fernet-Token der Datenbank)
+
+        Raises:
+            ValueError: Bei unbekanntem Format
+        """
+        with open(self.file_path, 'rb') as f:
+            magic, header = self._read_header(f)
+            return magic, header, f.read()
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """Änderungszeit und Größe (erkennt Änderungen nach preload)"""
+        stat = self.file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def preload(self):
+        """
+        Liest die Datei vollständig in den Speicher und validiert den Header
+
+        Der Inhalt bleibt verschlüsselt. open_database() verwendet ihn, solange
+        sich die Datei seitdem nicht geändert hat.
+
+        Raises:
+            ValueError: Bei unbekanntem Format
+            OSError: Wenn die Datei nicht gelesen werden kann
+        """
+        signature = self._file_signature()
+        magic, header, payload = self._read_file()
+        self._preloaded = (signature, magic, header, payload)
+
+    def is_preloaded(self) -> bool:
+        """Prüft ob ein aktueller vorab gelesener Inhalt vorliegt"""
+        if self._preloaded is None:
+            return False
+        try:
+            return self._preloaded[0] == self._file_signature()
+        except OSError:
+            return False
+
+    def read_header(self) -> Optional[dict]:
+        """
+        Liest nur den Header (ohne die verschlüsselte Datenbank)
+
+        Returns:
+            Header oder None bei V1-Dateien
+
+        Raises:
+            ValueError: Bei unbekanntem Format
+        """
+        if self.is_preloaded():
+            return self._preloaded[2]
+        with open(self.file_path, 'rb') as f:
+            return self._read_header(f)[1]
+
+    def _write_file(self, header: dict, payload: bytes):
+        """
+        Schreibt Header und verschlüsselte Daten atomar (temporäre Datei + rename)
+
+        Args:
+            header: Datei-Header
+            payload: Fernet-Token der Datenbank
+        """
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self.FILE_HEADER)
+            f.write(struct.pack(">I", len(header_bytes)))
+            f.write(header_bytes)
+            f.write(payload)
+        os.replace(tmp_path, self.file_path)
+
+    def create_new(self, master_password: str, kdf_params: Optional[dict] = None):
         """
         Erstellt eine neue verschlüsselte Datenbank-Datei
 
         Args:
             master_password: Master-Passwort für die Verschlüsselung
+            kdf_params: Argon2id-Parameter (time_cost, memory_cost, parallelism),
+                        Standard: KDF_PARAMS
         """
         self.master_password = master_password
+        if kdf_params is not None:
+            self.kdf_params = dict(kdf_params)
 
         # Erstelle temporäre SQLite-Datenbank
         with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp_file:
@@ -72,8 +343,10 @@ class DatabaseFile:
             with open(temp_db, 'rb') as f:
                 db_data = f.read()
 
-            # Verschlüssele und speichere
-            self._encrypt_and_save(db_data, master_password)
+            # Neuer zufälliger Datenschlüssel, verschlüsselt mit dem Master-Passwort
+            self.data_key = os.urandom(self.DATA_KEY_LENGTH)
+            self._header = self._wrap_data_key(self.data_key, master_password)
+            self._encrypt_and_save(db_data)
 
         finally:
             # Lösche temporäre Datei
@@ -119,95 +392,149 @@ class DatabaseFile:
             )
 
         # Passwort-Einträge Tabelle
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS password_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                username TEXT,
-                encrypted_password BLOB NOT NULL,
-                encrypted_notes BLOB,
-                website_url TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories (id)
-            )
-        """)
+        cursor.execute(self.PASSWORD_ENTRIES_SCHEMA.format(table="password_entries"))
+        for index_sql in self.PASSWORD_ENTRIES_INDEXES:
+            cursor.execute(index_sql)
+
+        cursor.execute(self.VAULT_META_SCHEMA)
 
         conn.commit()
 
-    def _encrypt_and_save(self, data: bytes, password: str):
+    def _encrypt_and_save(self, data: bytes):
         """
-        Verschlüsselt Daten und speichert in Datei
+        Verschlüsselt Daten mit dem Datenschlüssel und speichert in Datei
 
         Args:
             data: Zu verschlüsselnde Daten
-            password: Master-Passwort
         """
-        # Verschlüssele Daten
-        key = self._derive_key_from_password(password)
-        fernet = Fernet(key)
-        encrypted_data = fernet.encrypt(data)
-
-        # Erstelle Verzeichnis falls nötig
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Schreibe Datei mit Header
-        with open(self.file_path, 'wb') as f:
-            f.write(self.FILE_HEADER)
-            f.write(encrypted_data)
+        fernet = Fernet(base64.urlsafe_b64encode(self.data_key))
+        self._write_file(self._header, fernet.encrypt(data))
 
-    def open_database(self, master_password: str) -> str:
+    def open_database(self, master_password: str,
+                      progress_callback: Optional[Callable[[str], None]] = None) -> str:
         """
         Öffnet und entschlüsselt die Datenbank-Datei
 
         Args:
             master_password: Master-Passwort zum Entschlüsseln
+            progress_callback: Wird vor jeder Stufe (STAGE_*) aufgerufen und darf
+                               OperationCancelled auslösen
 
         Returns:
             Pfad zur temporären entschlüsselten Datenbank
 
         Raises:
-            ValueError: Wenn Datei nicht existiert oder Passwort falsch
+            WrongPasswordError: Wenn das Passwort falsch ist
+            ValueError: Wenn die Datei nicht existiert oder beschädigt ist
             Exception: Bei anderen Fehlern
         """
         if not self.file_path.exists():
             raise ValueError(f"Datenbank-Datei nicht gefunden: {self.file_path}")
 
         self.master_password = master_password
+        report = progress_callback or (lambda stage: None)
 
         # Lese und entschlüssele Datei
         try:
-            with open(self.file_path, 'rb') as f:
-                # Prüfe Header
-                header = f.read(len(self.FILE_HEADER))
-                if header != self.FILE_HEADER:
-                    raise ValueError("Ungültiges Dateiformat")
-
-                # Lese verschlüsselte Daten
-                encrypted_data = f.read()
-
-            # Entschlüssele
-            key = self._derive_key_from_password(master_password)
-            fernet = Fernet(key)
-
+            report(STAGE_READ)
+            if self.is_preloaded():
+                _, magic, header, encrypted_data = self._preloaded
+                report(STAGE_DERIVE)
+                if header is None:
+                    legacy_key, data_key = self._derive_key_from_password(master_password), None
+                else:
+                    legacy_key, data_key = None, self._unwrap_data_key(header, master_password)
+            else:
+                magic, header, encrypted_data = self._read_file()
+
+                report(STAGE_DERIVE)
+                if header is None:
+                    # V1: Schlüssel direkt aus dem Passwort
+                    legacy_key, data_key = self._derive_key_from_password(master_password), None
+                else:
+                    legacy_key, data_key = None, self._unwrap_data_key(header, master_password)
+            self._preloaded = None
+
+            report(STAGE_DECRYPT)
+            fernet = Fernet(legacy_key or base64.urlsafe_b64encode(data_key))
             try:
                 decrypted_data = fernet.decrypt(encrypted_data)
-            except Exception:
-                raise ValueError("Falsches Master-Passwort oder beschädigte Datei")
+            except InvalidToken:
+                if legacy_key is not None:
+                    # V1 hat keinen Header - nur hier zeigt sich ein falsches Passwort
+                    raise WrongPasswordError("Falsches Master-Passwort")
+                raise ValueError("Beschädigte Datei")
 
             # Erstelle temporäre Datenbank-Datei
             with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp_file:
                 tmp_file.write(decrypted_data)
                 self.temp_db_path = Path(tmp_file.name)
 
+            if header is None:
+                self._migrate_legacy_file(legacy_key, master_password)
+            else:
+                self.data_key, self._header = data_key, header
+                self.kdf_params = self.kdf_parameters()
+                if header.pop("verifier", None) is not None:
+                    # Ältere Versionen legten den Passwort-Hash unverschlüsselt im Header ab
+                    self._write_file(header, encrypted_data)
+
             return str(self.temp_db_path)
 
-        except ValueError:
+        except (ValueError, OperationCancelled):
             raise
         except Exception as e:
             raise Exception(f"Fehler beim Öffnen der Datenbank: {str(e)}")
 
+    def _migrate_legacy_file(self, legacy_key: bytes, master_password: str):
+        """
+        Migriert eine geöffnete V1-Datei auf Envelope-Verschlüsselung
+
+        Erzeugt einen zufälligen Datenschlüssel, verschlüsselt alle Feld-Tokens
+        der temporären Datenbank neu und schreibt die Datei im V2-Format.
+        Fingerprints hängen vom Schlüssel ab und werden geleert, damit der
+        Backfill sie neu berechnet.
+
+        Args:
+            legacy_key: Fernet-Key der V1-Datei
+            master_password: Master-Passwort
+        """
+        legacy = Fernet(legacy_key)
+        data_key = os.urandom(self.DATA_KEY_LENGTH)
+        current = Fernet(base64.urlsafe_b64encode(data_key))
+
+        conn = sqlite3.connect(str(self.temp_db_path))
+        try:
+            for table, columns in self.TOKEN_COLUMNS:
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                present = [column for column in columns if column in existing]
+                if not present:
+                    continue
+
+                rows = conn.execute(f"SELECT rowid, {', '.join(present)} FROM {table}").fetchall()
+                updates = []
+                for row in rows:
+                    tokens = [
+                        current.encrypt(legacy.decrypt(bytes(token))) if token else token
+                        for token in row[1:]
+                    ]
+                    updates.append((*tokens, row[0]))
+
+                assignments = ", ".join(f"{column} = ?" for column in present)
+                conn.executemany(f"UPDATE {table} SET {assignments} WHERE rowid = ?", updates)
+
+            if "reuse_fingerprint" in {row[1] for row in conn.execute("PRAGMA table_info(password_entries)")}:
+                conn.execute("UPDATE password_entries SET reuse_fingerprint = NULL")
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.data_key = data_key
+        self._header = self._wrap_data_key(data_key, master_password)
+        with open(self.temp_db_path, 'rb') as f:
+            self._encrypt_and_save(f.read())
+        logger.info(f"Datenbank auf Envelope-Verschlüsselung migriert: {self.file_path}")
+
     def save_database(self, temp_db_path: str):
         """
         Speichert die temporäre Datenbank zurück in die verschlüsselte Datei
@@ -215,15 +542,15 @@ class DatabaseFile:
         Args:
             temp_db_path: Pfad zur temporären Datenbank
         """
-        if not self.master_password:
-            raise ValueError("Master-Passwort nicht gesetzt")
+        if self.data_key is None:
+            raise ValueError("Datenbank ist nicht geöffnet")
 
         # Lese temporäre Datenbank
         with open(temp_db_path, 'rb') as f:
             db_data = f.read()
 
-        # Verschlüssele und speichere
-        self._encrypt_and_save(db_data, self.master_password)
+        # Verschlüssele und speichere (Header mit verschlüsseltem Datenschlüssel bleibt gleich)
+        self._encrypt_and_save(db_data)
 
     def close_database(self):
         """Schließt und löscht die temporäre Datenbank"""
@@ -234,33 +561,87 @@ class DatabaseFile:
             except Exception as e:
                 logger.warning(f"Konnte temporäre Datei nicht löschen: {self.temp_db_path} - {e}")
 
-    def change_master_password(self, old_password: str, new_password: str):
+    def kdf_parameters(self) -> dict:
+        """
+        Gibt die Argon2id-Parameter des Headers der geöffneten Datei zurück
+
+        Returns:
+            Dictionary mit time_cost, memory_cost und parallelism
+        """
+        if self._header is None:
+            raise ValueError("Datenbank ist nicht geöffnet")
+        return {name: self._header[name] for name in self.KDF_PARAMS}
+
+    def needs_rewrap(self, kdf_params: dict) -> bool:
+        """
+        Prüft ob der Datenschlüssel mit schwächeren Parametern verschlüsselt ist
+
+        Verglichen werden die Parameter als Ganzes, damit nie herabgestuft wird.
+
+        Args:
+            kdf_params: Gewünschte Argon2id-Parameter
+
+        Returns:
+            True wenn kein Parameter im Header größer und mindestens einer kleiner ist
+        """
+        current = self.kdf_parameters()
+        return (
+            all(current[name] <= kdf_params[name] for name in self.KDF_PARAMS)
+            and any(current[name] < kdf_params[name] for name in self.KDF_PARAMS)
+        )
+
+    def rewrap_data_key(self, master_password: str, kdf_params: dict):
+        """
+        Verschlüsselt den Datenschlüssel mit neuen KDF-Parametern
+
+        Args:
+            master_password: Aktuelles Master-Passwort
+            kdf_params: Neue Argon2id-Parameter
+
+        Raises:
+            WrongPasswordError: Wenn das Passwort falsch ist
+        """
+        self.change_master_password(master_password, master_password, kdf_params)
+
+    def change_master_password(self, old_password: str, new_password: str,
+                               kdf_params: Optional[dict] = None):
         """
         Ändert das Master-Passwort
 
+        Nur der Datenschlüssel wird mit dem neuen Passwort neu verschlüsselt;
+        Datenbank und Feld-Tokens bleiben unverändert (O(1) statt O(Einträge)).
+
         Args:
             old_password: Aktuelles Master-Passwort
             new_password: Neues Master-Passwort
+            kdf_params: Neue Argon2id-Parameter (Standard: bisherige Parameter)
 
         Raises:
-            ValueError: Wenn altes Passwort falsch ist
+            WrongPasswordError: Wenn altes Passwort falsch ist
         """
-        # Öffne mit altem Passwort
-        temp_db = self.open_database(old_password)
-
-        try:
-            # Lese Daten
-            with open(temp_db, 'rb') as f:
-                db_data = f.read()
+        magic, header, encrypted_data = self._read_file()
 
-            # Verschlüssele mit neuem Passwort
-            self._encrypt_and_save(db_data, new_password)
-            self.master_password = new_password
-
-        finally:
-            # Lösche temporäre Datei
-            if os.path.exists(temp_db):
-                os.remove(temp_db)
+        if header is None:
+            # V1-Datei: erst migrieren, danach liegt ein Header vor. Die Migration
+            # nutzt eine eigene temporäre Datenbank, eine bereits geöffnete bleibt gültig.
+            live_temp_db = self.temp_db_path
+            temp_db = self.open_database(old_password)
+            try:
+                magic, header, encrypted_data = self._read_file()
+            finally:
+                if os.path.exists(temp_db):
+                    os.remove(temp_db)
+                self.temp_db_path = live_temp_db
+
+        data_key = self._unwrap_data_key(header, old_password)
+
+        self.kdf_params = dict(kdf_params) if kdf_params is not None else {
+            name: header[name] for name in self.KDF_PARAMS
+        }
+        self._header = self._wrap_data_key(data_key, new_password)
+        self._write_file(self._header, encrypted_data)
+        self.data_key = data_key
+        self.master_password = new_password
 
     @staticmethod
     def is_valid_database_file(file_path: str) -> bool:
@@ -276,7 +657,7 @@ class DatabaseFile:
         try:
             with open(file_path, 'rb') as f:
                 header = f.read(len(DatabaseFile.FILE_HEADER))
-                return header == DatabaseFile.FILE_HEADER
+                return header in (DatabaseFile.FILE_HEADER, DatabaseFile.LEGACY_FILE_HEADER)
         except Exception:
             return False
 
@@ -4,6 +4,7 @@ Verwendet AES-256 via cryptography.Fernet
 """
 import base64
 import hashlib
+import hmac
 from cryptography.fernet import Fernet
 from typing import Optional
 
@@ -14,20 +15,52 @@ class EncryptionManager:
     def __init__(self):
         self._fernet: Optional[Fernet] = None
         self._master_password: Optional[str] = None
+        self._session_key: Optional[bytes] = None
+        self._fingerprint_key: Optional[bytes] = None
 
     def set_master_password(self, master_password: str):
         """
         Setzt das Master-Passwort und leitet daraus den Encryption-Key ab
 
+        Entspricht dem Schlüssel von Tresoren im Format V1. Tresore im Format V2
+        verwenden einen zufälligen Datenschlüssel, der per set_session_key()
+        gesetzt wird (DatabaseManager.data_key).
+
         Args:
             master_password: Das Master-Passwort des Benutzers
         """
         self._master_password = master_password
         # Key-Derivation: Master-Passwort -> SHA256 -> Fernet Key
         key = hashlib.sha256(master_password.encode()).digest()
+        self.set_session_key(key)
+
+    def set_session_key(self, key: bytes):
+        """
+        Setzt den Session-Key direkt (Datenschlüssel des Tresors, Worker-Prozesse)
+
+        Args:
+            key: 32-Byte Session-Key
+        """
         # Fernet benötigt Base64-encoded Key
         fernet_key = base64.urlsafe_b64encode(key)
         self._fernet = Fernet(fernet_key)
+        self._session_key = key
+        # Eigener Unterschlüssel für Fingerprints (Domain-Separation vom Fernet-Key)
+        self._fingerprint_key = hmac.new(key, b"securepass-reuse-fingerprint", hashlib.sha256).digest()
+
+    def export_session_key(self) -> bytes:
+        """
+        Gibt den Session-Key für Worker-Prozesse zurück
+
+        Der Key darf nur an lokale Worker übergeben und nie gespeichert werden.
+
+        Raises:
+            RuntimeError: Wenn kein Master-Passwort gesetzt wurde
+        """
+        if self._session_key is None:
+            raise RuntimeError("Kein Master-Passwort gesetzt. Rufe zuerst set_master_password() auf.")
+
+        return self._session_key
 
     def encrypt(self, plaintext: str) -> bytes:
         """
@@ -66,10 +99,33 @@ class EncryptionManager:
 
         return self._fernet.decrypt(ciphertext).decode()
 
+    def fingerprint(self, plaintext: str) -> str:
+        """
+        Berechnet einen geschlüsselten Fingerprint (HMAC-SHA256) eines Passworts
+
+        Gleiche Passwörter ergeben im selben Tresor den gleichen Fingerprint,
+        ohne dass der Fingerprint ohne Session-Key etwas über das Passwort verrät.
+
+        Args:
+            plaintext: Das Passwort im Klartext
+
+        Returns:
+            Hex-codierter Fingerprint
+
+        Raises:
+            RuntimeError: Wenn kein Master-Passwort gesetzt wurde
+        """
+        if self._fingerprint_key is None:
+            raise RuntimeError("Kein Master-Passwort gesetzt. Rufe zuerst set_master_password() auf.")
+
+        return hmac.new(self._fingerprint_key, plaintext.encode(), hashlib.sha256).hexdigest()
+
     def clear(self):
         """Löscht den Encryption-Key aus dem Speicher (für Lock-Funktion)"""
         self._fernet = None
         self._master_password = None
+        self._session_key = None
+        self._fingerprint_key = None
 
     def is_unlocked(self) -> bool:
         """Prüft, ob die Verschlüsselung entsperrt ist"""
@@ -1,44 +1,194 @@
 """
 Datenmodelle für den Password Manager
+
+Die Modelle verwenden __slots__ statt eines __dict__ pro Instanz, damit auch
+große Tresore (100k+ Einträge) mit wenig Speicher auskommen. Zeitstempel werden
+roh aus der Datenbank übernommen und erst beim ersten Zugriff in ein datetime
+umgewandelt; das Ergebnis wird im selben Slot zwischengespeichert. Neue Objekte
+ohne Zeitstempel erhalten wie bisher bei der Erstellung die aktuelle Zeit.
 """
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Rohformate, die aus der Datenbank kommen können
+RawTimestamp = Union[None, datetime, int, float, str]
+
+
+def to_datetime(value: RawTimestamp) -> Optional[datetime]:
+    """
+    Wandelt einen rohen Zeitstempel in ein lokales, naives datetime um
+
+    Args:
+        value: datetime, Unix-Epoch (int/float) oder SQLite-Text (UTC)
+
+    Returns:
+        datetime in lokaler Zeit oder None wenn nicht parsebar
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+    # SQLite CURRENT_TIMESTAMP ist UTC ohne Zeitzonen-Angabe
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone().replace(tzinfo=None)
+
+
+def to_epoch(value: RawTimestamp) -> Optional[int]:
+    """
+    Wandelt einen Zeitstempel in Unix-Epoch-Sekunden um (Format der Datenbank)
+
+    Args:
+        value: datetime (naiv = lokale Zeit), Epoch oder SQLite-Text
+
+    Returns:
+        Epoch-Sekunden oder None
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if not isinstance(value, datetime):
+        value = to_datetime(value)
+        if value is None:
+            return None
+    return int(value.timestamp())
+
+
+def _resolve_timestamp(instance, slot: str) -> Optional[datetime]:
+    """
+    Parst den Slot beim ersten Zugriff und cached das Ergebnis
+
+    Fehlende Werte bleiben None; nicht parsebare Werte werden protokolliert
+    und ebenfalls als None gespeichert.
+    """
+    value = getattr(instance, slot)
+    if value is not None and not isinstance(value, datetime):
+        parsed = to_datetime(value)
+        if parsed is None:
+            logger.warning(f"Ungültiger Zeitstempel {value!r} in {type(instance).__name__}.{slot[1:]}")
+        setattr(instance, slot, parsed)
+        value = parsed
+    return value
 
 
-@dataclass
 class Category:
     """Kategorie für Passwort-Einträge"""
-    id: Optional[int]
-    name: str
-    color: Optional[str] = None
-    created_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    __slots__ = ('id', 'name', 'color', '_created_at')
+
+    def __init__(self, id: Optional[int], name: str, color: Optional[str] = None,
+                 created_at: RawTimestamp = None):
+        self.id = id
+        self.name = name
+        self.color = color
+        self._created_at = datetime.now() if created_at is None else created_at
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return _resolve_timestamp(self, '_created_at')
+
+    @created_at.setter
+    def created_at(self, value: RawTimestamp):
+        self._created_at = value
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.name, self.color, self.created_at) == \
+               (other.id, other.name, other.color, other.created_at)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Category(id={self.id!r}, name={self.name!r}, color={self.color!r})"
 
 
-@dataclass
 class PasswordEntry:
     """Passwort-Eintrag mit allen relevanten Informationen"""
-    id: Optional[int]
-    category_id: Optional[int]
-    name: str
-    username: str
-    encrypted_password: bytes
-    encrypted_notes: Optional[bytes] = None
-    website_url: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    # Nicht-verschlüsselte Versionen (nur zur Laufzeit)
-    decrypted_password: Optional[str] = None
-    decrypted_notes: Optional[str] = None
-
-    def __post_init__(self):
-        now = datetime.now()
-        if self.created_at is None:
-            self.created_at = now
-        if self.updated_at is None:
-            self.updated_at = now
+
+    __slots__ = (
+        'id', 'category_id', 'name', 'username',
+        'encrypted_password', 'encrypted_notes', 'website_url',
+        '_created_at', '_updated_at',
+        # Beim Speichern aus dem Klartext berechnet (ohne Entschlüsselung auswertbar)
+        'strength_score', 'reuse_fingerprint',
+        # Verschlüsseltes TOTP-Secret (Base32 oder otpauth-URI) für 2FA-Codes des Eintrags
+        'encrypted_totp',
+        # Nicht-verschlüsselte Versionen (nur zur Laufzeit)
+        'decrypted_password', 'decrypted_notes',
+    )
+
+    def __init__(self, id: Optional[int], category_id: Optional[int], name: str,
+                 username: str, encrypted_password: bytes,
+                 encrypted_notes: Optional[bytes] = None,
+                 website_url: Optional[str] = None,
+                 created_at: RawTimestamp = None,
+                 updated_at: RawTimestamp = None,
+                 decrypted_password: Optional[str] = None,
+                 decrypted_notes: Optional[str] = None,
+                 strength_score: Optional[int] = None,
+                 reuse_fingerprint: Optional[str] = None,
+                 encrypted_totp: Optional[bytes] = None):
+        self.id = id
+        self.category_id = category_id
+        self.name = name
+        self.username = username
+        self.encrypted_password = encrypted_password
+        self.encrypted_notes = encrypted_notes
+        self.website_url = website_url
+        if created_at is None or updated_at is None:
+            now = datetime.now()
+            created_at = now if created_at is None else created_at
+            updated_at = now if updated_at is None else updated_at
+        self._created_at = created_at
+        self._updated_at = updated_at
+        self.decrypted_password = decrypted_password
+        self.decrypted_notes = decrypted_notes
+        self.strength_score = strength_score
+        self.reuse_fingerprint = reuse_fingerprint
+        self.encrypted_totp = encrypted_totp
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return _resolve_timestamp(self, '_created_at')
+
+    @created_at.setter
+    def created_at(self, value: RawTimestamp):
+        self._created_at = value
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        return _resolve_timestamp(self, '_updated_at')
+
+    @updated_at.setter
+    def updated_at(self, value: RawTimestamp):
+        self._updated_at = value
+
+    def _key(self) -> tuple:
+        return (
+            self.id, self.category_id, self.name, self.username,
+            self.encrypted_password, self.encrypted_notes, self.website_url,
+            self.created_at, self.updated_at, self.encrypted_totp,
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"PasswordEntry(id={self.id!r}, category_id={self.category_id!r}, "
+                f"name={self.name!r}, username={self.username!r})")
@@ -0,0 +1,111 @@
+"""
+Vorab-Lesen von Tresor-Dateien
+
+Während der Benutzer das Master-Passwort eingibt, wird die ausgewählte Datei
+im Hintergrund gelesen und ihr Header geprüft. Beim Entsperren fällt dann nur
+noch die Schlüsselableitung und Entschlüsselung an - das hilft vor allem bei
+Tresoren in langsamen, synchronisierten Netzwerk-Ordnern.
+
+Gelesen wird nur der verschlüsselte Inhalt; ohne Master-Passwort ist er
+wertlos.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from .database_file import DatabaseFile
+
+logger = logging.getLogger(__name__)
+
+
+class VaultPrefetcher:
+    """Liest Tresor-Dateien im Hintergrund in den Speicher"""
+
+    # Anzahl gleichzeitig gehaltener Dateien (z.B. beim Durchblättern der Liste)
+    MAX_FILES = 2
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[str, Future]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    @staticmethod
+    def _load(path: str) -> DatabaseFile:
+        db_file = DatabaseFile(path)
+        db_file.preload()
+        return db_file
+
+    def prefetch(self, path: str):
+        """
+        Startet das Lesen einer Datei im Hintergrund (mehrfacher Aufruf ist günstig)
+
+        Args:
+            path: Pfad zur .spdb Datei
+        """
+        if not path:
+            return
+        key = self._key(path)
+        with self._lock:
+            future = self._files.get(key)
+            if future is not None:
+                self._files.move_to_end(key)
+                return
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vault-prefetch")
+            self._files[key] = self._executor.submit(self._load, key)
+
+            while len(self._files) > self.MAX_FILES:
+                _, oldest = self._files.popitem(last=False)
+                oldest.cancel()
+
+    def take(self, path: str) -> Optional[DatabaseFile]:
+        """
+        Übernimmt eine vorab gelesene Datei (wartet, falls das Lesen noch läuft)
+
+        Nur im Worker-Thread aufrufen - das Warten kann bei langsamen
+        Laufwerken dauern, ersetzt aber nur das ohnehin nötige Lesen.
+
+        Args:
+            path: Pfad zur .spdb Datei
+
+        Returns:
+            DatabaseFile mit aktuellem Inhalt im Speicher oder None
+        """
+        with self._lock:
+            future = self._files.pop(self._key(path), None)
+        if future is None or future.cancelled():
+            return None
+
+        try:
+            db_file = future.result()
+        except Exception as e:
+            logger.info(f"Vorab-Lesen fehlgeschlagen, Datei wird beim Öffnen gelesen: {e}")
+            return None
+        # Datei wurde seitdem geändert - neu lesen
+        return db_file if db_file.is_preloaded() else None
+
+    def discard(self, path: str):
+        """Verwirft eine vorab gelesene Datei"""
+        with self._lock:
+            future = self._files.pop(self._key(path), None)
+        if future is not None:
+            future.cancel()
+
+    def clear(self):
+        """Verwirft alle vorab gelesenen Dateien"""
+        with self._lock:
+            futures = list(self._files.values())
+            self._files.clear()
+        for future in futures:
+            future.cancel()
+
+
+# Globale Instanz
+vault_prefetcher = VaultPrefetcher()
@@ -37,9 +37,11 @@ class AppSettings:
             "last_database": None,
             "recent_databases": [],
             "theme_mode": "light",
+            "reduced_motion": False,
             "auto_lock_minutes": 5,
             "clipboard_clear_seconds": 30,
             "window_geometry": None,
+            "breach_corpus_path": None,
         }
 
     def save(self):
@@ -0,0 +1,287 @@
+"""
+Statistik-Service für das Dashboard
+
+Beantwortet Kennzahlen über den Tresor mit Aggregat-Abfragen und merkt sich
+die Ergebnisse pro Abschnitt. Ein Abschnitt wird erst neu berechnet, wenn ein
+Änderungs-Event der Datenbank ihn als veraltet markiert (oder, bei
+zeitabhängigen Abschnitten, wenn seine Lebensdauer abgelaufen ist).
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .database import DatabaseManager, CHANGE_ENTRIES, CHANGE_CATEGORIES
+from .encryption import encryption_manager
+from ..password.strength import password_strength_checker, WEAK_SCORE_THRESHOLD, ESTIMATOR_VERSION
+
+logger = logging.getLogger(__name__)
+
+SECTION_TOTALS = "totals"
+SECTION_CATEGORIES = "categories"
+SECTION_RECENT = "recent"
+SECTION_AGE = "age"
+SECTION_WEAK = "weak"
+SECTION_REUSED = "reused"
+
+# Welche Abschnitte ein Änderungs-Thema ungültig macht
+INVALIDATES: Dict[str, tuple] = {
+    CHANGE_ENTRIES: (SECTION_TOTALS, SECTION_CATEGORIES, SECTION_RECENT,
+                     SECTION_AGE, SECTION_WEAK, SECTION_REUSED),
+    CHANGE_CATEGORIES: (SECTION_TOTALS, SECTION_CATEGORIES),
+}
+
+# vault_meta-Schlüssel der Bewertungs-Version, mit der die Scores berechnet wurden
+ESTIMATOR_VERSION_KEY = "strength_estimator"
+
+# Abschnitte, deren Ergebnis auch ohne Änderung mit der Zeit veraltet
+TIME_DEPENDENT_SECTIONS = (SECTION_RECENT, SECTION_AGE)
+
+
+def analyze_password(password: str) -> Tuple[int, str]:
+    """
+    Berechnet die Auswertungs-Spalten eines Passworts beim Speichern
+
+    Args:
+        password: Das Passwort im Klartext
+
+    Returns:
+        (strength_score, reuse_fingerprint)
+    """
+    return (
+        password_strength_checker.get_strength_percentage(password),
+        encryption_manager.fingerprint(password),
+    )
+
+
+def analyze_passwords(passwords: Sequence[str]) -> List[Tuple[int, str]]:
+    """
+    Berechnet die Auswertungs-Spalten für viele Passwörter (ohne Live-Cache)
+
+    Args:
+        passwords: Passwörter im Klartext
+
+    Returns:
+        (strength_score, reuse_fingerprint) pro Passwort
+    """
+    estimates = password_strength_checker.estimate_many(passwords)
+    return [
+        (estimate.percentage, encryption_manager.fingerprint(password))
+        for password, estimate in zip(passwords, estimates)
+    ]
+
+
+def load_backfill_rows(db_manager: DatabaseManager, force: bool = False) -> Tuple[List[Tuple[int, bytes]], bool]:
+    """
+    Liest die Einträge, deren Auswertung nachgetragen werden muss
+
+    Wurden die Scores mit einer älteren Version der Stärke-Bewertung berechnet,
+    werden alle Einträge neu bewertet.
+
+    Args:
+        db_manager: Geöffneter DatabaseManager
+        force: Alle Einträge neu berechnen (z.B. nach Wechsel des Session-Keys)
+
+    Returns:
+        ((ID, verschlüsseltes Passwort) pro Eintrag, ob die Bewertungs-Version veraltet ist)
+    """
+    outdated = db_manager.get_meta(ESTIMATOR_VERSION_KEY) != str(ESTIMATOR_VERSION)
+    if force or outdated:
+        return db_manager.get_encrypted_passwords(), outdated
+    return db_manager.get_entries_missing_analytics(), outdated
+
+
+def compute_backfill_analytics(rows: Sequence[Tuple[int, bytes]],
+                               cancel_event: Optional[threading.Event] = None) -> List[Tuple[int, int, str]]:
+    """
+    Entschlüsselt und bewertet die Passwörter (ohne Datenbank-Zugriff, thread-sicher)
+
+    Args:
+        rows: (ID, verschlüsseltes Passwort) aus load_backfill_rows()
+        cancel_event: Bricht vor der Bewertung ab, wenn gesetzt (z.B. beim Sperren)
+
+    Returns:
+        (ID, strength_score, reuse_fingerprint) pro entschlüsselbarem Eintrag
+    """
+    entry_ids, passwords = [], []
+    for entry_id, token in rows:
+        if cancel_event is not None and cancel_event.is_set():
+            return []
+        try:
+            passwords.append(encryption_manager.decrypt(token))
+        except Exception:
+            logger.warning(f"Eintrag {entry_id} konnte für den Backfill nicht entschlüsselt werden")
+            continue
+        entry_ids.append(entry_id)
+
+    # Batch-Bewertung ohne Live-Cache, damit keine Klartexte darin verbleiben
+    return [
+        (entry_id, score, fingerprint)
+        for entry_id, (score, fingerprint) in zip(entry_ids, analyze_passwords(passwords))
+    ]
+
+
+def store_backfill_analytics(db_manager: DatabaseManager, analytics: Sequence[Tuple[int, int, str]],
+                             outdated: bool):
+    """
+    Schreibt die berechneten Auswertungen in einer Transaktion zurück
+
+    Args:
+        db_manager: Geöffneter DatabaseManager
+        analytics: Ergebnis von compute_backfill_analytics()
+        outdated: Ob die Bewertungs-Version aktualisiert werden muss
+    """
+    db_manager.update_password_analytics(analytics)
+    if outdated:
+        db_manager.set_meta(ESTIMATOR_VERSION_KEY, str(ESTIMATOR_VERSION))
+    if analytics:
+        logger.info(f"Passwort-Auswertung für {len(analytics)} Einträge ergänzt")
+
+
+def backfill_password_analytics(db_manager: DatabaseManager, force: bool = False) -> int:
+    """
+    Ergänzt Score und Fingerprint für Einträge, die vor den Auswertungs-Spalten
+    gespeichert wurden (einmalige Entschlüsselung pro Eintrag)
+
+    Synchrone Variante; das Hauptfenster rechnet über den AnalyticsBackfillWorker
+    außerhalb des UI-Threads.
+
+    Args:
+        db_manager: Geöffneter DatabaseManager
+        force: Alle Einträge neu berechnen (z.B. nach Wechsel des Session-Keys)
+
+    Returns:
+        Anzahl der aktualisierten Einträge
+    """
+    if not encryption_manager.is_unlocked():
+        return 0
+
+    rows, outdated = load_backfill_rows(db_manager, force)
+    analytics = compute_backfill_analytics(rows)
+    store_backfill_analytics(db_manager, analytics, outdated)
+    return len(analytics)
+
+
+class VaultStatistics:
+    """Memoisierte Tresor-Statistiken, invalidiert durch Änderungs-Events"""
+
+    SECTIONS = (SECTION_TOTALS, SECTION_CATEGORIES, SECTION_RECENT,
+                SECTION_AGE, SECTION_WEAK, SECTION_REUSED)
+
+    # Alters-Buckets in Tagen (letzte Änderung)
+    AGE_BOUNDARIES_DAYS = (30, 180, 365)
+    AGE_LABELS = ("< 30 Tage", "30–180 Tage", "180–365 Tage", "> 1 Jahr")
+
+    def __init__(self, db_manager: DatabaseManager, recent_days: int = 7,
+                 recent_limit: int = 5, time_ttl: float = 300.0):
+        """
+        Initialisiert den Service und abonniert Änderungen der Datenbank
+
+        Args:
+            db_manager: Geöffneter DatabaseManager
+            recent_days: Zeitraum für "neue Einträge"
+            recent_limit: Anzahl der letzten Aktivitäten
+            time_ttl: Lebensdauer zeitabhängiger Abschnitte in Sekunden
+        """
+        self.db_manager = db_manager
+        self.recent_days = recent_days
+        self.recent_limit = recent_limit
+        self.time_ttl = time_ttl
+
+        self._cache: Dict[str, Any] = {}
+        self._computed_at: Dict[str, float] = {}
+        self._compute_count: Dict[str, int] = {section: 0 for section in self.SECTIONS}
+
+        db_manager.add_change_listener(self.on_change)
+
+    def detach(self):
+        """Meldet den Service von der Datenbank ab"""
+        self.db_manager.remove_change_listener(self.on_change)
+
+    def on_change(self, topic: str):
+        """Markiert die von einem Änderungs-Thema betroffenen Abschnitte als veraltet"""
+        for section in INVALIDATES.get(topic, self.SECTIONS):
+            self._cache.pop(section, None)
+
+    def invalidate(self, section: Optional[str] = None):
+        """Verwirft einen oder alle gemerkten Abschnitte"""
+        if section is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(section, None)
+
+    def is_stale(self, section: str) -> bool:
+        """Prüft ob ein Abschnitt neu berechnet werden muss"""
+        if section not in self._cache:
+            return True
+        if section in TIME_DEPENDENT_SECTIONS:
+            return time.monotonic() - self._computed_at[section] > self.time_ttl
+        return False
+
+    def stale_sections(self) -> List[str]:
+        """Gibt alle veralteten Abschnitte zurück"""
+        return [section for section in self.SECTIONS if self.is_stale(section)]
+
+    def get(self, section: str) -> Any:
+        """
+        Gibt das Ergebnis eines Abschnitts zurück (berechnet nur wenn veraltet)
+
+        Args:
+            section: Einer der SECTION_* Namen
+
+        Returns:
+            Ergebnis des Abschnitts
+
+        Raises:
+            ValueError: Bei unbekanntem Abschnitt
+        """
+        if section not in self.SECTIONS:
+            raise ValueError(f"Unbekannter Statistik-Abschnitt: {section}")
+
+        if self.is_stale(section):
+            self._cache[section] = getattr(self, f"_compute_{section}")()
+            self._computed_at[section] = time.monotonic()
+            self._compute_count[section] += 1
+
+        return self._cache[section]
+
+    @property
+    def compute_count(self) -> Dict[str, int]:
+        """Anzahl der Berechnungen pro Abschnitt (für Tests und Benchmarks)"""
+        return dict(self._compute_count)
+
+    # ==================== BERECHNUNG ====================
+
+    def _compute_totals(self) -> Dict[str, int]:
+        """Gesamtzahl der Einträge und Kategorien"""
+        return {
+            "entries": self.db_manager.count_password_entries(),
+            "categories": self.db_manager.count_categories(),
+        }
+
+    def _compute_categories(self) -> list:
+        """(Kategorie, Anzahl) per GROUP BY"""
+        return self.db_manager.count_password_entries_per_category()
+
+    def _compute_recent(self) -> Dict[str, Any]:
+        """Neue Einträge im Zeitraum und die letzten Aktivitäten"""
+        return {
+            "count": self.db_manager.count_password_entries_created_since(self.recent_days),
+            "entries": self.db_manager.get_recent_password_entries(self.recent_limit),
+        }
+
+    def _compute_age(self) -> List[tuple]:
+        """(Label, Anzahl) pro Alters-Bucket"""
+        counts = self.db_manager.count_password_entries_by_age(self.AGE_BOUNDARIES_DAYS)
+        return list(zip(self.AGE_LABELS, counts))
+
+    def _compute_weak(self) -> int:
+        """Zählt schwache Passwörter über strength_score (ohne Entschlüsselung)"""
+        return self.db_manager.count_weak_password_entries(WEAK_SCORE_THRESHOLD)
+
+    def _compute_reused(self) -> Dict[str, int]:
+        """Gruppen wiederverwendeter Passwörter über reuse_fingerprint"""
+        groups = self.db_manager.get_reused_password_groups()
+        return {
+            "groups": len(groups),
+            "entries": sum(count for _fingerprint, count in groups),
+        }
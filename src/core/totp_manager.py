@@ -1,21 +1,142 @@
 """
-TOTP-Manager für Datenbank-Unlock 2FA
+TOTP-Manager für 2FA
 
 Verwaltet TOTP-Secrets für Zwei-Faktor-Authentifizierung beim Entsperren
-der Datenbank (nicht für einzelne Passwort-Einträge).
+der Datenbank sowie TOTP-Codes einzelner Passwort-Einträge.
+
+Pro Secret wird ein CachedTOTP vorgehalten: der Base32-Schlüssel wird nur
+einmal dekodiert, das HMAC-Objekt mit vorberechnetem Schlüssel-Padding nur
+kopiert, und der Code bleibt für das laufende 30-Sekunden-Fenster gespeichert.
 """
+import hmac
 import logging
 import pyotp
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 from .encryption import encryption_manager
 
 logger = logging.getLogger(__name__)
 
 
+class CachedTOTP:
+    """TOTP-Generator (RFC 6238) mit vorbereitetem HMAC-Schlüssel"""
+
+    __slots__ = ('digits', 'interval', '_hmac', '_last')
+
+    def __init__(self, secret: str):
+        """
+        Args:
+            secret: Base32-Secret oder otpauth://totp/-URI
+
+        Raises:
+            ValueError: Wenn das Secret ungültig ist
+        """
+        try:
+            totp = pyotp.parse_uri(secret) if secret.startswith("otpauth://") else pyotp.TOTP(secret)
+            key = totp.byte_secret()
+        except Exception as e:
+            raise ValueError(f"Ungültiges TOTP-Secret: {e}")
+        if not isinstance(totp, pyotp.TOTP):
+            raise ValueError("Ungültiges TOTP-Secret: nur TOTP-URIs werden unterstützt")
+        if not key:
+            raise ValueError("Ungültiges TOTP-Secret: Secret ist leer")
+
+        self.digits = totp.digits
+        self.interval = totp.interval
+        self._hmac = hmac.new(key, digestmod=totp.digest)
+        self._last: Tuple[int, str] = (-1, "")
+
+    def counter(self, for_time: Optional[float] = None) -> int:
+        """Gibt die Nummer des Zeitfensters zurück"""
+        return int(time.time() if for_time is None else for_time) // self.interval
+
+    def at_counter(self, counter: int) -> str:
+        """Berechnet den Code für ein Zeitfenster (dynamische Kürzung nach RFC 4226)"""
+        last_counter, last_code = self._last
+        if counter == last_counter:
+            return last_code
+
+        mac = self._hmac.copy()
+        mac.update(counter.to_bytes(8, "big"))
+        digest = mac.digest()
+        offset = digest[-1] & 0x0F
+        value = int.from_bytes(digest[offset:offset + 4], "big") & 0x7FFFFFFF
+        code = str(value % 10 ** self.digits).zfill(self.digits)
+
+        self._last = (counter, code)
+        return code
+
+    def now(self) -> str:
+        """Gibt den aktuellen Code zurück"""
+        return self.at_counter(self.counter())
+
+    def remaining_seconds(self, for_time: Optional[float] = None) -> int:
+        """Sekunden bis zum nächsten Code"""
+        return self.interval - int(time.time() if for_time is None else for_time) % self.interval
+
+
 class TOTPManager:
     """Manager für TOTP-basierte Zwei-Faktor-Authentifizierung"""
 
+    # Maximal zwischengespeicherte Generatoren (LRU)
+    MAX_CACHED = 1024
+
+    def __init__(self):
+        self._cache: "OrderedDict[str, CachedTOTP]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_totp(self, secret: str) -> CachedTOTP:
+        """
+        Gibt den zwischengespeicherten Generator für ein Secret zurück
+
+        Args:
+            secret: Base32-Secret oder otpauth://totp/-URI
+
+        Returns:
+            CachedTOTP
+
+        Raises:
+            ValueError: Wenn das Secret ungültig ist
+        """
+        with self._lock:
+            totp = self._cache.get(secret)
+            if totp is not None:
+                self._cache.move_to_end(secret)
+                return totp
+
+        totp = CachedTOTP(secret)
+        with self._lock:
+            self._cache[secret] = totp
+            if len(self._cache) > self.MAX_CACHED:
+                self._cache.popitem(last=False)
+        return totp
+
+    def normalize_secret(self, secret: str) -> str:
+        """
+        Bereinigt eine Benutzereingabe (Leerzeichen, Kleinbuchstaben) und prüft sie
+
+        Args:
+            secret: Base32-Secret oder otpauth://totp/-URI
+
+        Returns:
+            Bereinigtes Secret
+
+        Raises:
+            ValueError: Wenn das Secret ungültig ist
+        """
+        secret = secret.strip()
+        if not secret.startswith("otpauth://"):
+            secret = secret.replace(" ", "").replace("-", "").upper()
+        self.get_totp(secret).now()
+        return secret
+
+    def clear_cache(self):
+        """Verwirft alle Generatoren (enthalten Schlüsselmaterial, z.B. beim Sperren)"""
+        with self._lock:
+            self._cache.clear()
+
     def generate_secret(self) -> str:
         """
         Generiert ein neues Base32-kodiertes TOTP-Secret
@@ -35,8 +156,7 @@ class TOTPManager:
         Returns:
             6-stelliger TOTP-Code (z.B. "123456")
         """
-        totp = pyotp.TOTP(secret)
-        return totp.now()
+        return self.get_totp(secret).now()
 
     def get_remaining_seconds(self) -> int:
         """
@@ -59,9 +179,13 @@ class TOTPManager:
             True wenn Code gültig, False sonst
         """
         try:
-            totp = pyotp.TOTP(secret)
-            # valid_window=1 erlaubt ±30 Sekunden Zeittoleranz
-            return totp.verify(code, valid_window=1)
+            totp = self.get_totp(secret)
+            counter = totp.counter()
+            # ±1 Fenster erlaubt ±30 Sekunden Zeittoleranz
+            return any(
+                hmac.compare_digest(totp.at_counter(counter + offset), str(code))
+                for offset in (-1, 0, 1)
+            )
         except Exception as e:
             logger.error(f"Fehler bei TOTP-Verifizierung: {e}")
             return False
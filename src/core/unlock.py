@@ -0,0 +1,149 @@
+"""
+Entsperr-Pipeline für Tresor-Dateien
+
+Führt alle teuren Schritte des Logins aus (Datei lesen, Schlüssel ableiten,
+entschlüsseln, SQLite öffnen, Parameter erneuern, 2FA-Secret laden) und
+ist dafür gedacht, in einem Worker-Thread zu laufen. Der UI-Thread erhält nur
+die fertige UnlockSession.
+
+Die globale encryption_manager-Instanz wird hier bewusst nicht verändert;
+das übernimmt der UI-Thread mit UnlockSession.data_key.
+"""
+import logging
+import threading
+from typing import Callable, NamedTuple, Optional
+from ..auth.master_password import master_password_manager
+from .database import DatabaseManager, STAGE_OPEN
+from .database_file import (
+    DatabaseFile, STAGE_READ, STAGE_DERIVE, STAGE_DECRYPT, OperationCancelled
+)
+from .encryption import EncryptionManager
+from .prefetch import vault_prefetcher
+
+logger = logging.getLogger(__name__)
+
+STAGE_VERIFY = "verify"
+STAGE_TOTP = "totp"
+
+# Reihenfolge und Beschriftung der Stufen
+UNLOCK_STAGES = (
+    (STAGE_READ, "Datei wird gelesen..."),
+    (STAGE_DERIVE, "Schlüssel wird abgeleitet..."),
+    (STAGE_DECRYPT, "Datenbank wird entschlüsselt..."),
+    (STAGE_OPEN, "Datenbank wird geöffnet..."),
+    (STAGE_VERIFY, "Schlüsselparameter werden geprüft..."),
+    (STAGE_TOTP, "Zwei-Faktor-Authentifizierung wird vorbereitet..."),
+)
+STAGE_LABELS = dict(UNLOCK_STAGES)
+STAGE_INDEX = {stage: index for index, (stage, _) in enumerate(UNLOCK_STAGES)}
+
+
+class UnlockCancelled(OperationCancelled):
+    """Das Entsperren wurde abgebrochen"""
+
+
+class UnlockSession(NamedTuple):
+    """Ergebnis eines erfolgreichen Entsperrens"""
+    db_manager: DatabaseManager
+    data_key: bytes
+    totp_secret: Optional[str]  # Entschlüsseltes 2FA-Secret, falls aktiviert
+
+
+def upgrade_key_derivation(db_manager: DatabaseManager, password: str):
+    """
+    Erneuert Hash und Header-KDF, falls sie schwächer als die Kalibrierung sind
+
+    Der gespeicherte Hash wird nur geprüft, bevor er ersetzt wird; passt er
+    nicht zum Passwort, bleibt er unverändert. Fehler werden nur protokolliert,
+    das Entsperren läuft weiter.
+
+    Args:
+        db_manager: Geöffneter DatabaseManager
+        password: Das durch den Datenschlüssel bestätigte Master-Passwort
+    """
+    try:
+        stored_hash = db_manager.get_master_password_hash()
+        if stored_hash is None:
+            # Kein Hash vorhanden - erste Verwendung nach Erstellung
+            db_manager.save_master_password_hash(master_password_manager.hash_password(password))
+        elif master_password_manager.needs_upgrade(stored_hash):
+            if master_password_manager.verify_password(password, stored_hash):
+                db_manager.save_master_password_hash(master_password_manager.hash_password(password))
+                logger.info("Master-Passwort-Hash mit stärkeren Parametern erneuert")
+            else:
+                logger.warning("Gespeicherter Master-Passwort-Hash passt nicht zum Passwort")
+
+        if db_manager.upgrade_kdf(master_password_manager.parameters._asdict()):
+            logger.info("Datenschlüssel mit stärkeren Parametern neu verschlüsselt")
+    except Exception as e:
+        logger.warning(f"Parameter-Upgrade fehlgeschlagen: {e}")
+
+
+def unlock_vault(db_path: str, password: str,
+                 progress_callback: Optional[Callable[[str], None]] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 settings=None, upgrade: bool = True) -> UnlockSession:
+    """
+    Entsperrt eine Tresor-Datei
+
+    Ein falsches Passwort fällt bereits beim Entschlüsseln des Datenschlüssels
+    auf (WrongPasswordError), bevor die Datenbank entschlüsselt wird. Ein
+    gelungenes Entschlüsseln bestätigt das Passwort; der Argon2-Hash in der
+    Datenbank wird nur für ein Upgrade geprüft (siehe upgrade_key_derivation).
+
+    Ein Abbruch wird zwischen den Stufen geprüft; eine bereits geöffnete
+    Datenbank wird dann wieder geschlossen.
+
+    Ohne upgrade wird nichts in die Datei geschrieben. Das ist beim erneuten
+    Entsperren eines bereits geöffneten Tresors nötig: dessen DatabaseManager
+    würde Hash und Header beim nächsten Speichern wieder überschreiben.
+
+    Args:
+        db_path: Pfad zur .spdb Datei
+        password: Master-Passwort
+        progress_callback: Wird vor jeder Stufe (siehe UNLOCK_STAGES) aufgerufen
+        cancel_event: Gesetztes Event bricht das Entsperren ab
+        settings: AppSettings mit der Argon2-Kalibrierung (Standard: globale Einstellungen)
+        upgrade: Hash und Header-KDF bei Bedarf erneuern
+
+    Returns:
+        UnlockSession mit geöffnetem DatabaseManager
+
+    Raises:
+        WrongPasswordError: Wenn das Master-Passwort falsch ist
+        UnlockCancelled: Wenn abgebrochen wurde
+        Exception: Bei anderen Fehlern beim Öffnen (z.B. ValueError bei beschädigter Datei)
+    """
+    def stage(name: str):
+        if cancel_event is not None and cancel_event.is_set():
+            raise UnlockCancelled()
+        if progress_callback:
+            progress_callback(name)
+
+    # Gespeicherte Argon2-Kalibrierung; fehlt sie, misst das Hauptfenster im Leerlauf
+    master_password_manager.load_calibration(settings, calibrate=False)
+
+    # Im Hintergrund vorab gelesene Datei verwenden, falls vorhanden
+    db_file = vault_prefetcher.take(db_path) or DatabaseFile(db_path, password)
+    db_manager = DatabaseManager(db_path, password, stage, db_file)
+    try:
+        stage(STAGE_VERIFY)
+        if upgrade:
+            upgrade_key_derivation(db_manager, password)
+
+        stage(STAGE_TOTP)
+        totp_secret = None
+        if db_manager.has_totp_enabled():
+            encrypted_secret = db_manager.get_totp_secret()
+            if encrypted_secret:
+                session_encryption = EncryptionManager()
+                session_encryption.set_session_key(db_manager.data_key)
+                totp_secret = session_encryption.decrypt(encrypted_secret)
+
+        if cancel_event is not None and cancel_event.is_set():
+            raise UnlockCancelled()
+        return UnlockSession(db_manager, db_manager.data_key, totp_secret)
+
+    except BaseException:
+        db_manager.close()
+        raise
@@ -2,21 +2,236 @@
 Animations-System für moderne UI-Übergänge im Apple-Stil
 
 Bietet flüssige Animationen für Fenster, Widgets und UI-Elemente.
+
+Alle Animationen laufen über einen zentralen Manager: die Anzahl gleichzeitig
+laufender Animationen ist begrenzt, wiederholte Animationen derselben
+Eigenschaft eines Widgets werden zusammengefasst, und bei reduzierter Bewegung,
+niedriger Bildrate oder sehr großen Listen werden Übergänge sofort ausgeführt.
 """
+import time
+import logging
 from PyQt6.QtCore import (
-    QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
-    QSequentialAnimationGroup, QPoint, QSize, Qt, QTimer, pyqtProperty
+    QPropertyAnimation, QVariantAnimation, QEasingCurve, QParallelAnimationGroup,
+    QSequentialAnimationGroup, QAbstractAnimation, QPoint, QSize, Qt, QTimer, pyqtProperty
 )
+from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
 from PyQt6.QtGui import QColor
-from typing import Optional
+from typing import Optional, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class AnimationHelper:
-    """Hilfsklasse für einfache Animation-Erstellung"""
+    """
+    Zentraler Manager für alle UI-Animationen
+
+    Jede Animation wird unter (Widget, Eigenschaft) registriert. Startet auf
+    derselben Eigenschaft eine neue Animation, springt die laufende sofort in
+    ihren Endzustand, damit sich Effekte nicht überlagern (z.B. ein Widget,
+    das durch wiederholtes Pulsieren dauerhaft wächst).
+    """
+
+    # Maximal gleichzeitig laufende Animationen
+    MAX_CONCURRENT = 8
+
+    # Ab dieser Anzahl Einträge werden Übergänge sofort ausgeführt
+    LARGE_LIST_THRESHOLD = 2000
+
+    # Frame-Abstand (ms), ab dem die Bildrate als zu niedrig gilt
+    SLOW_FRAME_MS = 50.0
+
+    # Dauer (s), für die nach niedriger Bildrate nicht animiert wird
+    DEGRADED_SECONDS = 3.0
+
+    # Glättungsfaktor für den gleitenden Frame-Abstand
+    FRAME_SMOOTHING = 0.2
+
+    def __init__(self):
+        self._reduced_motion: Optional[bool] = None
+        self._item_count = 0
+        self._running: Dict[Tuple[int, str], Tuple[QAbstractAnimation, Callable]] = {}
+        self._frame_ms = 0.0
+        self._last_frame: Optional[float] = None
+        self._degraded_until = 0.0
+        self._frame_probe: Optional[QVariantAnimation] = None
+
+    @property
+    def reduced_motion(self) -> bool:
+        """Ob reduzierte Bewegung aktiv ist (wird beim ersten Zugriff geladen)"""
+        if self._reduced_motion is None:
+            from ..core.settings import app_settings
+            self._reduced_motion = bool(app_settings.get("reduced_motion", False))
+        return self._reduced_motion
+
+    def set_reduced_motion(self, enabled: bool):
+        """
+        Aktiviert oder deaktiviert reduzierte Bewegung
+
+        Laufende Animationen springen beim Aktivieren in ihren Endzustand.
+
+        Args:
+            enabled: True für sofortige Übergänge ohne Animation
+        """
+        self._reduced_motion = enabled
+        if enabled:
+            self.finish_all()
+
+    def set_item_count(self, count: int):
+        """
+        Setzt die Anzahl der angezeigten Einträge
+
+        Args:
+            count: Anzahl der Einträge in der Liste
+        """
+        self._item_count = count
+
+    def animations_enabled(self) -> bool:
+        """
+        Prüft, ob neue Animationen gestartet werden dürfen
+
+        Returns:
+            False bei reduzierter Bewegung, großer Liste, niedriger Bildrate
+            oder ausgeschöpftem Budget
+        """
+        if self.reduced_motion or self._item_count >= self.LARGE_LIST_THRESHOLD:
+            return False
+        if time.monotonic() < self._degraded_until:
+            return False
+        return len(self._running) < self.MAX_CONCURRENT
+
+    def running_count(self) -> int:
+        """Gibt die Anzahl laufender Animationen zurück"""
+        return len(self._running)
+
+    def finish(self, widget: QWidget, kind: str):
+        """
+        Beendet eine laufende Animation und setzt ihren Endzustand
+
+        Args:
+            widget: Das animierte Widget
+            kind: Animierte Eigenschaft ("opacity", "pos", "size", ...)
+        """
+        running = self._running.pop((id(widget), kind), None)
+        if running:
+            animation, finalize = running
+            animation.stop()
+            finalize()
+            self._update_frame_probe()
+
+    def finish_all(self):
+        """Beendet alle laufenden Animationen"""
+        for widget_id, kind in list(self._running):
+            running = self._running.pop((widget_id, kind), None)
+            if running:
+                running[0].stop()
+                running[1]()
+        self._update_frame_probe()
+
+    def _start(self, widget: QWidget, kind: str, animation: QAbstractAnimation,
+               finalize: Callable) -> QAbstractAnimation:
+        """
+        Registriert und startet eine Animation
+
+        Args:
+            widget: Das animierte Widget
+            kind: Animierte Eigenschaft
+            animation: Die Animation (Parent ist das Widget)
+            finalize: Setzt den Endzustand, wenn die Animation endet
+
+        Returns:
+            Die gestartete Animation
+        """
+        key = (id(widget), kind)
+        self._running[key] = (animation, finalize)
+
+        def on_finished():
+            if self._running.get(key, (None,))[0] is animation:
+                del self._running[key]
+                finalize()
+                self._update_frame_probe()
+
+        def on_destroyed():
+            if self._running.get(key, (None,))[0] is animation:
+                del self._running[key]
+                self._update_frame_probe()
+
+        animation.finished.connect(on_finished)
+        animation.destroyed.connect(on_destroyed)
+        animation.start()
+        self._update_frame_probe()
+        return animation
+
+    def _update_frame_probe(self):
+        """
+        Startet oder stoppt die Messung der Bildrate
+
+        Die Messung läuft nur, solange Animationen laufen. Sie nutzt eine
+        eigene Animation mit Fließkomma-Werten, die (anders als z.B. eine
+        Größen-Animation um wenige Pixel) bei jedem Timer-Tick ein Update meldet.
+        """
+        if self._frame_probe is not None and sip.isdeleted(self._frame_probe):
+            # Beim Beenden der Anwendung bereits freigegeben
+            return
+        if self._frame_probe is None:
+            self._frame_probe = QVariantAnimation()
+            self._frame_probe.setStartValue(0.0)
+            self._frame_probe.setEndValue(1.0)
+            self._frame_probe.setDuration(1000)
+            self._frame_probe.setLoopCount(-1)
+            self._frame_probe.valueChanged.connect(lambda _value: self._record_frame(time.monotonic()))
+
+        running = self._frame_probe.state() == QAbstractAnimation.State.Running
+        if self._running and not running:
+            # Pausen zwischen Animationen zählen nicht als langsame Frames
+            self._last_frame = None
+            self._frame_probe.start()
+        elif not self._running and running:
+            self._frame_probe.stop()
+
+    def _record_frame(self, now: float):
+        """
+        Verarbeitet ein Frame-Update
+
+        Args:
+            now: Zeitpunkt des Updates (time.monotonic())
+        """
+        if self._last_frame is not None:
+            interval_ms = (now - self._last_frame) * 1000
+            self._frame_ms += self.FRAME_SMOOTHING * (interval_ms - self._frame_ms)
+            if self._frame_ms > self.SLOW_FRAME_MS:
+                logger.debug(f"Niedrige Bildrate ({self._frame_ms:.0f} ms/Frame), Animationen pausiert")
+                self._degraded_until = now + self.DEGRADED_SECONDS
+                self._frame_ms = 0.0
+                self.finish_all()
+        self._last_frame = now
+
+    @staticmethod
+    def _opacity_effect(widget: QWidget) -> QGraphicsOpacityEffect:
+        """Gibt den Opacity-Effekt des Widgets zurück und erstellt ihn bei Bedarf"""
+        effect = widget.graphicsEffect()
+        if not isinstance(effect, QGraphicsOpacityEffect):
+            effect = QGraphicsOpacityEffect(widget)
+            widget.setGraphicsEffect(effect)
+        return effect
 
     @staticmethod
-    def fade_in(widget: QWidget, duration: int = 300, on_finished: Optional[callable] = None):
+    def _remove_opacity_effect(widget: QWidget):
+        """
+        Entfernt einen temporären Opacity-Effekt
+
+        Ein Opacity-Effekt zwingt Qt, das Widget offscreen zu rendern. Nach
+        dem Einblenden wird er deshalb wieder entfernt; nur der dauerhafte
+        Effekt eines AnimatedWidget bleibt erhalten.
+        """
+        effect = widget.graphicsEffect()
+        if isinstance(effect, QGraphicsOpacityEffect) and effect is not getattr(widget, "_opacity_effect", None):
+            widget.setGraphicsEffect(None)
+        elif isinstance(effect, QGraphicsOpacityEffect):
+            effect.setOpacity(1.0)
+
+    def fade_in(self, widget: QWidget, duration: int = 300,
+                on_finished: Optional[callable] = None) -> Optional[QAbstractAnimation]:
         """
         Fade-In Animation für ein Widget
 
@@ -24,30 +239,30 @@ class AnimationHelper:
             widget: Das zu animierende Widget
             duration: Dauer in Millisekunden
             on_finished: Callback-Funktion nach Abschluss
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
         """
-        # Erstelle Opacity-Effekt falls noch nicht vorhanden
-        if not widget.graphicsEffect() or not isinstance(widget.graphicsEffect(), QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
-        else:
-            effect = widget.graphicsEffect()
+        self.finish(widget, "opacity")
+
+        def finalize():
+            self._remove_opacity_effect(widget)
+            if on_finished:
+                on_finished()
 
-        # Animation
-        animation = QPropertyAnimation(effect, b"opacity")
+        if not self.animations_enabled():
+            finalize()
+            return None
+
+        animation = QPropertyAnimation(self._opacity_effect(widget), b"opacity", widget)
         animation.setDuration(duration)
         animation.setStartValue(0.0)
         animation.setEndValue(1.0)
         animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        return self._start(widget, "opacity", animation, finalize)
 
-        if on_finished:
-            animation.finished.connect(on_finished)
-
-        animation.start()
-        # Speichere Referenz, damit Animation nicht garbage collected wird
-        widget._fade_animation = animation
-
-    @staticmethod
-    def fade_out(widget: QWidget, duration: int = 300, on_finished: Optional[callable] = None):
+    def fade_out(self, widget: QWidget, duration: int = 300,
+                 on_finished: Optional[callable] = None) -> Optional[QAbstractAnimation]:
         """
         Fade-Out Animation für ein Widget
 
@@ -55,87 +270,87 @@ class AnimationHelper:
             widget: Das zu animierende Widget
             duration: Dauer in Millisekunden
             on_finished: Callback-Funktion nach Abschluss
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
         """
-        if not widget.graphicsEffect() or not isinstance(widget.graphicsEffect(), QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
-        else:
-            effect = widget.graphicsEffect()
+        self.finish(widget, "opacity")
+        effect = self._opacity_effect(widget)
+
+        def finalize():
+            effect.setOpacity(0.0)
+            if on_finished:
+                on_finished()
 
-        animation = QPropertyAnimation(effect, b"opacity")
+        if not self.animations_enabled():
+            finalize()
+            return None
+
+        animation = QPropertyAnimation(effect, b"opacity", widget)
         animation.setDuration(duration)
         animation.setStartValue(1.0)
         animation.setEndValue(0.0)
         animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        return self._start(widget, "opacity", animation, finalize)
 
-        if on_finished:
-            animation.finished.connect(on_finished)
+    def _slide_in(self, widget: QWidget, duration: int, offset: int) -> Optional[QAbstractAnimation]:
+        """Slide-In Animation um einen vertikalen Versatz"""
+        self.finish(widget, "pos")
+        if not self.animations_enabled():
+            return None
 
-        animation.start()
-        widget._fade_animation = animation
-
-    @staticmethod
-    def slide_in_from_top(widget: QWidget, duration: int = 400, distance: int = 50):
-        """
-        Slide-In Animation von oben
-
-        Args:
-            widget: Das zu animierende Widget
-            duration: Dauer in Millisekunden
-            distance: Verschiebungs-Distanz in Pixeln
-        """
         original_pos = widget.pos()
-        start_pos = QPoint(original_pos.x(), original_pos.y() - distance)
+        start_pos = QPoint(original_pos.x(), original_pos.y() + offset)
 
         # Setze Startposition
         widget.move(start_pos)
 
-        # Animation
-        animation = QPropertyAnimation(widget, b"pos")
+        animation = QPropertyAnimation(widget, b"pos", widget)
         animation.setDuration(duration)
         animation.setStartValue(start_pos)
         animation.setEndValue(original_pos)
         animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        return self._start(widget, "pos", animation, lambda: widget.move(original_pos))
 
-        animation.start()
-        widget._slide_animation = animation
-
-    @staticmethod
-    def slide_in_from_bottom(widget: QWidget, duration: int = 400, distance: int = 50):
-        """Slide-In Animation von unten"""
-        original_pos = widget.pos()
-        start_pos = QPoint(original_pos.x(), original_pos.y() + distance)
+    def slide_in_from_top(self, widget: QWidget, duration: int = 400,
+                          distance: int = 50) -> Optional[QAbstractAnimation]:
+        """
+        Slide-In Animation von oben
 
-        widget.move(start_pos)
+        Args:
+            widget: Das zu animierende Widget
+            duration: Dauer in Millisekunden
+            distance: Verschiebungs-Distanz in Pixeln
 
-        animation = QPropertyAnimation(widget, b"pos")
-        animation.setDuration(duration)
-        animation.setStartValue(start_pos)
-        animation.setEndValue(original_pos)
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
+        """
+        return self._slide_in(widget, duration, -distance)
 
-        animation.start()
-        widget._slide_animation = animation
+    def slide_in_from_bottom(self, widget: QWidget, duration: int = 400,
+                             distance: int = 50) -> Optional[QAbstractAnimation]:
+        """Slide-In Animation von unten"""
+        return self._slide_in(widget, duration, distance)
 
-    @staticmethod
-    def scale_in(widget: QWidget, duration: int = 300):
+    def scale_in(self, widget: QWidget, duration: int = 300) -> Optional[QAbstractAnimation]:
         """
         Scale-In Animation (von klein zu normal)
 
         Args:
             widget: Das zu animierende Widget
             duration: Dauer in Millisekunden
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
         """
+        self.finish(widget, "opacity")
+        self.finish(widget, "size")
+        if not self.animations_enabled():
+            return None
+
         original_size = widget.size()
         start_size = QSize(int(original_size.width() * 0.95), int(original_size.height() * 0.95))
 
-        # Erstelle Opacity-Effekt
-        if not widget.graphicsEffect():
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
-        else:
-            effect = widget.graphicsEffect()
-
         # Größen-Animation
         size_animation = QPropertyAnimation(widget, b"size")
         size_animation.setDuration(duration)
@@ -144,7 +359,7 @@ class AnimationHelper:
         size_animation.setEasingCurve(QEasingCurve.Type.OutBack)
 
         # Opacity-Animation
-        opacity_animation = QPropertyAnimation(effect, b"opacity")
+        opacity_animation = QPropertyAnimation(self._opacity_effect(widget), b"opacity")
         opacity_animation.setDuration(duration)
         opacity_animation.setStartValue(0.0)
         opacity_animation.setEndValue(1.0)
@@ -155,89 +370,80 @@ class AnimationHelper:
         group.addAnimation(size_animation)
         group.addAnimation(opacity_animation)
 
-        group.start()
-        widget._scale_animation = group
+        def finalize():
+            widget.resize(original_size)
+            self._remove_opacity_effect(widget)
 
-    @staticmethod
-    def pulse(widget: QWidget, scale_factor: float = 1.05, duration: int = 200):
-        """
-        Pulse Animation (kurzes Aufblinken/Vergrößern)
+        return self._start(widget, "size", group, finalize)
+
+    def _resize_sequence(self, widget: QWidget, factor: float, first_duration: int,
+                         second_duration: int, first_easing, second_easing) -> Optional[QAbstractAnimation]:
+        """Skaliert ein Widget um einen Faktor und wieder zurück"""
+        self.finish(widget, "size")
+        if not self.animations_enabled():
+            return None
 
-        Args:
-            widget: Das zu animierende Widget
-            scale_factor: Vergrößerungsfaktor
-            duration: Dauer in Millisekunden
-        """
         original_size = widget.size()
-        larger_size = QSize(
-            int(original_size.width() * scale_factor),
-            int(original_size.height() * scale_factor)
+        scaled_size = QSize(
+            int(original_size.width() * factor),
+            int(original_size.height() * factor)
         )
 
-        # Vergrößern
-        expand = QPropertyAnimation(widget, b"size")
-        expand.setDuration(duration)
-        expand.setStartValue(original_size)
-        expand.setEndValue(larger_size)
-        expand.setEasingCurve(QEasingCurve.Type.OutCubic)
+        first = QPropertyAnimation(widget, b"size")
+        first.setDuration(first_duration)
+        first.setStartValue(original_size)
+        first.setEndValue(scaled_size)
+        first.setEasingCurve(first_easing)
 
-        # Verkleinern
-        shrink = QPropertyAnimation(widget, b"size")
-        shrink.setDuration(duration)
-        shrink.setStartValue(larger_size)
-        shrink.setEndValue(original_size)
-        shrink.setEasingCurve(QEasingCurve.Type.InCubic)
+        second = QPropertyAnimation(widget, b"size")
+        second.setDuration(second_duration)
+        second.setStartValue(scaled_size)
+        second.setEndValue(original_size)
+        second.setEasingCurve(second_easing)
 
         # Sequenz
         sequence = QSequentialAnimationGroup(widget)
-        sequence.addAnimation(expand)
-        sequence.addAnimation(shrink)
+        sequence.addAnimation(first)
+        sequence.addAnimation(second)
+        return self._start(widget, "size", sequence, lambda: widget.resize(original_size))
 
-        sequence.start()
-        widget._pulse_animation = sequence
+    def pulse(self, widget: QWidget, scale_factor: float = 1.05,
+              duration: int = 200) -> Optional[QAbstractAnimation]:
+        """
+        Pulse Animation (kurzes Aufblinken/Vergrößern)
 
-    @staticmethod
-    def press(widget: QWidget, scale_factor: float = 0.95, duration: int = 100):
+        Args:
+            widget: Das zu animierende Widget
+            scale_factor: Vergrößerungsfaktor
+            duration: Dauer in Millisekunden
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
+        """
+        return self._resize_sequence(widget, scale_factor, duration, duration,
+                                     QEasingCurve.Type.OutCubic, QEasingCurve.Type.InCubic)
+
+    def press(self, widget: QWidget, scale_factor: float = 0.95,
+              duration: int = 100) -> Optional[QAbstractAnimation]:
         """
         Press Animation (Button wird beim Drücken kleiner)
 
-        Optimiert für Button-Press-Effekte - schnelle, subtile Scale-Animation
+        Optimiert für Button-Press-Effekte - schnelle, subtile Scale-Animation.
+        Das Zurückfedern ist etwas langsamer für ein weiches Loslassen.
 
         Args:
             widget: Das zu animierende Widget (typischerweise QPushButton)
             scale_factor: Verkleinerungsfaktor (0.95 = 95% der Größe)
             duration: Dauer in Millisekunden (sollte kurz sein, 100-150ms)
-        """
-        original_size = widget.size()
-        pressed_size = QSize(
-            int(original_size.width() * scale_factor),
-            int(original_size.height() * scale_factor)
-        )
-
-        # Verkleinern (schnell)
-        shrink = QPropertyAnimation(widget, b"size")
-        shrink.setDuration(duration)
-        shrink.setStartValue(original_size)
-        shrink.setEndValue(pressed_size)
-        shrink.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Zurück zur Originalgröße (etwas langsamer für smooth release)
-        expand = QPropertyAnimation(widget, b"size")
-        expand.setDuration(int(duration * 1.5))
-        expand.setStartValue(pressed_size)
-        expand.setEndValue(original_size)
-        expand.setEasingCurve(QEasingCurve.Type.OutElastic)
-
-        # Sequenz
-        sequence = QSequentialAnimationGroup(widget)
-        sequence.addAnimation(shrink)
-        sequence.addAnimation(expand)
-
-        sequence.start()
-        widget._press_animation = sequence
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
+        """
+        return self._resize_sequence(widget, scale_factor, duration, int(duration * 1.5),
+                                     QEasingCurve.Type.OutCubic, QEasingCurve.Type.OutElastic)
 
-    @staticmethod
-    def shake(widget: QWidget, intensity: int = 10, duration: int = 50, times: int = 3):
+    def shake(self, widget: QWidget, intensity: int = 10, duration: int = 50,
+              times: int = 3) -> Optional[QAbstractAnimation]:
         """
         Shake Animation (für Fehler-Feedback)
 
@@ -246,46 +452,34 @@ class AnimationHelper:
             intensity: Intensität der Bewegung in Pixeln
             duration: Dauer pro Bewegung in Millisekunden
             times: Anzahl der Wiederholungen
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
         """
+        self.finish(widget, "pos")
+        if not self.animations_enabled():
+            return None
+
         original_pos = widget.pos()
+        right_pos = QPoint(original_pos.x() + intensity, original_pos.y())
+        left_pos = QPoint(original_pos.x() - intensity, original_pos.y())
 
-        animations = []
-        for i in range(times):
-            # Nach rechts
-            right = QPropertyAnimation(widget, b"pos")
-            right.setDuration(duration)
-            right.setStartValue(original_pos)
-            right.setEndValue(QPoint(original_pos.x() + intensity, original_pos.y()))
-            right.setEasingCurve(QEasingCurve.Type.InOutCubic)
-
-            # Nach links
-            left = QPropertyAnimation(widget, b"pos")
-            left.setDuration(duration)
-            left.setStartValue(QPoint(original_pos.x() + intensity, original_pos.y()))
-            left.setEndValue(QPoint(original_pos.x() - intensity, original_pos.y()))
-            left.setEasingCurve(QEasingCurve.Type.InOutCubic)
-
-            animations.extend([right, left])
-
-        # Zurück zur ursprünglichen Position
-        back = QPropertyAnimation(widget, b"pos")
-        back.setDuration(duration)
-        back.setStartValue(QPoint(original_pos.x() - intensity, original_pos.y()))
-        back.setEndValue(original_pos)
-        back.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        animations.append(back)
+        # Rechts, links, ... und zurück zur ursprünglichen Position
+        waypoints = [original_pos] + [right_pos, left_pos] * times + [original_pos]
 
-        # Sequenz
         sequence = QSequentialAnimationGroup(widget)
-        for anim in animations:
-            sequence.addAnimation(anim)
-
-        sequence.start()
-        widget._shake_animation = sequence
-
-    @staticmethod
-    def smooth_scroll(widget: QWidget, property_name: bytes, target_value: int,
-                      duration: int = 300, easing=QEasingCurve.Type.OutCubic):
+        for start, end in zip(waypoints, waypoints[1:]):
+            step = QPropertyAnimation(widget, b"pos")
+            step.setDuration(duration)
+            step.setStartValue(start)
+            step.setEndValue(end)
+            step.setEasingCurve(QEasingCurve.Type.InOutCubic)
+            sequence.addAnimation(step)
+
+        return self._start(widget, "pos", sequence, lambda: widget.move(original_pos))
+
+    def smooth_scroll(self, widget: QWidget, property_name: bytes, target_value: int,
+                      duration: int = 300, easing=QEasingCurve.Type.OutCubic) -> Optional[QAbstractAnimation]:
         """
         Smooth Scroll Animation
 
@@ -295,14 +489,25 @@ class AnimationHelper:
             target_value: Zielwert
             duration: Dauer in Millisekunden
             easing: Easing-Kurve
+
+        Returns:
+            Die gestartete Animation oder None bei sofortigem Übergang
         """
-        animation = QPropertyAnimation(widget, property_name)
+        kind = f"scroll:{property_name.decode()}"
+        self.finish(widget, kind)
+
+        def finalize():
+            widget.setProperty(property_name.decode(), target_value)
+
+        if not self.animations_enabled():
+            finalize()
+            return None
+
+        animation = QPropertyAnimation(widget, property_name, widget)
         animation.setDuration(duration)
         animation.setEndValue(target_value)
         animation.setEasingCurve(easing)
-
-        animation.start()
-        widget._scroll_animation = animation
+        return self._start(widget, kind, animation, finalize)
 
 
 class AnimatedWidget(QWidget):
@@ -337,13 +542,13 @@ class AnimatedWidget(QWidget):
             duration: Dauer in Millisekunden
         """
         if animation_type == "fade":
-            AnimationHelper.fade_in(self, duration)
+            animator.fade_in(self, duration)
         elif animation_type == "slide_top":
-            AnimationHelper.slide_in_from_top(self, duration)
+            animator.slide_in_from_top(self, duration)
         elif animation_type == "slide_bottom":
-            AnimationHelper.slide_in_from_bottom(self, duration)
+            animator.slide_in_from_bottom(self, duration)
         elif animation_type == "scale":
-            AnimationHelper.scale_in(self, duration)
+            animator.scale_in(self, duration)
 
     def animate_out(self, animation_type: str = "fade", duration: int = 300,
                     on_finished: Optional[callable] = None):
@@ -356,7 +561,7 @@ class AnimatedWidget(QWidget):
             on_finished: Callback nach Abschluss
         """
         if animation_type == "fade":
-            AnimationHelper.fade_out(self, duration, on_finished)
+            animator.fade_out(self, duration, on_finished)
 
 
 # Globale Helper-Instanz
@@ -4,14 +4,16 @@ Dashboard mit Statistiken und Übersicht
 Zeigt wichtige Metriken und Statistiken über die Passwort-Datenbank.
 """
 import logging
-from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QScrollArea, QGridLayout, QPushButton
+    QScrollArea, QGridLayout, QPushButton, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 from ..core.database import DatabaseManager
+from ..core.statistics import VaultStatistics
+from ..core.audit import PasswordAuditEngine
+from .workers import AuditWorker
 from .themes import theme
 from .icons import icon_provider
 from .animations import animator
@@ -32,8 +34,6 @@ class StatCard(QFrame):
 
     def setup_ui(self):
         """Erstellt das UI der Stat-Card"""
-        c = theme.get_colors()
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(12)
@@ -42,11 +42,9 @@ class StatCard(QFrame):
         top_row = QHBoxLayout()
 
         # Icon
-        icon_color = self.custom_color if self.custom_color else c['primary']
-        icon = icon_provider.get_icon(self.icon_name, icon_color, 32)
-        icon_label = QLabel()
-        icon_label.setPixmap(icon.pixmap(32, 32))
-        top_row.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.set_icon_color(self.custom_color)
+        top_row.addWidget(self.icon_label)
 
         top_row.addStretch()
 
@@ -56,7 +54,7 @@ class StatCard(QFrame):
         value_font.setPointSize(24)
         value_font.setBold(True)
         self.value_label.setFont(value_font)
-        self.value_label.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+        self.value_label.setObjectName("statValue")
         top_row.addWidget(self.value_label)
 
         layout.addLayout(top_row)
@@ -66,30 +64,29 @@ class StatCard(QFrame):
         title_font = QFont()
         title_font.setPointSize(12)
         self.title_label.setFont(title_font)
-        self.title_label.setStyleSheet(f"color: {c['text_secondary']}; background: transparent; border: none;")
+        self.title_label.setObjectName("statTitle")
         layout.addWidget(self.title_label)
 
-        # Card Style
-        self.setStyleSheet(f"""
-            StatCard {{
-                background-color: {c['background_secondary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 12px;
-            }}
-            StatCard:hover {{
-                border-color: {c['primary']};
-                background-color: {c['surface_hover']};
-            }}
-        """)
-
+        # Karten-Style kommt aus dem globalen Stylesheet (StatCard)
         self.setMinimumSize(200, 120)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+    def set_icon_color(self, color: str = None):
+        """
+        Rendert das Icon in einer neuen Farbe (z.B. nach einem Theme-Wechsel)
+
+        Args:
+            color: Icon-Farbe (Standard: Primärfarbe des Themes)
+        """
+        self.custom_color = color
+        icon_color = color if color else theme.get_colors()['primary']
+        self.icon_label.setPixmap(icon_provider.get_pixmap(self.icon_name, icon_color, 32))
+
     def update_value(self, new_value: str):
         """Aktualisiert den Wert"""
         self.value_text = new_value
         self.value_label.setText(new_value)
-        animator.pulse(self.value_label, scale=1.05, duration=300)
+        animator.pulse(self.value_label, scale_factor=1.05, duration=300)
 
     def mousePressEvent(self, event):
         """Animiere beim Klick"""
@@ -105,12 +102,33 @@ class Dashboard(QWidget):
     weak_passwords_clicked = pyqtSignal()
     recent_entries_clicked = pyqtSignal()
 
+    # Statistik-Karten: (Schlüssel, Titel, Icon, Theme-Farbschlüssel, Zeile, Spalte)
+    STAT_CARDS = (
+        ('total', "Gesamt-Einträge", "key", 'primary', 0, 0),
+        ('categories', "Kategorien", "folder", 'secondary', 0, 1),
+        ('recent', "Letzte 7 Tage", "refresh", 'warning', 0, 2),
+        ('weak', "Schwache Passwörter", "shield", 'danger', 0, 3),
+        ('reused', "Wiederverwendet", "copy", 'warning', 1, 0),
+    )
+
     def __init__(self, db_manager: DatabaseManager, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
+        self.statistics = VaultStatistics(db_manager)
         self.stat_cards = {}
+        self._activity_icons = []  # Icon-Labels der Aktivitäten (für Theme-Wechsel)
+        # Bereits angezeigte Abschnitte; Berechnung erst beim ersten Anzeigen
+        self._rendered_sections = set()
+        # Audit-Engine lebt so lange wie das Dashboard (Ergebnis-Cache)
+        self.audit_engine = PasswordAuditEngine()
+        self.audit_worker = None
         self.setup_ui()
-        self.load_statistics()
+        self.db_manager.add_change_listener(self._on_data_changed)
+        self.destroyed.connect(
+            lambda _=None, db=db_manager, stats=self.statistics, cb=self._on_data_changed: (
+                db.remove_change_listener(cb), stats.detach()
+            )
+        )
 
     def setup_ui(self):
         """Erstellt das Dashboard-UI"""
@@ -128,7 +146,7 @@ class Dashboard(QWidget):
         header_font.setPointSize(22)
         header_font.setBold(True)
         header_label.setFont(header_font)
-        header_label.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+        header_label.setObjectName("dashboardHeader")
         header_layout.addWidget(header_label)
 
         header_layout.addStretch()
@@ -140,20 +158,7 @@ class Dashboard(QWidget):
         self.refresh_button.clicked.connect(self.refresh_stats)
         self.refresh_button.pressed.connect(lambda: animator.press(self.refresh_button))
         self.refresh_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.refresh_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['background_secondary']};
-                color: {c['text_primary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {c['surface_hover']};
-                border-color: {c['primary']};
-            }}
-        """)
+        self.refresh_button.setObjectName("dashboardButton")
         header_layout.addWidget(self.refresh_button)
 
         main_layout.addLayout(header_layout)
@@ -162,12 +167,7 @@ class Dashboard(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {c['background']};
-                border: none;
-            }}
-        """)
+        scroll.setObjectName("dashboardScroll")
 
         content = QWidget()
         content_layout = QVBoxLayout(content)
@@ -177,42 +177,10 @@ class Dashboard(QWidget):
         stats_grid = QGridLayout()
         stats_grid.setSpacing(16)
 
-        # Karte: Gesamt-Einträge
-        self.stat_cards['total'] = StatCard(
-            "Gesamt-Einträge",
-            "0",
-            "key",
-            c['primary']
-        )
-        stats_grid.addWidget(self.stat_cards['total'], 0, 0)
-
-        # Karte: Kategorien
-        self.stat_cards['categories'] = StatCard(
-            "Kategorien",
-            "0",
-            "folder",
-            c['secondary']
-        )
-        stats_grid.addWidget(self.stat_cards['categories'], 0, 1)
-
-        # Karte: Letzte 7 Tage
-        self.stat_cards['recent'] = StatCard(
-            "Letzte 7 Tage",
-            "0",
-            "refresh",
-            c['warning']
-        )
-        stats_grid.addWidget(self.stat_cards['recent'], 0, 2)
-
-        # Karte: Schwache Passwörter
-        self.stat_cards['weak'] = StatCard(
-            "Schwache Passwörter",
-            "0",
-            "shield",
-            c['danger']
-        )
+        for key, title, icon_name, color_key, row, column in self.STAT_CARDS:
+            self.stat_cards[key] = StatCard(title, "0", icon_name, c[color_key])
+            stats_grid.addWidget(self.stat_cards[key], row, column)
         self.stat_cards['weak'].mousePressEvent = lambda e: self.weak_passwords_clicked.emit()
-        stats_grid.addWidget(self.stat_cards['weak'], 0, 3)
 
         content_layout.addLayout(stats_grid)
 
@@ -222,7 +190,7 @@ class Dashboard(QWidget):
         cat_header_font.setPointSize(16)
         cat_header_font.setBold(True)
         cat_header.setFont(cat_header_font)
-        cat_header.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+        cat_header.setObjectName("dashboardHeader")
         content_layout.addWidget(cat_header)
 
         self.category_container = QVBoxLayout()
@@ -235,122 +203,154 @@ class Dashboard(QWidget):
         activity_header_font.setPointSize(16)
         activity_header_font.setBold(True)
         activity_header.setFont(activity_header_font)
-        activity_header.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+        activity_header.setObjectName("dashboardHeader")
         content_layout.addWidget(activity_header)
 
         self.activity_container = QVBoxLayout()
         self.activity_container.setSpacing(8)
         content_layout.addLayout(self.activity_container)
 
+        # === PASSWORT-ALTER ===
+        age_header = QLabel("⏳ Passwort-Alter")
+        age_header_font = QFont()
+        age_header_font.setPointSize(16)
+        age_header_font.setBold(True)
+        age_header.setFont(age_header_font)
+        age_header.setObjectName("dashboardHeader")
+        content_layout.addWidget(age_header)
+
+        self.age_container = QVBoxLayout()
+        self.age_container.setSpacing(8)
+        content_layout.addLayout(self.age_container)
+
+        # === SICHERHEITS-AUDIT ===
+        audit_header_layout = QHBoxLayout()
+        audit_header = QLabel("🛡️ Sicherheits-Audit")
+        audit_header_font = QFont()
+        audit_header_font.setPointSize(16)
+        audit_header_font.setBold(True)
+        audit_header.setFont(audit_header_font)
+        audit_header.setObjectName("dashboardHeader")
+        audit_header_layout.addWidget(audit_header)
+        audit_header_layout.addStretch()
+
+        self.audit_button = QPushButton("Audit starten")
+        self.audit_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.audit_button.clicked.connect(self.toggle_audit)
+        self.audit_button.setObjectName("dashboardButton")
+        audit_header_layout.addWidget(self.audit_button)
+        content_layout.addLayout(audit_header_layout)
+
+        self.audit_progress = QProgressBar()
+        self.audit_progress.setTextVisible(True)
+        self.audit_progress.setFormat("%v / %m")
+        self.audit_progress.hide()
+        content_layout.addWidget(self.audit_progress)
+
+        self.audit_summary = QLabel("Prüft alle Passwörter auf Stärke, Wiederverwendung und Alter.")
+        self.audit_summary.setWordWrap(True)
+        self.audit_summary.setObjectName("dashboardHint")
+        content_layout.addWidget(self.audit_summary)
+
         content_layout.addStretch()
 
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
 
-    def load_statistics(self):
-        """Lädt alle Statistiken"""
-        try:
-            # Gesamt-Einträge
-            all_entries = self.db_manager.get_all_password_entries()
-            self.stat_cards['total'].update_value(str(len(all_entries)))
-
-            # Kategorien
-            categories = self.db_manager.get_all_categories()
-            self.stat_cards['categories'].update_value(str(len(categories)))
-
-            # Letzte 7 Tage
-            recent_count = self._count_recent_entries(all_entries, days=7)
-            self.stat_cards['recent'].update_value(str(recent_count))
+    def showEvent(self, event):
+        """Berechnet Statistiken erst, wenn das Dashboard sichtbar wird"""
+        super().showEvent(event)
+        self.load_statistics()
 
-            # Schwache Passwörter (Platzhalter - braucht Strength-Check)
-            weak_count = self._count_weak_passwords(all_entries)
-            self.stat_cards['weak'].update_value(str(weak_count))
+    def _on_data_changed(self, topic: str):
+        """Aktualisiert veraltete Abschnitte, falls das Dashboard gerade sichtbar ist"""
+        if self.isVisible():
+            QTimer.singleShot(0, self.load_statistics)
+
+    def load_statistics(self, sections=None):
+        """
+        Lädt die Statistiken der angegebenen Abschnitte
+
+        Args:
+            sections: Abschnitte zum Anzeigen; None = nur veraltete oder
+                      noch nie angezeigte Abschnitte
+        """
+        if sections is None:
+            sections = [
+                section for section in VaultStatistics.SECTIONS
+                if section not in self._rendered_sections or self.statistics.is_stale(section)
+            ]
+
+        for section in sections:
+            try:
+                getattr(self, f"_render_{section}")(self.statistics.get(section))
+                self._rendered_sections.add(section)
+            except Exception as e:
+                logger.error(f"Fehler beim Laden der Statistik '{section}': {e}")
+
+    def _render_totals(self, totals):
+        """Zeigt Gesamt-Einträge und Anzahl der Kategorien"""
+        self.stat_cards['total'].update_value(str(totals['entries']))
+        self.stat_cards['categories'].update_value(str(totals['categories']))
+
+    def _render_categories(self, category_counts):
+        """Zeigt die Kategorie-Übersicht"""
+        self._load_category_overview(category_counts)
+
+    def _render_recent(self, recent):
+        """Zeigt neue Einträge der letzten 7 Tage und die letzten Aktivitäten"""
+        self.stat_cards['recent'].update_value(str(recent['count']))
+        self._load_recent_activities(recent['entries'])
+
+    def _render_weak(self, weak_count):
+        """Zeigt die Anzahl schwacher Passwörter"""
+        self.stat_cards['weak'].update_value(str(weak_count))
+
+    def _render_reused(self, reused):
+        """Zeigt die Anzahl der Einträge mit wiederverwendetem Passwort"""
+        self.stat_cards['reused'].update_value(str(reused['entries']))
+
+    def _render_age(self, age_buckets):
+        """Zeigt die Einträge pro Alters-Bucket"""
+        while self.age_container.count():
+            item = self.age_container.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
-            # Lade Kategorie-Übersicht
-            self._load_category_overview(categories, all_entries)
+        for label, count in age_buckets:
+            age_frame = QFrame()
+            age_frame.setObjectName("dashboardRow")
 
-            # Lade Aktivitäten
-            self._load_recent_activities(all_entries)
+            age_layout = QHBoxLayout(age_frame)
 
-        except Exception as e:
-            logger.error(f"Fehler beim Laden der Statistiken: {e}")
+            name_label = QLabel(label)
+            name_label.setObjectName("dashboardRowName")
+            age_layout.addWidget(name_label)
 
-    def _count_recent_entries(self, entries, days: int = 7) -> int:
-        """Zählt Einträge der letzten N Tage"""
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            count = 0
-
-            for entry in entries:
-                if entry.created_at:
-                    # Parse created_at string
-                    try:
-                        created = datetime.fromisoformat(entry.created_at.replace('Z', '+00:00'))
-                        if created >= cutoff_date:
-                            count += 1
-                    except:
-                        pass
-
-            return count
-        except Exception as e:
-            logger.error(f"Fehler beim Zählen recent entries: {e}")
-            return 0
+            age_layout.addStretch()
 
-    def _count_weak_passwords(self, entries) -> int:
-        """Zählt schwache Passwörter"""
-        # TODO: Implementiere echten Strength-Check
-        # Aktuell: Platzhalter mit Längen-Check
-        try:
-            weak_count = 0
-            from ..core.encryption import encryption_manager
-
-            for entry in entries:
-                try:
-                    # Entschlüssele und prüfe Länge
-                    password = encryption_manager.decrypt(entry.encrypted_password)
-                    if len(password) < 8:
-                        weak_count += 1
-                except:
-                    pass
-
-            return weak_count
-        except Exception as e:
-            logger.error(f"Fehler beim Zählen weak passwords: {e}")
-            return 0
+            count_label = QLabel(str(count))
+            count_font = QFont()
+            count_font.setBold(True)
+            count_label.setFont(count_font)
+            count_label.setObjectName("dashboardRowCount")
+            age_layout.addWidget(count_label)
 
-    def _load_category_overview(self, categories, entries):
-        """Lädt Kategorie-Übersicht"""
-        c = theme.get_colors()
+            self.age_container.addWidget(age_frame)
 
+    def _load_category_overview(self, category_counts):
+        """Lädt Kategorie-Übersicht aus (Kategorie, Anzahl)-Paaren"""
         # Clear existing
         while self.category_container.count():
             item = self.category_container.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
 
-        # Zähle Einträge pro Kategorie
-        cat_counts = {}
-        for entry in entries:
-            cat_id = entry.category_id
-            cat_counts[cat_id] = cat_counts.get(cat_id, 0) + 1
-
         # Erstelle Kategorie-Balken
-        for category in categories[:5]:  # Top 5
-            count = cat_counts.get(category.id, 0)
-
+        for category, count in category_counts[:5]:  # Top 5
             cat_frame = QFrame()
-            cat_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {c['background_secondary']};
-                    border: 1px solid {c['surface_border']};
-                    border-radius: 8px;
-                    padding: 12px;
-                }}
-                QFrame:hover {{
-                    background-color: {c['surface_hover']};
-                    border-color: {c['primary']};
-                }}
-            """)
+            cat_frame.setObjectName("dashboardRow")
+            cat_frame.setProperty("clickable", True)
             cat_frame.setCursor(Qt.CursorShape.PointingHandCursor)
 
             cat_layout = QHBoxLayout(cat_frame)
@@ -366,7 +366,7 @@ class Dashboard(QWidget):
 
             # Name
             name_label = QLabel(category.name)
-            name_label.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+            name_label.setObjectName("dashboardRowName")
             cat_layout.addWidget(name_label)
 
             cat_layout.addStretch()
@@ -376,7 +376,7 @@ class Dashboard(QWidget):
             count_font = QFont()
             count_font.setBold(True)
             count_label.setFont(count_font)
-            count_label.setStyleSheet(f"color: {c['primary']}; background: transparent; border: none;")
+            count_label.setObjectName("dashboardRowCount")
             cat_layout.addWidget(count_label)
 
             # Click Handler
@@ -396,62 +396,106 @@ class Dashboard(QWidget):
             item = self.activity_container.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._activity_icons = []
 
-        # Sortiere nach Erstellungsdatum (neueste zuerst)
-        try:
-            sorted_entries = sorted(
-                [e for e in entries if e.created_at],
-                key=lambda x: x.created_at,
-                reverse=True
-            )[:5]  # Top 5
-        except:
-            sorted_entries = entries[:5]
-
-        for entry in sorted_entries:
+        # Einträge kommen bereits nach Erstellungsdatum sortiert aus der Datenbank
+        for entry in entries:
             activity_frame = QFrame()
-            activity_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {c['background_secondary']};
-                    border: 1px solid {c['surface_border']};
-                    border-radius: 8px;
-                    padding: 12px;
-                }}
-                QFrame:hover {{
-                    background-color: {c['surface_hover']};
-                }}
-            """)
+            activity_frame.setObjectName("dashboardRow")
 
             activity_layout = QHBoxLayout(activity_frame)
 
             # Icon
-            icon = icon_provider.get_icon("key", c['text_secondary'], 16)
             icon_label = QLabel()
-            icon_label.setPixmap(icon.pixmap(16, 16))
+            icon_label.setPixmap(icon_provider.get_pixmap("key", c['text_secondary'], 16))
             activity_layout.addWidget(icon_label)
+            self._activity_icons.append(icon_label)
 
             # Name
             name_label = QLabel(entry.name)
-            name_label.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+            name_label.setObjectName("dashboardRowName")
             activity_layout.addWidget(name_label)
 
             activity_layout.addStretch()
 
             # Date
-            if entry.created_at:
-                try:
-                    created = datetime.fromisoformat(entry.created_at.replace('Z', '+00:00'))
-                    date_str = created.strftime("%d.%m.%Y")
-                except:
-                    date_str = "Unbekannt"
-            else:
-                date_str = "Unbekannt"
+            created = entry.created_at
+            date_str = created.strftime("%d.%m.%Y") if created else "Unbekannt"
 
             date_label = QLabel(date_str)
-            date_label.setStyleSheet(f"color: {c['text_secondary']}; background: transparent; border: none;")
+            date_label.setObjectName("dashboardRowDate")
             activity_layout.addWidget(date_label)
 
             self.activity_container.addWidget(activity_frame)
 
+    # ==================== AUDIT ====================
+
+    def toggle_audit(self):
+        """Startet das Audit oder bricht ein laufendes Audit ab"""
+        if self.audit_worker is not None:
+            self.audit_worker.cancel()
+            self.audit_button.setEnabled(False)
+            return
+        self.start_audit()
+
+    def cancel_audit(self):
+        """Bricht ein laufendes Audit ab und wartet auf das Ende des Threads"""
+        if self.audit_worker is None:
+            return
+        self.audit_worker.cancel()
+        self.audit_worker.wait()
+
+    def start_audit(self):
+        """Startet das Passwort-Audit im Hintergrund"""
+        try:
+            rows = self.db_manager.get_entries_for_audit()
+        except Exception as e:
+            logger.error(f"Fehler beim Laden der Einträge für das Audit: {e}")
+            return
+
+        self.audit_worker = AuditWorker(self.audit_engine, rows, self)
+        self.audit_worker.progress.connect(self._on_audit_progress)
+        self.audit_worker.audit_finished.connect(self._on_audit_finished)
+        self.audit_worker.audit_failed.connect(self._on_audit_failed)
+        self.audit_worker.finished.connect(self._on_audit_thread_finished)
+
+        self.audit_progress.setValue(0)
+        self.audit_progress.show()
+        self.audit_button.setText("Abbrechen")
+        self.audit_summary.setText("Audit läuft...")
+        self.audit_worker.start()
+
+    def _on_audit_progress(self, done: int, total: int):
+        """Aktualisiert den Fortschrittsbalken"""
+        self.audit_progress.setMaximum(max(total, 1))
+        self.audit_progress.setValue(done)
+
+    def _on_audit_finished(self, report):
+        """Zeigt das Ergebnis des Audits"""
+        status = "abgebrochen" if report.cancelled else "abgeschlossen"
+        reused_entries = sum(len(group) for group in report.reused_groups)
+        self.audit_summary.setText(
+            f"Audit {status} in {report.duration:.1f}s: "
+            f"{len(report.weak_ids)} schwach, "
+            f"{reused_entries} wiederverwendet ({len(report.reused_groups)} Gruppen), "
+            f"{len(report.old_ids)} älter als {self.audit_engine.max_age_days} Tage"
+            + (f", {len(report.breached_ids)} in Datenlecks" if report.breached_ids else "")
+            + (f", {len(report.failed_ids)} nicht entschlüsselbar" if report.failed_ids else "")
+            + f" — {report.audited} von {report.total} Einträgen neu geprüft."
+        )
+
+    def _on_audit_failed(self, message: str):
+        """Zeigt einen Fehler des Audits"""
+        self.audit_summary.setText(f"Audit fehlgeschlagen: {message}")
+
+    def _on_audit_thread_finished(self):
+        """Setzt die Audit-Steuerung zurück"""
+        self.audit_worker.deleteLater()
+        self.audit_worker = None
+        self.audit_progress.hide()
+        self.audit_button.setText("Audit starten")
+        self.audit_button.setEnabled(True)
+
     def refresh_stats(self):
         """Aktualisiert alle Statistiken"""
         logger.info("Dashboard-Statistiken werden aktualisiert...")
@@ -459,13 +503,23 @@ class Dashboard(QWidget):
         # Animiere Refresh-Button
         animator.press(self.refresh_button)
 
-        # Lade Statistiken neu
-        self.load_statistics()
+        # Nur veraltete Abschnitte neu berechnen
+        stale = self.statistics.stale_sections()
+        self.load_statistics(stale)
 
-        logger.info("Dashboard aktualisiert")
+        logger.info(f"Dashboard aktualisiert ({len(stale)} Abschnitte neu berechnet)")
 
     def update_theme(self):
-        """Aktualisiert Theme-Farben"""
-        # Dashboard wird bei Bedarf neu gerendert
-        self.setup_ui()
-        self.load_statistics()
+        """
+        Aktualisiert Theme-Farben ohne das Dashboard neu aufzubauen
+
+        Farben und Rahmen kommen aus dem globalen Stylesheet; neu gerendert
+        werden nur die Icons.
+        """
+        c = theme.get_colors()
+        for key, _, _, color_key, _, _ in self.STAT_CARDS:
+            self.stat_cards[key].set_icon_color(c[color_key])
+        self.refresh_button.setIcon(icon_provider.get_icon("refresh", c['text_primary'], 18))
+        key_pixmap = icon_provider.get_pixmap("key", c['text_secondary'], 16)
+        for icon_label in self._activity_icons:
+            icon_label.setPixmap(key_pixmap)
@@ -336,7 +336,8 @@ class NewDatabaseDialog(QDialog):
         try:
             # Erstelle Datenbank-Datei
             db_file = DatabaseFile(location)
-            db_file.create_new(password)
+            parameters = master_password_manager.load_calibration()
+            db_file.create_new(password, parameters._asdict())
 
             # Speichere in Einstellungen
             app_settings.set_last_database(location)
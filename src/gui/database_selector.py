@@ -12,6 +12,7 @@ from PyQt6.QtGui import QFont
 from pathlib import Path
 from ..core.settings import app_settings
 from ..core.database_file import DatabaseFile
+from ..core.prefetch import vault_prefetcher
 from .themes import theme
 from .icons import icon_provider
 from .animations import animator
@@ -149,6 +150,7 @@ class DatabaseSelectorDialog(QDialog):
                 }}
             """)
             self.recent_list.itemDoubleClicked.connect(self.on_recent_database_selected)
+            self.recent_list.currentItemChanged.connect(self.on_recent_database_highlighted)
 
             for db_path in recent_databases:
                 if Path(db_path).exists():
@@ -255,9 +257,15 @@ class DatabaseSelectorDialog(QDialog):
 
         return button
 
+    def on_recent_database_highlighted(self, item: QListWidgetItem, _previous=None):
+        """Liest eine markierte Datenbank schon im Hintergrund (vor dem Login)"""
+        if item is not None:
+            vault_prefetcher.prefetch(item.data(Qt.ItemDataRole.UserRole))
+
     def on_recent_database_selected(self, item: QListWidgetItem):
         """Callback wenn kürzlich verwendete Datenbank ausgewählt wurde"""
         db_path = item.data(Qt.ItemDataRole.UserRole)
+        vault_prefetcher.prefetch(db_path)
         self.selected_database_path = db_path
         self.database_selected.emit(db_path)
         self.accept()
@@ -293,6 +301,7 @@ class DatabaseSelectorDialog(QDialog):
                 )
                 return
 
+            vault_prefetcher.prefetch(file_path)
             self.selected_database_path = file_path
             self.database_selected.emit(file_path)
             self.accept()
@@ -0,0 +1,175 @@
+"""
+Cache für wiederverwendbare Dialoge
+
+Große Dialoge (Eintrag, Generator, Einstellungen) werden einmal im Leerlauf
+nach dem Start aufgebaut und danach bei jedem Öffnen wiederverwendet; der
+Aufrufer setzt nur ihren Zustand zurück. Nach längerer Inaktivität und beim
+Sperren werden sie wieder freigegeben. Nach einem Theme-Wechsel werden sie
+erst beim nächsten Öffnen neu aufgebaut.
+"""
+import logging
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QDialog
+from typing import Callable, Dict, List, Optional
+from .themes import theme, ThemeMode
+
+logger = logging.getLogger(__name__)
+
+
+class DialogCache(QObject):
+    """Hält vorab aufgebaute Dialoge zur Wiederverwendung"""
+
+    # Freigabe nach dieser Zeit ohne Zugriff (ms)
+    RELEASE_AFTER_MS = 15 * 60 * 1000
+
+    def __init__(self):
+        super().__init__()
+        self._factories: Dict[str, Callable[[], QDialog]] = {}
+        self._dialogs: Dict[str, QDialog] = {}
+        self._theme_modes: Dict[str, ThemeMode] = {}
+        self._prewarm_queue: List[str] = []
+        self._release_timer: Optional[QTimer] = None
+
+    def register(self, name: str, factory: Callable[[], QDialog]):
+        """
+        Registriert die Factory für einen Dialog
+
+        Ein bereits gecachter Dialog dieses Namens wird verworfen.
+
+        Args:
+            name: Name des Dialogs (z.B. "entry")
+            factory: Erstellt einen neuen Dialog
+        """
+        self._discard(name)
+        self._factories[name] = factory
+
+    def get(self, name: str, factory: Optional[Callable[[], QDialog]] = None) -> QDialog:
+        """
+        Gibt den gecachten Dialog zurück und baut ihn bei Bedarf (neu) auf
+
+        Dialoge, die noch mit den Farben eines anderen Theme-Modus aufgebaut
+        wurden, werden neu erstellt. Der Aufrufer setzt den Zustand zurück.
+
+        Args:
+            name: Name des Dialogs
+            factory: Ersatz-Factory, falls keine registriert ist; solche
+                     Dialoge werden nicht gecacht
+
+        Returns:
+            Der Dialog
+
+        Raises:
+            KeyError: Wenn weder eine Factory registriert noch übergeben wurde
+        """
+        if name not in self._factories:
+            if factory is None:
+                raise KeyError(f"Kein Dialog registriert: {name}")
+            return factory()
+
+        self._restart_release_timer()
+        dialog = self._dialogs.get(name)
+        if dialog is not None and self._theme_modes[name] == theme.current_mode:
+            return dialog
+
+        self._discard(name)
+        return self._build(name)
+
+    def is_cached(self, name: str) -> bool:
+        """Prüft ob ein aktueller Dialog für den Namen gecacht ist"""
+        return name in self._dialogs and self._theme_modes[name] == theme.current_mode
+
+    def prewarm(self):
+        """
+        Baut fehlende oder veraltete Dialoge im Leerlauf auf
+
+        Pro Durchlauf der Event-Loop wird höchstens ein Dialog erstellt, damit
+        Eingaben zwischendurch verarbeitet werden.
+        """
+        pending = [name for name in self._factories
+                   if not self.is_cached(name) and name not in self._prewarm_queue]
+        if not pending:
+            return
+        if not self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+        self._prewarm_queue.extend(pending)
+        self._restart_release_timer()
+
+    def _prewarm_next(self):
+        """Baut den nächsten Dialog der Prewarm-Warteschlange auf"""
+        while self._prewarm_queue:
+            name = self._prewarm_queue.pop(0)
+            if name not in self._factories or self.is_cached(name):
+                continue
+            dialog = self._dialogs.get(name)
+            if dialog is not None and dialog.isVisible():
+                continue
+
+            self._discard(name)
+            self._build(name)
+            break
+
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def discard_stale(self, mode: ThemeMode):
+        """
+        Zerstört sofort alle nicht sichtbaren Dialoge, die nicht für `mode` aufgebaut wurden
+
+        Vor einem Theme-Wechsel aufrufen: sonst wendet Qt das neue
+        App-Stylesheet noch auf die versteckten Dialoge an, die get() beim
+        nächsten Öffnen ohnehin neu aufbaut.
+
+        Args:
+            mode: Theme-Modus, zu dem gewechselt wird
+        """
+        for name in list(self._dialogs):
+            dialog = self._dialogs[name]
+            if self._theme_modes[name] == mode or dialog.isVisible():
+                continue
+            self._discard(name)
+            # deleteLater() allein wirkt erst nach dem Wechsel
+            QCoreApplication.sendPostedEvents(dialog, QEvent.Type.DeferredDelete.value)
+
+    def release(self):
+        """Gibt alle nicht sichtbaren Dialoge frei"""
+        self._prewarm_queue.clear()
+        for name in list(self._dialogs):
+            if not self._dialogs[name].isVisible():
+                self._discard(name)
+        if self._dialogs:
+            self._restart_release_timer()
+        else:
+            logger.debug("Gecachte Dialoge freigegeben")
+
+    def _build(self, name: str) -> QDialog:
+        """Erstellt einen Dialog mit der registrierten Factory und cacht ihn"""
+        dialog = self._factories[name]()
+        self._dialogs[name] = dialog
+        self._theme_modes[name] = theme.current_mode
+        dialog.destroyed.connect(lambda: self._forget(name, dialog))
+        return dialog
+
+    def _forget(self, name: str, dialog: QDialog):
+        """Entfernt einen zerstörten Dialog aus dem Cache"""
+        if self._dialogs.get(name) is dialog:
+            del self._dialogs[name]
+            del self._theme_modes[name]
+
+    def _discard(self, name: str):
+        """Verwirft den gecachten Dialog eines Namens"""
+        dialog = self._dialogs.pop(name, None)
+        self._theme_modes.pop(name, None)
+        if dialog is not None:
+            dialog.deleteLater()
+
+    def _restart_release_timer(self):
+        """Startet den Inaktivitäts-Timer neu"""
+        if self._release_timer is None:
+            self._release_timer = QTimer(self)
+            self._release_timer.setSingleShot(True)
+            self._release_timer.timeout.connect(self.release)
+        self._release_timer.start(self.RELEASE_AFTER_MS)
+
+
+# Globale Instanz
+dialog_cache = DialogCache()
@@ -11,6 +11,10 @@ from PyQt6.QtGui import QFont
 from typing import Optional, List
 from ..core.models import PasswordEntry, Category
 from ..core.encryption import encryption_manager
+from ..core.statistics import analyze_password
+from ..core.totp_manager import totp_manager
+from ..password.breach import breach_checker
+from ..password.strength import password_strength_checker, PasswordStrength
 from .generator_dialog import PasswordGeneratorDialog
 from .themes import theme
 from .icons import icon_provider
@@ -32,23 +36,79 @@ class PasswordEntryDialog(QDialog):
         self.is_edit_mode = entry is not None
         self.password_visible = False
         self.setup_ui()
+        self.reset(categories, entry)
 
+    def reset(self, categories: List[Category], entry: Optional[PasswordEntry] = None):
+        """
+        Setzt den Dialog für ein erneutes Öffnen zurück
+
+        Der Dialog wird wiederverwendet (siehe dialog_cache); hier werden
+        Titel, Kategorien und alle Felder auf den neuen Eintrag gesetzt.
+
+        Args:
+            categories: Verfügbare Kategorien
+            entry: Zu bearbeitender Eintrag oder None für einen neuen Eintrag
+        """
+        self.categories = categories
+        self.entry = entry
+        self.is_edit_mode = entry is not None
+
+        c = theme.get_colors()
+        title = "Eintrag bearbeiten" if self.is_edit_mode else "Neuer Eintrag"
+        self.setWindowTitle(title)
+        self.title_label.setText(title)
+        icon_name = "edit" if self.is_edit_mode else "plus"
+        self.header_icon_label.setPixmap(
+            icon_provider.get_pixmap(icon_name, c['primary'], self.header_icon_label.width())
+        )
+
+        self.category_combo.clear()
+        for category in categories:
+            self.category_combo.addItem(category.name, category.id)
+
+        self.clear_fields()
         if self.is_edit_mode:
             self.load_entry_data()
 
-        # Fade-in Animation
-        QTimer.singleShot(50, lambda: self.animate_in())
+    def clear_fields(self):
+        """Leert alle Felder, damit keine Klartexte im gecachten Dialog verbleiben"""
+        for field in (self.name_input, self.username_input, self.password_input,
+                      self.website_input, self.totp_input):
+            field.clear()
+        self.notes_input.clear()
+
+        if self.password_visible:
+            self.toggle_password_visibility()
+        self.strength_label.hide()
+        self.breach_label.hide()
+
+    def showEvent(self, event):
+        """Startet Eingangs-Animation und Fokus bei jedem Öffnen"""
+        super().showEvent(event)
+        QTimer.singleShot(50, self.animate_in)
+        QTimer.singleShot(100, self.name_input.setFocus)
+
+    def done(self, result: int):
+        """Schließt den Dialog und leert die Felder"""
+        super().done(result)
+        self.clear_fields()
 
     def animate_in(self):
-        """Animiert den Dialog beim Öffnen"""
-        if hasattr(self, 'header_container'):
-            animator.fade_in(self.header_container, 250)
-        if hasattr(self, 'form_container'):
-            QTimer.singleShot(50, lambda: animator.fade_in(self.form_container, 250))
-        if hasattr(self, 'notes_container'):
-            QTimer.singleShot(100, lambda: animator.fade_in(self.notes_container, 250))
-        if hasattr(self, 'button_container'):
-            QTimer.singleShot(150, lambda: animator.fade_in(self.button_container, 250))
+        """Animiert den Dialog beim Öffnen (Bereiche im Abstand von 50 ms)"""
+        self._fade_sections = [self.header_container, self.form_container,
+                               self.notes_container, self.button_container]
+        self._fade_in_next_section()
+
+    def _fade_in_next_section(self):
+        """
+        Blendet den nächsten Bereich ein
+
+        Als gebundene Methode verfällt der Timer, falls der gecachte Dialog
+        inzwischen verworfen wurde.
+        """
+        if self._fade_sections:
+            animator.fade_in(self._fade_sections.pop(0), 250)
+            QTimer.singleShot(50, self._fade_in_next_section)
 
     def setup_ui(self):
         """Erstellt das moderne, kompakte UI"""
@@ -57,13 +117,13 @@ class PasswordEntryDialog(QDialog):
         self.setModal(True)
 
         # Feste kompakte Größe
-        self.setMinimumSize(500, 580)
-        self.resize(500, 580)
+        self.setMinimumSize(500, 620)
+        self.resize(500, 620)
 
         # Zentriere auf Bildschirm
         screen_info = responsive.get_screen_info()
         x = (screen_info['screen_width'] - 500) // 2
-        y = (screen_info['screen_height'] - 580) // 2
+        y = (screen_info['screen_height'] - 620) // 2
         self.move(x, y)
 
         fonts = responsive.get_font_sizes()
@@ -88,6 +148,7 @@ class PasswordEntryDialog(QDialog):
         icon_label.setPixmap(icon_pixmap)
         icon_label.setFixedSize(icon_size, icon_size)
         header_layout.addWidget(icon_label)
+        self.header_icon_label = icon_label
 
         title_label = QLabel(title)
         title_font = QFont()
@@ -96,6 +157,7 @@ class PasswordEntryDialog(QDialog):
         title_label.setFont(title_font)
         title_label.setStyleSheet(f"color: {c['text_primary']};")
         header_layout.addWidget(title_label)
+        self.title_label = title_label
         header_layout.addStretch()
 
         main_layout.addWidget(self.header_container)
@@ -152,8 +214,6 @@ class PasswordEntryDialog(QDialog):
         category_label.setStyleSheet(label_style)
         self.category_combo = QComboBox()
         self.category_combo.setStyleSheet(input_style)
-        for category in self.categories:
-            self.category_combo.addItem(category.name, category.id)
         form_layout.addRow(category_label, self.category_combo)
 
         # Username
@@ -224,6 +284,20 @@ class PasswordEntryDialog(QDialog):
 
         form_layout.addRow(password_label, password_container)
 
+        # Live-Stärke-Anzeige (gecachte Schätzung, siehe password_strength_checker.estimate)
+        self.strength_label = QLabel()
+        self.strength_label.hide()
+        form_layout.addRow("", self.strength_label)
+        self.password_input.textChanged.connect(self.update_strength_hint)
+
+        # Datenleck-Warnung (nur mit lokalem Corpus, siehe Einstellungen)
+        self.breach_label = QLabel()
+        self.breach_label.setWordWrap(True)
+        self.breach_label.setStyleSheet(f"color: {c['danger']}; font-size: 12px; background: transparent; border: none;")
+        self.breach_label.hide()
+        form_layout.addRow("", self.breach_label)
+        self.password_input.textChanged.connect(self.update_breach_warning)
+
         # Website
         website_label = QLabel("Website:")
         website_label.setStyleSheet(label_style)
@@ -232,6 +306,15 @@ class PasswordEntryDialog(QDialog):
         self.website_input.setStyleSheet(input_style)
         form_layout.addRow(website_label, self.website_input)
 
+        # 2FA-Secret (optional, für TOTP-Codes in der Liste)
+        totp_label = QLabel("2FA-Secret:")
+        totp_label.setStyleSheet(label_style)
+        self.totp_input = QLineEdit()
+        self.totp_input.setPlaceholderText("Base32-Secret oder otpauth://-Link (optional)")
+        self.totp_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.totp_input.setStyleSheet(input_style)
+        form_layout.addRow(totp_label, self.totp_input)
+
         main_layout.addWidget(self.form_container)
 
         # === NOTIZEN ===
@@ -329,9 +412,6 @@ class PasswordEntryDialog(QDialog):
 
         main_layout.addWidget(self.button_container)
 
-        # Fokus
-        QTimer.singleShot(100, lambda: self.name_input.setFocus())
-
     def toggle_password_visibility(self):
         """Toggle Passwort-Sichtbarkeit mit Icon-Wechsel"""
         c = theme.get_colors()
@@ -348,10 +428,46 @@ class PasswordEntryDialog(QDialog):
             self.toggle_password_button.setIcon(eye_icon)
 
     def open_generator(self):
-        """Öffnet den Passwort-Generator"""
-        generator_dialog = PasswordGeneratorDialog(self)
+        """Öffnet den (gecachten) Passwort-Generator"""
+        from .dialog_cache import dialog_cache
+        generator_dialog = dialog_cache.get("generator", lambda: PasswordGeneratorDialog(self))
+        generator_dialog.reset()
         generator_dialog.password_generated.connect(self.on_password_generated)
-        generator_dialog.exec()
+        try:
+            generator_dialog.exec()
+        finally:
+            generator_dialog.password_generated.disconnect(self.on_password_generated)
+
+    def update_strength_hint(self, password: str):
+        """Zeigt Stärke und geschätzte Entropie des eingegebenen Passworts"""
+        if not password:
+            self.strength_label.hide()
+            return
+
+        c = theme.get_colors()
+        estimate = password_strength_checker.estimate(password)
+        if estimate.strength == PasswordStrength.WEAK:
+            color = c['danger']
+        elif estimate.strength == PasswordStrength.MEDIUM:
+            color = c['warning']
+        else:
+            color = c['secondary']
+
+        self.strength_label.setText(f"Stärke: {estimate.strength.value} (~{estimate.entropy_bits:.0f} Bit)")
+        self.strength_label.setStyleSheet(f"color: {color}; font-size: 12px; background: transparent; border: none;")
+        self.strength_label.show()
+
+    def update_breach_warning(self, password: str):
+        """Prüft das Passwort beim Tippen gegen den lokalen Datenleck-Corpus"""
+        # Ohne Corpus liefert check() sofort 0 (Corpus kann in den Einstellungen wechseln)
+        count = breach_checker.check(password)
+        if count:
+            self.breach_label.setText(
+                f"⚠️ Dieses Passwort ist in bekannten Datenlecks enthalten ({count:,}× gefunden)".replace(",", ".")
+            )
+            self.breach_label.show()
+        else:
+            self.breach_label.hide()
 
     def on_password_generated(self, password: str):
         """Callback für generiertes Passwort mit Animation"""
@@ -377,9 +493,21 @@ class PasswordEntryDialog(QDialog):
         notes = self.notes_input.toPlainText().strip()
         category_id = self.category_combo.currentData()
 
+        totp_secret = self.totp_input.text().strip()
+        if totp_secret:
+            try:
+                totp_secret = totp_manager.normalize_secret(totp_secret)
+            except ValueError as e:
+                QMessageBox.warning(self, "Fehler", str(e))
+                animator.shake(self.totp_input, 8, 50, 3)
+                return
+
         try:
             encrypted_password = encryption_manager.encrypt(password)
             encrypted_notes = encryption_manager.encrypt(notes) if notes else None
+            encrypted_totp = encryption_manager.encrypt(totp_secret) if totp_secret else None
+            # Auswertung jetzt, solange der Klartext vorliegt
+            strength_score, reuse_fingerprint = analyze_password(password)
 
             if self.is_edit_mode:
                 self.entry.name = name
@@ -388,6 +516,9 @@ class PasswordEntryDialog(QDialog):
                 self.entry.encrypted_notes = encrypted_notes
                 self.entry.website_url = website
                 self.entry.category_id = category_id
+                self.entry.strength_score = strength_score
+                self.entry.reuse_fingerprint = reuse_fingerprint
+                self.entry.encrypted_totp = encrypted_totp
             else:
                 self.entry = PasswordEntry(
                     id=None,
@@ -396,7 +527,10 @@ class PasswordEntryDialog(QDialog):
                     username=username,
                     encrypted_password=encrypted_password,
                     encrypted_notes=encrypted_notes,
-                    website_url=website
+                    website_url=website,
+                    strength_score=strength_score,
+                    reuse_fingerprint=reuse_fingerprint,
+                    encrypted_totp=encrypted_totp
                 )
 
             self.entry_saved.emit(self.entry)
@@ -429,6 +563,13 @@ class PasswordEntryDialog(QDialog):
             except Exception as e:
                 logger.error(f"Fehler beim Entschlüsseln der Notizen: {e}")
 
+        # 2FA-Secret entschlüsseln
+        if self.entry.encrypted_totp:
+            try:
+                self.totp_input.setText(encryption_manager.decrypt(self.entry.encrypted_totp))
+            except Exception as e:
+                logger.error(f"Fehler beim Entschlüsseln des 2FA-Secrets: {e}")
+
         # Kategorie setzen
         for i in range(self.category_combo.count()):
             if self.category_combo.itemData(i) == self.entry.category_id:
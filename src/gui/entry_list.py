@@ -0,0 +1,682 @@
+"""
+Virtualisierte Eintragsliste (Model/View)
+
+Statt eines PasswordEntryWidget pro Eintrag hält EntryListModel nur die
+PasswordEntry-Objekte, und EntryDelegate zeichnet ausschließlich die gerade
+sichtbaren Zeilen. Pro Eintrag entstehen keine QObjects; Speicher und
+Zeichenaufwand beim Scrollen hängen nicht von der Anzahl der Einträge ab.
+
+Die Aktionen (Anzeigen, Kopieren, Bearbeiten, Löschen) erscheinen beim
+Überfahren einer Zeile und werden über die Klick-Position erkannt.
+
+TOTP-Codes aktualisiert wie bisher totp_ticker im Sekundentakt: angemeldet
+ist die View, die dann nur sichtbare Zeilen mit TOTP-Secret neu zeichnet.
+"""
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from PyQt6.QtWidgets import (
+    QAbstractScrollArea, QListView, QStyledItemDelegate, QStyle, QStyleOptionViewItem, QToolTip, QFrame
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QEvent, QPoint, QRect, QRectF, QSize, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
+from ..core.models import PasswordEntry
+from ..core.encryption import encryption_manager
+from ..utils.clipboard import clipboard_manager
+from .themes import theme
+from .icons import icon_provider
+from .totp_ticker import totp_ticker
+
+logger = logging.getLogger(__name__)
+
+# Daten-Rollen des Models
+ENTRY_ROLE = Qt.ItemDataRole.UserRole + 1
+PLACEHOLDER_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Aktionen beim Überfahren: (Kennung, Icon, Tooltip, Hover-Farbe)
+ACTION_REVEAL = "reveal"
+ACTION_COPY = "copy"
+ACTION_EDIT = "edit"
+ACTION_DELETE = "delete"
+ACTION_COPY_TOTP = "copy_totp"
+ROW_ACTIONS = (
+    (ACTION_REVEAL, "eye", "Passwort anzeigen/verstecken", "primary"),
+    (ACTION_COPY, "copy", "Passwort kopieren", "secondary"),
+    (ACTION_EDIT, "edit", "Bearbeiten", "warning"),
+    (ACTION_DELETE, "trash", "Löschen", "danger"),
+)
+
+HIDDEN_PASSWORD = "••••••••••••"
+TOTP_PLACEHOLDER = "••• •••"
+DECRYPT_ERROR = "❌ Fehler beim Entschlüsseln"
+
+# Dauer der Bestätigung nach dem Kopieren
+COPY_FEEDBACK_MS = 1500
+
+
+class EntryListModel(QAbstractListModel):
+    """
+    Listen-Model der angezeigten Einträge
+
+    Am Ende können Platzhalter-Zeilen stehen, solange Einträge noch laden.
+    Angezeigte Passwörter und TOTP-Generatoren werden pro Eintrag gehalten und
+    beim Sperren mit clear_secrets() verworfen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[PasswordEntry] = []
+        self._placeholders = 0
+        self._totp_rows = 0
+        self._revealed: Dict[int, str] = {}   # Entry-ID -> Klartext (oder Fehlertext)
+        self._totp: Dict[bytes, object] = {}  # Verschlüsseltes Secret -> CachedTOTP (None = ungültig)
+        self._copied: Optional[int] = None    # Entry-ID mit Kopier-Bestätigung
+
+    # ==================== QAbstractListModel ====================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._entries) + self._placeholders
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._entries):
+            return True if role == PLACEHOLDER_ROLE else None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._entries[row].name
+        if role == ENTRY_ROLE:
+            return self._entries[row]
+        if role == PLACEHOLDER_ROLE:
+            return False
+        return None
+
+    # ==================== Inhalt ====================
+
+    def set_entries(self, entries: Sequence[PasswordEntry], placeholders: int = 0):
+        """
+        Ersetzt alle Einträge (angezeigte Passwörter werden wieder versteckt)
+
+        Args:
+            entries: Anzuzeigende Einträge (wird kopiert)
+            placeholders: Anzahl Platzhalter-Zeilen am Ende
+        """
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._placeholders = placeholders
+        self._totp_rows = sum(1 for entry in self._entries if entry.encrypted_totp)
+        self._revealed.clear()
+        self._copied = None
+        self.endResetModel()
+
+    def append_entries(self, entries: Sequence[PasswordEntry]):
+        """
+        Hängt Einträge vor den Platzhaltern an (schrittweises Laden)
+
+        Args:
+            entries: Neue Einträge
+        """
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self._totp_rows += sum(1 for entry in entries if entry.encrypted_totp)
+        self.endInsertRows()
+
+    def set_placeholders(self, count: int):
+        """
+        Setzt die Anzahl der Platzhalter-Zeilen
+
+        Args:
+            count: Neue Anzahl (0 entfernt alle)
+        """
+        first = len(self._entries)
+        if count < self._placeholders:
+            self.beginRemoveRows(QModelIndex(), first + count, first + self._placeholders - 1)
+            self._placeholders = count
+            self.endRemoveRows()
+        elif count > self._placeholders:
+            self.beginInsertRows(QModelIndex(), first + self._placeholders, first + count - 1)
+            self._placeholders = count
+            self.endInsertRows()
+
+    def entry_count(self) -> int:
+        """Anzahl Einträge ohne Platzhalter"""
+        return len(self._entries)
+
+    def placeholder_count(self) -> int:
+        """Anzahl Platzhalter-Zeilen"""
+        return self._placeholders
+
+    def entry_at(self, row: int) -> Optional[PasswordEntry]:
+        """Gibt den Eintrag einer Zeile zurück (None für Platzhalter)"""
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def has_totp(self) -> bool:
+        """Prüft ob mindestens ein Eintrag ein TOTP-Secret hat"""
+        return self._totp_rows > 0
+
+    def _row_changed(self, row: int):
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    # ==================== Geheimnisse ====================
+
+    def revealed_password(self, entry: PasswordEntry) -> Optional[str]:
+        """Gibt das angezeigte Passwort zurück (None = versteckt)"""
+        return self._revealed.get(entry.id)
+
+    def toggle_revealed(self, row: int) -> bool:
+        """
+        Zeigt das Passwort einer Zeile an oder versteckt es wieder
+
+        Args:
+            row: Zeile
+
+        Returns:
+            True wenn das Passwort jetzt angezeigt wird
+        """
+        entry = self.entry_at(row)
+        if entry is None:
+            return False
+
+        if entry.id in self._revealed:
+            del self._revealed[entry.id]
+            visible = False
+        else:
+            try:
+                self._revealed[entry.id] = encryption_manager.decrypt(entry.encrypted_password)
+            except Exception:
+                self._revealed[entry.id] = DECRYPT_ERROR
+            visible = True
+        self._row_changed(row)
+        return visible
+
+    def totp_for(self, entry: PasswordEntry):
+        """
+        Gibt den TOTP-Generator eines Eintrags zurück (Secret wird beim ersten Bedarf entschlüsselt)
+
+        Args:
+            entry: Eintrag mit encrypted_totp
+
+        Returns:
+            CachedTOTP oder None bei ungültigem Secret
+        """
+        token = entry.encrypted_totp
+        if token not in self._totp:
+            from ..core.totp_manager import totp_manager
+            try:
+                self._totp[token] = totp_manager.get_totp(encryption_manager.decrypt(token))
+            except Exception:
+                self._totp[token] = None
+        return self._totp[token]
+
+    def is_copied(self, entry: PasswordEntry) -> bool:
+        """Prüft ob für den Eintrag gerade die Kopier-Bestätigung angezeigt wird"""
+        return self._copied is not None and self._copied == entry.id
+
+    def mark_copied(self, row: int):
+        """Zeigt die Kopier-Bestätigung für eine Zeile an"""
+        entry = self.entry_at(row)
+        if entry is None:
+            return
+        self._copied = entry.id
+        self._row_changed(row)
+        QTimer.singleShot(COPY_FEEDBACK_MS, lambda entry_id=entry.id: self._clear_copied(entry_id))
+
+    def _clear_copied(self, entry_id: int):
+        if self._copied != entry_id:
+            return
+        self._copied = None
+        for row, entry in enumerate(self._entries):
+            if entry.id == entry_id:
+                self._row_changed(row)
+                break
+
+    def clear_secrets(self):
+        """Verwirft angezeigte Passwörter und TOTP-Generatoren (z.B. beim Sperren)"""
+        self._revealed.clear()
+        self._totp.clear()
+        self._copied = None
+        if self._entries:
+            self.dataChanged.emit(self.index(0), self.index(len(self._entries) - 1))
+
+
+class EntryDelegate(QStyledItemDelegate):
+    """Zeichnet eine Eintrags-Karte und erkennt Klicks auf ihre Aktionen"""
+
+    edit_requested = pyqtSignal(PasswordEntry)
+    delete_requested = pyqtSignal(PasswordEntry)
+
+    ROW_HEIGHT = 156      # Karte plus Abstand
+    ROW_SPACING = 10
+    PADDING = 20
+    ACTION_SIZE = 36
+    ACTION_SPACING = 8
+    RADIUS = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover_pos: Optional[QPoint] = None  # Mausposition im Viewport (von der View gesetzt)
+        self._device_pixel_ratio = 1.0  # Pixel-Dichte des aktuellen Zeichenvorgangs
+
+        self.name_font = QFont()
+        self.name_font.setPointSize(14)
+        self.name_font.setBold(True)
+        self.text_font = QFont()
+        self.text_font.setPixelSize(13)
+        self.small_font = QFont()
+        self.small_font.setPixelSize(12)
+        self.mono_font = QFont('Consolas', 12)
+        self.mono_bold_font = QFont('Consolas', 12)
+        self.mono_bold_font.setBold(True)
+
+    def _pixmap(self, name: str, color: str, size: int) -> QPixmap:
+        """Gerendertes Icon aus dem Cache des icon_provider (passend zur Pixel-Dichte)"""
+        return icon_provider.get_pixmap(name, color, size, self._device_pixel_ratio)
+
+    # ==================== Geometrie ====================
+
+    def card_rect(self, row_rect: QRect) -> QRect:
+        """Rechteck der Karte innerhalb der Zeile"""
+        return row_rect.adjusted(1, 1, -1, -self.ROW_SPACING - 1)
+
+    def action_rects(self, row_rect: QRect) -> List[Tuple[str, QRect]]:
+        """Rechtecke der Aktions-Buttons (rechts oben in der Karte)"""
+        card = self.card_rect(row_rect)
+        right = card.right() - self.PADDING + 1
+        top = card.top() + 14
+        rects = []
+        for action, _, _, _ in reversed(ROW_ACTIONS):
+            left = right - self.ACTION_SIZE
+            rects.append((action, QRect(left, top, self.ACTION_SIZE, self.ACTION_SIZE)))
+            right = left - self.ACTION_SPACING
+        rects.reverse()
+        return rects
+
+    def totp_copy_rect(self, row_rect: QRect) -> QRect:
+        """Klickfläche des TOTP-Codes (Code, Countdown und Kopier-Icon)"""
+        card = self.card_rect(row_rect)
+        return QRect(card.left() + self.PADDING, card.top() + 112, 190, 24)
+
+    def action_at(self, row_rect: QRect, pos: QPoint, entry: Optional[PasswordEntry]) -> Optional[str]:
+        """
+        Ermittelt die Aktion unter einer Position
+
+        Args:
+            row_rect: Rechteck der Zeile
+            pos: Position im Viewport
+            entry: Eintrag der Zeile (None für Platzhalter)
+
+        Returns:
+            ACTION_* oder None
+        """
+        if entry is None:
+            return None
+        for action, rect in self.action_rects(row_rect):
+            if rect.contains(pos):
+                return action
+        if entry.encrypted_totp and self.totp_copy_rect(row_rect).contains(pos):
+            return ACTION_COPY_TOTP
+        return None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    # ==================== Zeichnen ====================
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        c = theme.get_colors()
+        self._device_pixel_ratio = painter.device().devicePixelRatio()
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if index.data(PLACEHOLDER_ROLE):
+            self._paint_placeholder(painter, option.rect, c)
+            painter.restore()
+            return
+
+        model = index.model()
+        entry: PasswordEntry = index.data(ENTRY_ROLE)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = self.card_rect(option.rect)
+        left = card.left() + self.PADDING
+        right = card.right() - self.PADDING
+
+        # Karte
+        painter.setPen(QPen(QColor(c['primary'] if hovered else c['surface_border']), 2))
+        painter.setBrush(QColor(c['surface_hover'] if hovered else c['surface']))
+        painter.drawRoundedRect(QRectF(card), self.RADIUS, self.RADIUS)
+
+        # Erste Zeile: Icon, Name und (beim Überfahren) Aktionen
+        painter.drawPixmap(left, card.top() + 22, self._pixmap("key", c['primary'], 20))
+        actions_width = len(ROW_ACTIONS) * (self.ACTION_SIZE + self.ACTION_SPACING)
+        name_rect = QRect(left + 30, card.top() + 14, right - left - 30 - actions_width, 36)
+        painter.setFont(self.name_font)
+        painter.setPen(QColor(c['text_primary']))
+        self._draw_elided(painter, name_rect, entry.name)
+
+        revealed = model.revealed_password(entry)
+        if hovered:
+            self._paint_actions(painter, option.rect, entry, revealed is not None, model.is_copied(entry), c)
+
+        # Benutzername
+        if entry.username:
+            painter.drawPixmap(left, card.top() + 57, self._pixmap("user", c['text_tertiary'], 14))
+            painter.setFont(self.text_font)
+            painter.setPen(QColor(c['text_secondary']))
+            self._draw_elided(painter, QRect(left + 22, card.top() + 54, right - left - 22, 20), entry.username)
+
+        # Passwort (versteckt oder angezeigt)
+        password_rect = QRect(left, card.top() + 80, right - left, 32)
+        painter.setPen(QPen(QColor(c['primary']), 2) if revealed is not None else Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(c['background_tertiary']))
+        painter.drawRoundedRect(QRectF(password_rect), 8, 8)
+        if revealed is None:
+            painter.setFont(self.mono_font)
+            painter.setPen(QColor(c['text_tertiary']))
+            text = HIDDEN_PASSWORD
+        else:
+            painter.setFont(self.mono_bold_font)
+            painter.setPen(QColor(c['danger'] if revealed == DECRYPT_ERROR else c['text_primary']))
+            text = revealed
+        self._draw_elided(painter, password_rect.adjusted(14, 0, -14, 0), text)
+
+        # Letzte Zeile: TOTP-Code und Website
+        x = left
+        bottom = QRect(left, card.top() + 112, right - left, 24)
+        if entry.encrypted_totp:
+            x = self._paint_totp(painter, bottom, entry, model, c) + 24
+        if entry.website_url:
+            painter.drawPixmap(x, bottom.top() + 5, self._pixmap("link", c['primary'], 14))
+            painter.setFont(self.small_font)
+            painter.setPen(QColor(c['primary']))
+            self._draw_elided(painter, QRect(x + 22, bottom.top(), right - x - 22, bottom.height()),
+                              entry.website_url)
+
+        painter.restore()
+
+    def _draw_elided(self, painter: QPainter, rect: QRect, text: str):
+        """Zeichnet einspaltigen Text, bei Platzmangel mit Auslassungszeichen"""
+        if rect.width() <= 0:
+            return
+        elided = QFontMetrics(painter.font()).elidedText(text, Qt.TextElideMode.ElideRight, rect.width())
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+
+    def _paint_actions(self, painter: QPainter, row_rect: QRect, entry: PasswordEntry,
+                       revealed: bool, copied: bool, c: dict):
+        """Zeichnet die Aktions-Buttons einer überfahrenen Zeile"""
+        hover_action = self.action_at(row_rect, self.hover_pos, entry) if self.hover_pos else None
+
+        for (action, icon, _, hover_color), (_, rect) in zip(ROW_ACTIONS, self.action_rects(row_rect)):
+            active = action == hover_action or (action == ACTION_COPY and copied)
+            if active:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(c[hover_color]))
+            else:
+                painter.setPen(QPen(QColor(c['surface_border']), 2))
+                painter.setBrush(QColor(c['background_tertiary']))
+            painter.drawRoundedRect(QRectF(rect), 10, 10)
+
+            if action == ACTION_REVEAL and revealed:
+                icon = "eye_off"
+            elif action == ACTION_COPY and copied:
+                icon = "check"
+            pixmap = self._pixmap(icon, "white" if active else c['text_secondary'], 18)
+            painter.drawPixmap(rect.left() + 9, rect.top() + 9, pixmap)
+
+    def _paint_totp(self, painter: QPainter, rect: QRect, entry: PasswordEntry,
+                    model: EntryListModel, c: dict) -> int:
+        """Zeichnet TOTP-Code und Countdown, gibt die rechte Kante zurück"""
+        painter.drawPixmap(rect.left(), rect.top() + 5, self._pixmap("shield", c['text_tertiary'], 14))
+        x = rect.left() + 22
+
+        totp = model.totp_for(entry)
+        if totp is None:
+            text, countdown = "❌ Ungültiges Secret", ""
+        else:
+            now = time.time()
+            code = totp.at_counter(totp.counter(now))
+            middle = len(code) // 2
+            text, countdown = f"{code[:middle]} {code[middle:]}", f"{totp.remaining_seconds(now)}s"
+
+        painter.setFont(self.mono_bold_font)
+        painter.setPen(QColor(c['primary']))
+        width = QFontMetrics(self.mono_bold_font).horizontalAdvance(text)
+        painter.drawText(QRect(x, rect.top(), width, rect.height()), Qt.AlignmentFlag.AlignVCenter, text)
+        x += width + 8
+
+        if countdown:
+            painter.setFont(self.small_font)
+            painter.setPen(QColor(c['text_tertiary']))
+            width = QFontMetrics(self.small_font).horizontalAdvance(countdown)
+            painter.drawText(QRect(x, rect.top(), width, rect.height()), Qt.AlignmentFlag.AlignVCenter, countdown)
+            x += width + 8
+            painter.drawPixmap(x, rect.top() + 5, self._pixmap("copy", c['text_secondary'], 14))
+            x += 14
+        return x
+
+    def _paint_placeholder(self, painter: QPainter, row_rect: QRect, c: dict):
+        """Zeichnet eine Platzhalter-Karte mit grauen Balken"""
+        card = self.card_rect(row_rect)
+        painter.setPen(QPen(QColor(c['surface_border']), 2))
+        painter.setBrush(QColor(c['surface']))
+        painter.drawRoundedRect(QRectF(card), self.RADIUS, self.RADIUS)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(c['background_tertiary']))
+        left = card.left() + self.PADDING
+        for top, width in ((24, 180), (56, 120), (84, card.width() - 2 * self.PADDING)):
+            painter.drawRoundedRect(QRectF(left, card.top() + top, width, 14), 7, 7)
+
+    # ==================== Interaktion ====================
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        entry = model.entry_at(index.row())
+        action = self.action_at(option.rect, event.position().toPoint(), entry)
+        if action is None:
+            return False
+        self.trigger(action, model, index.row())
+        return True
+
+    def trigger(self, action: str, model: EntryListModel, row: int):
+        """
+        Führt eine Aktion für eine Zeile aus
+
+        Bearbeiten und Löschen werden erst nach dem Klick-Event gemeldet, da
+        beide das Model neu befüllen können.
+
+        Args:
+            action: ACTION_*
+            model: EntryListModel
+            row: Zeile
+        """
+        entry = model.entry_at(row)
+        if entry is None:
+            return
+
+        if action == ACTION_REVEAL:
+            model.toggle_revealed(row)
+        elif action == ACTION_COPY:
+            try:
+                clipboard_manager.copy_to_clipboard(
+                    encryption_manager.decrypt(entry.encrypted_password), auto_clear_seconds=30
+                )
+            except Exception as e:
+                logger.error(f"Fehler beim Kopieren: {e}")
+                return
+            model.mark_copied(row)
+        elif action == ACTION_COPY_TOTP:
+            totp = model.totp_for(entry)
+            if totp is not None:
+                clipboard_manager.copy_to_clipboard(totp.now(), auto_clear_seconds=30)
+        elif action == ACTION_EDIT:
+            QTimer.singleShot(0, lambda: self.edit_requested.emit(entry))
+        elif action == ACTION_DELETE:
+            QTimer.singleShot(0, lambda: self.delete_requested.emit(entry))
+
+    def helpEvent(self, event, view, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.Type.ToolTip:
+            action = self.action_at(option.rect, event.pos(), index.model().entry_at(index.row()))
+            tooltips = {action_id: tooltip for action_id, _, tooltip, _ in ROW_ACTIONS}
+            tooltips[ACTION_COPY_TOTP] = "2FA-Code kopieren"
+            if action is not None:
+                QToolTip.showText(event.globalPos(), tooltips[action], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class EntryListView(QListView):
+    """Virtualisierte Liste der Passwort-Einträge"""
+
+    edit_clicked = pyqtSignal(PasswordEntry)
+    delete_clicked = pyqtSignal(PasswordEntry)
+
+    EMPTY_TEXT = "Keine Einträge vorhanden"
+
+    # Nach diesen Ereignissen legt QAbstractItemView alle Zeilen neu aus (O(n)).
+    # Zeilenhöhe und Abstände sind hier fest (EntryDelegate), Stylesheet und
+    # Schrift ändern nur das Aussehen: Scrollbereich anpassen und neu zeichnen.
+    STYLE_EVENTS = (QEvent.Type.StyleChange, QEvent.Type.FontChange)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entry_model = EntryListModel(self)
+        self.delegate = EntryDelegate(self)
+        self.setModel(self.entry_model)
+        self.setItemDelegate(self.delegate)
+
+        # Alle Zeilen gleich hoch: Layout ohne sizeHint pro Zeile
+        self.setUniformItemSizes(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)  # Zeilenbreite folgt dem Viewport
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(2000)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+
+        self._hover_action: Optional[Tuple[int, Optional[str]]] = None
+
+        self.delegate.edit_requested.connect(self.edit_clicked)
+        self.delegate.delete_requested.connect(self.delete_clicked)
+        self.entry_model.modelReset.connect(self._update_ticker_registration)
+        self.entry_model.rowsInserted.connect(self._update_ticker_registration)
+
+        # Hintergrund kommt aus dem globalen Stylesheet (QListView#entryList)
+        self.setObjectName("entryList")
+
+    def apply_theme(self):
+        """Zeichnet die Zeilen mit den Farben des aktuellen Themes neu"""
+        self.viewport().update()
+
+    # ==================== Inhalt ====================
+
+    def set_entries(self, entries: Sequence[PasswordEntry], placeholders: int = 0):
+        """Zeigt die Einträge an (siehe EntryListModel.set_entries)"""
+        self.entry_model.set_entries(entries, placeholders)
+
+    def append_entries(self, entries: Sequence[PasswordEntry]):
+        """Hängt geladene Einträge an (siehe EntryListModel.append_entries)"""
+        self.entry_model.append_entries(entries)
+
+    def set_placeholders(self, count: int):
+        """Setzt die Anzahl der Platzhalter-Zeilen"""
+        self.entry_model.set_placeholders(count)
+
+    # ==================== TOTP (totp_ticker) ====================
+
+    def _update_ticker_registration(self):
+        if self.entry_model.has_totp():
+            totp_ticker.register(self)
+        else:
+            totp_ticker.unregister(self)
+
+    def visible_rows(self) -> range:
+        """Bereich der aktuell sichtbaren Zeilen"""
+        count = self.entry_model.rowCount()
+        if count == 0:
+            return range(0)
+        first = self.indexAt(QPoint(0, 0)).row()
+        last = self.indexAt(QPoint(0, self.viewport().height() - 1)).row()
+        return range(max(first, 0), (last if last >= 0 else count - 1) + 1)
+
+    def update_totp(self, now: float):
+        """Zeichnet sichtbare Zeilen mit TOTP-Secret neu (aufgerufen von totp_ticker)"""
+        for row in self.visible_rows():
+            entry = self.entry_model.entry_at(row)
+            if entry is not None and entry.encrypted_totp:
+                self.viewport().update(self.visualRect(self.entry_model.index(row)))
+
+    def reset_totp(self):
+        """Verwirft TOTP-Generatoren und angezeigte Passwörter (z.B. beim Sperren)"""
+        self.entry_model.clear_secrets()
+
+    # ==================== Events ====================
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        self.delegate.hover_pos = pos
+        index = self.indexAt(pos)
+        action = None
+        if index.isValid():
+            action = self.delegate.action_at(self.visualRect(index), pos, self.entry_model.entry_at(index.row()))
+
+        # Nur neu zeichnen, wenn sich die Aktion unter der Maus ändert
+        hover_action = (index.row(), action)
+        if hover_action != self._hover_action:
+            if index.isValid():
+                self.viewport().update(self.visualRect(index))
+            self._hover_action = hover_action
+            if action is None:
+                self.viewport().unsetCursor()
+            else:
+                self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        super().mouseMoveEvent(event)
+
+    def event(self, event) -> bool:
+        if event.type() in self.STYLE_EVENTS:
+            handled = QAbstractScrollArea.event(self, event)
+            self.updateGeometries()
+            self.viewport().update()
+            return handled
+        return super().event(event)
+
+    def viewportEvent(self, event) -> bool:
+        if event.type() in self.STYLE_EVENTS:
+            return QAbstractScrollArea.viewportEvent(self, event)
+        return super().viewportEvent(event)
+
+    def leaveEvent(self, event):
+        self.delegate.hover_pos = None
+        self._hover_action = None
+        self.viewport().unsetCursor()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        if self.entry_model.rowCount() == 0:
+            c = theme.get_colors()
+            painter = QPainter(self.viewport())
+            font = QFont()
+            font.setPixelSize(16)
+            painter.setFont(font)
+            painter.setPen(QColor(c['text_tertiary']))
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, self.EMPTY_TEXT)
+            painter.end()
+            return
+        super().paintEvent(event)
@@ -3,17 +3,26 @@ Passwort-Generator Dialog mit modernem Design und Animationen
 """
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QSlider, QCheckBox, QProgressBar, QFrame, QSizePolicy
+    QPushButton, QSlider, QCheckBox, QProgressBar, QFrame, QSizePolicy,
+    QButtonGroup, QComboBox, QWidget
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 from ..password.generator import password_generator
-from ..password.strength import password_strength_checker, PasswordStrength
+from ..password.passphrase import passphrase_generator, WORDLISTS, SEPARATORS, MIN_WORDS, MAX_WORDS
+from ..password.strength import password_strength_checker, PasswordStrength, StrengthEstimate
 from .themes import theme
 from .animations import animator
 from .icons import icon_provider
 
 
+# Standard-Wortanzahl für Passphrasen (~77 Bit mit 7776 Wörtern)
+DEFAULT_WORD_COUNT = 6
+
+MODE_PASSWORD = 0
+MODE_PASSPHRASE = 1
+
+
 class PasswordGeneratorDialog(QDialog):
     """Moderner Dialog zum Generieren von sicheren Passwörtern mit Apple-Design"""
 
@@ -25,6 +34,21 @@ class PasswordGeneratorDialog(QDialog):
         self.setup_ui()
         self.generate_password()
 
+    def reset(self):
+        """
+        Bereitet den wiederverwendeten Dialog auf ein erneutes Öffnen vor
+
+        Die gewählten Optionen bleiben erhalten, es wird ein neues Passwort erzeugt.
+        """
+        self.reset_copy_button()
+        self.generate_password()
+
+    def done(self, result: int):
+        """Schließt den Dialog und verwirft das angezeigte Passwort"""
+        super().done(result)
+        self.current_password = ""
+        self.password_display.clear()
+
     def setup_ui(self):
         """Erstellt das moderne, kompakte UI des Generator-Dialogs"""
         self.setWindowTitle("Passwort Generieren")
@@ -202,6 +226,42 @@ class PasswordGeneratorDialog(QDialog):
         options_layout.setSpacing(12)
         options_layout.setContentsMargins(16, 16, 16, 16)
 
+        # Modus: zufälliges Passwort oder Passphrase
+        mode_layout = QHBoxLayout()
+        mode_layout.setSpacing(0)
+        mode_button_style = f"""
+            QPushButton {{
+                background-color: {c['background_tertiary']};
+                color: {c['text_primary']};
+                border: 2px solid {c['surface_border']};
+                padding: 8px 16px;
+                font-size: 13px;
+                font-weight: 600;
+            }}
+            QPushButton:checked {{
+                background-color: {c['primary']};
+                border-color: {c['primary']};
+                color: white;
+            }}
+        """
+        self.mode_group = QButtonGroup(self)
+        for index, text in enumerate(("Passwort", "Passphrase")):
+            button = QPushButton(text)
+            button.setCheckable(True)
+            button.setChecked(index == 0)
+            button.setCursor(Qt.CursorShape.PointingHandCursor)
+            button.setStyleSheet(mode_button_style)
+            self.mode_group.addButton(button, index)
+            mode_layout.addWidget(button)
+        self.mode_group.idClicked.connect(self.on_mode_changed)
+        options_layout.addLayout(mode_layout)
+
+        self.password_options = QWidget()
+        self.password_options.setStyleSheet("background: transparent; border: none;")
+        password_options_layout = QVBoxLayout(self.password_options)
+        password_options_layout.setSpacing(12)
+        password_options_layout.setContentsMargins(0, 0, 0, 0)
+
         # Längen-Kontrolle
         length_container = QVBoxLayout()
         length_container.setSpacing(6)
@@ -268,13 +328,13 @@ class PasswordGeneratorDialog(QDialog):
         min_max_layout.addWidget(max_label)
         length_container.addLayout(min_max_layout)
 
-        options_layout.addLayout(length_container)
+        password_options_layout.addLayout(length_container)
 
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setStyleSheet(f"background-color: {c['surface_border']}; border: none; max-height: 1px;")
-        options_layout.addWidget(separator)
+        password_options_layout.addWidget(separator)
 
         # Zeichenoptionen
         chars_title = QLabel("Zeichenoptionen")
@@ -283,7 +343,7 @@ class PasswordGeneratorDialog(QDialog):
         chars_title_font.setBold(True)
         chars_title.setFont(chars_title_font)
         chars_title.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
-        options_layout.addWidget(chars_title)
+        password_options_layout.addWidget(chars_title)
 
         # Checkboxen mit modernem Design
         checkbox_style = f"""
@@ -324,28 +384,98 @@ class PasswordGeneratorDialog(QDialog):
         self.uppercase_check.setCursor(Qt.CursorShape.PointingHandCursor)
         self.uppercase_check.stateChanged.connect(self.on_options_changed)
         self.uppercase_check.setStyleSheet(checkbox_style)
-        options_layout.addWidget(self.uppercase_check)
+        password_options_layout.addWidget(self.uppercase_check)
 
         self.lowercase_check = QCheckBox("Kleinbuchstaben (a-z)")
         self.lowercase_check.setChecked(True)
         self.lowercase_check.setCursor(Qt.CursorShape.PointingHandCursor)
         self.lowercase_check.stateChanged.connect(self.on_options_changed)
         self.lowercase_check.setStyleSheet(checkbox_style)
-        options_layout.addWidget(self.lowercase_check)
+        password_options_layout.addWidget(self.lowercase_check)
 
         self.digits_check = QCheckBox("Zahlen (0-9)")
         self.digits_check.setChecked(True)
         self.digits_check.setCursor(Qt.CursorShape.PointingHandCursor)
         self.digits_check.stateChanged.connect(self.on_options_changed)
         self.digits_check.setStyleSheet(checkbox_style)
-        options_layout.addWidget(self.digits_check)
+        password_options_layout.addWidget(self.digits_check)
 
         self.special_check = QCheckBox("Sonderzeichen (!@#$%^&*)")
         self.special_check.setChecked(True)
         self.special_check.setCursor(Qt.CursorShape.PointingHandCursor)
         self.special_check.stateChanged.connect(self.on_options_changed)
         self.special_check.setStyleSheet(checkbox_style)
-        options_layout.addWidget(self.special_check)
+        password_options_layout.addWidget(self.special_check)
+
+        options_layout.addWidget(self.password_options)
+
+        # Passphrasen-Optionen
+        self.passphrase_options = QWidget()
+        self.passphrase_options.setStyleSheet("background: transparent; border: none;")
+        passphrase_layout = QVBoxLayout(self.passphrase_options)
+        passphrase_layout.setSpacing(12)
+        passphrase_layout.setContentsMargins(0, 0, 0, 0)
+
+        words_header = QHBoxLayout()
+        words_title = QLabel("Anzahl Wörter")
+        words_title.setFont(length_title_font)
+        words_title.setStyleSheet(f"color: {c['text_primary']}; background: transparent; border: none;")
+        words_header.addWidget(words_title)
+        self.word_count_label = QLabel(str(DEFAULT_WORD_COUNT))
+        self.word_count_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.word_count_label.setFont(length_value_font)
+        self.word_count_label.setStyleSheet(f"color: {c['primary']}; background: transparent; border: none;")
+        words_header.addWidget(self.word_count_label)
+        passphrase_layout.addLayout(words_header)
+
+        self.word_count_slider = QSlider(Qt.Orientation.Horizontal)
+        self.word_count_slider.setMinimum(MIN_WORDS)
+        self.word_count_slider.setMaximum(MAX_WORDS)
+        self.word_count_slider.setValue(DEFAULT_WORD_COUNT)
+        self.word_count_slider.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.word_count_slider.setStyleSheet(self.length_slider.styleSheet())
+        self.word_count_slider.valueChanged.connect(self.on_options_changed)
+        passphrase_layout.addWidget(self.word_count_slider)
+
+        combo_style = f"""
+            QComboBox {{
+                background-color: {c['background_tertiary']};
+                color: {c['text_primary']};
+                border: 2px solid {c['surface_border']};
+                border-radius: 8px;
+                padding: 6px 10px;
+            }}
+        """
+        choices_layout = QHBoxLayout()
+        self.wordlist_combo = QComboBox()
+        for key, (label, _filename) in WORDLISTS.items():
+            self.wordlist_combo.addItem(label, key)
+        self.wordlist_combo.setStyleSheet(combo_style)
+        self.wordlist_combo.currentIndexChanged.connect(self.on_options_changed)
+        choices_layout.addWidget(self.wordlist_combo)
+
+        self.separator_combo = QComboBox()
+        for separator in SEPARATORS:
+            self.separator_combo.addItem("Leerzeichen" if separator == " " else separator, separator)
+        self.separator_combo.setStyleSheet(combo_style)
+        self.separator_combo.currentIndexChanged.connect(self.on_options_changed)
+        choices_layout.addWidget(self.separator_combo)
+        passphrase_layout.addLayout(choices_layout)
+
+        self.capitalize_check = QCheckBox("Wörter groß schreiben")
+        self.capitalize_check.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.capitalize_check.stateChanged.connect(self.on_options_changed)
+        self.capitalize_check.setStyleSheet(checkbox_style)
+        passphrase_layout.addWidget(self.capitalize_check)
+
+        self.add_digit_check = QCheckBox("Zahl einfügen")
+        self.add_digit_check.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.add_digit_check.stateChanged.connect(self.on_options_changed)
+        self.add_digit_check.setStyleSheet(checkbox_style)
+        passphrase_layout.addWidget(self.add_digit_check)
+
+        self.passphrase_options.hide()
+        options_layout.addWidget(self.passphrase_options)
 
         main_layout.addWidget(options_section)
 
@@ -437,13 +567,24 @@ class PasswordGeneratorDialog(QDialog):
 
         main_layout.addLayout(button_layout)
 
+    def on_mode_changed(self, mode: int):
+        """Wechselt zwischen Passwort- und Passphrasen-Modus"""
+        self.password_options.setVisible(mode == MODE_PASSWORD)
+        self.passphrase_options.setVisible(mode == MODE_PASSPHRASE)
+        self.generate_password()
+
     def on_options_changed(self):
         """Wird aufgerufen, wenn sich die Generator-Optionen ändern"""
         self.length_label.setText(str(self.length_slider.value()))
+        self.word_count_label.setText(str(self.word_count_slider.value()))
         self.generate_password()
 
     def generate_password(self):
         """Generiert ein neues Passwort basierend auf den Optionen"""
+        if self.mode_group.checkedId() == MODE_PASSPHRASE:
+            self.generate_passphrase()
+            return
+
         try:
             length = self.length_slider.value()
             options = {
@@ -470,11 +611,40 @@ class PasswordGeneratorDialog(QDialog):
         except Exception as e:
             self.password_display.setText(f"Fehler: {str(e)}")
 
-    def update_strength_display(self, password: str):
-        """Aktualisiert die Passwort-Stärke-Anzeige mit Animation"""
+    def generate_passphrase(self):
+        """Generiert eine Passphrase; die Stärke folgt direkt aus der exakten Entropie"""
+        try:
+            passphrase = passphrase_generator.generate(
+                word_count=self.word_count_slider.value(),
+                wordlist=self.wordlist_combo.currentData(),
+                separator=self.separator_combo.currentData(),
+                capitalize=self.capitalize_check.isChecked(),
+                add_digit=self.add_digit_check.isChecked()
+            )
+            self.current_password = passphrase.text
+            self.password_display.setText(passphrase.text)
+            self.password_display.setCursorPosition(0)
+
+            animator.pulse(self.password_display, 1.02, 150)
+
+            self.update_strength_display(passphrase.text, passphrase_generator.estimate(passphrase))
+
+        except Exception as e:
+            self.password_display.setText(f"Fehler: {str(e)}")
+
+    def update_strength_display(self, password: str, estimate: StrengthEstimate = None):
+        """
+        Aktualisiert die Passwort-Stärke-Anzeige mit Animation
+
+        Args:
+            password: Das angezeigte Passwort
+            estimate: Bereits bekannte Bewertung (z.B. exakte Passphrasen-Entropie);
+                      None = Schätzung über password_strength_checker
+        """
         c = theme.get_colors()
-        strength = password_strength_checker.check_strength(password)
-        percentage = password_strength_checker.get_strength_percentage(password)
+        if estimate is None:
+            estimate = password_strength_checker.estimate(password)
+        strength, percentage = estimate.strength, estimate.percentage
 
         # Animiere Progress Bar
         animation = QPropertyAnimation(self.strength_bar, b"value")
@@ -485,7 +655,7 @@ class PasswordGeneratorDialog(QDialog):
         animation.start()
         self._strength_animation = animation
 
-        self.strength_label.setText(strength.value)
+        self.strength_label.setText(f"{strength.value} (~{estimate.entropy_bits:.0f} Bit)")
 
         # Farbe basierend auf Stärke
         if strength == PasswordStrength.WEAK:
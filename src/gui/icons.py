@@ -2,11 +2,26 @@
 Icon-System mit SVG-Icons für gestochen scharfe Darstellung
 
 Verwendet inline SVG-Icons die auf jedem Display gestochen scharf sind.
+Gerenderte Pixmaps landen in einem LRU-Cache (Name, Farbe, Größe,
+Device-Pixel-Ratio), häufige Icons werden für beide Themes vorgerendert.
 """
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
+import logging
+from collections import OrderedDict
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QGuiApplication
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtCore import QByteArray, QSize
-from typing import Dict
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IconCacheInfo(NamedTuple):
+    """Trefferstatistik des Icon-Caches"""
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    hit_rate: float
 
 
 class IconProvider:
@@ -178,8 +193,39 @@ class IconProvider:
         """,
     }
 
-    @classmethod
-    def get_icon(cls, name: str, color: str = "#000000", size: int = 24) -> QIcon:
+    # Maximale Anzahl gerenderter Pixmaps im Cache
+    CACHE_SIZE = 256
+
+    # Häufige Icons (Name, Theme-Farbschlüssel oder Farbe, Größe), werden für beide Themes vorgerendert
+    COMMON_ICONS = (
+        ("key", "primary", 20),
+        ("user", "text_tertiary", 14),
+        ("link", "primary", 14),
+        ("shield", "text_tertiary", 14),
+        ("copy", "text_secondary", 14),
+        ("eye", "text_secondary", 18),
+        ("eye_off", "text_secondary", 18),
+        ("copy", "text_secondary", 18),
+        ("edit", "text_secondary", 18),
+        ("trash", "text_secondary", 18),
+        ("eye", "white", 18),
+        ("copy", "white", 18),
+        ("edit", "white", 18),
+        ("trash", "white", 18),
+        ("check", "white", 18),
+        ("lock", "text_primary", 20),
+    )
+
+    def __init__(self):
+        # LRU-Cache: (Name, Farbe, Größe, Device-Pixel-Ratio) -> QPixmap
+        self._cache: "OrderedDict[Tuple[str, str, int, float], QPixmap]" = OrderedDict()
+        self._device_pixel_ratio: Optional[float] = None
+        self._watched_screens: Set[int] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get_icon(self, name: str, color: str = "#000000", size: int = 24,
+                 device_pixel_ratio: Optional[float] = None) -> QIcon:
         """
         Erstellt ein QIcon aus einem SVG-String
 
@@ -187,61 +233,138 @@ class IconProvider:
             name: Name des Icons (z.B. "lock", "eye", "copy")
             color: Farbe des Icons als Hex-String (z.B. "#6366f1")
             size: Größe des Icons in Pixeln
+            device_pixel_ratio: Pixel-Dichte (Standard: primärer Bildschirm)
 
         Returns:
             QIcon-Objekt
         """
-        if name not in cls.ICONS:
-            # Fallback zu einem Standard-Icon
-            name = "key"
-
-        # Ersetze Farb-Platzhalter
-        svg_string = cls.ICONS[name].format(color=color)
-
-        # Erstelle QSvgRenderer
-        svg_bytes = QByteArray(svg_string.encode('utf-8'))
-        renderer = QSvgRenderer(svg_bytes)
-
-        # Erstelle Pixmap
-        pixmap = QPixmap(QSize(size, size))
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
-
-        # Rendere SVG
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
+        return QIcon(self.get_pixmap(name, color, size, device_pixel_ratio))
 
-        return QIcon(pixmap)
-
-    @classmethod
-    def get_pixmap(cls, name: str, color: str = "#000000", size: int = 24) -> QPixmap:
+    def get_pixmap(self, name: str, color: str = "#000000", size: int = 24,
+                   device_pixel_ratio: Optional[float] = None) -> QPixmap:
         """
-        Erstellt ein QPixmap aus einem SVG-String
+        Gibt ein gerendertes Icon zurück (aus dem Cache, falls vorhanden)
+
+        QPixmap ist implizit geteilt; Aufrufer erhalten eine Kopie, die den
+        Cache-Eintrag nicht verändert.
 
         Args:
             name: Name des Icons
             color: Farbe des Icons
-            size: Größe in Pixeln
+            size: Größe in logischen Pixeln
+            device_pixel_ratio: Pixel-Dichte (Standard: primärer Bildschirm)
 
         Returns:
             QPixmap-Objekt
         """
-        if name not in cls.ICONS:
+        if name not in self.ICONS:
+            # Fallback zu einem Standard-Icon
             name = "key"
-
-        svg_string = cls.ICONS[name].format(color=color)
-        svg_bytes = QByteArray(svg_string.encode('utf-8'))
-        renderer = QSvgRenderer(svg_bytes)
-
-        pixmap = QPixmap(QSize(size, size))
-        pixmap.fill(QColor(0, 0, 0, 0))
+        if device_pixel_ratio is None:
+            device_pixel_ratio = self.device_pixel_ratio()
+
+        key = (name, color, size, device_pixel_ratio)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return QPixmap(pixmap)
+
+        self.misses += 1
+        pixmap = self._render(name, color, size, device_pixel_ratio)
+        self._cache[key] = pixmap
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return QPixmap(pixmap)
+
+    def _render(self, name: str, color: str, size: int, device_pixel_ratio: float) -> QPixmap:
+        """Rendert das SVG in der physischen Pixelgröße"""
+        svg_string = self.ICONS[name].format(color=color)
+        renderer = QSvgRenderer(QByteArray(svg_string.encode('utf-8')))
+
+        physical_size = max(1, round(size * device_pixel_ratio))
+        pixmap = QPixmap(QSize(physical_size, physical_size))
+        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
 
         painter = QPainter(pixmap)
         renderer.render(painter)
         painter.end()
 
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
         return pixmap
 
+    def device_pixel_ratio(self) -> float:
+        """Pixel-Dichte des primären Bildschirms (wird bei Änderungen aktualisiert)"""
+        if self._device_pixel_ratio is None:
+            self._device_pixel_ratio = 1.0
+            app = QGuiApplication.instance()
+            screen = app.primaryScreen() if app is not None else None
+            if screen is not None:
+                self._device_pixel_ratio = screen.devicePixelRatio()
+                self._watch_screens(app)
+        return self._device_pixel_ratio
+
+    def _watch_screens(self, app: QGuiApplication):
+        """Verbindet Bildschirm-Signale, damit DPR-Wechsel erkannt werden"""
+        if not self._watched_screens:
+            app.primaryScreenChanged.connect(self._on_screen_changed)
+            app.screenAdded.connect(lambda screen: self._watch_screens(app))
+        for screen in app.screens():
+            if id(screen) not in self._watched_screens:
+                self._watched_screens.add(id(screen))
+                screen.logicalDotsPerInchChanged.connect(self._on_screen_changed)
+                screen.physicalDotsPerInchChanged.connect(self._on_screen_changed)
+
+    def _on_screen_changed(self, *args):
+        """Übernimmt eine geänderte Pixel-Dichte; alte Einträge verdrängt der LRU-Cache"""
+        previous = self._device_pixel_ratio
+        self._device_pixel_ratio = None
+        if self.device_pixel_ratio() != previous:
+            logger.info(f"Device-Pixel-Ratio geändert: {previous} -> {self._device_pixel_ratio}")
+            self.prewarm()
+
+    def prewarm(self, palettes: Optional[Iterable[Dict[str, str]]] = None,
+                device_pixel_ratio: Optional[float] = None) -> int:
+        """
+        Rendert COMMON_ICONS für die angegebenen Farbpaletten vor
+
+        Args:
+            palettes: Theme-Farben (Standard: Light und Dark Mode)
+            device_pixel_ratio: Pixel-Dichte (Standard: primärer Bildschirm)
+
+        Returns:
+            Anzahl neu gerenderter Icons
+        """
+        if palettes is None:
+            from .themes import Theme
+            palettes = (Theme.LIGHT, Theme.DARK)
+
+        # Vorrendern zählt nicht in die Trefferquote
+        hits, misses = self.hits, self.misses
+        for colors in palettes:
+            for name, color, size in self.COMMON_ICONS:
+                self.get_pixmap(name, colors.get(color, color), size, device_pixel_ratio)
+        rendered = self.misses - misses
+        self.hits, self.misses = hits, misses
+        return rendered
+
+    def cache_info(self) -> IconCacheInfo:
+        """Trefferstatistik des Caches"""
+        lookups = self.hits + self.misses
+        return IconCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._cache),
+            max_size=self.CACHE_SIZE,
+            hit_rate=self.hits / lookups if lookups else 0.0
+        )
+
+    def clear_cache(self):
+        """Leert den Cache und setzt die Zähler zurück"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
 
 # Globale Instanz
 icon_provider = IconProvider()
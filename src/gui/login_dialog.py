@@ -1,16 +1,17 @@
 """
 Login-Dialog für Master-Passwort (für bestehende Datenbanken)
 """
+from typing import List, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QMessageBox, QFrame, QInputDialog
+    QPushButton, QMessageBox, QFrame, QInputDialog, QProgressBar
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
-from ..auth.master_password import master_password_manager
-from ..core.database import DatabaseManager
 from ..core.encryption import encryption_manager
-from ..core.totp_manager import totp_manager
+from ..core.prefetch import vault_prefetcher
+from ..testing.performance import startup_timeline
+from .workers import UnlockWorker
 from .themes import theme
 from .icons import icon_provider
 from .animations import animator
@@ -22,10 +23,16 @@ class LoginDialog(QDialog):
 
     login_successful = pyqtSignal(str)  # Emit password when successful
 
-    def __init__(self, db_path: str, parent=None):
+    def __init__(self, db_path: str, parent=None, upgrade: bool = True):
         super().__init__(parent)
         self.db_path = db_path
+        self.upgrade = upgrade  # False beim erneuten Entsperren eines geöffneten Tresors
         self.master_password = None
+        self.db_manager = None  # DatabaseManager nach erfolgreichem Login
+        self.unlock_worker: Optional[UnlockWorker] = None
+        self._abandoned_workers: List[UnlockWorker] = []
+        # Datei schon lesen, während das Passwort eingegeben wird
+        vault_prefetcher.prefetch(db_path)
         self.setup_ui()
 
     def setup_ui(self):
@@ -160,6 +167,39 @@ class LoginDialog(QDialog):
         """)
         main_layout.addWidget(self.login_button)
 
+        # Fortschritt und Abbruch während des Entsperrens
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setStyleSheet(f"color: {c['text_secondary']}; font-size: {fonts['small']}px;")
+        self.status_label.hide()
+        main_layout.addWidget(self.status_label)
+
+        self.unlock_progress = QProgressBar()
+        self.unlock_progress.setTextVisible(False)
+        self.unlock_progress.setMaximumHeight(6)
+        self.unlock_progress.hide()
+        main_layout.addWidget(self.unlock_progress)
+
+        self.cancel_button = QPushButton("Abbrechen")
+        self.cancel_button.setMinimumHeight(spacing['button_height'])
+        self.cancel_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_button.clicked.connect(self.cancel_unlock)
+        self.cancel_button.setStyleSheet(f"""
+            QPushButton {{
+                font-size: {fonts['button']}px;
+                font-weight: 600;
+                background-color: {c['background_tertiary']};
+                color: {c['text_primary']};
+                border: 2px solid {c['surface_border']};
+                border-radius: 12px;
+            }}
+            QPushButton:hover {{
+                background-color: {c['surface_hover']};
+            }}
+        """)
+        self.cancel_button.hide()
+        main_layout.addWidget(self.cancel_button)
+
         # Fokus auf Passwort-Feld nach kurzer Verzögerung
         QTimer.singleShot(100, lambda: self.password_input.setFocus())
 
@@ -175,93 +215,162 @@ class LoginDialog(QDialog):
 
     def verify_master_password(self, password: str):
         """
-        Überprüft das eingegebene Master-Passwort
+        Startet das Entsperren mit dem eingegebenen Passwort im Hintergrund
+
+        Datei lesen, entschlüsseln, SQLite öffnen und Argon2-Prüfung laufen im
+        UnlockWorker; der UI-Thread erhält nur die fertige Sitzung.
 
         Args:
             password: Das eingegebene Passwort
         """
-        try:
-            # Versuche Datenbank mit Passwort zu öffnen
-            db_manager = DatabaseManager(self.db_path, password)
-
-            # Hole Master-Passwort Hash aus Datenbank
-            stored_hash = db_manager.get_master_password_hash()
-
-            if stored_hash is None:
-                # Keine Hash vorhanden - erste Verwendung nach Erstellung
-                # Speichere Hash
-                password_hash = master_password_manager.hash_password(password)
-                db_manager.save_master_password_hash(password_hash)
-
-            else:
-                # Verifiziere Passwort
-                if not master_password_manager.verify_password(password, stored_hash):
-                    db_manager.close()
-                    raise ValueError("Falsches Passwort")
-
-            # Prüfe ob 2FA aktiviert ist
-            if db_manager.has_totp_enabled():
-                encrypted_secret = db_manager.get_totp_secret()
-                if encrypted_secret:
-                    # Entschlüssle Secret
-                    totp_secret = totp_manager.decrypt_secret(encrypted_secret)
-
-                    # Schließe temporäre Verbindung vor Dialog
-                    db_manager.close()
-
-                    # Fordere TOTP-Code vom Benutzer
-                    totp_code, ok = QInputDialog.getText(
-                        self,
-                        "Zwei-Faktor-Authentifizierung",
-                        "Gib den 6-stelligen Code aus deiner\nAuthenticator-App ein:",
-                        QLineEdit.EchoMode.Normal
-                    )
-
-                    if not ok or not totp_code:
-                        # Benutzer hat abgebrochen
-                        return
-
-                    # Verifiziere TOTP-Code
-                    if not totp_manager.verify_code(totp_secret, totp_code.strip()):
-                        QMessageBox.warning(
-                            self,
-                            "Fehler",
-                            "Ungültiger 2FA-Code. Bitte versuche es erneut."
-                        )
-                        self.password_input.clear()
-                        return
-
-                    # 2FA erfolgreich
-            else:
-                # Kein 2FA - schließe Verbindung
-                db_manager.close()
-
-            # Setze Encryption Manager
-            encryption_manager.set_master_password(password)
-
-            # Speichere Passwort für Hauptfenster
-            self.master_password = password
-
-            self.login_successful.emit(password)
-            self.accept()
-
-        except ValueError as e:
-            QMessageBox.warning(
-                self,
-                "Fehler",
-                "Falsches Master-Passwort."
-            )
+        if self.unlock_worker is not None:
+            return
+        startup_timeline.mark("password_submitted")
+
+        self.unlock_worker = UnlockWorker(self.db_path, password, self, upgrade=self.upgrade)
+        self.unlock_worker.stage_changed.connect(self._on_unlock_stage)
+        self.unlock_worker.unlock_finished.connect(self._on_unlock_finished)
+        self.unlock_worker.wrong_password.connect(self._on_wrong_password)
+        self.unlock_worker.unlock_failed.connect(self._on_unlock_failed)
+        self.unlock_worker.finished.connect(self._on_unlock_thread_finished)
+
+        self._set_busy(True)
+        self.unlock_worker.start()
+
+    def _set_busy(self, busy: bool):
+        """Schaltet zwischen Eingabe und Fortschrittsanzeige um"""
+        self.password_input.setEnabled(not busy)
+        self.login_button.setVisible(not busy)
+        self.cancel_button.setVisible(busy)
+        self.unlock_progress.setVisible(busy)
+        self.status_label.setVisible(busy)
+        if busy:
+            self.unlock_progress.setValue(0)
+            self.status_label.setText("Entsperren...")
+
+    def cancel_unlock(self):
+        """Bricht das laufende Entsperren ab (der Worker beendet sich nach der aktuellen Stufe)"""
+        worker = self.unlock_worker
+        if worker is None:
+            return
+        worker.cancel()
+        self._detach_worker(worker)
+        self._set_busy(False)
+        self.password_input.setFocus()
+
+    def _detach_worker(self, worker: UnlockWorker):
+        """Löst den Worker vom Dialog; er läuft ggf. noch bis zur nächsten Stufe weiter"""
+        for signal in (worker.stage_changed, worker.unlock_finished,
+                       worker.wrong_password, worker.unlock_failed):
+            signal.disconnect()
+        self._abandoned_workers.append(worker)
+        worker.finished.connect(lambda worker=worker: self._abandoned_workers.remove(worker))
+        self.unlock_worker = None
+
+    def _on_unlock_stage(self, index: int, total: int, label: str):
+        """Zeigt die aktuelle Stufe"""
+        self.unlock_progress.setMaximum(total)
+        self.unlock_progress.setValue(index)
+        self.status_label.setText(label)
+
+    def _on_unlock_finished(self, session):
+        """
+        Übernimmt die entsperrte Sitzung (im UI-Thread)
+
+        Args:
+            session: UnlockSession aus dem Worker
+        """
+        if session.totp_secret is not None and not self.verify_totp(session.totp_secret):
+            session.db_manager.close()
             self.password_input.clear()
-            self.password_input.setFocus()
-            animator.shake(self.password_input, 10, 50, 3)
+            return
+
+        # Setze Encryption Manager auf den Datenschlüssel des Tresors
+        encryption_manager.set_session_key(session.data_key)
+
+        # Speichere Passwort und geöffnete Datenbank für das Hauptfenster
+        self.master_password = self.password_input.text()
+        self.db_manager = session.db_manager
 
-        except Exception as e:
-            QMessageBox.critical(
+        self.login_successful.emit(self.master_password)
+        self.accept()
+
+    def verify_totp(self, totp_secret: str) -> bool:
+        """
+        Fragt den 2FA-Code ab und prüft ihn
+
+        Args:
+            totp_secret: Entschlüsseltes TOTP-Secret
+
+        Returns:
+            True wenn der Code gültig ist
+        """
+        totp_code, ok = QInputDialog.getText(
+            self,
+            "Zwei-Faktor-Authentifizierung",
+            "Gib den 6-stelligen Code aus deiner\nAuthenticator-App ein:",
+            QLineEdit.EchoMode.Normal
+        )
+
+        if not ok or not totp_code:
+            # Benutzer hat abgebrochen
+            return False
+
+        from ..core.totp_manager import totp_manager
+        if not totp_manager.verify_code(totp_secret, totp_code.strip()):
+            QMessageBox.warning(
                 self,
                 "Fehler",
-                f"Fehler beim Öffnen der Datenbank:\n{str(e)}"
+                "Ungültiger 2FA-Code. Bitte versuche es erneut."
             )
-            self.reject()
+            return False
+
+        return True
+
+    def _on_wrong_password(self):
+        """Zeigt einen Fehler bei falschem Master-Passwort"""
+        QMessageBox.warning(
+            self,
+            "Fehler",
+            "Falsches Master-Passwort."
+        )
+        self.password_input.clear()
+        self.password_input.setFocus()
+        animator.shake(self.password_input, 10, 50, 3)
+        # Für den nächsten Versuch wieder vorab lesen
+        vault_prefetcher.prefetch(self.db_path)
+
+    def _on_unlock_failed(self, message: str):
+        """Zeigt einen Fehler beim Öffnen der Datenbank"""
+        QMessageBox.critical(
+            self,
+            "Fehler",
+            f"Fehler beim Öffnen der Datenbank:\n{message}"
+        )
+        self.reject()
+
+    def _on_unlock_thread_finished(self):
+        """Setzt die Eingabe nach dem Worker-Lauf zurück"""
+        worker = self.sender()
+        if worker is not self.unlock_worker:
+            return
+        worker.deleteLater()
+        self.unlock_worker = None
+        if self.result() != QDialog.DialogCode.Accepted:
+            self._set_busy(False)
+
+    def reject(self):
+        """Bricht ein laufendes Entsperren ab und wartet auf den Worker"""
+        if self.unlock_worker is not None:
+            self.cancel_unlock()
+        for worker in list(self._abandoned_workers):
+            worker.wait()
+        vault_prefetcher.discard(self.db_path)
+        super().reject()
+
+    def get_database_manager(self):
+        """Gibt die beim Login geöffnete Datenbank zurück (nur nach erfolgreichem Login)"""
+        return self.db_manager
 
     def get_master_password(self) -> str:
         """Gibt das eingegebene Master-Passwort zurück"""
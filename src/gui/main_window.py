@@ -1,24 +1,47 @@
 """
 Hauptfenster der Anwendung mit modernem Design und Dark Mode
 """
+import logging
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QScrollArea, QMessageBox, QSplitter,
-    QFrame
+    QPushButton, QLineEdit, QMessageBox, QSplitter,
+    QFrame, QButtonGroup, QStackedWidget
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QAction
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, List, Optional
 from ..core.database import DatabaseManager
 from ..core.models import PasswordEntry, Category
 from ..core.encryption import encryption_manager
-from .widgets import PasswordEntryWidget, CategoryButton
+from ..core.statistics import load_backfill_rows, store_backfill_analytics, analyze_passwords
+from ..password.generator import password_generator
+from ..core.totp_manager import totp_manager
+from ..password.strength import password_strength_checker
+from .widgets import CategoryButton
+from .entry_list import EntryListView
+from .workers import EntryLoadWorker, AnalyticsBackfillWorker, CalibrationWorker
 from .entry_dialog import PasswordEntryDialog
+from .generator_dialog import PasswordGeneratorDialog
+from .dialog_cache import dialog_cache
+from .rotate_dialog import PasswordRotateDialog
+from .totp_ticker import totp_ticker
 from .login_dialog import LoginDialog
 from .settings_dialog import SettingsDialog
 from .themes import theme, ThemeMode
 from .icons import icon_provider
+from .animations import animator
 from ..core.settings import app_settings
+from ..auth.master_password import master_password_manager
+
+logger = logging.getLogger(__name__)
+
+# Platzhalter-Zeilen, solange die Einträge im Hintergrund laden
+PLACEHOLDER_ROWS = 6
+
+# Verzögerung der Argon2-Kalibrierung nach dem Öffnen (ms), damit Laden und
+# Auswertung der Einträge nicht um die Kerne konkurrieren
+CALIBRATION_DELAY_MS = 10_000
 
 
 class MainWindow(QMainWindow):
@@ -31,21 +54,123 @@ class MainWindow(QMainWindow):
         self.all_entries: List[PasswordEntry] = []
         self.displayed_entries: List[PasswordEntry] = []
         self.categories: List[Category] = []
-        self.category_buttons: List[CategoryButton] = []
+        # Sidebar-Buttons nach Kategorie-ID (None = "Alle"), nur bei Kategorie-Änderungen neu erstellt
+        self.category_buttons: Dict[Optional[int], CategoryButton] = {}
+        self.category_button_group = QButtonGroup(self)
+        self.category_button_group.setExclusive(True)
+        self.category_counts: Dict[int, int] = {}
+
+        # Schrittweises Laden: Einträge kommen blockweise aus dem EntryLoadWorker
+        self.entry_loader: Optional[EntryLoadWorker] = None
+        # Nachtragen der Passwort-Auswertung (Entschlüsseln und Bewerten im Hintergrund)
+        self.backfill_worker: Optional[AnalyticsBackfillWorker] = None
+        # Dashboard mit Statistiken und Audit, erst beim ersten Öffnen erstellt
+        self.dashboard = None
+        # Argon2-Kalibrierung, falls für diesen Rechner noch keine gespeichert ist
+        self.calibration_worker: Optional[CalibrationWorker] = None
 
         # Auto-Lock Timer (5 Minuten)
         self.auto_lock_timer = QTimer()
         self.auto_lock_timer.timeout.connect(self.lock_application)
         self.auto_lock_minutes = 5
 
+        # Erst das Gerüst (Header, Sidebar, Suche), Einträge folgen im Hintergrund
         self.setup_ui()
         self.load_categories()
-        self.load_all_entries()
-        self.show_all_entries()
+        self.start_entry_loading()
+
+        # Häufige Icons für beide Themes vorrendern, sobald die Event-Loop frei ist
+        QTimer.singleShot(0, icon_provider.prewarm)
+
+        # Große Dialoge einmal im Leerlauf aufbauen und danach wiederverwenden
+        self.register_dialogs()
+        QTimer.singleShot(0, dialog_cache.prewarm)
+
+        # Fehlende Kalibrierung im Leerlauf messen statt beim Entsperren
+        QTimer.singleShot(CALIBRATION_DELAY_MS, self.calibrate_key_derivation)
 
         # Starte Auto-Lock Timer
         self.reset_auto_lock_timer()
 
+    def calibrate_key_derivation(self):
+        """
+        Kalibriert die Argon2-Parameter im Hintergrund, falls keine gespeichert sind
+
+        Das Ergebnis gilt für neue Hashes sofort; Hash und Tresor-Header werden
+        beim nächsten Entsperren erneuert (siehe unlock.upgrade_key_derivation).
+        """
+        if self.calibration_worker is not None or master_password_manager.stored_calibration() is not None:
+            return
+        worker = CalibrationWorker(self)
+        worker.calibrated.connect(self._on_calibrated)
+        worker.finished.connect(self._on_calibration_finished)
+        self.calibration_worker = worker
+        worker.start()
+
+    def _on_calibrated(self, parameters):
+        """Speichert das Kalibrierungsergebnis (im UI-Thread)"""
+        master_password_manager.save_calibration(parameters)
+        logger.info("Argon2-Kalibrierung gespeichert, wird beim nächsten Entsperren angewendet")
+
+    def _on_calibration_finished(self):
+        """Gibt den beendeten Kalibrierungs-Worker frei"""
+        if self.calibration_worker is not None:
+            self.calibration_worker.deleteLater()
+            self.calibration_worker = None
+
+    def backfill_password_analytics(self):
+        """
+        Ergänzt Stärke-Score und Reuse-Fingerprint für Einträge ohne Auswertung
+
+        Gelesen und zurückgeschrieben wird im UI-Thread (die SQLite-Verbindung
+        ist an ihn gebunden); Entschlüsseln und Bewerten läuft im
+        AnalyticsBackfillWorker.
+        """
+        if self.backfill_worker is not None or not encryption_manager.is_unlocked():
+            return
+        try:
+            rows, outdated = load_backfill_rows(self.db_manager)
+        except Exception as e:
+            logger.error(f"Fehler beim Nachtragen der Passwort-Auswertung: {e}")
+            return
+        if not rows and not outdated:
+            return
+
+        worker = AnalyticsBackfillWorker(rows, outdated, parent=self)
+        worker.backfill_finished.connect(self._on_backfill_finished)
+        worker.backfill_failed.connect(self._on_backfill_failed)
+        worker.finished.connect(worker.deleteLater)
+        self.backfill_worker = worker
+        worker.start()
+
+    def _on_backfill_finished(self, analytics: list, outdated: bool):
+        """Schreibt die im Hintergrund berechneten Auswertungen zurück (im UI-Thread)"""
+        self.backfill_worker = None
+        try:
+            store_backfill_analytics(self.db_manager, analytics, outdated)
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern der Passwort-Auswertung: {e}")
+
+    def _on_backfill_failed(self, message: str):
+        """Nachtragen fehlgeschlagen - beim nächsten Laden erneut versuchen"""
+        self.backfill_worker = None
+
+    def _stop_backfill_worker(self, wait: bool = False):
+        """
+        Bricht ein laufendes Nachtragen ab und verwirft sein Ergebnis
+
+        Args:
+            wait: Auf das Ende des Threads warten (beim Schließen des Fensters)
+        """
+        if self.backfill_worker is None:
+            return
+        worker, self.backfill_worker = self.backfill_worker, None
+        worker.backfill_finished.disconnect()
+        worker.backfill_failed.disconnect()
+        worker.cancel()
+        if wait:
+            worker.wait()
+
     def setup_ui(self):
         """Erstellt das UI des Hauptfensters"""
         self.setWindowTitle("SecurePass Manager")
@@ -108,6 +233,11 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.open_settings)
         file_menu.addAction(settings_action)
 
+        rotate_action = QAction("🔄 Passwörter erneuern...", self)
+        rotate_action.setShortcut("Ctrl+R")
+        rotate_action.triggered.connect(self.open_rotate_dialog)
+        file_menu.addAction(rotate_action)
+
         file_menu.addSeparator()
 
         exit_action = QAction("Beenden", self)
@@ -123,6 +253,11 @@ class MainWindow(QMainWindow):
         theme_action.triggered.connect(self.toggle_theme)
         view_menu.addAction(theme_action)
 
+        dashboard_action = QAction("📊 Dashboard", self)
+        dashboard_action.setShortcut("Ctrl+Shift+D")
+        dashboard_action.triggered.connect(self.show_dashboard)
+        view_menu.addAction(dashboard_action)
+
         # Hilfe-Menü
         help_menu = menubar.addMenu("Hilfe")
 
@@ -135,13 +270,8 @@ class MainWindow(QMainWindow):
         c = theme.get_colors()
 
         header = QFrame()
+        header.setObjectName("mainHeader")
         header.setFixedHeight(90)
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['surface']};
-                border: none;
-            }}
-        """)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -159,7 +289,7 @@ class MainWindow(QMainWindow):
         title_font.setPointSize(20)
         title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet(f"color: {c['primary']};")
+        title.setObjectName("appTitle")
         title_container.addWidget(title)
         title_container.addStretch()
 
@@ -186,23 +316,7 @@ class MainWindow(QMainWindow):
         self.lock_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.lock_button.clicked.connect(self.lock_application)
         self.lock_button.setToolTip("Anwendung sperren (Ctrl+L)")
-        self.lock_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['background_tertiary']};
-                color: {c['text_primary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 12px;
-                padding: 0 16px;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {c['danger']};
-                color: white;
-                border-color: {c['danger']};
-            }}
-        """)
-        from .animations import animator
+        self.lock_button.setObjectName("lockButton")
         self.lock_button.pressed.connect(lambda: animator.press(self.lock_button, scale_factor=0.96, duration=120))
         layout.addWidget(self.lock_button)
 
@@ -210,17 +324,10 @@ class MainWindow(QMainWindow):
 
     def create_sidebar(self) -> QWidget:
         """Erstellt die Sidebar mit Kategorien"""
-        c = theme.get_colors()
-
         sidebar = QFrame()
+        sidebar.setObjectName("sidebar")
         sidebar.setMinimumWidth(200)
         sidebar.setMaximumWidth(300)
-        sidebar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['background_secondary']};
-                border-right: 2px solid {c['surface_border']};
-            }}
-        """)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 20, 15, 20)
@@ -232,7 +339,7 @@ class MainWindow(QMainWindow):
         categories_font.setPointSize(14)
         categories_font.setBold(True)
         categories_label.setFont(categories_font)
-        categories_label.setStyleSheet(f"color: {c['text_primary']}; padding-left: 5px;")
+        categories_label.setObjectName("sidebarTitle")
         layout.addWidget(categories_label)
 
         # Kategorie-Buttons Container
@@ -242,35 +349,31 @@ class MainWindow(QMainWindow):
 
         layout.addStretch()
 
+        # Dashboard (Statistiken und Sicherheits-Audit)
+        dashboard_button = QPushButton("📊 Dashboard")
+        dashboard_button.setMinimumHeight(40)
+        dashboard_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        dashboard_button.clicked.connect(self.show_dashboard)
+        dashboard_button.setObjectName("sidebarAction")
+        layout.addWidget(dashboard_button)
+
         # Neue Kategorie Button
         add_category_button = QPushButton("+ Neue Kategorie")
         add_category_button.setMinimumHeight(40)
         add_category_button.setCursor(Qt.CursorShape.PointingHandCursor)
         add_category_button.clicked.connect(self.add_category)
-        add_category_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['primary']};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                padding: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {c['primary_hover']};
-            }}
-        """)
+        add_category_button.setObjectName("sidebarAction")
         layout.addWidget(add_category_button)
 
         sidebar.setLayout(layout)
         return sidebar
 
     def create_content_area(self) -> QWidget:
-        """Erstellt den Content-Bereich"""
-        c = theme.get_colors()
+        """Erstellt den Content-Bereich (Eintragsliste, bei Bedarf Dashboard)"""
+        self.content_stack = QStackedWidget()
 
         content = QWidget()
-        content.setStyleSheet(f"background-color: {c['background']};")
+        content.setObjectName("contentArea")
 
         layout = QVBoxLayout()
         layout.setContentsMargins(30, 25, 30, 25)
@@ -284,7 +387,7 @@ class MainWindow(QMainWindow):
         content_title_font.setPointSize(16)
         content_title_font.setBold(True)
         self.content_title.setFont(content_title_font)
-        self.content_title.setStyleSheet(f"color: {c['text_primary']};")
+        self.content_title.setObjectName("contentTitle")
         content_header.addWidget(self.content_title)
 
         content_header.addStretch()
@@ -294,202 +397,239 @@ class MainWindow(QMainWindow):
         add_entry_button.setMinimumWidth(150)
         add_entry_button.setCursor(Qt.CursorShape.PointingHandCursor)
         add_entry_button.clicked.connect(self.add_entry)
-        add_entry_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['secondary']};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {c['secondary_hover']};
-            }}
-        """)
+        add_entry_button.setObjectName("contentAction")
         content_header.addWidget(add_entry_button)
 
         layout.addLayout(content_header)
 
-        # Scroll Area für Einträge
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setStyleSheet(f"background-color: {c['background']};")
-
-        self.entries_container = QWidget()
-        self.entries_container.setStyleSheet(f"background-color: {c['background']};")
-        self.entries_layout = QVBoxLayout()
-        self.entries_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.entries_layout.setSpacing(10)
-        self.entries_container.setLayout(self.entries_layout)
-
-        scroll_area.setWidget(self.entries_container)
-        layout.addWidget(scroll_area)
+        # Virtualisierte Eintragsliste (zeichnet nur sichtbare Zeilen)
+        self.entry_list = EntryListView()
+        self.entry_list.edit_clicked.connect(self.edit_entry)
+        self.entry_list.delete_clicked.connect(self.delete_entry)
+        layout.addWidget(self.entry_list)
 
         content.setLayout(layout)
-        return content
+        self.entries_page = content
+        self.content_stack.addWidget(content)
+        return self.content_stack
+
+    def show_dashboard(self):
+        """Zeigt das Dashboard mit Statistiken und Sicherheits-Audit"""
+        if self.dashboard is None:
+            # Dashboard zieht Statistik und Audit (multiprocessing) nach
+            from .dashboard import Dashboard
+            self.dashboard = Dashboard(self.db_manager)
+            self.dashboard.category_clicked.connect(self.show_category)
+            self.dashboard.recent_entries_clicked.connect(self.show_all_entries)
+            self.content_stack.addWidget(self.dashboard)
+        self.content_stack.setCurrentWidget(self.dashboard)
+
+    def show_entries_page(self):
+        """Wechselt vom Dashboard zurück zur Eintragsliste"""
+        self.content_stack.setCurrentWidget(self.entries_page)
+
+    def _release_dashboard(self):
+        """
+        Verwirft das Dashboard samt Audit-Ergebnissen (beim Sperren und Schließen)
+
+        Ein laufendes Audit wird abgebrochen; beim nächsten Öffnen wird das
+        Dashboard neu erstellt.
+        """
+        if self.dashboard is None:
+            return
+        dashboard, self.dashboard = self.dashboard, None
+        dashboard.cancel_audit()
+        self.show_entries_page()
+        self.content_stack.removeWidget(dashboard)
+        dashboard.deleteLater()
 
     def toggle_theme(self):
         """Wechselt zwischen Light und Dark Mode"""
-        theme.toggle_mode()
+        self.apply_theme_mode(ThemeMode.DARK if theme.current_mode == ThemeMode.LIGHT else ThemeMode.LIGHT)
 
         # Speichere Theme-Einstellung
-        current_mode = theme.current_mode
-        theme_mode_str = "dark" if current_mode == ThemeMode.DARK else "light"
+        theme_mode_str = "dark" if theme.current_mode == ThemeMode.DARK else "light"
         app_settings.set("theme_mode", theme_mode_str)
 
-        # Wende globales Stylesheet an
+    def apply_theme_mode(self, mode: ThemeMode):
+        """
+        Wendet einen Theme-Modus an
+
+        Während des Wechsels sind Updates des Fensters ausgesetzt: das
+        gecachte Stylesheet wird getauscht, die Widgets werden neu gestylt,
+        und erst danach wird das Fenster einmal komplett neu gezeichnet.
+        Versteckte gecachte Dialoge werden vorher verworfen und von
+        dialog_cache.get() beim nächsten Öffnen neu aufgebaut.
+
+        Args:
+            mode: Neuer Theme-Modus
+        """
         from PyQt6.QtWidgets import QApplication
-        QApplication.instance().setStyleSheet(theme.get_stylesheet())
 
-        # Aktualisiere Theme-spezifische Styles
-        self.update_theme_styles()
+        dialog_cache.discard_stale(mode)
+        self.setUpdatesEnabled(False)
+        try:
+            theme.set_mode(mode)
+            theme.apply_theme(QApplication.instance())
+            self.update_theme_styles()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def update_theme_styles(self):
-        """Aktualisiert die Farben aller Komponenten basierend auf dem aktuellen Theme"""
+        """Aktualisiert, was das globale Stylesheet nicht abdeckt (Icons, gezeichnete Eintragsliste)"""
         c = theme.get_colors()
+        self.lock_button.setIcon(icon_provider.get_icon("lock", c['text_primary'], 20))
 
-        # Update Header
-        self.header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['surface']};
-                border-bottom: 2px solid {c['surface_border']};
-            }}
-        """)
-
-        # Update Title
-        title_widgets = self.header.findChildren(QLabel)
-        for widget in title_widgets:
-            if "SecurePass" in widget.text():
-                widget.setStyleSheet(f"color: {c['primary']};")
-
-        # Update lock button style
-        lock_icon = icon_provider.get_icon("lock", c['text_primary'], 20)
-        self.lock_button.setIcon(lock_icon)
-        self.lock_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['background_tertiary']};
-                color: {c['text_primary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 12px;
-                padding: 0 16px;
-                font-size: 14px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {c['danger']};
-                color: white;
-                border-color: {c['danger']};
-            }}
-        """)
-
-        # Update Sidebar
-        self.sidebar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {c['background_secondary']};
-                border-right: 2px solid {c['surface_border']};
-            }}
-        """)
-
-        # Update sidebar labels
-        for widget in self.sidebar.findChildren(QLabel):
-            if "Kategorien" in widget.text():
-                widget.setStyleSheet(f"color: {c['text_primary']}; padding-left: 5px;")
-
-        # Update "Neue Kategorie" Button
-        for widget in self.sidebar.findChildren(QPushButton):
-            if "Neue Kategorie" in widget.text():
-                widget.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {c['primary']};
-                        color: white;
-                        border: none;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        padding: 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {c['primary_hover']};
-                    }}
-                """)
-
-        # Update separator
-        for widget in self.sidebar.findChildren(QFrame):
-            if widget.frameShape() == QFrame.Shape.HLine:
-                widget.setStyleSheet(f"background-color: {c['surface_border']};")
-
-        # Update Content Area
-        self.content.setStyleSheet(f"background-color: {c['background']};")
-        self.entries_container.setStyleSheet(f"background-color: {c['background']};")
-
-        # Update content title
-        self.content_title.setStyleSheet(f"color: {c['text_primary']};")
-
-        # Update "Neuer Eintrag" Button
-        for widget in self.content.findChildren(QPushButton):
-            if "Neuer Eintrag" in widget.text():
-                widget.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {c['secondary']};
-                        color: white;
-                        border: none;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 14px;
-                        padding: 10px 20px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {c['secondary_hover']};
-                    }}
-                """)
-
-        # Update alle Kategorie-Buttons
-        for button in self.category_buttons:
-            button.setStyleSheet(button._get_stylesheet())
-
-        # Update alle Entry-Widgets
-        self.update_entry_widgets()
+        # Eintragsliste neu zeichnen (Delegate liest die Theme-Farben beim Zeichnen)
+        self.entry_list.apply_theme()
+        if self.dashboard is not None:
+            self.dashboard.update_theme()
 
     def load_categories(self):
-        """Lädt alle Kategorien aus der Datenbank"""
+        """Lädt alle Kategorien aus der Datenbank und gleicht die Sidebar-Buttons ab"""
         self.categories = self.db_manager.get_all_categories()
+        self.sync_category_buttons()
 
     def update_category_list(self):
-        """Aktualisiert die Kategorie-Liste in der Sidebar"""
-        # Lösche alte Buttons
-        for button in self.category_buttons:
-            button.deleteLater()
-        self.category_buttons.clear()
+        """Aktualisiert Zähler und Auswahl der Kategorie-Buttons (ohne Widgets neu zu erstellen)"""
+        self.update_category_counts()
 
-        # "Alle"-Button
-        all_count = len(self.all_entries)
-        all_button = CategoryButton(None, "📁 Alle", all_count, "#6366f1")
-        all_button.clicked.connect(lambda: self.show_all_entries())
-        self.categories_container.addWidget(all_button)
-        self.category_buttons.append(all_button)
+        button = self.category_buttons.get(self.current_category_id)
+        if button is not None and not button.isChecked():
+            button.setChecked(True)
 
-        if self.current_category_id is None:
-            all_button.setChecked(True)
+    def sync_category_buttons(self):
+        """
+        Gleicht die Sidebar-Buttons mit self.categories ab
 
-        # Kategorie-Buttons
-        for category in self.categories:
-            count = len(self.db_manager.get_password_entries_by_category(category.id))
-            button = CategoryButton(category.id, f"📂 {category.name}", count, category.color)
-            button.clicked.connect(lambda checked, cat_id=category.id: self.show_category(cat_id))
-            self.categories_container.addWidget(button)
-            self.category_buttons.append(button)
+        Nur neue Kategorien erhalten einen Button, Buttons gelöschter Kategorien
+        werden entfernt; Name und Farbe bestehender Buttons werden übernommen.
+        """
+        if None not in self.category_buttons:
+            all_button = CategoryButton(None, "📁 Alle", len(self.all_entries), "#6366f1")
+            all_button.clicked.connect(lambda: self.show_all_entries())
+            self._add_category_button(None, all_button)
+
+        current_ids = {category.id for category in self.categories}
+        for category_id in [key for key in self.category_buttons if key is not None and key not in current_ids]:
+            button = self.category_buttons.pop(category_id)
+            self.category_button_group.removeButton(button)
+            self.categories_container.removeWidget(button)
+            button.deleteLater()
 
-            if self.current_category_id == category.id:
-                button.setChecked(True)
+        for category in self.categories:
+            button = self.category_buttons.get(category.id)
+            if button is None:
+                count = self.category_counts.get(category.id, 0)
+                button = CategoryButton(category.id, f"📂 {category.name}", count, category.color)
+                button.clicked.connect(lambda checked, cat_id=category.id: self.show_category(cat_id))
+                self._add_category_button(category.id, button)
+            else:
+                button.update_category(f"📂 {category.name}", category.color)
+
+        # Reihenfolge wie self.categories ("Alle" zuerst), Widgets nur umhängen
+        order = [None] + [category.id for category in self.categories]
+        if list(self.category_buttons) != order:
+            self.category_buttons = {key: self.category_buttons[key] for key in order}
+            for index, button in enumerate(self.category_buttons.values()):
+                self.categories_container.removeWidget(button)
+                self.categories_container.insertWidget(index, button)
+
+        # Ausgewählte Kategorie wurde gelöscht
+        if self.current_category_id not in self.category_buttons:
+            self.current_category_id = None
+        self.category_buttons[self.current_category_id].setChecked(True)
+
+    def _add_category_button(self, category_id: Optional[int], button: CategoryButton):
+        """Registriert einen neuen Kategorie-Button (Dict, Button-Gruppe, Layout)"""
+        self.category_buttons[category_id] = button
+        self.category_button_group.addButton(button)
+        self.categories_container.addWidget(button)
 
     def load_all_entries(self):
-        """Lädt alle Passwort-Einträge aus der Datenbank"""
+        """Lädt alle Passwort-Einträge aus der Datenbank (synchron, z.B. nach Änderungen)"""
+        self._stop_entry_loader()
         self.all_entries = self.db_manager.get_all_password_entries()
+        self.category_counts = Counter(entry.category_id for entry in self.all_entries)
+
+    def start_entry_loading(self):
+        """
+        Lädt alle Einträge blockweise im Hintergrund und zeigt sie schrittweise an
+
+        Bis dahin zeigt die Liste Platzhalter-Zeilen; Einträge und Zähler werden
+        mit jedem Block ergänzt.
+        """
+        self._stop_entry_loader()
+        self.all_entries = []
+        self.category_counts = Counter()
+
+        self.entry_loader = EntryLoadWorker(self.db_manager, parent=self)
+        self.entry_loader.chunk_loaded.connect(self._on_entries_chunk)
+        self.entry_loader.load_finished.connect(self._on_entries_loaded)
+        self.entry_loader.load_failed.connect(self._on_entries_load_failed)
+
+        self.show_all_entries()
+        self.entry_loader.start()
+
+    def is_loading_entries(self) -> bool:
+        """Prüft ob die Einträge noch im Hintergrund laden"""
+        return self.entry_loader is not None
+
+    def _stop_entry_loader(self):
+        """Bricht ein laufendes Laden ab (wartet höchstens auf den aktuellen Block)"""
+        if self.entry_loader is None:
+            return
+        loader, self.entry_loader = self.entry_loader, None
+        loader.chunk_loaded.disconnect()
+        loader.load_finished.disconnect()
+        loader.load_failed.disconnect()
+        loader.cancel()
+        loader.wait()
+
+    def _on_entries_chunk(self, chunk: List[PasswordEntry]):
+        """Übernimmt einen geladenen Block (im UI-Thread)"""
+        self.all_entries.extend(chunk)
+        self.category_counts.update(entry.category_id for entry in chunk)
+
+        # Alle-Ansicht ohne Suche zeigt dieselbe Liste an
+        if self.displayed_entries is self.all_entries:
+            self.content_title.setText(f"📚 Alle Einträge ({len(self.all_entries)})")
+            self.entry_list.append_entries(chunk)
+        self.update_category_counts()
+
+    def _on_entries_loaded(self):
+        """Alle Blöcke sind geladen"""
+        self.entry_loader = None
+        logger.info(f"{len(self.all_entries)} Einträge geladen")
+
+        if self.displayed_entries is self.all_entries:
+            self.entry_list.set_placeholders(0)
+        self.update_category_counts()
+
+        # Auswertungs-Spalten für ältere Einträge nachtragen (nach dem Laden)
+        QTimer.singleShot(0, self.backfill_password_analytics)
+
+    def _on_entries_load_failed(self, message: str):
+        """Hintergrund-Laden fehlgeschlagen - synchron nachladen"""
+        logger.warning(f"Hintergrund-Laden fehlgeschlagen, lade synchron: {message}")
+        self.entry_loader = None
+        self.load_all_entries()
+        self.show_all_entries()
+        QTimer.singleShot(0, self.backfill_password_analytics)
+
+    def update_category_counts(self):
+        """Aktualisiert die Zähler der Kategorie-Buttons"""
+        # Bei sehr vielen Einträgen werden Übergänge sofort ausgeführt
+        animator.set_item_count(len(self.all_entries))
+        for button in self.category_buttons.values():
+            if button.category_id is None:
+                button.update_count(len(self.all_entries))
+            else:
+                button.update_count(self.category_counts.get(button.category_id, 0))
 
     def show_all_entries(self):
         """Zeigt alle Einträge an"""
+        self.show_entries_page()
         self.current_category_id = None
         self.content_title.setText(f"📚 Alle Einträge ({len(self.all_entries)})")
         self.displayed_entries = self.all_entries
@@ -503,6 +643,7 @@ class MainWindow(QMainWindow):
         Args:
             category_id: ID der anzuzeigenden Kategorie
         """
+        self.show_entries_page()
         self.current_category_id = category_id
         category = next((cat for cat in self.categories if cat.id == category_id), None)
 
@@ -519,6 +660,7 @@ class MainWindow(QMainWindow):
         Args:
             query: Der Suchbegriff
         """
+        self.show_entries_page()
         if not query:
             # Zeige alle Einträge der aktuellen Kategorie
             if self.current_category_id is None:
@@ -533,35 +675,33 @@ class MainWindow(QMainWindow):
 
     def update_entry_widgets(self):
         """Aktualisiert die Anzeige der Passwort-Einträge"""
-        c = theme.get_colors()
+        # Noch ladend: bereits geladene Einträge plus Platzhalter, der Rest folgt blockweise
+        loading = self.is_loading_entries() and self.displayed_entries is self.all_entries
+        self.entry_list.set_entries(self.displayed_entries, PLACEHOLDER_ROWS if loading else 0)
+
+    def register_dialogs(self):
+        """Registriert die wiederverwendbaren Dialoge im dialog_cache"""
+        from pathlib import Path
+        db_name = Path(self.db_manager.encrypted_db_path).stem
 
-        # Lösche alte Widgets
-        while self.entries_layout.count():
-            item = self.entries_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        def create_entry_dialog() -> PasswordEntryDialog:
+            dialog = PasswordEntryDialog(self.categories, parent=self)
+            dialog.entry_saved.connect(self.on_entry_saved)
+            return dialog
 
-        # Erstelle neue Widgets
-        if not self.displayed_entries:
-            no_entries_label = QLabel("Keine Einträge vorhanden")
-            no_entries_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_entries_label.setStyleSheet(f"""
-                color: {c['text_tertiary']};
-                padding: 100px;
-                font-size: 16px;
-            """)
-            self.entries_layout.addWidget(no_entries_label)
-        else:
-            for entry in self.displayed_entries:
-                widget = PasswordEntryWidget(entry)
-                widget.edit_clicked.connect(self.edit_entry)
-                widget.delete_clicked.connect(self.delete_entry)
-                self.entries_layout.addWidget(widget)
+        def create_settings_dialog() -> SettingsDialog:
+            dialog = SettingsDialog(self.db_manager, db_name, self)
+            dialog.settings_changed.connect(self.on_settings_changed)
+            return dialog
+
+        dialog_cache.register("entry", create_entry_dialog)
+        dialog_cache.register("generator", lambda: PasswordGeneratorDialog(self))
+        dialog_cache.register("settings", create_settings_dialog)
 
     def add_entry(self):
         """Öffnet Dialog zum Hinzufügen eines neuen Eintrags"""
-        dialog = PasswordEntryDialog(self.categories, parent=self)
-        dialog.entry_saved.connect(self.on_entry_saved)
+        dialog = dialog_cache.get("entry")
+        dialog.reset(self.categories)
         dialog.exec()
 
     def edit_entry(self, entry: PasswordEntry):
@@ -571,8 +711,8 @@ class MainWindow(QMainWindow):
         Args:
             entry: Der zu bearbeitende Eintrag
         """
-        dialog = PasswordEntryDialog(self.categories, entry, parent=self)
-        dialog.entry_saved.connect(self.on_entry_saved)
+        dialog = dialog_cache.get("entry")
+        dialog.reset(self.categories, entry)
         dialog.exec()
 
     def on_entry_saved(self, entry: PasswordEntry):
@@ -620,6 +760,85 @@ class MainWindow(QMainWindow):
             else:
                 self.show_category(self.current_category_id)
 
+    def open_rotate_dialog(self):
+        """Öffnet den Dialog zum Erneuern mehrerer Passwörter (angezeigte Einträge)"""
+        if not self.displayed_entries:
+            QMessageBox.information(self, "Passwörter erneuern", "Keine Einträge ausgewählt.")
+            return
+
+        dialog = PasswordRotateDialog(self.displayed_entries, parent=self)
+        dialog.rotation_requested.connect(self.rotate_passwords)
+        dialog.exec()
+
+    def rotate_passwords(self, entry_ids: List[int], length: int):
+        """
+        Generiert neue Passwörter für mehrere Einträge und speichert sie in einer Transaktion
+
+        Args:
+            entry_ids: IDs der zu erneuernden Einträge
+            length: Länge der neuen Passwörter
+        """
+        try:
+            passwords = password_generator.generate_many(len(entry_ids), length)
+            analytics = analyze_passwords(passwords)
+            self.db_manager.update_passwords([
+                (entry_id, encryption_manager.encrypt(password), score, fingerprint)
+                for entry_id, password, (score, fingerprint) in zip(entry_ids, passwords, analytics)
+            ])
+        except Exception as e:
+            logger.error(f"Fehler beim Erneuern der Passwörter: {e}")
+            QMessageBox.warning(self, "Fehler", f"Fehler beim Erneuern der Passwörter: {str(e)}")
+            return
+
+        self._refresh_current_view()
+
+        # Die bisherigen Passwörter liegen in previous_password - Rückgängig anbieten
+        message = QMessageBox(self)
+        message.setIcon(QMessageBox.Icon.Information)
+        message.setWindowTitle("Passwörter erneuern")
+        message.setText(f"{len(entry_ids)} Passwörter wurden erneuert.")
+        message.setInformativeText("Die bisherigen Passwörter werden danach verworfen.")
+        message.addButton(QMessageBox.StandardButton.Ok)
+        undo_button = message.addButton("Rückgängig", QMessageBox.ButtonRole.RejectRole)
+        message.exec()
+
+        if message.clickedButton() is undo_button:
+            self.restore_rotated_passwords(entry_ids)
+            return
+
+        # Ergebnis übernommen - die Sicherung gilt nur für das Rückgängig-Fenster
+        try:
+            self.db_manager.clear_previous_passwords(entry_ids)
+        except Exception as e:
+            logger.error(f"Fehler beim Verwerfen der bisherigen Passwörter: {e}")
+
+    def restore_rotated_passwords(self, entry_ids: List[int]):
+        """
+        Stellt die vor der Erneuerung gespeicherten Passwörter wieder her
+
+        Args:
+            entry_ids: IDs der erneuerten Einträge
+        """
+        try:
+            restored = self.db_manager.restore_previous_passwords(entry_ids)
+        except Exception as e:
+            logger.error(f"Fehler beim Wiederherstellen der Passwörter: {e}")
+            QMessageBox.warning(self, "Fehler", f"Fehler beim Wiederherstellen der Passwörter: {str(e)}")
+            return
+
+        # Score und Fingerprint wurden geleert - im Hintergrund neu berechnen
+        self.backfill_password_analytics()
+        self._refresh_current_view()
+        logger.info(f"{restored} Passwörter wiederhergestellt")
+
+    def _refresh_current_view(self):
+        """Lädt die Einträge neu und zeigt die aktuelle Kategorie erneut an"""
+        self.load_all_entries()
+        if self.current_category_id is None:
+            self.show_all_entries()
+        else:
+            self.show_category(self.current_category_id)
+
     def add_category(self):
         """Öffnet Dialog zum Hinzufügen einer neuen Kategorie"""
         from PyQt6.QtWidgets import QInputDialog
@@ -636,25 +855,41 @@ class MainWindow(QMainWindow):
 
     def lock_application(self):
         """Sperrt die Anwendung"""
-        # Lösche Encryption-Key
+        # Lösche Encryption-Key und zwischengespeicherte Stärke-Bewertungen
+        self._stop_backfill_worker()
+        self._release_dashboard()
         encryption_manager.clear()
+        password_strength_checker.clear_cache()
+        totp_manager.clear_cache()
+        totp_ticker.reset()
+        self.entry_list.entry_model.clear_secrets()
+        dialog_cache.release()
 
         # Stoppe Auto-Lock Timer
         self.auto_lock_timer.stop()
 
         # Zeige Login-Dialog
         self.hide()
-        login_dialog = LoginDialog(self.db_manager.encrypted_db_path)
+        # Die Login-Kopie darf nichts schreiben - self.db_manager würde beim
+        # nächsten Speichern seinen eigenen Header und Hash zurückschreiben
+        login_dialog = LoginDialog(self.db_manager.encrypted_db_path, upgrade=False)
         login_dialog.login_successful.connect(self.on_unlock)
 
         if login_dialog.exec() != LoginDialog.DialogCode.Accepted:
             # Benutzer hat abgebrochen, beende Anwendung
             self.close()
+            return
+
+        # Die geöffnete Datenbank bleibt in Verwendung, die Login-Kopie wird verworfen
+        unlocked_db = login_dialog.get_database_manager()
+        if unlocked_db is not None:
+            unlocked_db.close()
 
     def on_unlock(self):
         """Wird aufgerufen, wenn die Anwendung entsperrt wurde"""
         self.show()
         self.reset_auto_lock_timer()
+        QTimer.singleShot(0, dialog_cache.prewarm)
 
     def reset_auto_lock_timer(self):
         """Setzt den Auto-Lock Timer zurück"""
@@ -678,10 +913,8 @@ class MainWindow(QMainWindow):
 
     def open_settings(self):
         """Öffnet den Einstellungs-Dialog"""
-        from pathlib import Path
-        db_name = Path(self.db_manager.encrypted_db_path).stem
-        dialog = SettingsDialog(self.db_manager, db_name, self)
-        dialog.settings_changed.connect(self.on_settings_changed)
+        dialog = dialog_cache.get("settings")
+        dialog.load_settings()
         dialog.exec()
 
     def on_settings_changed(self):
@@ -693,13 +926,20 @@ class MainWindow(QMainWindow):
         # Theme aktualisieren
         theme_mode = app_settings.get("theme_mode", "light")
         if theme_mode == "dark":
-            theme.set_mode(ThemeMode.DARK)
+            self.apply_theme_mode(ThemeMode.DARK)
         elif theme_mode == "light":
-            theme.set_mode(ThemeMode.LIGHT)
+            self.apply_theme_mode(ThemeMode.LIGHT)
         # System-Theme würde hier implementiert werden
 
-        # Update komplettes UI mit neuen Theme-Farben
-        self.update_theme_styles()
+    def closeEvent(self, event):
+        """Beendet ein laufendes Hintergrund-Laden vor dem Schließen"""
+        self._stop_entry_loader()
+        self._stop_backfill_worker(wait=True)
+        if self.calibration_worker is not None:
+            # Ein Argon2-Durchlauf lässt sich nicht abbrechen - kurz warten
+            self.calibration_worker.wait()
+        self._release_dashboard()
+        super().closeEvent(event)
 
     # Event-Handler für Auto-Lock
     def mousePressEvent(self, event):
@@ -0,0 +1,165 @@
+"""
+Dialog zum Erneuern der Passwörter mehrerer Einträge
+
+Der Benutzer wählt Einträge und Passwort-Länge; die neuen Passwörter werden
+im Hauptfenster in einem Durchgang generiert und in einer Transaktion gespeichert.
+"""
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QListWidget, QListWidgetItem, QSpinBox
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont
+from typing import List
+from ..core.models import PasswordEntry
+from ..password.strength import WEAK_SCORE_THRESHOLD
+from .themes import theme
+from .icons import icon_provider
+
+
+class PasswordRotateDialog(QDialog):
+    """Auswahl der Einträge, deren Passwörter neu generiert werden"""
+
+    # Signal mit (Eintrags-IDs, Passwort-Länge)
+    rotation_requested = pyqtSignal(list, int)
+
+    def __init__(self, entries: List[PasswordEntry], parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Erstellt das UI des Dialogs"""
+        self.setWindowTitle("Passwörter erneuern")
+        self.setModal(True)
+        self.setMinimumSize(460, 520)
+
+        c = theme.get_colors()
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(14)
+        layout.setContentsMargins(24, 24, 24, 24)
+
+        # Header
+        header_layout = QHBoxLayout()
+        icon_label = QLabel()
+        icon_label.setPixmap(icon_provider.get_pixmap("refresh", c['primary'], 24))
+        header_layout.addWidget(icon_label)
+
+        title = QLabel("Passwörter erneuern")
+        title_font = QFont()
+        title_font.setPointSize(16)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        title.setStyleSheet(f"color: {c['text_primary']};")
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+        layout.addLayout(header_layout)
+
+        hint = QLabel(
+            "Für die ausgewählten Einträge werden neue zufällige Passwörter gespeichert. "
+            "Ändere sie anschließend auch auf den jeweiligen Websites. "
+            "Die bisherigen Passwörter bleiben gespeichert und können wiederhergestellt werden."
+        )
+        hint.setWordWrap(True)
+        hint.setStyleSheet(f"color: {c['text_secondary']}; font-size: 12px;")
+        layout.addWidget(hint)
+
+        # Eintrags-Liste (schwache Passwörter sind vorausgewählt)
+        self.entry_list = QListWidget()
+        self.entry_list.setStyleSheet(f"""
+            QListWidget {{
+                background-color: {c['input_background']};
+                color: {c['text_primary']};
+                border: 2px solid {c['input_border']};
+                border-radius: 8px;
+                padding: 4px;
+            }}
+        """)
+        for entry in self.entries:
+            item = QListWidgetItem(f"{entry.name} ({entry.username})" if entry.username else entry.name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            weak = entry.strength_score is not None and entry.strength_score < WEAK_SCORE_THRESHOLD
+            item.setCheckState(Qt.CheckState.Checked if weak else Qt.CheckState.Unchecked)
+            item.setData(Qt.ItemDataRole.UserRole, entry.id)
+            self.entry_list.addItem(item)
+        self.entry_list.itemChanged.connect(self.update_rotate_button)
+        layout.addWidget(self.entry_list)
+
+        # Länge
+        length_layout = QHBoxLayout()
+        length_label = QLabel("Passwort-Länge:")
+        length_label.setStyleSheet(f"color: {c['text_primary']};")
+        length_layout.addWidget(length_label)
+        self.length_spin = QSpinBox()
+        self.length_spin.setRange(8, 64)
+        self.length_spin.setValue(20)
+        length_layout.addWidget(self.length_spin)
+        length_layout.addStretch()
+        layout.addLayout(length_layout)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        cancel_button = QPushButton("Abbrechen")
+        cancel_button.setMinimumHeight(40)
+        cancel_button.clicked.connect(self.reject)
+        cancel_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {c['background_tertiary']};
+                color: {c['text_primary']};
+                border: 2px solid {c['surface_border']};
+                border-radius: 10px;
+                font-weight: 600;
+                padding: 0 16px;
+            }}
+            QPushButton:hover {{
+                background-color: {c['surface_hover']};
+            }}
+        """)
+        button_layout.addWidget(cancel_button)
+        button_layout.addStretch()
+
+        self.rotate_button = QPushButton()
+        self.rotate_button.setMinimumHeight(40)
+        self.rotate_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rotate_button.clicked.connect(self.request_rotation)
+        self.rotate_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {c['primary']};
+                color: white;
+                border: none;
+                border-radius: 10px;
+                font-weight: 600;
+                padding: 0 20px;
+            }}
+            QPushButton:hover {{
+                background-color: {c['primary_hover']};
+            }}
+            QPushButton:disabled {{
+                background-color: {c['background_tertiary']};
+                color: {c['text_secondary']};
+            }}
+        """)
+        button_layout.addWidget(self.rotate_button)
+        layout.addLayout(button_layout)
+
+        self.update_rotate_button()
+
+    def selected_entry_ids(self) -> List[int]:
+        """Gibt die IDs der ausgewählten Einträge zurück"""
+        return [
+            self.entry_list.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(self.entry_list.count())
+            if self.entry_list.item(row).checkState() == Qt.CheckState.Checked
+        ]
+
+    def update_rotate_button(self, *_):
+        """Aktualisiert Beschriftung und Status des Erneuern-Buttons"""
+        count = len(self.selected_entry_ids())
+        self.rotate_button.setText(f"{count} erneuern")
+        self.rotate_button.setEnabled(count > 0)
+
+    def request_rotation(self):
+        """Sendet die Auswahl an das Hauptfenster und schließt den Dialog"""
+        self.rotation_requested.emit(self.selected_entry_ids(), self.length_spin.value())
+        self.accept()
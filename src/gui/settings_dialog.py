@@ -3,19 +3,22 @@ Einstellungs-Dialog mit modernem Design
 
 Ermöglicht Konfiguration von:
 - Theme (Dark/Light Mode)
+- Reduzierte Bewegung (Animationen aus)
 - Auto-Lock Timeout
 - Zwischenablage Timeout
 - 2FA/TOTP für Datenbank-Unlock
+- Lokaler Datenleck-Corpus (Offline-Prüfung)
 """
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QSpinBox, QFrame, QScrollArea, QWidget, QGroupBox,
-    QMessageBox
+    QMessageBox, QLineEdit, QFileDialog, QCheckBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from ..core.settings import app_settings
 from ..core.totp_manager import totp_manager
+from ..password.breach import breach_checker
 from .themes import theme
 from .icons import icon_provider
 from .animations import animator
@@ -139,6 +142,16 @@ class SettingsDialog(QDialog):
         theme_row.addWidget(self.theme_combo)
         appearance_layout.addLayout(theme_row)
 
+        # Reduzierte Bewegung
+        motion_row = self.create_setting_row(
+            "Reduzierte Bewegung",
+            "Übergänge sofort ausführen statt zu animieren"
+        )
+        self.reduced_motion_check = QCheckBox()
+        self.reduced_motion_check.setCursor(Qt.CursorShape.PointingHandCursor)
+        motion_row.addWidget(self.reduced_motion_check)
+        appearance_layout.addLayout(motion_row)
+
         appearance_group.setLayout(appearance_layout)
         content_layout.addWidget(appearance_group)
 
@@ -197,6 +210,52 @@ class SettingsDialog(QDialog):
         clipboard_row.addWidget(self.clipboard_spin)
         security_layout.addLayout(clipboard_row)
 
+        # Datenleck-Corpus (offline)
+        breach_row = self.create_setting_row(
+            "Datenleck-Prüfung (offline)",
+            "Sortierte SHA-1-Liste (Pwned Passwords) oder Verzeichnis mit Präfix-Dateien"
+        )
+        breach_controls = QHBoxLayout()
+        breach_controls.setSpacing(8)
+
+        self.breach_path_input = QLineEdit()
+        self.breach_path_input.setReadOnly(True)
+        self.breach_path_input.setPlaceholderText("Nicht konfiguriert")
+        self.breach_path_input.setMinimumHeight(40)
+        self.breach_path_input.setMinimumWidth(200)
+        self.breach_path_input.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {c['background_tertiary']};
+                color: {c['text_primary']};
+                border: 2px solid {c['surface_border']};
+                border-radius: 8px;
+                padding: 8px 12px;
+                font-size: 13px;
+            }}
+        """)
+        breach_controls.addWidget(self.breach_path_input)
+
+        breach_file_button = QPushButton("Datei...")
+        breach_file_button.setMinimumHeight(40)
+        breach_file_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        breach_file_button.clicked.connect(self.choose_breach_corpus_file)
+        breach_controls.addWidget(breach_file_button)
+
+        breach_dir_button = QPushButton("Ordner...")
+        breach_dir_button.setMinimumHeight(40)
+        breach_dir_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        breach_dir_button.clicked.connect(self.choose_breach_corpus_dir)
+        breach_controls.addWidget(breach_dir_button)
+
+        breach_clear_button = QPushButton("Entfernen")
+        breach_clear_button.setMinimumHeight(40)
+        breach_clear_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        breach_clear_button.clicked.connect(self.breach_path_input.clear)
+        breach_controls.addWidget(breach_clear_button)
+
+        breach_row.addLayout(breach_controls)
+        security_layout.addLayout(breach_row)
+
         # 2FA / TOTP
         if self.db_manager:
             totp_row = self.create_setting_row(
@@ -404,6 +463,9 @@ class SettingsDialog(QDialog):
         theme_index = {"light": 0, "dark": 1, "system": 2}.get(theme_mode, 0)
         self.theme_combo.setCurrentIndex(theme_index)
 
+        # Reduzierte Bewegung
+        self.reduced_motion_check.setChecked(app_settings.get("reduced_motion", False))
+
         # Auto-Lock
         auto_lock = app_settings.get("auto_lock_minutes", 5)
         self.autolock_spin.setValue(auto_lock)
@@ -412,6 +474,9 @@ class SettingsDialog(QDialog):
         clipboard_clear = app_settings.get("clipboard_clear_seconds", 30)
         self.clipboard_spin.setValue(clipboard_clear)
 
+        # Datenleck-Corpus
+        self.breach_path_input.setText(app_settings.get("breach_corpus_path") or "")
+
         # 2FA Status
         if self.db_manager:
             self.update_2fa_status()
@@ -423,17 +488,41 @@ class SettingsDialog(QDialog):
         theme_mode = theme_map[self.theme_combo.currentIndex()]
         app_settings.set("theme_mode", theme_mode)
 
+        # Reduzierte Bewegung
+        reduced_motion = self.reduced_motion_check.isChecked()
+        app_settings.set("reduced_motion", reduced_motion)
+        animator.set_reduced_motion(reduced_motion)
+
         # Auto-Lock
         app_settings.set("auto_lock_minutes", self.autolock_spin.value())
 
         # Clipboard Clear
         app_settings.set("clipboard_clear_seconds", self.clipboard_spin.value())
 
+        # Datenleck-Corpus
+        breach_path = self.breach_path_input.text() or None
+        app_settings.set("breach_corpus_path", breach_path)
+        breach_checker.configure(breach_path)
+
         # Emit Signal
         self.settings_changed.emit()
 
         self.accept()
 
+    def choose_breach_corpus_file(self):
+        """Wählt eine sortierte Hash-Datei als Datenleck-Corpus"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Datenleck-Corpus wählen", "", "Hash-Listen (*.txt);;Alle Dateien (*)"
+        )
+        if path:
+            self.breach_path_input.setText(path)
+
+    def choose_breach_corpus_dir(self):
+        """Wählt ein Verzeichnis mit Präfix-Dateien als Datenleck-Corpus"""
+        path = QFileDialog.getExistingDirectory(self, "Datenleck-Corpus wählen")
+        if path:
+            self.breach_path_input.setText(path)
+
     def update_2fa_status(self):
         """Aktualisiert 2FA-Status-Anzeige"""
         if not self.db_manager:
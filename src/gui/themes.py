@@ -1,10 +1,17 @@
 """
 Theme-System für Light und Dark Mode
+
+Das globale Stylesheet wird pro ThemeMode einmal erzeugt und gecacht. Es
+enthält auch die Styles der Hauptfenster-Komponenten; diese werden über
+objectName und dynamische Properties (z.B. class, state) ausgewählt statt
+über eigene setStyleSheet-Aufrufe pro Widget. Ein Theme-Wechsel ist damit
+ein einziger Austausch des App-Stylesheets.
 """
 from enum import Enum
+from typing import Any, Dict, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QWidget
 
 
 class ThemeMode(Enum):
@@ -98,6 +105,8 @@ class Theme(QObject):
     def __init__(self):
         super().__init__()
         self.current_mode = ThemeMode.LIGHT
+        # Fertige Stylesheets pro Modus (werden nur einmal erzeugt)
+        self._stylesheets: Dict[ThemeMode, str] = {}
 
     def get_colors(self):
         """Gibt die aktuellen Theme-Farben zurück"""
@@ -113,10 +122,26 @@ class Theme(QObject):
         self.current_mode = mode
         self.theme_changed.emit()
 
-    def get_stylesheet(self) -> str:
-        """Gibt das globale Stylesheet zurück"""
-        c = self.get_colors()
+    def get_stylesheet(self, mode: Optional[ThemeMode] = None) -> str:
+        """
+        Gibt das globale Stylesheet zurück (pro Modus gecacht)
+
+        Args:
+            mode: Theme-Modus (Standard: aktueller Modus)
 
+        Returns:
+            Stylesheet als String
+        """
+        mode = mode or self.current_mode
+        stylesheet = self._stylesheets.get(mode)
+        if stylesheet is None:
+            colors = self.DARK if mode == ThemeMode.DARK else self.LIGHT
+            stylesheet = self._build_stylesheet(colors) + self._build_component_stylesheet(colors)
+            self._stylesheets[mode] = stylesheet
+        return stylesheet
+
+    def _build_stylesheet(self, c: Dict[str, str]) -> str:
+        """Erzeugt die Basis-Styles für Standard-Widgets"""
         return f"""
             /* Globale Styles */
             QWidget {{
@@ -396,9 +421,288 @@ class Theme(QObject):
             }}
         """
 
+    def _build_component_stylesheet(self, c: Dict[str, str]) -> str:
+        """
+        Erzeugt die Styles der Hauptfenster-Komponenten
+
+        Die Selektoren verwenden objectName (#...), damit sie Vorrang vor den
+        allgemeinen QPushButton-/QLabel-Regeln haben.
+        """
+        return f"""
+            /* Header */
+            QFrame#mainHeader {{
+                background-color: {c["surface"]};
+                border: none;
+            }}
+
+            QLabel#appTitle {{
+                color: {c["primary"]};
+            }}
+
+            QPushButton#lockButton {{
+                background-color: {c["background_tertiary"]};
+                color: {c["text_primary"]};
+                border: 2px solid {c["surface_border"]};
+                border-radius: 12px;
+                padding: 0 16px;
+                font-size: 14px;
+                font-weight: 600;
+            }}
+
+            QPushButton#lockButton:hover {{
+                background-color: {c["danger"]};
+                color: white;
+                border-color: {c["danger"]};
+            }}
+
+            /* Sidebar */
+            QFrame#sidebar {{
+                background-color: {c["background_secondary"]};
+                border-right: 2px solid {c["surface_border"]};
+            }}
+
+            QLabel#sidebarTitle {{
+                color: {c["text_primary"]};
+                padding-left: 5px;
+            }}
+
+            /* Kategorie-Buttons (Akzentfarbe zeichnet CategoryButton selbst) */
+            QPushButton#categoryButton {{
+                text-align: left;
+                padding: 12px 16px;
+                border: none;
+                border-left: 4px solid transparent;
+                background-color: transparent;
+                font-size: 14px;
+                font-weight: 500;
+                border-radius: 0px 12px 12px 0px;
+                color: {c["text_primary"]};
+            }}
+
+            QPushButton#categoryButton:hover {{
+                background-color: {c["surface_hover"]};
+            }}
+
+            QPushButton#categoryButton:checked {{
+                background-color: {c["surface_hover"]};
+                font-weight: 700;
+                color: {c["primary"]};
+            }}
+
+            QPushButton#categoryButton:pressed {{
+                background-color: {c["background_tertiary"]};
+            }}
+
+            /* Aktions-Buttons im Hauptfenster */
+            QPushButton#sidebarAction, QPushButton#contentAction {{
+                color: white;
+                border: none;
+                border-radius: 10px;
+                font-weight: 600;
+            }}
+
+            QPushButton#sidebarAction {{
+                background-color: {c["primary"]};
+                padding: 10px;
+            }}
+
+            QPushButton#sidebarAction:hover {{
+                background-color: {c["primary_hover"]};
+            }}
+
+            QPushButton#contentAction {{
+                background-color: {c["secondary"]};
+                font-size: 14px;
+                padding: 10px 20px;
+            }}
+
+            QPushButton#contentAction:hover {{
+                background-color: {c["secondary_hover"]};
+            }}
+
+            /* Inhaltsbereich */
+            QWidget#contentArea {{
+                background-color: {c["background"]};
+            }}
+
+            QLabel#contentTitle {{
+                color: {c["text_primary"]};
+            }}
+
+            QListView#entryList {{
+                background-color: {c["background"]};
+                border: none;
+            }}
+
+            /* Eintrags-Karte (PasswordEntryWidget) */
+            PasswordEntryWidget {{
+                background-color: {c["surface"]};
+                border: 2px solid {c["surface_border"]};
+                border-radius: 16px;
+                padding: 0px;
+            }}
+
+            PasswordEntryWidget:hover {{
+                background-color: {c["surface_hover"]};
+                border-color: {c["primary"]};
+            }}
+
+            QLabel#entryName {{
+                color: {c["text_primary"]};
+            }}
+
+            QLabel#entryUsername {{
+                color: {c["text_secondary"]};
+                font-size: 13px;
+            }}
+
+            QLabel#entryWebsite {{
+                color: {c["primary"]};
+                font-size: 12px;
+            }}
+
+            QLabel#totpCode {{
+                color: {c["primary"]};
+            }}
+
+            QLabel#totpCountdown {{
+                color: {c["text_tertiary"]};
+                font-size: 12px;
+            }}
+
+            QLabel#passwordField {{
+                color: {c["text_tertiary"]};
+                padding: 10px 14px;
+                background-color: {c["background_tertiary"]};
+                border-radius: 8px;
+            }}
+
+            QLabel#passwordField[state="visible"] {{
+                color: {c["text_primary"]};
+                border: 2px solid {c["primary"]};
+            }}
+
+            QLabel#passwordField[state="error"] {{
+                color: {c["danger"]};
+            }}
+
+            QPushButton#entryAction {{
+                background-color: {c["background_tertiary"]};
+                border: 2px solid {c["surface_border"]};
+                border-radius: 10px;
+                padding: 0px;
+            }}
+
+            QPushButton#entryAction[action="reveal"]:hover {{
+                background-color: {c["primary"]};
+                border-color: {c["primary"]};
+            }}
+
+            QPushButton#entryAction[action="copy"]:hover {{
+                background-color: {c["secondary"]};
+                border-color: {c["secondary"]};
+            }}
+
+            QPushButton#entryAction[action="edit"]:hover {{
+                background-color: {c["warning"]};
+                border-color: {c["warning"]};
+            }}
+
+            QPushButton#entryAction[action="delete"]:hover {{
+                background-color: {c["danger"]};
+                border-color: {c["danger"]};
+            }}
+
+            QPushButton#entryAction[copied="true"] {{
+                background-color: {c["secondary"]};
+                border: none;
+            }}
+
+            /* Dashboard */
+            StatCard {{
+                background-color: {c["background_secondary"]};
+                border: 2px solid {c["surface_border"]};
+                border-radius: 12px;
+            }}
+
+            StatCard:hover {{
+                border-color: {c["primary"]};
+                background-color: {c["surface_hover"]};
+            }}
+
+            QLabel#statValue, QLabel#dashboardHeader, QLabel#dashboardRowName {{
+                color: {c["text_primary"]};
+            }}
+
+            QLabel#statTitle, QLabel#dashboardHint, QLabel#dashboardRowDate {{
+                color: {c["text_secondary"]};
+            }}
+
+            QLabel#dashboardRowCount {{
+                color: {c["primary"]};
+            }}
+
+            QPushButton#dashboardButton {{
+                background-color: {c["background_secondary"]};
+                color: {c["text_primary"]};
+                border: 2px solid {c["surface_border"]};
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-size: 13px;
+            }}
+
+            QPushButton#dashboardButton:hover {{
+                background-color: {c["surface_hover"]};
+                border-color: {c["primary"]};
+            }}
+
+            QScrollArea#dashboardScroll {{
+                background-color: {c["background"]};
+                border: none;
+            }}
+
+            QFrame#dashboardRow {{
+                background-color: {c["background_secondary"]};
+                border: 1px solid {c["surface_border"]};
+                border-radius: 8px;
+                padding: 12px;
+            }}
+
+            QFrame#dashboardRow:hover {{
+                background-color: {c["surface_hover"]};
+            }}
+
+            QFrame#dashboardRow[clickable="true"]:hover {{
+                border-color: {c["primary"]};
+            }}
+        """
+
     def apply_theme(self, app: QApplication):
-        """Wendet das aktuelle Theme auf die Anwendung an"""
-        app.setStyleSheet(self.get_stylesheet())
+        """Wendet das aktuelle Theme auf die Anwendung an (nur wenn es sich geändert hat)"""
+        stylesheet = self.get_stylesheet()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+
+
+def set_style_property(widget: QWidget, name: str, value: Any):
+    """
+    Setzt eine dynamische Property, die im Stylesheet als Selektor dient
+
+    Qt wertet Property-Selektoren nur beim Polishing aus, daher wird das
+    Widget danach neu gestylt.
+
+    Args:
+        widget: Zu stylendes Widget
+        name: Name der Property (z.B. "state")
+        value: Neuer Wert
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
 
 
 # Globale Theme-Instanz
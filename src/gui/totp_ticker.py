@@ -0,0 +1,98 @@
+"""
+Gemeinsamer Sekundentakt für TOTP-Anzeigen
+
+Statt eines QTimers pro Eintrag gibt es einen einzigen 1-Hz-Timer, der nur
+läuft, solange TOTP-Widgets registriert sind. Pro Takt werden nur Widgets
+aktualisiert, die tatsächlich im sichtbaren Bereich der Liste liegen; der
+Code selbst wird nur beim Wechsel des 30-Sekunden-Fensters neu berechnet
+(siehe CachedTOTP).
+"""
+import time
+from typing import Dict
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QWidget
+
+
+class TOTPTicker(QObject):
+    """1-Hz-Scheduler für alle TOTP-Widgets"""
+
+    INTERVAL_MS = 1000
+
+    def __init__(self):
+        super().__init__()
+        self._widgets: Dict[int, QWidget] = {}
+        self._timer = None
+        self._tick_pending = False
+
+    def register(self, widget: QWidget):
+        """
+        Meldet ein Widget an (muss update_totp(now) und reset_totp() anbieten)
+
+        Das Widget wird beim Zerstören automatisch abgemeldet.
+        """
+        key = id(widget)
+        if key in self._widgets:
+            return
+        self._widgets[key] = widget
+        widget.destroyed.connect(lambda _=None, key=key: self._remove(key))
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(self.INTERVAL_MS)
+            self._timer.timeout.connect(self.tick)
+        if not self._timer.isActive():
+            self._timer.start()
+
+        # Neue Widgets nicht erst nach einer Sekunde füllen (mehrere Anmeldungen = ein Takt)
+        if not self._tick_pending:
+            self._tick_pending = True
+            QTimer.singleShot(0, self.tick)
+
+    def unregister(self, widget: QWidget):
+        """Meldet ein Widget ab"""
+        self._remove(id(widget))
+
+    def _remove(self, key: int):
+        self._widgets.pop(key, None)
+        if not self._widgets and self._timer is not None:
+            try:
+                self._timer.stop()
+            except RuntimeError:
+                # Beim Beenden der Anwendung ist der Timer ggf. schon gelöscht
+                self._timer = None
+
+    @staticmethod
+    def _is_on_screen(widget: QWidget) -> bool:
+        """Prüft ob das Widget sichtbar ist und nicht aus dem Scrollbereich geschnitten wird"""
+        try:
+            return widget.isVisible() and not widget.visibleRegion().isEmpty()
+        except RuntimeError:
+            # C++-Objekt bereits gelöscht, destroyed noch nicht verarbeitet
+            return False
+
+    def visible_widgets(self):
+        """Gibt die aktuell sichtbaren registrierten Widgets zurück"""
+        return [widget for widget in list(self._widgets.values()) if self._is_on_screen(widget)]
+
+    def tick(self):
+        """Aktualisiert alle sichtbaren Widgets"""
+        self._tick_pending = False
+        now = time.time()
+        for widget in self.visible_widgets():
+            widget.update_totp(now)
+
+    def reset(self):
+        """Lässt alle Widgets ihren TOTP-Zustand verwerfen (z.B. beim Sperren)"""
+        for widget in list(self._widgets.values()):
+            try:
+                widget.reset_totp()
+            except RuntimeError:
+                continue
+
+    def registered_count(self) -> int:
+        """Anzahl registrierter Widgets"""
+        return len(self._widgets)
+
+
+# Globale Instanz
+totp_ticker = TOTPTicker()
@@ -2,16 +2,21 @@
 Benutzerdefinierte Widgets mit modernem Design und Animationen
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QPainter, QColor
 from ..core.models import PasswordEntry
 from ..core.encryption import encryption_manager
+from ..core.totp_manager import totp_manager
 from ..utils.clipboard import clipboard_manager
-from .themes import theme
+from .themes import theme, set_style_property
 from .animations import animator
 from .icons import icon_provider
+from .totp_ticker import totp_ticker
+
+# Platzhalter, bis der Code beim ersten sichtbaren Takt berechnet wurde
+TOTP_PLACEHOLDER = "••• •••"
 
 
 class PasswordEntryWidget(QFrame):
@@ -24,8 +29,13 @@ class PasswordEntryWidget(QFrame):
         super().__init__(parent)
         self.entry = entry
         self.password_visible = False
+        self._totp = None          # CachedTOTP, erst beim ersten sichtbaren Takt entschlüsselt
+        self._totp_counter = None  # Zuletzt angezeigtes Zeitfenster
         self.setup_ui()
 
+        if self.entry.encrypted_totp:
+            totp_ticker.register(self)
+
         # Fade-in Animation beim Erstellen
         QTimer.singleShot(10, lambda: animator.fade_in(self, 200))
 
@@ -37,19 +47,7 @@ class PasswordEntryWidget(QFrame):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.setMinimumHeight(120)
 
-        # Basis-Styling
-        self.setStyleSheet(f"""
-            PasswordEntryWidget {{
-                background-color: {c['surface']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 16px;
-                padding: 0px;
-            }}
-            PasswordEntryWidget:hover {{
-                background-color: {c['surface_hover']};
-                border-color: {c['primary']};
-            }}
-        """)
+        # Styling über das globale Stylesheet (PasswordEntryWidget, #entryAction, #passwordField, ...)
 
         # Haupt-Layout
         main_layout = QVBoxLayout()
@@ -77,22 +75,14 @@ class PasswordEntryWidget(QFrame):
         name_font.setPointSize(14)
         name_font.setBold(True)
         name_label.setFont(name_font)
-        name_label.setStyleSheet(f"color: {c['text_primary']};")
+        name_label.setObjectName("entryName")
         name_container.addWidget(name_label)
         name_container.addStretch()
 
         first_row.addLayout(name_container)
         first_row.addStretch()
 
-        # Action Buttons
-        button_style_base = f"""
-            QPushButton {{
-                background-color: {c['background_tertiary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 10px;
-            }}
-        """
-
+        # Action Buttons (Hover-Farbe über die Property "action")
         # View Button
         self.view_button = QPushButton()
         view_icon = icon_provider.get_icon("eye", c['text_secondary'], 18)
@@ -101,12 +91,8 @@ class PasswordEntryWidget(QFrame):
         self.view_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.view_button.clicked.connect(self.toggle_password)
         self.view_button.setToolTip("Passwort anzeigen/verstecken")
-        self.view_button.setStyleSheet(button_style_base + f"""
-            QPushButton:hover {{
-                background-color: {c['primary']};
-                border-color: {c['primary']};
-            }}
-        """)
+        self.view_button.setObjectName("entryAction")
+        self.view_button.setProperty("action", "reveal")
         first_row.addWidget(self.view_button)
 
         # Copy Button
@@ -117,12 +103,8 @@ class PasswordEntryWidget(QFrame):
         self.copy_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.copy_button.clicked.connect(self.copy_password)
         self.copy_button.setToolTip("Passwort kopieren")
-        self.copy_button.setStyleSheet(button_style_base + f"""
-            QPushButton:hover {{
-                background-color: {c['secondary']};
-                border-color: {c['secondary']};
-            }}
-        """)
+        self.copy_button.setObjectName("entryAction")
+        self.copy_button.setProperty("action", "copy")
         first_row.addWidget(self.copy_button)
 
         # Edit Button
@@ -133,12 +115,8 @@ class PasswordEntryWidget(QFrame):
         self.edit_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.edit_button.clicked.connect(lambda: self.edit_clicked.emit(self.entry))
         self.edit_button.setToolTip("Bearbeiten")
-        self.edit_button.setStyleSheet(button_style_base + f"""
-            QPushButton:hover {{
-                background-color: {c['warning']};
-                border-color: {c['warning']};
-            }}
-        """)
+        self.edit_button.setObjectName("entryAction")
+        self.edit_button.setProperty("action", "edit")
         first_row.addWidget(self.edit_button)
 
         # Delete Button
@@ -149,12 +127,8 @@ class PasswordEntryWidget(QFrame):
         self.delete_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.delete_button.clicked.connect(lambda: self.delete_clicked.emit(self.entry))
         self.delete_button.setToolTip("Löschen")
-        self.delete_button.setStyleSheet(button_style_base + f"""
-            QPushButton:hover {{
-                background-color: {c['danger']};
-                border-color: {c['danger']};
-            }}
-        """)
+        self.delete_button.setObjectName("entryAction")
+        self.delete_button.setProperty("action", "delete")
         first_row.addWidget(self.delete_button)
 
         main_layout.addLayout(first_row)
@@ -175,7 +149,7 @@ class PasswordEntryWidget(QFrame):
             username_container.addWidget(user_icon_label)
 
             username_label = QLabel(self.entry.username)
-            username_label.setStyleSheet(f"color: {c['text_secondary']}; font-size: 13px;")
+            username_label.setObjectName("entryUsername")
             username_container.addWidget(username_label)
             username_container.addStretch()
 
@@ -185,14 +159,42 @@ class PasswordEntryWidget(QFrame):
         self.password_label = QLabel("••••••••••••")
         password_font = QFont('Consolas', 12)
         self.password_label.setFont(password_font)
-        self.password_label.setStyleSheet(f"""
-            color: {c['text_tertiary']};
-            padding: 10px 14px;
-            background-color: {c['background_tertiary']};
-            border-radius: 8px;
-        """)
+        self.password_label.setObjectName("passwordField")
         details_layout.addWidget(self.password_label)
 
+        # TOTP-Code (falls Secret hinterlegt), aktualisiert durch totp_ticker
+        if self.entry.encrypted_totp:
+            totp_container = QHBoxLayout()
+            totp_container.setSpacing(8)
+
+            totp_icon_label = QLabel()
+            totp_icon_label.setPixmap(icon_provider.get_pixmap("shield", c['text_tertiary'], 14))
+            totp_icon_label.setFixedSize(14, 14)
+            totp_container.addWidget(totp_icon_label)
+
+            self.totp_label = QLabel(TOTP_PLACEHOLDER)
+            totp_font = QFont('Consolas', 12)
+            totp_font.setBold(True)
+            self.totp_label.setFont(totp_font)
+            self.totp_label.setObjectName("totpCode")
+            totp_container.addWidget(self.totp_label)
+
+            self.totp_countdown_label = QLabel()
+            self.totp_countdown_label.setObjectName("totpCountdown")
+            totp_container.addWidget(self.totp_countdown_label)
+            totp_container.addStretch()
+
+            self.totp_copy_button = QPushButton()
+            self.totp_copy_button.setIcon(icon_provider.get_icon("copy", c['text_secondary'], 14))
+            self.totp_copy_button.setFixedSize(28, 28)
+            self.totp_copy_button.setCursor(Qt.CursorShape.PointingHandCursor)
+            self.totp_copy_button.clicked.connect(self.copy_totp_code)
+            self.totp_copy_button.setToolTip("2FA-Code kopieren")
+            self.totp_copy_button.setObjectName("entryAction")
+            totp_container.addWidget(self.totp_copy_button)
+
+            details_layout.addLayout(totp_container)
+
         # Website (falls vorhanden)
         if self.entry.website_url:
             website_container = QHBoxLayout()
@@ -205,7 +207,7 @@ class PasswordEntryWidget(QFrame):
             website_container.addWidget(link_icon_label)
 
             website_label = QLabel(self.entry.website_url)
-            website_label.setStyleSheet(f"color: {c['primary']}; font-size: 12px;")
+            website_label.setObjectName("entryWebsite")
             website_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
             website_label.setCursor(Qt.CursorShape.IBeamCursor)
             website_container.addWidget(website_label)
@@ -230,13 +232,7 @@ class PasswordEntryWidget(QFrame):
                 password_font.setBold(True)
                 self.password_label.setFont(password_font)
 
-                self.password_label.setStyleSheet(f"""
-                    color: {c['text_primary']};
-                    padding: 10px 14px;
-                    background-color: {c['background_tertiary']};
-                    border-radius: 8px;
-                    border: 2px solid {c['primary']};
-                """)
+                set_style_property(self.password_label, "state", "visible")
 
                 # Update Icon
                 eye_off_icon = icon_provider.get_icon("eye_off", c['text_secondary'], 18)
@@ -247,23 +243,13 @@ class PasswordEntryWidget(QFrame):
 
             except Exception as e:
                 self.password_label.setText(f"❌ Fehler beim Entschlüsseln")
-                self.password_label.setStyleSheet(f"""
-                    color: {c['danger']};
-                    padding: 10px 14px;
-                    background-color: {c['background_tertiary']};
-                    border-radius: 8px;
-                """)
+                set_style_property(self.password_label, "state", "error")
         else:
             self.password_label.setText("••••••••••••")
             password_font = QFont('Consolas', 12)
             self.password_label.setFont(password_font)
 
-            self.password_label.setStyleSheet(f"""
-                color: {c['text_tertiary']};
-                padding: 10px 14px;
-                background-color: {c['background_tertiary']};
-                border-radius: 8px;
-            """)
+            set_style_property(self.password_label, "state", None)
 
             # Update Icon
             eye_icon = icon_provider.get_icon("eye", c['text_secondary'], 18)
@@ -271,7 +257,6 @@ class PasswordEntryWidget(QFrame):
 
     def copy_password(self):
         """Kopiert das Passwort in die Zwischenablage mit visuellem Feedback"""
-        c = theme.get_colors()
         try:
             decrypted = encryption_manager.decrypt(self.entry.encrypted_password)
             clipboard_manager.copy_to_clipboard(decrypted, auto_clear_seconds=30)
@@ -279,13 +264,7 @@ class PasswordEntryWidget(QFrame):
             # Visuelles Feedback
             check_icon = icon_provider.get_icon("check", "white", 18)
             self.copy_button.setIcon(check_icon)
-            self.copy_button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {c['secondary']};
-                    border: none;
-                    border-radius: 10px;
-                }}
-            """)
+            set_style_property(self.copy_button, "copied", True)
 
             # Pulse Animation
             animator.pulse(self.copy_button, 1.15, 180)
@@ -296,22 +275,58 @@ class PasswordEntryWidget(QFrame):
         except Exception as e:
             self.password_label.setText(f"❌ Fehler: {str(e)}")
 
+    def _get_totp(self):
+        """Entschlüsselt das Secret beim ersten Bedarf und holt den gecachten Generator"""
+        if self._totp is None:
+            secret = encryption_manager.decrypt(self.entry.encrypted_totp)
+            self._totp = totp_manager.get_totp(secret)
+        return self._totp
+
+    def update_totp(self, now: float):
+        """
+        Aktualisiert Code und Countdown (aufgerufen von totp_ticker, nur wenn sichtbar)
+
+        Args:
+            now: Aktueller Unix-Zeitstempel
+        """
+        try:
+            totp = self._get_totp()
+        except Exception:
+            self.totp_label.setText("❌ Ungültiges Secret")
+            totp_ticker.unregister(self)
+            return
+
+        counter = totp.counter(now)
+        if counter != self._totp_counter:
+            code = totp.at_counter(counter)
+            middle = len(code) // 2
+            self.totp_label.setText(f"{code[:middle]} {code[middle:]}")
+            self._totp_counter = counter
+        self.totp_countdown_label.setText(f"{totp.remaining_seconds(now)}s")
+
+    def reset_totp(self):
+        """Verwirft Generator und angezeigten Code (z.B. beim Sperren)"""
+        self._totp = None
+        self._totp_counter = None
+        if self.entry.encrypted_totp:
+            self.totp_label.setText(TOTP_PLACEHOLDER)
+            self.totp_countdown_label.clear()
+
+    def copy_totp_code(self):
+        """Kopiert den aktuellen 2FA-Code in die Zwischenablage"""
+        try:
+            code = self._get_totp().now()
+        except Exception:
+            return
+        clipboard_manager.copy_to_clipboard(code, auto_clear_seconds=30)
+        animator.pulse(self.totp_copy_button, 1.15, 180)
+
     def reset_copy_button(self):
         """Setzt den Copy-Button zurück"""
         c = theme.get_colors()
         copy_icon = icon_provider.get_icon("copy", c['text_secondary'], 18)
         self.copy_button.setIcon(copy_icon)
-        self.copy_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {c['background_tertiary']};
-                border: 2px solid {c['surface_border']};
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {c['secondary']};
-                border-color: {c['secondary']};
-            }}
-        """)
+        set_style_property(self.copy_button, "copied", None)
 
 
 class CategoryButton(QPushButton):
@@ -329,91 +344,42 @@ class CategoryButton(QPushButton):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.setMinimumHeight(48)
 
+        # Styles aus dem globalen Stylesheet (#categoryButton), Akzentfarbe in paintEvent
+        self.setObjectName("categoryButton")
         self.update_display()
-        self.setStyleSheet(self._get_stylesheet())
 
     def update_display(self):
         """Aktualisiert die Anzeige des Buttons"""
-        c = theme.get_colors()
-
-        # Layout für Button-Inhalt
-        layout = QHBoxLayout()
-        layout.setContentsMargins(12, 0, 12, 0)
-        layout.setSpacing(10)
-
-        # Icon
-        if "Alle" in self.category_name:
-            icon_name = "folder"
-        else:
-            icon_name = "folder_open"
-
-        icon_label = QLabel()
-        icon_pixmap = icon_provider.get_pixmap(icon_name, c['text_secondary'], 18)
-        icon_label.setPixmap(icon_pixmap)
-        icon_label.setFixedSize(18, 18)
-
-        # Text
-        text_label = QLabel(f"{self.category_name}")
-        text_label.setStyleSheet(f"color: {c['text_primary']}; font-size: 13px; background: transparent; border: none;")
-
-        # Count Badge
-        count_label = QLabel(str(self.count))
-        count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        count_label.setFixedSize(28, 22)
-        count_label.setStyleSheet(f"""
-            background-color: {c['background_tertiary']};
-            color: {c['text_secondary']};
-            border-radius: 11px;
-            font-size: 11px;
-            font-weight: 600;
-        """)
-
-        # Zusammensetzen
-        container = QWidget()
-        button_layout = QHBoxLayout(container)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-        button_layout.setSpacing(10)
-        button_layout.addWidget(icon_label)
-        button_layout.addWidget(text_label)
-        button_layout.addStretch()
-        button_layout.addWidget(count_label)
-
-        self.setText("")  # Entferne Text, verwende Layout
-        # Da QPushButton kein Layout direkt unterstützt, verwenden wir weiterhin Text
-        # aber mit besserem Styling
         self.setText(f"  {self.category_name}")
 
-    def _get_stylesheet(self) -> str:
-        """Gibt das Stylesheet für den Button zurück"""
-        c = theme.get_colors()
-        return f"""
-            QPushButton {{
-                text-align: left;
-                padding: 12px 16px;
-                border: none;
-                border-left: 4px solid transparent;
-                background-color: transparent;
-                font-size: 14px;
-                font-weight: 500;
-                border-radius: 0px 12px 12px 0px;
-                color: {c['text_primary']};
-            }}
-            QPushButton:hover {{
-                background-color: {c['surface_hover']};
-            }}
-            QPushButton:checked {{
-                background-color: {c['surface_hover']};
-                border-left: 4px solid {self.color};
-                font-weight: 700;
-                color: {c['primary']};
-            }}
-            QPushButton:pressed {{
-                background-color: {c['background_tertiary']};
-            }}
+    def update_category(self, name: str, color: str = None):
         """
+        Übernimmt geänderten Namen und Farbe der Kategorie
+
+        Args:
+            name: Anzeigename
+            color: Kategorie-Farbe
+        """
+        color = color or "#808080"
+        if name == self.category_name and color == self.color:
+            return
+        self.category_name = name
+        self.color = color
+        self.update_display()
+        self.update()
+
+    def paintEvent(self, event):
+        """Zeichnet den Button und bei Auswahl den Farbbalken der Kategorie"""
+        super().paintEvent(event)
+        if self.isChecked():
+            painter = QPainter(self)
+            painter.fillRect(0, 0, 4, self.height(), QColor(self.color))
+            painter.end()
 
     def update_count(self, count: int):
         """Aktualisiert die Anzahl der Einträge"""
+        if count == self.count:
+            return
         self.count = count
         self.setText(f"  {self.category_name}")
         # Für eine bessere Anzeige können wir später ein Custom Paint Event verwenden
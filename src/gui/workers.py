@@ -0,0 +1,237 @@
+"""
+Hintergrund-Worker für langlaufende Aufgaben
+
+Die Worker laufen in eigenen QThreads und melden Fortschritt und Ergebnis
+über Signals zurück an den UI-Thread.
+"""
+import logging
+import threading
+from typing import Sequence, Tuple, TYPE_CHECKING
+from PyQt6.QtCore import QThread, pyqtSignal
+from ..core.database import STAGE_OPEN, ENTRY_CHUNK_SIZE
+from ..core.database_file import WrongPasswordError
+from ..core.unlock import (
+    unlock_vault, UnlockCancelled, UNLOCK_STAGES, STAGE_INDEX, STAGE_LABELS, STAGE_VERIFY
+)
+from ..testing.performance import startup_timeline
+
+if TYPE_CHECKING:
+    # Audit (multiprocessing, Stärke-Bewertung) wird erst im Hauptfenster gebraucht
+    from ..core.audit import PasswordAuditEngine, AuditRow
+    from ..core.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWorker(QThread):
+    """Führt das Passwort-Audit außerhalb des UI-Threads aus"""
+
+    progress = pyqtSignal(int, int)      # erledigt, gesamt
+    audit_finished = pyqtSignal(object)  # AuditReport
+    audit_failed = pyqtSignal(str)
+
+    def __init__(self, engine: "PasswordAuditEngine", rows: Sequence["AuditRow"], parent=None):
+        """
+        Initialisiert den Worker
+
+        Args:
+            engine: Audit-Engine (hält den Ergebnis-Cache über mehrere Läufe)
+            rows: Einträge aus DatabaseManager.get_entries_for_audit() - werden im
+                  UI-Thread geladen, da die SQLite-Verbindung an ihn gebunden ist
+            parent: Parent-QObject
+        """
+        super().__init__(parent)
+        self.engine = engine
+        self.rows = rows
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bricht das Audit nach dem aktuellen Batch ab"""
+        self._cancel_event.set()
+
+    def run(self):
+        """Thread-Einstiegspunkt"""
+        try:
+            report = self.engine.run(
+                self.rows,
+                progress_callback=self.progress.emit,
+                cancel_event=self._cancel_event
+            )
+            self.audit_finished.emit(report)
+        except Exception as e:
+            logger.error(f"Fehler beim Passwort-Audit: {e}")
+            self.audit_failed.emit(str(e))
+
+
+class AnalyticsBackfillWorker(QThread):
+    """Entschlüsselt und bewertet Passwörter ohne Auswertung im Hintergrund"""
+
+    backfill_finished = pyqtSignal(object, bool)  # [(ID, Score, Fingerprint)], Version veraltet
+    backfill_failed = pyqtSignal(str)
+
+    def __init__(self, rows: Sequence[Tuple[int, bytes]], outdated: bool, parent=None):
+        """
+        Initialisiert den Worker
+
+        Args:
+            rows: (ID, verschlüsseltes Passwort) aus load_backfill_rows() - im
+                  UI-Thread geladen; zurückgeschrieben wird ebenfalls dort
+            outdated: Ob die Bewertungs-Version veraltet ist
+            parent: Parent-QObject
+        """
+        super().__init__(parent)
+        self.rows = rows
+        self.outdated = outdated
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bricht ab und verwirft das Ergebnis (z.B. beim Sperren)"""
+        self._cancel_event.set()
+
+    def run(self):
+        """Thread-Einstiegspunkt"""
+        from ..core.statistics import compute_backfill_analytics
+        try:
+            analytics = compute_backfill_analytics(self.rows, self._cancel_event)
+        except Exception as e:
+            logger.error(f"Fehler beim Nachtragen der Passwort-Auswertung: {e}")
+            self.backfill_failed.emit(str(e))
+            return
+        finally:
+            self.rows = None
+
+        if not self._cancel_event.is_set():
+            self.backfill_finished.emit(analytics, self.outdated)
+
+
+class CalibrationWorker(QThread):
+    """Misst die Argon2-Parameter dieses Rechners im Leerlauf nach dem Entsperren"""
+
+    calibrated = pyqtSignal(object)  # Argon2Parameters
+
+    def run(self):
+        """Thread-Einstiegspunkt"""
+        from ..auth.master_password import calibrate_parameters
+        try:
+            parameters = calibrate_parameters()
+        except Exception as e:
+            logger.warning(f"Argon2-Kalibrierung fehlgeschlagen: {e}")
+            return
+        self.calibrated.emit(parameters)
+
+
+class EntryLoadWorker(QThread):
+    """Lädt die Passwort-Einträge blockweise im Hintergrund"""
+
+    chunk_loaded = pyqtSignal(object)  # Liste von PasswordEntry
+    load_finished = pyqtSignal()
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, db_manager: "DatabaseManager", chunk_size: int = ENTRY_CHUNK_SIZE, parent=None):
+        """
+        Initialisiert den Worker
+
+        Args:
+            db_manager: Geöffneter DatabaseManager - gelesen wird über eine eigene
+                        Nur-Lese-Verbindung, die Hauptverbindung bleibt beim UI-Thread
+            chunk_size: Anzahl Einträge pro Block
+            parent: Parent-QObject
+        """
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bricht das Laden nach dem aktuellen Block ab"""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """Prüft ob abgebrochen wurde"""
+        return self._cancel_event.is_set()
+
+    def run(self):
+        """Thread-Einstiegspunkt"""
+        try:
+            for chunk in self.db_manager.iter_password_entry_chunks(self.chunk_size, self._cancel_event):
+                if self._cancel_event.is_set():
+                    return
+                self.chunk_loaded.emit(chunk)
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                logger.error(f"Fehler beim Laden der Einträge: {e}")
+                self.load_failed.emit(str(e))
+            return
+
+        if not self._cancel_event.is_set():
+            self.load_finished.emit()
+
+
+class UnlockWorker(QThread):
+    """Entsperrt eine Tresor-Datei außerhalb des UI-Threads"""
+
+    stage_changed = pyqtSignal(int, int, str)  # Stufe (0-basiert), Anzahl Stufen, Beschriftung
+    unlock_finished = pyqtSignal(object)       # UnlockSession
+    wrong_password = pyqtSignal()
+    unlock_failed = pyqtSignal(str)
+
+    def __init__(self, db_path: str, password: str, parent=None, upgrade: bool = True):
+        """
+        Initialisiert den Worker
+
+        Args:
+            db_path: Pfad zur .spdb Datei
+            password: Master-Passwort
+            parent: Parent-QObject
+            upgrade: Hash und Header-KDF bei Bedarf erneuern (siehe unlock_vault)
+        """
+        super().__init__(parent)
+        self.db_path = db_path
+        self.password = password
+        self.upgrade = upgrade
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bricht das Entsperren nach der aktuellen Stufe ab"""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """Prüft ob abgebrochen wurde"""
+        return self._cancel_event.is_set()
+
+    def _report_stage(self, stage: str):
+        # Beginn einer Stufe = Ende der vorherigen (Start-Zeitleiste)
+        if stage == STAGE_OPEN:
+            startup_timeline.mark("vault_decrypted")
+        elif stage == STAGE_VERIFY:
+            startup_timeline.mark("migrations")
+        self.stage_changed.emit(STAGE_INDEX[stage], len(UNLOCK_STAGES), STAGE_LABELS[stage])
+
+    def run(self):
+        """Thread-Einstiegspunkt"""
+        try:
+            session = unlock_vault(
+                self.db_path,
+                self.password,
+                progress_callback=self._report_stage,
+                cancel_event=self._cancel_event,
+                upgrade=self.upgrade
+            )
+        except UnlockCancelled:
+            logger.info("Entsperren abgebrochen")
+            return
+        except WrongPasswordError:
+            self.wrong_password.emit()
+            return
+        except Exception as e:
+            logger.error(f"Fehler beim Entsperren: {e}")
+            self.unlock_failed.emit(str(e))
+            return
+        finally:
+            self.password = None
+
+        if self._cancel_event.is_set():
+            # Abbruch nach der letzten Prüfung - Sitzung verwerfen
+            session.db_manager.close()
+            return
+        self.unlock_finished.emit(session)
@@ -0,0 +1,241 @@
+"""
+Offline-Prüfung gegen bekannte Datenlecks
+
+Durchsucht einen lokalen SHA-1-Corpus im Format von "Have I Been Pwned"
+(Pwned Passwords), ohne Netzwerkzugriff. Unterstützt werden:
+
+- eine nach Hash sortierte Textdatei mit Zeilen "SHA1HEX:ANZAHL"
+  (HIBP-Download "ordered by hash", mehrere GB)
+- ein Verzeichnis mit Präfix-Partitionen "ABCDE.txt", deren Zeilen nur den
+  Rest des Hashes enthalten: "SUFFIX35:ANZAHL" (Format des PwnedPasswordsDownloader)
+
+Die Dateien werden per mmap eingeblendet und binär durchsucht. Der
+Speicherbedarf bleibt damit unabhängig von der Corpus-Größe (nur die
+berührten Seiten landen im Page-Cache), eine Suche braucht ~log2(Zeilen) Zugriffe.
+"""
+import hashlib
+import logging
+import mmap
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+from ..core.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _binary_search(data: mmap.mmap, key: bytes) -> int:
+    """
+    Sucht eine Zeile "KEY[:ANZAHL]" in einer sortierten, eingeblendeten Datei
+
+    Args:
+        data: Eingeblendete Datei mit aufsteigend sortierten Zeilen
+        key: Gesuchter Schlüssel (Hex, Großbuchstaben)
+
+    Returns:
+        Anzahl aus der Zeile (1 wenn keine Anzahl angegeben), 0 wenn nicht gefunden
+    """
+    key_length = len(key)
+    low, high = 0, len(data)
+
+    # low ist immer ein Zeilenanfang, high das Ende des Suchbereichs
+    while low < high:
+        mid = (low + high) // 2
+        newline = data.rfind(b"\n", low, mid)
+        start = newline + 1 if newline != -1 else low
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = len(data)
+
+        line_key = data[start:start + key_length]
+        if line_key < key:
+            low = end + 1
+        elif line_key > key:
+            high = start
+        else:
+            _, _, count = data[start:end].rstrip(b"\r").partition(b":")
+            return int(count) if count.strip() else 1
+
+    return 0
+
+
+class BreachCorpus:
+    """Memory-mapped SHA-1-Corpus (einzelne Datei oder Präfix-Partitionen)"""
+
+    PREFIX_LENGTH = 5
+    # Maximal gleichzeitig eingeblendete Partitionen
+    MAX_OPEN_PARTITIONS = 32
+
+    def __init__(self, path: str):
+        """
+        Öffnet einen Corpus (die Dateien werden erst bei der ersten Suche eingeblendet)
+
+        Args:
+            path: Sortierte Hash-Datei oder Verzeichnis mit Präfix-Partitionen
+
+        Raises:
+            ValueError: Wenn der Pfad nicht existiert
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise ValueError(f"Datenleck-Corpus nicht gefunden: {self.path}")
+
+        self.is_partitioned = self.path.is_dir()
+        self._lock = threading.Lock()
+        self._single: Optional[Tuple[object, Optional[mmap.mmap]]] = None
+        self._partitions: "OrderedDict[str, Tuple[object, Optional[mmap.mmap]]]" = OrderedDict()
+
+    @staticmethod
+    def _map_file(file_path: Path) -> Tuple[object, Optional[mmap.mmap]]:
+        """Blendet eine Datei schreibgeschützt ein (None bei leerer Datei)"""
+        handle = open(file_path, "rb")
+        try:
+            return handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Leere Dateien können nicht eingeblendet werden
+            return handle, None
+
+    def _get_single(self) -> Optional[mmap.mmap]:
+        """Gibt die eingeblendete Corpus-Datei zurück"""
+        if self._single is None:
+            with self._lock:
+                if self._single is None:
+                    self._single = self._map_file(self.path)
+        return self._single[1]
+
+    def _get_partition(self, prefix: str) -> Optional[mmap.mmap]:
+        """Gibt die eingeblendete Partition zu einem Präfix zurück (LRU)"""
+        with self._lock:
+            mapped = self._partitions.get(prefix)
+            if mapped is not None:
+                self._partitions.move_to_end(prefix)
+                return mapped[1]
+
+            file_path = self.path / f"{prefix}.txt"
+            if not file_path.exists():
+                return None
+
+            mapped = self._map_file(file_path)
+            self._partitions[prefix] = mapped
+            if len(self._partitions) > self.MAX_OPEN_PARTITIONS:
+                _prefix, oldest = self._partitions.popitem(last=False)
+                self._close_mapping(oldest)
+            return mapped[1]
+
+    def lookup_hash(self, sha1_hex: str) -> int:
+        """
+        Sucht einen SHA-1-Hash im Corpus
+
+        Args:
+            sha1_hex: SHA-1 als Hex-String (Groß-/Kleinschreibung egal)
+
+        Returns:
+            Anzahl der Vorkommen in Datenlecks (0 = nicht gefunden)
+        """
+        sha1_hex = sha1_hex.upper()
+
+        if self.is_partitioned:
+            data = self._get_partition(sha1_hex[:self.PREFIX_LENGTH])
+            key = sha1_hex[self.PREFIX_LENGTH:]
+        else:
+            data = self._get_single()
+            key = sha1_hex
+
+        if data is None:
+            return 0
+        return _binary_search(data, key.encode("ascii"))
+
+    def lookup(self, password: str) -> int:
+        """
+        Prüft ein Passwort gegen den Corpus
+
+        Args:
+            password: Passwort im Klartext
+
+        Returns:
+            Anzahl der Vorkommen in Datenlecks (0 = nicht gefunden)
+        """
+        return self.lookup_hash(hashlib.sha1(password.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def _close_mapping(mapped: Tuple[object, Optional[mmap.mmap]]):
+        handle, data = mapped
+        if data is not None:
+            data.close()
+        handle.close()
+
+    def close(self):
+        """Hebt alle Einblendungen auf"""
+        with self._lock:
+            if self._single is not None:
+                self._close_mapping(self._single)
+                self._single = None
+            while self._partitions:
+                _prefix, mapped = self._partitions.popitem()
+                self._close_mapping(mapped)
+
+
+class BreachChecker:
+    """Prüft Passwörter gegen den in den Einstellungen konfigurierten Corpus"""
+
+    def __init__(self):
+        self._corpus: Optional[BreachCorpus] = None
+        self._configured = False
+
+    def configure(self, path: Optional[str]):
+        """
+        Setzt den Corpus-Pfad (None deaktiviert die Prüfung)
+
+        Args:
+            path: Sortierte Hash-Datei oder Verzeichnis mit Präfix-Partitionen
+        """
+        if self._corpus is not None:
+            self._corpus.close()
+            self._corpus = None
+        self._configured = True
+
+        if not path:
+            return
+        try:
+            self._corpus = BreachCorpus(path)
+        except ValueError as e:
+            logger.warning(str(e))
+
+    def get_corpus(self) -> Optional[BreachCorpus]:
+        """Gibt den aktiven Corpus zurück (Pfad beim ersten Zugriff aus den Einstellungen)"""
+        if not self._configured:
+            self.configure(app_settings.get("breach_corpus_path"))
+        return self._corpus
+
+    def is_available(self) -> bool:
+        """Prüft ob ein Corpus konfiguriert ist"""
+        return self.get_corpus() is not None
+
+    def corpus_path(self) -> Optional[str]:
+        """Gibt den Pfad des aktiven Corpus zurück"""
+        corpus = self.get_corpus()
+        return str(corpus.path) if corpus else None
+
+    def check(self, password: str) -> int:
+        """
+        Prüft ein Passwort gegen den Corpus
+
+        Args:
+            password: Passwort im Klartext
+
+        Returns:
+            Anzahl der Vorkommen in Datenlecks (0 = nicht gefunden oder kein Corpus)
+        """
+        corpus = self.get_corpus()
+        if corpus is None or not password:
+            return 0
+        try:
+            return corpus.lookup(password)
+        except (OSError, ValueError) as e:
+            logger.error(f"Fehler bei der Datenleck-Prüfung: {e}")
+            return 0
+
+
+# Globale Instanz
+breach_checker = BreachChecker()
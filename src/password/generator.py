@@ -4,17 +4,143 @@ Generiert sichere, zufällige Passwörter
 """
 import secrets
 import string
-from typing import Dict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Reihenfolge der Zeichengruppen (bestimmt die Reihenfolge im Zeichensatz)
+OPTION_KEYS = ("uppercase", "lowercase", "digits", "special")
+
+DEFAULT_OPTIONS = {key: True for key in OPTION_KEYS}
+
+
+class _Alphabet(NamedTuple):
+    """Vorberechnete Tabellen für eine Options-Kombination"""
+    size: int
+    table: bytes          # Zufallsbyte -> Zeichen (nur für akzeptierte Bytes gültig)
+    rejected: bytes       # Bytes >= größtes Vielfaches von size (werden verworfen)
+    groups: Tuple[bytes, ...]  # Zeichen jeder gewählten Gruppe (für die Pflicht-Prüfung)
 
 
 class PasswordGenerator:
     """Generiert sichere Passwörter mit konfigurierbaren Optionen"""
 
+    # Höchstens so viele Passwörter werden aus einem Zufallsaufruf gezogen
+    BATCH_SIZE = 64
+
     def __init__(self):
         self.uppercase = string.ascii_uppercase
         self.lowercase = string.ascii_lowercase
         self.digits = string.digits
         self.special = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self._alphabets: Dict[Tuple[bool, ...], _Alphabet] = {}
+
+    def _get_alphabet(self, options: Optional[Dict[str, bool]]) -> _Alphabet:
+        """
+        Gibt die (gecachten) Tabellen für eine Options-Kombination zurück
+
+        Raises:
+            ValueError: Wenn keine Option ausgewählt ist
+        """
+        if options is None:
+            options = DEFAULT_OPTIONS
+        key = tuple(bool(options.get(name, False)) for name in OPTION_KEYS)
+
+        alphabet = self._alphabets.get(key)
+        if alphabet is None:
+            groups = tuple(
+                getattr(self, name).encode("ascii")
+                for name, enabled in zip(OPTION_KEYS, key) if enabled
+            )
+            if not groups:
+                raise ValueError("Mindestens eine Zeichenoption muss ausgewählt sein")
+
+            charset = b"".join(groups)
+            size = len(charset)
+            # Bytes oberhalb des größten Vielfachen würden Zeichen bevorzugen
+            limit = 256 - 256 % size
+            alphabet = _Alphabet(
+                size=size,
+                table=bytes(charset[b % size] for b in range(256)),
+                rejected=bytes(range(limit, 256)),
+                groups=groups,
+            )
+            self._alphabets[key] = alphabet
+        return alphabet
+
+    @staticmethod
+    def _draw(alphabet: _Alphabet, length: int) -> bytes:
+        """
+        Zieht `length` gleichverteilte Zeichen aus dem Zeichensatz
+
+        Die Zufallsbytes werden pro Aufruf passend zur Anfrage geholt und nicht
+        auf Vorrat gehalten, damit keine künftigen Passwörter im Speicher liegen.
+        """
+        result = b""
+        while len(result) < length:
+            missing = length - len(result)
+            # Etwas mehr anfordern, da verworfene Bytes ersetzt werden müssen
+            raw = secrets.token_bytes(missing + missing // 4 + 4)
+            result += raw.translate(alphabet.table, alphabet.rejected)
+        return result[:length]
+
+    @staticmethod
+    def _validate_length(length: int):
+        if length < 8 or length > 64:
+            raise ValueError("Passwort-Länge muss zwischen 8 und 64 Zeichen liegen")
+
+    def iter_generate(self, count: int, length: int = 16,
+                      options: Dict[str, bool] = None) -> Iterator[str]:
+        """
+        Erzeugt `count` Passwörter als Generator (für sehr große Mengen)
+
+        Jedes Passwort wird gleichverteilt aus dem Zeichensatz gezogen und
+        verworfen, solange eine gewählte Zeichengruppe fehlt
+        (Rejection Sampling - alle gültigen Passwörter sind gleich wahrscheinlich).
+
+        Args:
+            count: Anzahl der Passwörter
+            length: Länge des Passworts (8-64 Zeichen)
+            options: Zeichen-Optionen wie bei generate()
+
+        Yields:
+            Generierte Passwörter
+
+        Raises:
+            ValueError: Wenn Länge ungültig oder keine Option ausgewählt
+        """
+        self._validate_length(length)
+        alphabet = self._get_alphabet(options)
+        groups = alphabet.groups if len(alphabet.groups) > 1 else ()
+
+        produced = 0
+        while produced < count:
+            # Ein Zufallsaufruf pro Stapel, begrenzt auf die noch fehlende Anzahl
+            batch = min(count - produced, self.BATCH_SIZE)
+            chars = self._draw(alphabet, batch * length)
+            for start in range(0, len(chars), length):
+                candidate = chars[start:start + length]
+                # translate(None, group) entfernt die Gruppe - gleich lang = Gruppe fehlt
+                if any(len(candidate.translate(None, group)) == length for group in groups):
+                    continue
+                produced += 1
+                yield candidate.decode("ascii")
+
+    def generate_many(self, count: int, length: int = 16,
+                      options: Dict[str, bool] = None) -> List[str]:
+        """
+        Generiert mehrere Passwörter mit wenigen, stapelweisen Zufallsaufrufen
+
+        Args:
+            count: Anzahl der Passwörter
+            length: Länge des Passworts (8-64 Zeichen)
+            options: Zeichen-Optionen wie bei generate()
+
+        Returns:
+            Liste generierter Passwörter
+
+        Raises:
+            ValueError: Wenn Länge ungültig oder keine Option ausgewählt
+        """
+        return list(self.iter_generate(count, length, options))
 
     def generate(self, length: int = 16, options: Dict[str, bool] = None) -> str:
         """
@@ -34,51 +160,7 @@ class PasswordGenerator:
         Raises:
             ValueError: Wenn Länge ungültig oder keine Option ausgewählt
         """
-        if length < 8 or length > 64:
-            raise ValueError("Passwort-Länge muss zwischen 8 und 64 Zeichen liegen")
-
-        # Standard-Optionen, falls nicht angegeben
-        if options is None:
-            options = {
-                "uppercase": True,
-                "lowercase": True,
-                "digits": True,
-                "special": True
-            }
-
-        # Baue den Zeichensatz basierend auf den Optionen
-        charset = ""
-        required_chars = []
-
-        if options.get("uppercase", False):
-            charset += self.uppercase
-            required_chars.append(secrets.choice(self.uppercase))
-
-        if options.get("lowercase", False):
-            charset += self.lowercase
-            required_chars.append(secrets.choice(self.lowercase))
-
-        if options.get("digits", False):
-            charset += self.digits
-            required_chars.append(secrets.choice(self.digits))
-
-        if options.get("special", False):
-            charset += self.special
-            required_chars.append(secrets.choice(self.special))
-
-        if not charset:
-            raise ValueError("Mindestens eine Zeichenoption muss ausgewählt sein")
-
-        # Generiere den Rest des Passworts
-        remaining_length = length - len(required_chars)
-        password_chars = required_chars + [
-            secrets.choice(charset) for _ in range(remaining_length)
-        ]
-
-        # Mische die Zeichen zufällig
-        secrets.SystemRandom().shuffle(password_chars)
-
-        return "".join(password_chars)
+        return next(self.iter_generate(1, length, options))
 
 
 # Globale Instanz
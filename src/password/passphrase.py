@@ -0,0 +1,195 @@
+"""
+Passphrasen-Generator (Diceware)
+
+Wählt Wörter gleichverteilt aus großen Wortlisten (assets/wordlists). Die
+Listen werden erst bei der ersten Verwendung per mmap eingeblendet; beim
+Start wird nichts gelesen. Statt die Wörter zu parsen, wird nur ein
+Offset-Index der Zeilenanfänge aufgebaut und jedes gezogene Wort direkt aus
+der eingeblendeten Datei gelesen.
+
+Die Entropie ergibt sich exakt aus Wortanzahl und Listengröße, eine
+Muster-Erkennung ist nicht nötig.
+"""
+import math
+import mmap
+import secrets
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+from .strength import StrengthEstimate, strength_from_entropy, WORDLIST_DIR
+
+# Verfügbare Listen: Kennung -> (Anzeigename, Datei in assets/wordlists)
+WORDLISTS: Dict[str, Tuple[str, str]] = {
+    "de": ("Deutsch", "german_long.txt"),
+    "en": ("Englisch (EFF)", "eff_large.txt"),
+}
+DEFAULT_WORDLIST = "de"
+
+SEPARATORS = ("-", ".", "_", " ", "/")
+
+MIN_WORDS = 3
+MAX_WORDS = 12
+
+
+class Passphrase(NamedTuple):
+    """Generierte Passphrase mit exakter Entropie"""
+    text: str
+    entropy_bits: float
+
+
+class MappedWordlist:
+    """Wortliste (ein Wort pro Zeile), eingeblendet per mmap mit Offset-Index"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._handle = None
+        self._data: Optional[mmap.mmap] = None
+        self._offsets: Optional[array] = None
+
+    def _load(self):
+        """Blendet die Datei ein und indiziert die Zeilenanfänge"""
+        with self._lock:
+            if self._offsets is not None:
+                return
+
+            handle = open(self.path, "rb")
+            try:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                handle.close()
+                raise ValueError(f"Wortliste ist leer: {self.path}")
+
+            # Offsets der Zeilenanfänge plus Endposition (leere Zeilen werden übersprungen)
+            offsets = array("L")
+            position, size = 0, len(data)
+            while position < size:
+                end = data.find(b"\n", position)
+                if end == -1:
+                    end = size
+                if data[position:end].strip():
+                    offsets.append(position)
+                position = end + 1
+
+            self._handle, self._data, self._offsets = handle, data, offsets
+
+    def __len__(self) -> int:
+        if self._offsets is None:
+            self._load()
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> str:
+        if self._offsets is None:
+            self._load()
+        start = self._offsets[index]
+        end = self._data.find(b"\n", start)
+        if end == -1:
+            end = len(self._data)
+        return self._data[start:end].strip().decode("utf-8")
+
+    def close(self):
+        """Hebt die Einblendung auf (wird bei Bedarf neu geladen)"""
+        with self._lock:
+            if self._data is not None:
+                self._data.close()
+                self._handle.close()
+            self._handle, self._data, self._offsets = None, None, None
+
+
+class PassphraseGenerator:
+    """Generiert Passphrasen aus zufällig gewählten Wörtern"""
+
+    def __init__(self):
+        self._wordlists: Dict[str, MappedWordlist] = {}
+
+    def get_wordlist(self, name: str = DEFAULT_WORDLIST) -> MappedWordlist:
+        """
+        Gibt eine (lazy eingeblendete) Wortliste zurück
+
+        Raises:
+            ValueError: Wenn die Liste unbekannt ist
+        """
+        wordlist = self._wordlists.get(name)
+        if wordlist is None:
+            if name not in WORDLISTS:
+                raise ValueError(f"Unbekannte Wortliste: {name}")
+            wordlist = MappedWordlist(WORDLIST_DIR / WORDLISTS[name][1])
+            self._wordlists[name] = wordlist
+        return wordlist
+
+    def entropy_bits(self, word_count: int, wordlist: str = DEFAULT_WORDLIST,
+                     add_digit: bool = False) -> float:
+        """
+        Berechnet die exakte Entropie einer Passphrase
+
+        Jedes Wort trägt log2(Listengröße) bei. Die eingefügte Ziffer trägt
+        log2(10 * Wortanzahl) bei (Ziffer und Position). Trennzeichen und
+        Großschreibung sind fest gewählt und tragen nichts bei.
+
+        Args:
+            word_count: Anzahl der Wörter
+            wordlist: Kennung der Wortliste
+            add_digit: Ob eine zufällige Ziffer eingefügt wird
+
+        Returns:
+            Entropie in Bit
+        """
+        bits = word_count * math.log2(len(self.get_wordlist(wordlist)))
+        if add_digit:
+            bits += math.log2(10 * word_count)
+        return bits
+
+    def generate(self, word_count: int = 6, wordlist: str = DEFAULT_WORDLIST,
+                 separator: str = "-", capitalize: bool = False,
+                 add_digit: bool = False) -> Passphrase:
+        """
+        Generiert eine Passphrase
+
+        Args:
+            word_count: Anzahl der Wörter (3-12)
+            wordlist: Kennung der Wortliste (siehe WORDLISTS)
+            separator: Trennzeichen zwischen den Wörtern (ohne Buchstaben)
+            capitalize: Jedes Wort mit Großbuchstaben beginnen
+            add_digit: Eine zufällige Ziffer an ein zufälliges Wort anhängen
+
+        Returns:
+            Passphrase mit Text und exakter Entropie
+
+        Raises:
+            ValueError: Wenn Wortanzahl, Trennzeichen oder Wortliste ungültig sind
+        """
+        if word_count < MIN_WORDS or word_count > MAX_WORDS:
+            raise ValueError(f"Wortanzahl muss zwischen {MIN_WORDS} und {MAX_WORDS} liegen")
+        # Ohne eindeutiges Trennzeichen wären Wortgrenzen mehrdeutig und die Entropie geringer
+        if not separator or any(char.isalpha() for char in separator):
+            raise ValueError("Trennzeichen darf nicht leer sein und keine Buchstaben enthalten")
+
+        words_source = self.get_wordlist(wordlist)
+        size = len(words_source)
+        words = [words_source[secrets.randbelow(size)] for _ in range(word_count)]
+
+        if capitalize:
+            words = [word[:1].upper() + word[1:] for word in words]
+        if add_digit:
+            position = secrets.randbelow(word_count)
+            words[position] += str(secrets.randbelow(10))
+
+        return Passphrase(separator.join(words), self.entropy_bits(word_count, wordlist, add_digit))
+
+    @staticmethod
+    def estimate(passphrase: Passphrase) -> StrengthEstimate:
+        """
+        Bewertet eine generierte Passphrase anhand ihrer exakten Entropie
+
+        Args:
+            passphrase: Ergebnis von generate()
+
+        Returns:
+            StrengthEstimate für die Stärke-Anzeige
+        """
+        return strength_from_entropy(passphrase.entropy_bits, ("passphrase",))
+
+
+# Globale Instanz
+passphrase_generator = PassphraseGenerator()
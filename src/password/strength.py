@@ -1,8 +1,42 @@
 """
 Passwort-Stärke-Bewertung
+
+Schätzt die Entropie eines Passworts nach dem Vorbild von zxcvbn: das
+Passwort wird in erkannte Muster (Wörterbuch-Wörter, Tastatur-Läufe,
+Wiederholungen, Sequenzen, Datumsangaben) und Rest-Zeichen zerlegt, und die
+Zerlegung mit der geringsten Gesamt-Entropie bestimmt die Stärke.
+
+Alle Muster-Tabellen werden beim Import einmalig aufgebaut, das Wörterbuch
+(Trie aus assets/wordlists) erst bei der ersten Bewertung.
 """
+import math
 import re
+import threading
+from datetime import date
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Prozentwerte unterhalb dieser Schwelle entsprechen PasswordStrength.WEAK
+WEAK_SCORE_THRESHOLD = 50
+
+# Version der Bewertung - gespeicherte Scores älterer Versionen werden neu berechnet
+ESTIMATOR_VERSION = 2
+
+# Entropie-Grenzen in Bit
+MEDIUM_ENTROPY_BITS = 20.0
+STRONG_ENTROPY_BITS = 40.0
+# Oberhalb von STRONG + dieser Spanne gilt die Anzeige als 100 %
+STRONG_ENTROPY_SPAN = 40.0
+
+# Muster unterhalb dieser Länge zählen als einzelne Zeichen
+MIN_SEQUENCE_LENGTH = 4
+MIN_KEYBOARD_LENGTH = 4
+MIN_DICTIONARY_LENGTH = 3
+
+WORDLIST_DIR = Path(__file__).resolve().parents[2] / "assets" / "wordlists"
+DICTIONARY_FILES = ("common_passwords.txt", "english_words.txt")
 
 
 class PasswordStrength(Enum):
@@ -12,9 +46,486 @@ class PasswordStrength(Enum):
     STRONG = "Stark"
 
 
+class StrengthEstimate(NamedTuple):
+    """Ergebnis einer Stärke-Schätzung"""
+    entropy_bits: float
+    strength: PasswordStrength
+    percentage: int
+    patterns: Tuple[str, ...]  # Erkannte Muster, z.B. ("dictionary", "sequence")
+
+
+class _Match(NamedTuple):
+    """Erkanntes Muster im Passwort (Zeichen start bis end exklusiv)"""
+    start: int
+    end: int
+    bits: float
+    pattern: str
+
+
+# ==================== VORBERECHNETE TABELLEN ====================
+
+_LOWER_RE = re.compile(r'[a-z]')
+_UPPER_RE = re.compile(r'[A-Z]')
+_DIGIT_RE = re.compile(r'\d')
+_SYMBOL_RE = re.compile(r'[^a-zA-Z\d]')
+_ASCII_SYMBOL_RE = re.compile(r'[!-/:-@\[-`{-~ ]')
+
+_REPEAT_CHAR_RE = re.compile(r'(.)\1{2,}')
+_REPEAT_BLOCK_RE = re.compile(r'(.{2,}?)\1+')
+
+_DATE_SEPARATED_RE = re.compile(r'(?<!\d)(\d{1,4})([./\-_ ])(\d{1,2})\2(\d{1,4})(?!\d)')
+_DATE_COMPACT_RE = re.compile(r'(?<!\d)(\d{6}|\d{8})(?!\d)')
+_YEAR_RE = re.compile(r'(?<!\d)(19\d\d|20\d\d)(?!\d)')
+
+REFERENCE_YEAR = date.today().year
+MIN_YEAR_SPACE = 20
+
+# Häufige Leetspeak-Ersetzungen (Zeichen -> Buchstabe)
+_L33T_TABLE = str.maketrans({
+    '4': 'a', '@': 'a', '8': 'b', '(': 'c', '3': 'e', '6': 'g', '1': 'i',
+    '!': 'i', '|': 'l', '0': 'o', '$': 's', '5': 's', '7': 't', '+': 't', '2': 'z',
+})
+
+
+def _build_keyboard_graph(rows: Iterable[str], shifted_rows: Iterable[str]):
+    """Baut Nachbarschafts-Graph und Shift-Tabelle eines versetzten Tastatur-Layouts"""
+    rows = list(rows)
+    positions: Dict[str, Tuple[int, int]] = {}
+    for r, row in enumerate(rows):
+        for c, char in enumerate(row):
+            positions[char] = (r, c)
+
+    graph: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    for char, (r, c) in positions.items():
+        neighbors = {}
+        # Nachbarn in der Zeile sowie oben (c, c+1) und unten (c-1, c) - versetzte Reihen
+        for dr, dc in ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, -1), (1, 0)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < len(rows) and 0 <= nc < len(rows[nr]):
+                neighbors[rows[nr][nc]] = (dr, dc)
+        graph[char] = neighbors
+
+    unshift = {}
+    for row, shifted in zip(rows, shifted_rows):
+        for plain, shifted_char in zip(row, shifted):
+            if shifted_char != plain:
+                unshift[shifted_char] = plain
+    return graph, unshift
+
+
+_KEYBOARDS = {
+    "qwerty": _build_keyboard_graph(
+        ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./"),
+        ("~!@#$%^&*()_+", "QWERTYUIOP{}|", "ASDFGHJKL:\"", "ZXCVBNM<>?"),
+    ),
+    "qwertz": _build_keyboard_graph(
+        ("^1234567890ß´", "qwertzuiopü+", "asdfghjklöä#", "<yxcvbnm,.-"),
+        ("°!\"§$%&/()=?`", "QWERTZUIOPÜ*", "ASDFGHJKLÖÄ'", ">YXCVBNM;:_"),
+    ),
+}
+
+
+def _average_degree(graph) -> float:
+    return sum(len(neighbors) for neighbors in graph.values()) / len(graph)
+
+
+_KEYBOARD_STATS = {
+    name: (math.log2(len(graph)), math.log2(_average_degree(graph)))
+    for name, (graph, _unshift) in _KEYBOARDS.items()
+}
+
+
+# ==================== WÖRTERBUCH ====================
+
+class _DictionaryTrie:
+    """Trie über die Wortlisten; wird beim ersten Zugriff geladen"""
+
+    _RANK = ""  # Schlüssel für den Rang eines Wortendes (kein gültiges Zeichen)
+
+    def __init__(self, files: Iterable[Path]):
+        self._files = list(files)
+        self._root: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        root: dict = {}
+        for path in self._files:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for rank, line in enumerate(f, 1):
+                        word = line.strip().lower()
+                        if len(word) < MIN_DICTIONARY_LENGTH:
+                            continue
+                        node = root
+                        for char in word:
+                            node = node.setdefault(char, {})
+                        # Bei Duplikaten zählt der beste (kleinste) Rang
+                        node[self._RANK] = min(rank, node.get(self._RANK, rank))
+            except OSError:
+                continue
+        return root
+
+    def _get_root(self) -> dict:
+        if self._root is None:
+            with self._lock:
+                if self._root is None:
+                    self._root = self._load()
+        return self._root
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Findet alle Wörter im Text
+
+        Returns:
+            Liste von (start, end, rank)
+        """
+        root = self._get_root()
+        found = []
+        for start in range(len(text)):
+            node = root
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                rank = node.get(self._RANK)
+                if rank is not None and end + 1 - start >= MIN_DICTIONARY_LENGTH:
+                    found.append((start, end + 1, rank))
+        return found
+
+
+_dictionary = _DictionaryTrie(WORDLIST_DIR / name for name in DICTIONARY_FILES)
+
+
+# ==================== MUSTER-ERKENNUNG ====================
+
+def _cardinality(password: str) -> int:
+    """Größe des Zeichenraums für Brute-Force"""
+    size = 0
+    if _LOWER_RE.search(password):
+        size += 26
+    if _UPPER_RE.search(password):
+        size += 26
+    if _DIGIT_RE.search(password):
+        size += 10
+    if _ASCII_SYMBOL_RE.search(password):
+        size += 33
+    if any(ord(char) > 127 for char in password):
+        size += 100
+    return max(size, 1)
+
+
+def _variation_bits(count: int, other: int) -> float:
+    """Bits für die Position von `count` Varianten unter `count + other` Zeichen"""
+    if count == 0:
+        return 0.0
+    if other == 0:
+        return 1.0
+    total = count + other
+    return math.log2(sum(math.comb(total, i) for i in range(1, min(count, other) + 1)))
+
+
+def _case_bits(token: str) -> float:
+    """Zusatz-Bits für Großschreibung innerhalb eines Musters"""
+    upper = sum(1 for char in token if char.isupper())
+    if upper == 0:
+        return 0.0
+    lower = sum(1 for char in token if char.islower())
+    # Nur erster/letzter Buchstabe groß oder alles groß: ein Bit
+    if lower == 0 or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return 1.0
+    return _variation_bits(upper, lower)
+
+
+def _dictionary_matches(password: str) -> List[_Match]:
+    lowered = password.lower()
+    matches = []
+
+    for start, end, rank in _dictionary.find_all(lowered):
+        token = password[start:end]
+        matches.append(_Match(start, end, math.log2(rank) + _case_bits(token), "dictionary"))
+
+    # Rückwärts geschriebene Wörter
+    length = len(lowered)
+    for start, end, rank in _dictionary.find_all(lowered[::-1]):
+        token = password[length - end:length - start]
+        matches.append(_Match(length - end, length - start,
+                              math.log2(rank) + _case_bits(token) + 1, "dictionary"))
+
+    # Leetspeak (p@ssw0rd)
+    unleeted = lowered.translate(_L33T_TABLE)
+    if unleeted != lowered:
+        for start, end, rank in _dictionary.find_all(unleeted):
+            substitutions = sum(1 for a, b in zip(lowered[start:end], unleeted[start:end]) if a != b)
+            if substitutions:
+                token = password[start:end]
+                letters = sum(1 for char in token if char.isalpha())
+                bits = math.log2(rank) + _case_bits(token) + _variation_bits(substitutions, letters)
+                matches.append(_Match(start, end, bits, "l33t"))
+
+    return matches
+
+
+def _sequence_matches(password: str) -> List[_Match]:
+    """Findet Sequenzen wie abcd, 9876 oder XYZA mit konstantem Abstand ±1"""
+    matches = []
+    lowered = password.lower()
+    start = 0
+
+    while start < len(lowered) - 1:
+        delta = ord(lowered[start + 1]) - ord(lowered[start])
+        end = start + 1
+        if delta in (1, -1):
+            while end < len(lowered) and ord(lowered[end]) - ord(lowered[end - 1]) == delta:
+                end += 1
+
+        if end - start >= MIN_SEQUENCE_LENGTH:
+            first = lowered[start]
+            token = password[start:end]
+            if first in "a1z9":
+                base = 1.0
+            elif first.isdigit():
+                base = math.log2(10)
+            elif first.isalpha():
+                base = math.log2(26)
+            else:
+                base = math.log2(33)
+            bits = base + math.log2(end - start) + (1 if delta < 0 else 0) + _case_bits(token)
+            matches.append(_Match(start, end, bits, "sequence"))
+            start = end - 1
+        else:
+            start += 1
+
+    return matches
+
+
+def _keyboard_matches(password: str) -> List[_Match]:
+    """Findet Tastatur-Läufe wie qwer, asdfgh oder 1qaz auf QWERTY und QWERTZ"""
+    matches = []
+
+    for name, (graph, unshift) in _KEYBOARDS.items():
+        start_bits, degree_bits = _KEYBOARD_STATS[name]
+        keys = [unshift.get(char, char.lower()) for char in password]
+        start = 0
+
+        while start < len(keys) - 1:
+            end = start + 1
+            turns = 0
+            direction = None
+            while end < len(keys):
+                step = graph.get(keys[end - 1], {}).get(keys[end])
+                if step is None:
+                    break
+                if step != direction:
+                    turns += 1
+                    direction = step
+                end += 1
+
+            if end - start >= MIN_KEYBOARD_LENGTH:
+                token = password[start:end]
+                shifted = sum(1 for char in token if char in unshift or char.isupper())
+                bits = (start_bits + turns * degree_bits + math.log2(end - start)
+                        + _variation_bits(shifted, len(token) - shifted))
+                matches.append(_Match(start, end, bits, "keyboard"))
+                start = end - 1
+            else:
+                start += 1
+
+    return matches
+
+
+def _repeat_matches(password: str) -> List[_Match]:
+    """Findet Wiederholungen wie aaaa oder abcabc"""
+    matches = []
+
+    for match in _REPEAT_CHAR_RE.finditer(password):
+        bits = math.log2(_cardinality(match.group(1))) + math.log2(len(match.group(0)))
+        matches.append(_Match(match.start(), match.end(), bits, "repeat"))
+
+    for match in _REPEAT_BLOCK_RE.finditer(password):
+        base = match.group(1)
+        count = len(match.group(0)) // len(base)
+        bits = _estimate_bits(base)[0] + math.log2(count)
+        matches.append(_Match(match.start(), match.end(), bits, "repeat"))
+
+    return matches
+
+
+def _year_bits(year: int) -> float:
+    return math.log2(max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE))
+
+
+def _normalize_year(year: int) -> int:
+    """Zweistellige Jahre auf 19xx/20xx abbilden"""
+    if year >= 100:
+        return year
+    return 2000 + year if year <= REFERENCE_YEAR % 100 + 5 else 1900 + year
+
+
+def _is_valid_date(parts: Tuple[int, int, int]) -> Optional[int]:
+    """Prüft (a, b, c) als Tag/Monat/Jahr in gängigen Reihenfolgen; gibt das Jahr zurück"""
+    a, b, c = parts
+    for day, month, year in ((a, b, c), (b, a, c), (c, b, a)):
+        year = _normalize_year(year)
+        if 1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= REFERENCE_YEAR + 50:
+            return year
+    return None
+
+
+def _date_matches(password: str) -> List[_Match]:
+    """Findet Datumsangaben (24.12.1990, 1990-12-24, 241290, 19901224) und Jahreszahlen"""
+    matches = []
+
+    for match in _DATE_SEPARATED_RE.finditer(password):
+        year = _is_valid_date((int(match.group(1)), int(match.group(3)), int(match.group(4))))
+        if year is not None:
+            bits = math.log2(31 * 12) + _year_bits(year) + 2
+            matches.append(_Match(match.start(), match.end(), bits, "date"))
+
+    for match in _DATE_COMPACT_RE.finditer(password):
+        digits = match.group(1)
+        year_length = 2 if len(digits) == 6 else 4
+        splits = (
+            (int(digits[:2]), int(digits[2:4]), int(digits[4:])),
+            (int(digits[-2:]), int(digits[-4:-2]), int(digits[:year_length])),
+        )
+        years = [year for year in (_is_valid_date(split) for split in splits) if year is not None]
+        if years:
+            bits = math.log2(31 * 12) + _year_bits(years[0])
+            matches.append(_Match(match.start(), match.end(), bits, "date"))
+
+    for match in _YEAR_RE.finditer(password):
+        matches.append(_Match(match.start(), match.end(), _year_bits(int(match.group(1))), "date"))
+
+    return matches
+
+
+_MATCHERS = (_dictionary_matches, _sequence_matches, _keyboard_matches,
+             _repeat_matches, _date_matches)
+
+
+def _estimate_bits(password: str) -> Tuple[float, Tuple[str, ...]]:
+    """
+    Minimale Entropie über alle Zerlegungen in Muster und Einzelzeichen
+
+    Returns:
+        (Entropie in Bit, verwendete Muster)
+    """
+    length = len(password)
+    if length == 0:
+        return 0.0, ()
+
+    matches_by_end: Dict[int, List[_Match]] = {}
+    for matcher in _MATCHERS:
+        for match in matcher(password):
+            matches_by_end.setdefault(match.end, []).append(match)
+
+    char_bits = math.log2(_cardinality(password))
+
+    # best[i] = minimale Entropie für password[:i]
+    best = [0.0] * (length + 1)
+    chosen: List[Optional[_Match]] = [None] * (length + 1)
+    for end in range(1, length + 1):
+        best[end] = best[end - 1] + char_bits
+        for match in matches_by_end.get(end, ()):
+            candidate = best[match.start] + match.bits
+            if candidate < best[end]:
+                best[end] = candidate
+                chosen[end] = match
+
+    patterns = []
+    position = length
+    while position > 0:
+        match = chosen[position]
+        if match is None:
+            position -= 1
+        else:
+            patterns.append(match.pattern)
+            position = match.start
+
+    return best[length], tuple(dict.fromkeys(reversed(patterns)))
+
+
+def _bits_to_percentage(bits: float) -> int:
+    """Bildet Entropie auf 0-100 ab: WEAK < 50 <= MEDIUM < 75 <= STRONG"""
+    if bits < MEDIUM_ENTROPY_BITS:
+        percentage = bits / MEDIUM_ENTROPY_BITS * 50
+    elif bits < STRONG_ENTROPY_BITS:
+        percentage = 50 + (bits - MEDIUM_ENTROPY_BITS) / (STRONG_ENTROPY_BITS - MEDIUM_ENTROPY_BITS) * 25
+    else:
+        percentage = 75 + min(bits - STRONG_ENTROPY_BITS, STRONG_ENTROPY_SPAN) / STRONG_ENTROPY_SPAN * 25
+    return int(percentage)
+
+
+def strength_from_entropy(bits: float, patterns: Tuple[str, ...] = ()) -> StrengthEstimate:
+    """
+    Bildet eine bekannte Entropie auf Kategorie und Prozentwert ab
+
+    Für Generatoren, deren Entropie exakt berechnet werden kann (z.B. Passphrasen),
+    ohne Muster-Erkennung.
+
+    Args:
+        bits: Entropie in Bit
+        patterns: Beschreibung der Quelle, z.B. ("passphrase",)
+
+    Returns:
+        StrengthEstimate mit Entropie, Kategorie und Prozentwert
+    """
+    if bits < MEDIUM_ENTROPY_BITS:
+        strength = PasswordStrength.WEAK
+    elif bits < STRONG_ENTROPY_BITS:
+        strength = PasswordStrength.MEDIUM
+    else:
+        strength = PasswordStrength.STRONG
+
+    return StrengthEstimate(round(bits, 1), strength, _bits_to_percentage(bits), patterns)
+
+
+def estimate_strength(password: str) -> StrengthEstimate:
+    """
+    Schätzt die Stärke eines Passworts (ohne Cache)
+
+    Args:
+        password: Das zu bewertende Passwort
+
+    Returns:
+        StrengthEstimate mit Entropie, Kategorie und Prozentwert
+    """
+    return strength_from_entropy(*_estimate_bits(password))
+
+
+# Cache für die Live-Anzeige beim Tippen (gleiche Eingaben werden mehrfach bewertet)
+_estimate_cached = lru_cache(maxsize=256)(estimate_strength)
+
+
 class PasswordStrengthChecker:
     """Bewertet die Stärke von Passwörtern"""
 
+    @staticmethod
+    def estimate(password: str) -> StrengthEstimate:
+        """
+        Schätzt die Stärke eines Passworts (gecacht, für die Live-Anzeige)
+
+        Args:
+            password: Das zu bewertende Passwort
+
+        Returns:
+            StrengthEstimate mit Entropie, Kategorie und Prozentwert
+        """
+        return _estimate_cached(password)
+
+    @staticmethod
+    def estimate_many(passwords: Iterable[str]) -> List[StrengthEstimate]:
+        """
+        Bewertet viele Passwörter (z.B. im Audit) ohne den Live-Cache zu füllen
+
+        Args:
+            passwords: Passwörter im Klartext
+
+        Returns:
+            Ein StrengthEstimate pro Passwort
+        """
+        return [estimate_strength(password) for password in passwords]
+
     @staticmethod
     def check_strength(password: str) -> PasswordStrength:
         """
@@ -26,37 +537,7 @@ class PasswordStrengthChecker:
         Returns:
             PasswordStrength Enum-Wert
         """
-        if not password:
-            return PasswordStrength.WEAK
-
-        score = 0
-        length = len(password)
-
-        # Längen-Score
-        if length >= 8:
-            score += 1
-        if length >= 12:
-            score += 1
-        if length >= 16:
-            score += 1
-
-        # Zeichentypen-Score
-        if re.search(r'[a-z]', password):  # Kleinbuchstaben
-            score += 1
-        if re.search(r'[A-Z]', password):  # Großbuchstaben
-            score += 1
-        if re.search(r'\d', password):     # Zahlen
-            score += 1
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password):  # Sonderzeichen
-            score += 1
-
-        # Bewertung basierend auf Score
-        if score <= 3:
-            return PasswordStrength.WEAK
-        elif score <= 5:
-            return PasswordStrength.MEDIUM
-        else:
-            return PasswordStrength.STRONG
+        return _estimate_cached(password).strength
 
     @staticmethod
     def get_strength_percentage(password: str) -> int:
@@ -69,32 +550,12 @@ class PasswordStrengthChecker:
         Returns:
             Stärke als Prozent (0-100)
         """
-        if not password:
-            return 0
-
-        max_score = 7
-        score = 0
-        length = len(password)
-
-        # Längen-Score (0-3 Punkte)
-        if length >= 8:
-            score += 1
-        if length >= 12:
-            score += 1
-        if length >= 16:
-            score += 1
-
-        # Zeichentypen-Score (0-4 Punkte)
-        if re.search(r'[a-z]', password):
-            score += 1
-        if re.search(r'[A-Z]', password):
-            score += 1
-        if re.search(r'\d', password):
-            score += 1
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password):
-            score += 1
-
-        return int((score / max_score) * 100)
+        return _estimate_cached(password).percentage
+
+    @staticmethod
+    def clear_cache():
+        """Leert den Live-Cache (enthält Klartext-Passwörter, z.B. beim Sperren)"""
+        _estimate_cached.cache_clear()
 
 
 # Globale Instanz
@@ -1,12 +1,28 @@
-"""Testing Utilities für SecurePass Manager"""
-from .mock_database import MockDatabase
-from .screenshot_compare import ScreenshotCompare, screenshot_compare
-from .performance import PerformanceMetrics, performance
-
-__all__ = [
-    'MockDatabase',
-    'ScreenshotCompare',
-    'screenshot_compare',
-    'PerformanceMetrics',
-    'performance'
-]
+"""
+Testing Utilities für SecurePass Manager
+
+Die Module werden erst beim ersten Zugriff importiert, damit main.py die
+Startzeit-Messung (performance.startup_timeline) ohne PIL und psutil laden kann.
+"""
+import importlib
+
+# Exportierter Name -> Modul
+_EXPORTS = {
+    'MockDatabase': '.mock_database',
+    'ScreenshotCompare': '.screenshot_compare',
+    'screenshot_compare': '.screenshot_compare',
+    'PerformanceMetrics': '.performance',
+    'performance': '.performance',
+    'StartupTimeline': '.performance',
+    'startup_timeline': '.performance',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,403 @@
+"""
+Micro-Benchmarks für SecurePass Manager
+
+Jeder Benchmark ist eine Funktion, die ein Ergebnis-Dict zurückgibt.
+Ausführen über die Kommandozeile:
+
+    python -m src.testing.benchmarks            # alle Benchmarks
+    python -m src.testing.benchmarks models     # einzelner Benchmark
+"""
+import hashlib
+import os
+import random
+import secrets
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from ..auth.master_password import (
+    master_password_manager, DEFAULT_PARAMETERS, CALIBRATION_SETTINGS_KEY, TARGET_UNLOCK_MS
+)
+from ..core.audit import PasswordAuditEngine
+from ..core.database import DatabaseManager
+from ..core.database_file import DatabaseFile, WrongPasswordError
+from ..core.encryption import encryption_manager
+from ..core.models import PasswordEntry
+from ..core.unlock import unlock_vault
+from ..password.breach import BreachCorpus
+from ..password.generator import PasswordGenerator
+
+
+@dataclass
+class _DictPasswordEntry:
+    """Referenz: ursprüngliches Dataclass-Layout mit __dict__ pro Instanz"""
+    id: Optional[int]
+    category_id: Optional[int]
+    name: str
+    username: str
+    encrypted_password: bytes
+    encrypted_notes: Optional[bytes] = None
+    website_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    decrypted_password: Optional[str] = None
+    decrypted_notes: Optional[str] = None
+
+    def __post_init__(self):
+        now = datetime.now()
+        if self.created_at is None:
+            self.created_at = now
+        if self.updated_at is None:
+            self.updated_at = now
+
+
+def _measure_allocations(factory: Callable[[int], object], count: int) -> Dict[str, float]:
+    """Misst Speicher und Zeit für `count` Aufrufe von factory(i)"""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    objects = [factory(i) for i in range(count)]
+    duration = time.perf_counter() - start_time
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return {
+        "total_mb": round(current / 1024 / 1024, 2),
+        "bytes_per_entry": round(current / count, 1),
+        "duration_ms": round(duration * 1000, 2),
+    }
+
+
+def benchmark_model_memory(count: int = 100_000) -> Dict[str, Dict[str, float]]:
+    """
+    Vergleicht den Speicherbedarf pro Eintrag: Slots-Modell vs. Dataclass
+
+    Die Feldwerte (Name, Token, Zeitstempel-Strings) werden vorab erzeugt und
+    geteilt, damit nur der Overhead der Modell-Instanzen gemessen wird.
+
+    Args:
+        count: Anzahl der Einträge
+
+    Returns:
+        Dict mit Messwerten für "slots" und "dataclass"
+    """
+    token = b"gAAAAA" + b"x" * 94
+    timestamp = "2025-01-01 12:00:00"
+
+    def slotted(i):
+        return PasswordEntry(i, 1, "Eintrag", "user", token, None, None, timestamp, timestamp)
+
+    def legacy(i):
+        return _DictPasswordEntry(i, 1, "Eintrag", "user", token, None, None, timestamp, timestamp)
+
+    return {
+        "slots": _measure_allocations(slotted, count),
+        "dataclass": _measure_allocations(legacy, count),
+    }
+
+
+def benchmark_audit(count: int = 30_000) -> Dict[str, Dict[str, float]]:
+    """
+    Vergleicht das Passwort-Audit seriell vs. auf dem Prozess-Pool
+
+    Args:
+        count: Anzahl der Einträge
+
+    Returns:
+        Dict mit Messwerten für "serial", "parallel" und "cached_rerun"
+    """
+    encryption_manager.set_master_password("benchmark-master-password")
+    now = int(time.time())
+    rows = [(i, now, encryption_manager.encrypt(f"Passwort-{i % 5000}!")) for i in range(count)]
+
+    def timed(engine: PasswordAuditEngine) -> Dict[str, float]:
+        start_time = time.perf_counter()
+        report = engine.run(rows)
+        return {
+            "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            "audited": report.audited,
+            "workers": engine.max_workers,
+        }
+
+    try:
+        parallel_engine = PasswordAuditEngine()
+        return {
+            "serial": timed(PasswordAuditEngine(max_workers=1)),
+            "parallel": timed(parallel_engine),
+            "cached_rerun": timed(parallel_engine),
+        }
+    finally:
+        encryption_manager.clear()
+
+
+def benchmark_breach_lookup(lines: int = 2_000_000, lookups: int = 10_000) -> Dict[str, float]:
+    """
+    Misst Suchzeiten im memory-mapped Datenleck-Corpus
+
+    Erzeugt eine sortierte Hash-Datei im HIBP-Format (~100 Bytes pro 2 Zeilen).
+
+    Args:
+        lines: Anzahl der Hashes im Corpus
+        lookups: Anzahl der Suchen (je zur Hälfte Treffer und Fehlschläge)
+
+    Returns:
+        Dict mit Corpus-Größe und Suchzeiten
+    """
+    rng = random.Random(1)
+    hashes = sorted(f"{rng.getrandbits(160):040X}" for _ in range(lines))
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for h in hashes:
+                f.write(f"{h}:{rng.randint(1, 1000)}\r\n")
+
+        queries = rng.sample(hashes, lookups // 2) + [
+            hashlib.sha1(str(i).encode()).hexdigest() for i in range(lookups // 2)
+        ]
+
+        corpus = BreachCorpus(path)
+        corpus.lookup_hash(queries[0])  # Einblenden nicht mitmessen
+        start_time = time.perf_counter()
+        hits = sum(1 for query in queries if corpus.lookup_hash(query))
+        duration = time.perf_counter() - start_time
+        corpus.close()
+
+        return {
+            "corpus_mb": round(os.path.getsize(path) / 1024 / 1024, 1),
+            "hits": hits,
+            "avg_lookup_us": round(duration / len(queries) * 1_000_000, 1),
+        }
+    finally:
+        os.remove(path)
+
+
+def _legacy_generate(generator: PasswordGenerator, length: int) -> str:
+    """Referenz: ursprüngliche Generierung mit secrets.choice pro Zeichen"""
+    groups = (generator.uppercase, generator.lowercase, generator.digits, generator.special)
+    charset = "".join(groups)
+    chars = [secrets.choice(group) for group in groups]
+    chars += [secrets.choice(charset) for _ in range(length - len(chars))]
+    secrets.SystemRandom().shuffle(chars)
+    return "".join(chars)
+
+
+def benchmark_generator(count: int = 50_000, length: int = 16) -> Dict[str, Dict[str, float]]:
+    """
+    Vergleicht den Durchsatz der Passwort-Generierung (Passwörter pro Sekunde)
+
+    Args:
+        count: Anzahl zu generierender Passwörter
+        length: Passwort-Länge
+
+    Returns:
+        Dict mit Durchsatz für Referenz, Einzelaufrufe und generate_many
+    """
+    generator = PasswordGenerator()
+
+    def timed(produce: Callable[[], object]) -> Dict[str, float]:
+        start_time = time.perf_counter()
+        produce()
+        duration = time.perf_counter() - start_time
+        return {"seconds": round(duration, 3), "passwords_per_second": round(count / duration)}
+
+    return {
+        "legacy_choice": timed(lambda: [_legacy_generate(generator, length) for _ in range(count)]),
+        "generate": timed(lambda: [generator.generate(length) for _ in range(count)]),
+        "generate_many": timed(lambda: generator.generate_many(count, length)),
+    }
+
+
+class _FixedCalibration:
+    """Einstellungen mit fester Argon2-Kalibrierung (ohne Messung, ohne Datei)"""
+
+    def get(self, key, default=None):
+        if key != CALIBRATION_SETTINGS_KEY:
+            return default
+        return {**DEFAULT_PARAMETERS._asdict(), "cpu_count": os.cpu_count(), "target_ms": TARGET_UNLOCK_MS}
+
+    def set(self, key, value):
+        pass
+
+
+def benchmark_unlock(count: int = 20_000, repeats: int = 3) -> Dict[str, float]:
+    """
+    Misst das Entsperren und seine Argon2-Anteile
+
+    Ein falsches Passwort scheitert schon am Datenschlüssel im Header, also
+    nach einem Argon2-Durchlauf und ohne die Datenbank zu entschlüsseln.
+    sequential_ms misst zum Vergleich den früheren Ablauf, der nach dem
+    Öffnen zusätzlich den Argon2-Hash in der Datenbank geprüft hat.
+
+    Args:
+        count: Anzahl der Einträge im Tresor
+        repeats: Wiederholungen (gemeldet wird das Minimum)
+
+    Returns:
+        Dict mit Dauern in Millisekunden
+    """
+    password = "benchmark-master-password"
+    temp_dir = tempfile.mkdtemp(prefix="securepass_bench_")
+    path = os.path.join(temp_dir, "bench.spdb")
+    settings = _FixedCalibration()
+
+    try:
+        DatabaseFile(path).create_new(password, DEFAULT_PARAMETERS._asdict())
+        db_manager = DatabaseManager(path, password)
+        db_manager.conn.executemany(
+            "INSERT INTO password_entries (category_id, name, encrypted_password) VALUES (1, ?, ?)",
+            [(f"Eintrag {i}", os.urandom(160)) for i in range(count)]
+        )
+        password_hash = master_password_manager.hash_password(password)
+        db_manager.save_master_password_hash(password_hash)
+        db_manager.close()
+
+        def best(run: Callable[[], None]) -> float:
+            durations = []
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                run()
+                durations.append(time.perf_counter() - start_time)
+            return round(min(durations) * 1000, 1)
+
+        def sequential_unlock():
+            manager = DatabaseManager(path, password)
+            try:
+                master_password_manager.verify_password(password, manager.get_master_password_hash())
+            finally:
+                manager.close()
+
+        def wrong_password():
+            try:
+                unlock_vault(path, "wrong", settings=settings)
+            except WrongPasswordError:
+                pass
+
+        header = DatabaseFile(path).read_header()
+        return {
+            "file_mb": round(os.path.getsize(path) / 1024 / 1024, 2),
+            "kdf_ms": best(lambda: DatabaseFile._derive_kek(password, header)),
+            "verify_ms": best(lambda: master_password_manager.verify_password(password, password_hash)),
+            "sequential_ms": best(sequential_unlock),
+            "unlock_ms": best(lambda: unlock_vault(path, password, settings=settings).db_manager.close()),
+            "wrong_password_ms": best(wrong_password),
+            "cpu_count": os.cpu_count(),
+        }
+    finally:
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+
+
+THEME_SWITCH_TARGET_MS = 50
+
+
+def benchmark_theme_switch(count: int = 5_000, switches: int = 10) -> Dict[str, float]:
+    """
+    Misst den Theme-Wechsel im Hauptfenster mit `count` Einträgen
+
+    Gemessen wird MainWindow.toggle_theme() bis einschließlich des folgenden
+    Neuzeichnens, nachdem Laden und Hintergrund-Auswertung abgeschlossen
+    sind. Die Anzahl der Wechsel ist gerade, damit die gespeicherte
+    Theme-Einstellung am Ende unverändert ist. Ohne Display mit
+    QT_QPA_PLATFORM=offscreen ausführen.
+
+    Args:
+        count: Anzahl der Einträge im Tresor
+        switches: Anzahl der Theme-Wechsel (wird auf eine gerade Zahl aufgerundet)
+
+    Returns:
+        Dict mit Dauern in Millisekunden
+    """
+    from PyQt6.QtWidgets import QApplication
+    from ..gui.themes import theme
+    from ..gui.main_window import MainWindow
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    theme.apply_theme(app)
+
+    password = "benchmark-master-password"
+    temp_dir = tempfile.mkdtemp(prefix="securepass_bench_")
+    path = os.path.join(temp_dir, "bench.spdb")
+
+    try:
+        DatabaseFile(path).create_new(password, DEFAULT_PARAMETERS._asdict())
+        db_manager = DatabaseManager(path, password)
+        encryption_manager.set_session_key(db_manager.data_key)
+        encrypted = encryption_manager.encrypt("Benchmark!123")
+        db_manager.conn.executemany(
+            "INSERT INTO password_entries (category_id, name, username, encrypted_password, website_url) "
+            "VALUES (1, ?, 'user', ?, 'https://example.com')",
+            [(f"Eintrag {i}", encrypted) for i in range(count)]
+        )
+        db_manager.conn.commit()
+
+        window = MainWindow(db_manager)
+        window.resize(1280, 800)
+        window.show()
+        # Erst messen, wenn Laden und Nachtragen der Auswertung fertig sind
+        while window.is_loading_entries():
+            app.processEvents()
+        app.processEvents()  # startet das Nachtragen (QTimer.singleShot)
+        while window.backfill_worker is not None:
+            app.processEvents()
+        app.processEvents()
+
+        durations = []
+        for _ in range(switches + switches % 2):
+            start_time = time.perf_counter()
+            window.toggle_theme()
+            window.repaint()
+            app.processEvents()
+            durations.append((time.perf_counter() - start_time) * 1000)
+
+        window.close()
+        db_manager.close()
+        durations.sort()
+        return {
+            "entries": count,
+            "median_ms": round(durations[len(durations) // 2], 2),
+            "max_ms": round(durations[-1], 2),
+            "target_ms": THEME_SWITCH_TARGET_MS,
+            "within_target": durations[len(durations) // 2] < THEME_SWITCH_TARGET_MS,
+        }
+    finally:
+        encryption_manager.clear()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+
+
+BENCHMARKS: Dict[str, Callable[[], dict]] = {
+    "models": benchmark_model_memory,
+    "audit": benchmark_audit,
+    "breach": benchmark_breach_lookup,
+    "generator": benchmark_generator,
+    "unlock": benchmark_unlock,
+    "theme": benchmark_theme_switch,
+}
+
+
+def main(argv=None) -> int:
+    """Führt die angegebenen (oder alle) Benchmarks aus und gibt die Ergebnisse aus"""
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unbekannter Benchmark: {name} (verfügbar: {', '.join(BENCHMARKS)})")
+            return 1
+
+        print(f"\n📊 {name}")
+        result = BENCHMARKS[name]()
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
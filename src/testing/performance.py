@@ -1,15 +1,21 @@
 """
 Performance-Messung für UI-Komponenten
 
-Misst Rendering-Zeit, Memory-Usage und Response-Zeit.
+Misst Rendering-Zeit, Memory-Usage und Response-Zeit sowie die Phasen des
+Programmstarts (StartupTimeline).
+
+psutil wird erst bei der ersten Messung importiert, da main.py dieses Modul
+für die Startzeit-Messung bereits beim Start lädt.
 """
 import time
 import logging
-import psutil
 import os
-from typing import Callable, Dict, Any, Optional
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from contextlib import contextmanager
-from PyQt6.QtCore import QElapsedTimer
+from PyQt6.QtCore import QElapsedTimer, QEvent, QObject
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +25,15 @@ class PerformanceMetrics:
 
     def __init__(self):
         self.metrics: Dict[str, Dict[str, Any]] = {}
-        self.process = psutil.Process(os.getpid())
+        self._process = None
+
+    @property
+    def process(self):
+        """psutil-Prozess (wird bei der ersten Messung erstellt)"""
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process(os.getpid())
+        return self._process
 
     @contextmanager
     def measure(self, name: str, category: str = "general"):
@@ -266,8 +280,6 @@ class PerformanceMetrics:
         Args:
             filepath: Pfad zur JSON-Datei
         """
-        import json
-
         data = {
             "summary": self.get_summary(),
             "metrics": self.metrics,
@@ -285,5 +297,228 @@ class PerformanceMetrics:
         logger.info("Performance-Metriken zurückgesetzt")
 
 
+class _FirstPaintFilter(QObject):
+    """Event-Filter, der beim ersten Paint-Event eines Widgets einmalig feuert"""
+
+    def __init__(self, widget, callback: Callable[[], None]):
+        super().__init__(widget)
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            self._callback()
+            self.deleteLater()
+        return False
+
+
+class StartupTimeline:
+    """
+    Monotone Zeitleiste der Start-Phasen
+
+    Phasen werden mit mark() markiert (auch aus Worker-Threads) und relativ zum
+    Start des Interpreters abgelegt. Ohne Aktivierung ist mark() ein No-Op.
+
+    Aktivierung per Umgebungsvariable oder Kommandozeile:
+        SECUREPASS_STARTUP_TIMELINE=/pfad/timeline.json
+        python main.py --startup-timeline[=/pfad/timeline.json]
+
+    Endet der Dateiname auf ".trace.json", wird ein Chrome-Trace geschrieben
+    (chrome://tracing, Perfetto), sonst eine einfache JSON-Liste der Phasen.
+    """
+
+    ENV_VAR = "SECUREPASS_STARTUP_TIMELINE"
+    CLI_FLAG = "--startup-timeline"
+    TRACE_SUFFIX = ".trace.json"
+    DEFAULT_PATH = Path.home() / ".securepass" / "logs" / "startup_timeline.json"
+
+    def __init__(self):
+        # Bezugspunkt: monotone Uhr und Wanduhr zum selben Zeitpunkt
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+        self._lock = threading.Lock()
+        self._marks: List[Tuple[str, float, str]] = []
+        self._interpreter_start: Optional[float] = None
+        self.enabled = False
+        self.output_path: Optional[Path] = None
+        self._finished = False
+
+    def configure(self, argv: List[str], environ=None) -> List[str]:
+        """
+        Aktiviert die Zeitleiste per Umgebungsvariable oder Kommandozeile
+
+        Args:
+            argv: Kommandozeilen-Argumente (z.B. sys.argv)
+            environ: Umgebung (Standard: os.environ)
+
+        Returns:
+            argv ohne die Zeitleisten-Option (für QApplication)
+        """
+        environ = os.environ if environ is None else environ
+        path = environ.get(self.ENV_VAR)
+        remaining = []
+        for arg in argv:
+            if arg == self.CLI_FLAG:
+                path = path or str(self.DEFAULT_PATH)
+            elif arg.startswith(self.CLI_FLAG + "="):
+                path = arg.split("=", 1)[1]
+            else:
+                remaining.append(arg)
+
+        if path:
+            self.enable(path)
+        return remaining
+
+    def enable(self, output_path: Optional[str] = None):
+        """
+        Aktiviert die Zeitleiste
+
+        Args:
+            output_path: Zieldatei für finish() (None = nicht schreiben)
+        """
+        self.enabled = True
+        self.output_path = Path(output_path) if output_path else None
+        self._interpreter_start = self._measure_interpreter_start()
+
+    def _measure_interpreter_start(self) -> float:
+        """Startzeit des Prozesses in perf_counter-Sekunden (Näherung)"""
+        try:
+            # Linux: Prozess-Start in Ticks seit Boot, ohne Umweg über die Wanduhr
+            with open("/proc/self/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            age = time.clock_gettime(time.CLOCK_BOOTTIME) - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+            age -= time.perf_counter() - self._origin  # Alter zum Bezugspunkt
+        except (OSError, AttributeError, ValueError, IndexError):
+            try:
+                import psutil
+                age = self._origin_wall - psutil.Process(os.getpid()).create_time()
+            except Exception:
+                return self._origin
+        # Nie nach dem Bezugspunkt (Uhren-Sprünge, grobe Auflösung)
+        return self._origin - max(0.0, age)
+
+    def mark(self, phase: str):
+        """
+        Markiert das Ende einer Phase
+
+        Args:
+            phase: Name der Phase (z.B. "imports_done")
+        """
+        if not self.enabled:
+            return
+        timestamp = time.perf_counter()
+        with self._lock:
+            self._marks.append((phase, timestamp, threading.current_thread().name))
+
+    def mark_on_first_paint(self, widget, phase: str, finish: bool = False):
+        """
+        Markiert eine Phase beim ersten Paint-Event eines Widgets
+
+        Args:
+            widget: Das Widget (z.B. Dialog oder Hauptfenster)
+            phase: Name der Phase
+            finish: Danach finish() aufrufen
+        """
+        if not self.enabled:
+            return
+
+        def on_paint():
+            self.mark(phase)
+            if finish:
+                self.finish()
+
+        _FirstPaintFilter(widget, on_paint)
+
+    def phases(self) -> List[Dict[str, Any]]:
+        """
+        Gibt die Phasen in zeitlicher Reihenfolge zurück
+
+        Returns:
+            Liste mit name, thread, at_ms (seit Interpreter-Start) und
+            duration_ms (seit der vorherigen Phase)
+        """
+        start = self._interpreter_start if self._interpreter_start is not None else self._origin
+        with self._lock:
+            marks = sorted(self._marks, key=lambda mark: mark[1])
+
+        result = [{"name": "interpreter_start", "thread": "MainThread", "at_ms": 0.0, "duration_ms": 0.0}]
+        previous = start
+        for name, timestamp, thread in marks:
+            result.append({
+                "name": name,
+                "thread": thread,
+                "at_ms": round((timestamp - start) * 1000, 2),
+                "duration_ms": round((timestamp - previous) * 1000, 2),
+            })
+            previous = timestamp
+        return result
+
+    def to_json(self) -> Dict[str, Any]:
+        """Zeitleiste als JSON-Objekt"""
+        phases = self.phases()
+        start = self._interpreter_start if self._interpreter_start is not None else self._origin
+        return {
+            "interpreter_start": round(self._origin_wall - (self._origin - start), 3),  # Unix-Zeit
+            "total_ms": phases[-1]["at_ms"],
+            "phases": phases,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Zeitleiste im Chrome-Trace-Format
+
+        Jede Phase wird ein "complete"-Event von der vorherigen Phase bis zu
+        ihrer Markierung (Zeiten in Mikrosekunden).
+        """
+        pid = os.getpid()
+        events = []
+        phases = self.phases()
+        # Beginn = Ende der vorherigen Phase, damit die Events lückenlos anschließen
+        for previous, phase in zip(phases, phases[1:]):
+            start_us = round(previous["at_ms"] * 1000, 1)
+            events.append({
+                "name": phase["name"],
+                "cat": "startup",
+                "ph": "X",
+                "ts": start_us,
+                "dur": round(phase["at_ms"] * 1000 - start_us, 1),
+                "pid": pid,
+                "tid": phase["thread"],
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, filepath: str):
+        """
+        Schreibt die Zeitleiste (Chrome-Trace bei Endung ".trace.json")
+
+        Args:
+            filepath: Pfad zur Zieldatei
+        """
+        path = Path(filepath)
+        data = self.to_chrome_trace() if path.name.endswith(self.TRACE_SUFFIX) else self.to_json()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        logger.info(f"Start-Zeitleiste exportiert: {path}")
+
+    def finish(self):
+        """Protokolliert die Phasen und schreibt sie einmalig in die konfigurierte Datei"""
+        if not self.enabled or self._finished:
+            return
+        self._finished = True
+
+        for phase in self.phases()[1:]:
+            logger.info(f"⏱ {phase['name']}: +{phase['duration_ms']:.1f}ms (bei {phase['at_ms']:.1f}ms)")
+        if self.output_path is not None:
+            try:
+                self.dump(self.output_path)
+            except OSError as e:
+                logger.warning(f"Start-Zeitleiste konnte nicht geschrieben werden: {e}")
+
+
 # Singleton-Instanz
 performance = PerformanceMetrics()
+
+# Globale Instanz (wird von main.py so früh wie möglich importiert)
+startup_timeline = StartupTimeline()
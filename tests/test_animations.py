@@ -0,0 +1,85 @@
+"""
+Tests for the animation budget of the AnimationHelper
+"""
+import os
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QApplication, QWidget
+from src.gui.animations import AnimationHelper
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestAnimationBudget(unittest.TestCase):
+    """Tests for coalescing, the concurrency cap and instant transitions"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.animator = AnimationHelper()
+        self.animator.set_reduced_motion(False)
+        self.widgets = [QWidget() for _ in range(3)]
+        for widget in self.widgets:
+            widget.resize(100, 40)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.animator.finish_all()
+        for widget in self.widgets:
+            widget.deleteLater()
+
+    def test_coalesce_same_property(self):
+        """Test that a repeated animation replaces the running one and keeps the size"""
+        widget = self.widgets[0]
+        first = self.animator.pulse(widget, 1.5, 1000)
+        widget.resize(150, 60)
+        self.animator.press(widget, 0.9, 1000)
+
+        self.assertEqual(self.animator.running_count(), 1)
+        self.assertEqual(first.state(), first.State.Stopped)
+
+        self.animator.finish_all()
+        self.assertEqual(widget.size(), QSize(100, 40))
+
+    def test_concurrency_cap(self):
+        """Test that animations beyond the cap run instantly"""
+        self.animator.MAX_CONCURRENT = 2
+        self.assertIsNotNone(self.animator.fade_in(self.widgets[0], 1000))
+        self.assertIsNotNone(self.animator.fade_in(self.widgets[1], 1000))
+        self.assertIsNone(self.animator.fade_in(self.widgets[2], 1000))
+        self.assertEqual(self.animator.running_count(), 2)
+
+        self.animator.finish_all()
+        self.assertEqual(self.animator.running_count(), 0)
+        self.assertIsNone(self.widgets[0].graphicsEffect())
+
+    def test_reduced_motion_and_large_list(self):
+        """Test that reduced motion and large lists skip animations"""
+        finished = []
+        self.animator.set_reduced_motion(True)
+        self.assertIsNone(self.animator.fade_in(self.widgets[0], 1000, lambda: finished.append(True)))
+        self.assertEqual(finished, [True])
+        self.assertIsNone(self.widgets[0].graphicsEffect())
+
+        self.animator.set_reduced_motion(False)
+        self.animator.set_item_count(AnimationHelper.LARGE_LIST_THRESHOLD)
+        self.assertIsNone(self.animator.shake(self.widgets[1]))
+        self.animator.set_item_count(10)
+        self.assertIsNotNone(self.animator.shake(self.widgets[1]))
+
+    def test_slow_frames_degrade(self):
+        """Test that a low frame rate pauses animations for a while"""
+        self.animator.fade_in(self.widgets[0], 1000)
+        now = time.monotonic()
+        for frame in range(10):
+            self.animator._record_frame(now + frame * 0.1)
+
+        self.assertFalse(self.animator.animations_enabled())
+        self.assertEqual(self.animator.running_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
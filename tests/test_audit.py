@@ -0,0 +1,112 @@
+"""
+Tests for the password audit engine
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.core.audit import PasswordAuditEngine
+from src.core.encryption import encryption_manager
+from src.password.breach import breach_checker
+
+MASTER_PASSWORD = "TestMasterPassword123!"
+STRONG_PASSWORD = "Xy7!kP2#qR9$mL4&"
+
+
+class TestPasswordAudit(unittest.TestCase):
+    """Tests for batching, caching and reporting of the audit"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        encryption_manager.set_master_password(MASTER_PASSWORD)
+        self.now = int(time.time())
+        self.rows = [
+            (1, self.now, encryption_manager.encrypt("abc")),
+            (2, self.now, encryption_manager.encrypt(STRONG_PASSWORD)),
+            (3, self.now, encryption_manager.encrypt(STRONG_PASSWORD)),
+            (4, self.now - 400 * 86400, encryption_manager.encrypt("Another$trongOne99")),
+            (5, self.now, b"not-a-token"),
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        encryption_manager.clear()
+
+    def test_report(self):
+        """Test weak, reused, old and failed detection"""
+        report = PasswordAuditEngine().run(self.rows)
+        self.assertEqual(report.total, 5)
+        self.assertEqual(report.audited, 5)
+        self.assertEqual(report.weak_ids, [1])
+        self.assertEqual(report.reused_groups, [[2, 3]])
+        self.assertEqual(report.old_ids, [4])
+        self.assertEqual(report.failed_ids, [5])
+        self.assertEqual(report.breached_ids, [])
+        self.assertFalse(report.cancelled)
+
+    def test_breach_corpus(self):
+        """Test that the configured breach corpus is checked and invalidates the cache"""
+        engine = PasswordAuditEngine()
+        engine.run(self.rows)
+
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(hashlib.sha1(b"abc").hexdigest().upper() + ":42\n")
+        try:
+            breach_checker.configure(path)
+            report = engine.run(self.rows)
+            self.assertEqual(report.audited, 5)
+            self.assertEqual(report.breached_ids, [1])
+        finally:
+            breach_checker.configure(None)
+            os.remove(path)
+
+    def test_rerun_only_audits_changed_entries(self):
+        """Test that results are cached per entry and updated_at"""
+        engine = PasswordAuditEngine()
+        engine.run(self.rows)
+
+        rows = list(self.rows[:4])
+        rows[0] = (1, self.now + 1, encryption_manager.encrypt(STRONG_PASSWORD))
+        report = engine.run(rows)
+
+        self.assertEqual(report.audited, 1)
+        self.assertEqual(report.weak_ids, [])
+        self.assertEqual(report.reused_groups, [[1, 2, 3]])
+        self.assertEqual(report.failed_ids, [])
+
+    def test_progress_and_cancel(self):
+        """Test progress reporting and cancellation between batches"""
+        engine = PasswordAuditEngine()
+        engine.BATCH_SIZE = 2
+        cancel_event = threading.Event()
+        progress = []
+
+        def on_progress(done, total):
+            progress.append((done, total))
+            if done >= 2:
+                cancel_event.set()
+
+        report = engine.run(self.rows, on_progress, cancel_event)
+        self.assertTrue(report.cancelled)
+        self.assertEqual(report.audited, 2)
+        self.assertEqual(progress, [(0, 5), (2, 5)])
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool produces the same report"""
+        engine = PasswordAuditEngine(max_workers=2)
+        engine.PARALLEL_THRESHOLD = 1
+        engine.BATCH_SIZE = 2
+
+        parallel = engine.run(self.rows)
+        serial = PasswordAuditEngine(max_workers=1).run(self.rows)
+
+        self.assertEqual(parallel.audited, 5)
+        for field in ("weak_ids", "reused_groups", "old_ids", "failed_ids"):
+            self.assertEqual(sorted(getattr(parallel, field)), sorted(getattr(serial, field)))
+
+
+if __name__ == '__main__':
+    unittest.main()
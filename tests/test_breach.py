@@ -0,0 +1,96 @@
+"""
+Tests for the offline breach corpus lookup
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from src.password.breach import BreachCorpus, BreachChecker
+
+BREACHED = ["password", "123456", "qwerty", "letmein", "Passwort1"]
+
+
+def sha1(password: str) -> str:
+    return hashlib.sha1(password.encode()).hexdigest().upper()
+
+
+class TestBreachCorpus(unittest.TestCase):
+    """Tests for binary search over sorted and partitioned hash files"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_breach_")
+        self.hashes = sorted((sha1(p), i + 1) for i, p in enumerate(BREACHED))
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+
+    def write_sorted_file(self, newline: str = "\n") -> str:
+        path = os.path.join(self.temp_dir, "pwned.txt")
+        with open(path, "w", newline="") as f:
+            f.write(newline.join(f"{h}:{count}" for h, count in self.hashes) + newline)
+        return path
+
+    def test_sorted_file_lookup(self):
+        """Test hits (including first and last line) and misses"""
+        corpus = BreachCorpus(self.write_sorted_file())
+        for password in BREACHED:
+            self.assertEqual(corpus.lookup(password), BREACHED.index(password) + 1)
+        self.assertEqual(corpus.lookup("Xy7!kP2#qR9$mL4&"), 0)
+        self.assertEqual(corpus.lookup_hash("0" * 40), 0)
+        self.assertEqual(corpus.lookup_hash("F" * 40), 0)
+        corpus.close()
+
+    def test_crlf_and_missing_count(self):
+        """Test Windows line endings and lines without a count"""
+        corpus = BreachCorpus(self.write_sorted_file("\r\n"))
+        self.assertEqual(corpus.lookup("qwerty"), BREACHED.index("qwerty") + 1)
+        corpus.close()
+
+        path = os.path.join(self.temp_dir, "plain.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(h for h, _ in self.hashes))
+        corpus = BreachCorpus(path)
+        self.assertEqual(corpus.lookup("letmein"), 1)
+        corpus.close()
+
+    def test_partitioned_directory(self):
+        """Test prefix-partitioned corpus directories"""
+        partitions = {}
+        for h, count in self.hashes:
+            partitions.setdefault(h[:5], []).append(f"{h[5:]}:{count}")
+        for prefix, lines in partitions.items():
+            with open(os.path.join(self.temp_dir, f"{prefix}.txt"), "w") as f:
+                f.write("\n".join(lines))
+
+        corpus = BreachCorpus(self.temp_dir)
+        self.assertTrue(corpus.is_partitioned)
+        self.assertEqual(corpus.lookup("password"), 1)
+        self.assertEqual(corpus.lookup("Xy7!kP2#qR9$mL4&"), 0)
+        corpus.close()
+
+    def test_empty_file_and_missing_path(self):
+        """Test edge cases for corpus paths"""
+        path = os.path.join(self.temp_dir, "empty.txt")
+        open(path, "w").close()
+        self.assertEqual(BreachCorpus(path).lookup("password"), 0)
+
+        with self.assertRaises(ValueError):
+            BreachCorpus(os.path.join(self.temp_dir, "missing.txt"))
+
+    def test_checker_configuration(self):
+        """Test enabling and disabling the checker"""
+        checker = BreachChecker()
+        checker.configure(self.write_sorted_file())
+        self.assertTrue(checker.is_available())
+        self.assertEqual(checker.check("123456"), 2)
+
+        checker.configure(None)
+        self.assertFalse(checker.is_available())
+        self.assertEqual(checker.check("123456"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+Tests for the encrypted .spdb file format (envelope encryption)
+"""
+import base64
+import hashlib
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from cryptography.fernet import Fernet
+from src.core.database import DatabaseManager
+from src.core.database_file import DatabaseFile, WrongPasswordError
+from src.core.encryption import EncryptionManager
+
+MASTER_PASSWORD = "TestMasterPassword123!"
+NEW_PASSWORD = "AnotherMasterPassword456?"
+
+
+class DatabaseFileTestCase(unittest.TestCase):
+    """Base class providing a temporary directory"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_test_")
+        self.db_path = os.path.join(self.temp_dir, "test.spdb")
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def read_payload(self) -> bytes:
+        """Returns the encrypted database token of the file"""
+        return DatabaseFile(self.db_path)._read_file()[2]
+
+
+class TestEnvelopeFormat(DatabaseFileTestCase):
+    """Tests for V2 files with a wrapped random data key"""
+
+    def test_create_and_open(self):
+        """Test that a new file uses V2 and opens with the master password"""
+        db_file = DatabaseFile(self.db_path)
+        db_file.create_new(MASTER_PASSWORD)
+
+        with open(self.db_path, "rb") as f:
+            self.assertEqual(f.read(len(DatabaseFile.FILE_HEADER)), DatabaseFile.FILE_HEADER)
+        self.assertTrue(DatabaseFile.is_valid_database_file(self.db_path))
+
+        opened = DatabaseFile(self.db_path)
+        opened.open_database(MASTER_PASSWORD)
+        self.assertEqual(opened.data_key, db_file.data_key)
+        self.assertEqual(len(opened.data_key), 32)
+        # Datenschlüssel ist zufällig, nicht aus dem Passwort abgeleitet
+        self.assertNotEqual(opened.data_key, hashlib.sha256(MASTER_PASSWORD.encode()).digest())
+        opened.close_database()
+
+    def test_wrong_password(self):
+        """Test that a wrong password is rejected"""
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+        with self.assertRaises(WrongPasswordError):
+            DatabaseFile(self.db_path).open_database("wrong")
+
+    def test_change_master_password_rewraps_only(self):
+        """Test that a password change keeps the data key and field tokens"""
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+        db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        encryption = EncryptionManager()
+        encryption.set_session_key(db_manager.data_key)
+
+        category_id = db_manager.get_all_categories()[0].id
+        db_manager.conn.execute(
+            "INSERT INTO password_entries (category_id, name, encrypted_password) VALUES (?, ?, ?)",
+            (category_id, "Mail", encryption.encrypt("Geheim!123"))
+        )
+        db_manager.save_changes()
+        token = db_manager.get_encrypted_passwords()[0][1]
+
+        db_manager.change_master_password(MASTER_PASSWORD, NEW_PASSWORD)
+        db_manager.close()
+
+        with self.assertRaises(ValueError):
+            DatabaseFile(self.db_path).open_database(MASTER_PASSWORD)
+
+        reopened = DatabaseManager(self.db_path, NEW_PASSWORD)
+        try:
+            self.assertEqual(reopened.get_encrypted_passwords()[0][1], token)
+            encryption.set_session_key(reopened.data_key)
+            self.assertEqual(encryption.decrypt(token), "Geheim!123")
+        finally:
+            reopened.close()
+
+    def test_change_master_password_wrong_old_password(self):
+        """Test that the old password is verified before rewrapping"""
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+        with self.assertRaises(ValueError):
+            DatabaseFile(self.db_path).change_master_password("wrong", NEW_PASSWORD)
+
+        db_file = DatabaseFile(self.db_path)
+        db_file.open_database(MASTER_PASSWORD)
+        db_file.close_database()
+
+
+class TestKdfUpgrade(DatabaseFileTestCase):
+    """Tests for rewrapping the data key with stronger parameters"""
+
+    WEAK_PARAMS = {"time_cost": 1, "memory_cost": 8192, "parallelism": 1}
+
+    def test_upgrade_kdf(self):
+        """Test that weaker header parameters are raised and the data key is kept"""
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD, self.WEAK_PARAMS)
+        db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        try:
+            data_key = db_manager.data_key
+            payload = self.read_payload()
+            stronger = dict(self.WEAK_PARAMS, time_cost=2)
+
+            self.assertTrue(db_manager.upgrade_kdf(stronger))
+            self.assertEqual(db_manager.db_file.kdf_parameters(), stronger)
+            self.assertFalse(db_manager.upgrade_kdf(self.WEAK_PARAMS))
+            # Mehr Speicher, aber weniger Iterationen: kein Upgrade und kein Mischwert
+            self.assertFalse(db_manager.upgrade_kdf(dict(self.WEAK_PARAMS, memory_cost=16384)))
+            self.assertEqual(db_manager.db_file.kdf_parameters(), stronger)
+            self.assertEqual(self.read_payload(), payload)
+        finally:
+            db_manager.close()
+
+        reopened = DatabaseFile(self.db_path)
+        reopened.open_database(MASTER_PASSWORD)
+        self.assertEqual(reopened.data_key, data_key)
+        self.assertEqual(reopened.kdf_parameters()["time_cost"], 2)
+        reopened.close_database()
+
+    def test_password_change_keeps_parameters(self):
+        """Test that a plain password change keeps the header parameters"""
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD, self.WEAK_PARAMS)
+        db_file = DatabaseFile(self.db_path)
+        db_file.change_master_password(MASTER_PASSWORD, NEW_PASSWORD)
+
+        db_file.open_database(NEW_PASSWORD)
+        self.assertEqual(db_file.kdf_parameters(), self.WEAK_PARAMS)
+        db_file.close_database()
+
+
+class TestLegacyMigration(DatabaseFileTestCase):
+    """Tests for reading and migrating V1 files"""
+
+    def create_legacy_file(self, password: str) -> Fernet:
+        """Writes a V1 file with one entry and a 2FA secret, returns the legacy Fernet"""
+        legacy = Fernet(base64.urlsafe_b64encode(hashlib.sha256(password.encode()).digest()))
+
+        temp_db = os.path.join(self.temp_dir, "legacy.db")
+        conn = sqlite3.connect(temp_db)
+        DatabaseFile(self.db_path)._create_database_schema(conn)
+        conn.execute(
+            "INSERT INTO password_entries (category_id, name, encrypted_password, encrypted_notes, "
+            "reuse_fingerprint) VALUES (1, 'Bank', ?, ?, 'old')",
+            (legacy.encrypt(b"Konto-Passwort"), legacy.encrypt(b"Notiz"))
+        )
+        conn.execute(
+            "INSERT INTO users (id, password_hash, totp_secret) VALUES (1, 'hash', ?)",
+            (legacy.encrypt(b"JBSWY3DPEHPK3PXP"),)
+        )
+        conn.commit()
+        conn.close()
+
+        with open(temp_db, "rb") as f:
+            data = f.read()
+        os.remove(temp_db)
+        with open(self.db_path, "wb") as f:
+            f.write(DatabaseFile.LEGACY_FILE_HEADER)
+            f.write(legacy.encrypt(data))
+        return legacy
+
+    def test_migration(self):
+        """Test that opening a V1 file re-encrypts all tokens under a new data key"""
+        self.create_legacy_file(MASTER_PASSWORD)
+        self.assertTrue(DatabaseFile.is_valid_database_file(self.db_path))
+
+        db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        try:
+            with open(self.db_path, "rb") as f:
+                self.assertEqual(f.read(len(DatabaseFile.FILE_HEADER)), DatabaseFile.FILE_HEADER)
+
+            encryption = EncryptionManager()
+            encryption.set_session_key(db_manager.data_key)
+            row = db_manager.conn.execute(
+                "SELECT encrypted_password, encrypted_notes, encrypted_totp, reuse_fingerprint "
+                "FROM password_entries"
+            ).fetchone()
+            self.assertEqual(encryption.decrypt(row[0]), "Konto-Passwort")
+            self.assertEqual(encryption.decrypt(row[1]), "Notiz")
+            self.assertIsNone(row[2])
+            # Fingerprints hängen vom Schlüssel ab und werden neu berechnet
+            self.assertIsNone(row[3])
+            self.assertEqual(encryption.decrypt(db_manager.get_totp_secret()), "JBSWY3DPEHPK3PXP")
+            data_key = db_manager.data_key
+        finally:
+            db_manager.close()
+
+        reopened = DatabaseFile(self.db_path)
+        reopened.open_database(MASTER_PASSWORD)
+        self.assertEqual(reopened.data_key, data_key)
+        reopened.close_database()
+
+    def test_legacy_wrong_password(self):
+        """Test that a wrong password leaves the V1 file untouched"""
+        self.create_legacy_file(MASTER_PASSWORD)
+        with self.assertRaises(WrongPasswordError):
+            DatabaseFile(self.db_path).open_database("wrong")
+
+        with open(self.db_path, "rb") as f:
+            self.assertEqual(f.read(len(DatabaseFile.FILE_HEADER)), DatabaseFile.LEGACY_FILE_HEADER)
+
+    def test_change_password_of_legacy_file(self):
+        """Test that a password change on a V1 file migrates it first"""
+        legacy = self.create_legacy_file(MASTER_PASSWORD)
+        db_file = DatabaseFile(self.db_path)
+        live_temp_db = Path(self.temp_dir) / "live.db"
+        db_file.temp_db_path = live_temp_db
+        db_file.change_master_password(MASTER_PASSWORD, NEW_PASSWORD)
+        self.assertEqual(db_file.temp_db_path, live_temp_db)
+
+        db_manager = DatabaseManager(self.db_path, NEW_PASSWORD)
+        try:
+            encryption = EncryptionManager()
+            encryption.set_session_key(db_manager.data_key)
+            token = db_manager.get_encrypted_passwords()[0][1]
+            self.assertEqual(encryption.decrypt(token), "Konto-Passwort")
+            self.assertNotEqual(token, legacy.encrypt(b"Konto-Passwort"))
+        finally:
+            db_manager.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,405 @@
+"""
+Tests for DatabaseManager on encrypted .spdb files
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from src.core.database import DatabaseManager, SECONDS_PER_DAY
+from src.core.database_file import DatabaseFile
+from src.core.models import PasswordEntry
+from src.core.encryption import encryption_manager
+from src.core.statistics import (
+    VaultStatistics, SECTION_TOTALS, SECTION_CATEGORIES, SECTION_AGE,
+    SECTION_WEAK, SECTION_REUSED, analyze_password, analyze_passwords,
+    backfill_password_analytics, load_backfill_rows, compute_backfill_analytics,
+    store_backfill_analytics
+)
+from src.password.strength import ESTIMATOR_VERSION
+
+MASTER_PASSWORD = "TestMasterPassword123!"
+
+
+class DatabaseManagerTestCase(unittest.TestCase):
+    """Base class creating a fresh encrypted vault per test"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_test_")
+        self.db_path = os.path.join(self.temp_dir, "test.spdb")
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+        self.db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        self.category_id = self.db_manager.get_all_categories()[0].id
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.db_manager.close()
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def add_entry(self, name: str, password: bytes = b"token") -> int:
+        """Adds a minimal entry and returns its ID"""
+        entry = PasswordEntry(
+            id=None,
+            category_id=self.category_id,
+            name=name,
+            username="user",
+            encrypted_password=password
+        )
+        return self.db_manager.add_password_entry(entry)
+
+    def set_timestamps(self, entry_id: int, days_ago: int):
+        """Moves created_at/updated_at of an entry into the past"""
+        epoch = int(time.time()) - days_ago * SECONDS_PER_DAY
+        self.db_manager.conn.execute(
+            "UPDATE password_entries SET created_at = ?, updated_at = ? WHERE id = ?",
+            (epoch, epoch, entry_id)
+        )
+
+
+class TestEpochTimestamps(DatabaseManagerTestCase):
+    """Tests for integer epoch timestamp columns"""
+
+    def test_timestamps_are_integer_epochs(self):
+        """Test that new entries store integer epochs"""
+        entry_id = self.add_entry("Gmail")
+        row = self.db_manager.conn.execute(
+            "SELECT typeof(created_at), typeof(updated_at) FROM password_entries WHERE id = ?",
+            (entry_id,)
+        ).fetchone()
+        self.assertEqual(tuple(row), ("integer", "integer"))
+
+        entry = self.db_manager.get_password_entry_by_id(entry_id)
+        self.assertIsInstance(entry.created_at, datetime)
+
+    def test_rehash_keeps_totp_secret(self):
+        """Test that replacing the master password hash keeps the 2FA secret"""
+        self.db_manager.save_master_password_hash("old-hash")
+        self.db_manager.save_totp_secret(b"secret-token")
+
+        self.db_manager.save_master_password_hash("new-hash")
+        self.assertEqual(self.db_manager.get_master_password_hash(), "new-hash")
+        self.assertEqual(self.db_manager.get_totp_secret(), b"secret-token")
+
+    def test_totp_secret_roundtrip(self):
+        """Test that the encrypted per-entry TOTP secret is stored and updated"""
+        entry_id = self.add_entry("Mit 2FA")
+        entry = self.db_manager.get_password_entry_by_id(entry_id)
+        self.assertIsNone(entry.encrypted_totp)
+
+        entry.encrypted_totp = b"totp-token"
+        self.db_manager.update_password_entry(entry)
+        self.assertEqual(self.db_manager.get_password_entry_by_id(entry_id).encrypted_totp, b"totp-token")
+
+    def test_range_queries(self):
+        """Test created/changed-since and oldest-entry queries"""
+        old_id = self.add_entry("Alt")
+        self.set_timestamps(old_id, days_ago=400)
+        mid_id = self.add_entry("Mittel")
+        self.set_timestamps(mid_id, days_ago=30)
+        self.add_entry("Neu")
+
+        self.assertEqual(self.db_manager.count_password_entries_created_since(7), 1)
+        changed = self.db_manager.get_password_entries_changed_since(60)
+        self.assertEqual([e.name for e in changed], ["Neu", "Mittel"])
+
+        oldest = self.db_manager.get_oldest_password_entries(limit=1)
+        self.assertEqual(oldest[0].id, old_id)
+
+        recent = self.db_manager.get_recent_password_entries(limit=2)
+        self.assertEqual([e.name for e in recent], ["Neu", "Mittel"])
+
+    def test_range_queries_use_index(self):
+        """Test that the range queries are index scans"""
+        plan = self.db_manager.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM password_entries WHERE created_at >= 0"
+        ).fetchall()
+        self.assertIn("idx_entries_created_at", " ".join(str(tuple(row)) for row in plan))
+
+    def test_migrates_legacy_text_timestamps(self):
+        """Test migrating a vault with CURRENT_TIMESTAMP text columns"""
+        self.db_manager.close()
+
+        legacy_path = os.path.join(self.temp_dir, "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.executescript("""
+            CREATE TABLE users (id INTEGER PRIMARY KEY, password_hash TEXT NOT NULL,
+                                totp_secret BLOB, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE,
+                                     color TEXT DEFAULT '#808080',
+                                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            INSERT INTO categories (name) VALUES ('Allgemein');
+            CREATE TABLE password_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, category_id INTEGER NOT NULL,
+                name TEXT NOT NULL, username TEXT, encrypted_password BLOB NOT NULL,
+                encrypted_notes BLOB, website_url TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            INSERT INTO password_entries (category_id, name, username, encrypted_password,
+                                          created_at, updated_at)
+            VALUES (1, 'Legacy', 'user', X'00', '2020-01-01 00:00:00', '2021-01-01 00:00:00');
+        """)
+        conn.commit()
+        conn.close()
+        db_file = DatabaseFile(self.db_path)
+        db_file.open_database(MASTER_PASSWORD)
+        db_file.close_database()
+        with open(legacy_path, 'rb') as f:
+            db_file._encrypt_and_save(f.read())
+        os.remove(legacy_path)
+
+        self.db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        entry = self.db_manager.get_all_password_entries()[0]
+        self.assertEqual(entry.name, "Legacy")
+        self.assertEqual(self.db_manager.conn.execute(
+            "SELECT created_at, updated_at FROM password_entries"
+        ).fetchone()[:], (1577836800, 1609459200))
+
+
+class TestChunkedEntryLoading(DatabaseManagerTestCase):
+    """Tests for reading entries in chunks over a read-only connection"""
+
+    def test_chunks_match_full_load(self):
+        """Test that chunks cover all entries in the order of the full load"""
+        for index in range(7):
+            entry_id = self.add_entry(f"Eintrag {index}")
+            # Gleiche Zeitstempel für einige Einträge: Reihenfolge über die ID
+            self.set_timestamps(entry_id, days_ago=index // 3)
+        self.db_manager.conn.commit()
+
+        chunks = list(self.db_manager.iter_password_entry_chunks(chunk_size=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(
+            [entry.id for chunk in chunks for entry in chunk],
+            [entry.id for entry in self.db_manager.get_all_password_entries()]
+        )
+
+    def test_cancel_between_chunks(self):
+        """Test that a set cancel event stops before the next chunk"""
+        for index in range(5):
+            self.add_entry(f"Eintrag {index}")
+        cancel_event = threading.Event()
+
+        chunks = []
+        for chunk in self.db_manager.iter_password_entry_chunks(2, cancel_event):
+            chunks.append(chunk)
+            cancel_event.set()
+        self.assertEqual(len(chunks), 1)
+
+    def test_read_only_connection(self):
+        """Test that the background connection cannot write and does not block writes"""
+        self.add_entry("Eintrag")
+        conn = self.db_manager.open_read_only_connection()
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM password_entries")
+
+            chunks = self.db_manager.iter_password_entry_chunks(chunk_size=1)
+            next(chunks)
+            # Zwischen zwei Blöcken wird keine Lesesperre gehalten
+            self.add_entry("Während des Ladens")
+            chunks.close()
+        finally:
+            conn.close()
+
+
+class TestVaultStatistics(DatabaseManagerTestCase):
+    """Tests for the memoized statistics service"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.statistics = VaultStatistics(self.db_manager)
+
+    def test_category_counts(self):
+        """Test per-category counts from the GROUP BY query"""
+        self.add_entry("A")
+        self.add_entry("B")
+        counts = dict((category.id, count) for category, count
+                      in self.statistics.get(SECTION_CATEGORIES))
+        self.assertEqual(counts[self.category_id], 2)
+        self.assertEqual(sum(counts.values()), 2)
+
+    def test_results_are_memoized_until_change(self):
+        """Test that sections are only recomputed after a change event"""
+        self.assertEqual(self.statistics.get(SECTION_TOTALS)["entries"], 0)
+        self.statistics.get(SECTION_TOTALS)
+        self.assertEqual(self.statistics.compute_count[SECTION_TOTALS], 1)
+        self.assertEqual(self.statistics.stale_sections().count(SECTION_TOTALS), 0)
+
+        self.add_entry("Neu")
+        self.assertTrue(self.statistics.is_stale(SECTION_TOTALS))
+        self.assertEqual(self.statistics.get(SECTION_TOTALS)["entries"], 1)
+        self.assertEqual(self.statistics.compute_count[SECTION_TOTALS], 2)
+
+    def test_category_change_keeps_entry_sections(self):
+        """Test that category changes do not invalidate entry-only sections"""
+        self.statistics.get(SECTION_AGE)
+        self.db_manager.add_category("Neu")
+        self.assertFalse(self.statistics.is_stale(SECTION_AGE))
+        self.assertTrue(self.statistics.is_stale(SECTION_CATEGORIES))
+
+    def test_age_buckets(self):
+        """Test age bucket aggregation"""
+        for name, days_ago in (("a", 1), ("b", 90), ("c", 200), ("d", 500), ("e", 600)):
+            self.set_timestamps(self.add_entry(name), days_ago)
+        counts = [count for _label, count in self.statistics.get(SECTION_AGE)]
+        self.assertEqual(counts, [1, 1, 1, 2])
+
+
+class TestPasswordAnalytics(DatabaseManagerTestCase):
+    """Tests for write-time strength score and reuse fingerprint columns"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        encryption_manager.set_master_password(MASTER_PASSWORD)
+        self.statistics = VaultStatistics(self.db_manager)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        encryption_manager.clear()
+        super().tearDown()
+
+    def add_analyzed_entry(self, name: str, password: str) -> int:
+        """Adds an entry with analytics computed like the entry dialog does"""
+        score, fingerprint = analyze_password(password)
+        entry = PasswordEntry(
+            id=None,
+            category_id=self.category_id,
+            name=name,
+            username="user",
+            encrypted_password=encryption_manager.encrypt(password),
+            strength_score=score,
+            reuse_fingerprint=fingerprint
+        )
+        return self.db_manager.add_password_entry(entry)
+
+    def test_weak_and_reused_counts_without_decryption(self):
+        """Test weak/reuse statistics from indexed columns"""
+        self.add_analyzed_entry("A", "abc")
+        self.add_analyzed_entry("B", "Xy7!kP2#qR9$mL4&")
+        self.add_analyzed_entry("C", "Xy7!kP2#qR9$mL4&")
+
+        self.assertEqual(self.statistics.get(SECTION_WEAK), 1)
+        self.assertEqual(self.statistics.get(SECTION_REUSED), {"groups": 1, "entries": 2})
+
+        fingerprint = self.db_manager.get_reused_password_groups()[0][0]
+        names = [e.name for e in self.db_manager.get_password_entries_by_fingerprint(fingerprint)]
+        self.assertEqual(names, ["B", "C"])
+
+    def test_backfill_existing_entries(self):
+        """Test that the backfill fills entries saved without analytics"""
+        entry_id = self.add_entry("Alt", encryption_manager.encrypt("abc"))
+        self.set_timestamps(entry_id, days_ago=100)
+        self.assertEqual(self.statistics.get(SECTION_WEAK), 0)
+
+        self.assertEqual(backfill_password_analytics(self.db_manager), 1)
+        self.assertEqual(backfill_password_analytics(self.db_manager), 0)
+
+        entry = self.db_manager.get_password_entry_by_id(entry_id)
+        self.assertEqual((entry.strength_score, entry.reuse_fingerprint), analyze_password("abc"))
+        self.assertEqual(self.db_manager.get_oldest_password_entries(1)[0].id, entry_id)
+        self.assertEqual(self.statistics.get(SECTION_WEAK), 1)
+
+    def test_backfill_computed_off_thread(self):
+        """Test computing the backfill in another thread and storing it afterwards"""
+        entry_id = self.add_entry("Alt", encryption_manager.encrypt("abc"))
+        rows, outdated = load_backfill_rows(self.db_manager)
+        self.assertEqual([row[0] for row in rows], [entry_id])
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(compute_backfill_analytics(rows)))
+        thread.start()
+        thread.join()
+        store_backfill_analytics(self.db_manager, results[0], outdated)
+
+        self.assertEqual(self.db_manager.get_entries_missing_analytics(), [])
+        cancelled = threading.Event()
+        cancelled.set()
+        self.assertEqual(compute_backfill_analytics(rows, cancelled), [])
+
+    def test_bulk_password_update(self):
+        """Test replacing several passwords in one transaction"""
+        first = self.add_analyzed_entry("A", "abc")
+        second = self.add_analyzed_entry("B", "abc")
+        self.set_timestamps(first, days_ago=400)
+        self.assertEqual(self.statistics.get(SECTION_REUSED), {"groups": 1, "entries": 2})
+
+        passwords = ["Xy7!kP2#qR9$mL4&", "Zq8@mW3%tB6^nH1*"]
+        self.db_manager.update_passwords([
+            (entry_id, encryption_manager.encrypt(password), score, fingerprint)
+            for entry_id, password, (score, fingerprint)
+            in zip((first, second), passwords, analyze_passwords(passwords))
+        ])
+
+        entry = self.db_manager.get_password_entry_by_id(first)
+        self.assertEqual(encryption_manager.decrypt(entry.encrypted_password), passwords[0])
+        self.assertEqual(self.statistics.get(SECTION_REUSED), {"groups": 0, "entries": 0})
+        self.assertEqual(self.statistics.get(SECTION_WEAK), 0)
+        self.assertEqual(self.db_manager.count_password_entries_created_since(1), 1)
+        self.assertEqual(len(self.db_manager.get_password_entries_changed_since(1)), 2)
+
+    def test_restore_previous_passwords(self):
+        """Test that a rotation keeps the old password and can be undone"""
+        rotated = self.add_analyzed_entry("A", "abc")
+        untouched = self.add_analyzed_entry("B", "abc")
+        score, fingerprint = analyze_password("Xy7!kP2#qR9$mL4&")
+        self.db_manager.update_passwords(
+            [(rotated, encryption_manager.encrypt("Xy7!kP2#qR9$mL4&"), score, fingerprint)]
+        )
+
+        self.assertEqual(self.db_manager.restore_previous_passwords([rotated, untouched]), 1)
+        entry = self.db_manager.get_password_entry_by_id(rotated)
+        self.assertEqual(encryption_manager.decrypt(entry.encrypted_password), "abc")
+        self.assertIsNone(entry.strength_score)
+        backfill_password_analytics(self.db_manager)
+        self.assertEqual(self.db_manager.get_entries_missing_analytics(), [])
+        self.assertEqual(self.statistics.get(SECTION_REUSED), {"groups": 1, "entries": 2})
+
+        # The saved password is restored only once
+        self.assertEqual(self.db_manager.restore_previous_passwords([rotated]), 0)
+
+    def test_previous_password_is_discarded(self):
+        """Test that keeping a rotation or editing the entry drops the saved password"""
+        kept = self.add_analyzed_entry("A", "abc")
+        edited = self.add_analyzed_entry("B", "abc")
+        score, fingerprint = analyze_password("Xy7!kP2#qR9$mL4&")
+        self.db_manager.update_passwords([
+            (entry_id, encryption_manager.encrypt("Xy7!kP2#qR9$mL4&"), score, fingerprint)
+            for entry_id in (kept, edited)
+        ])
+        changed_at = self.db_manager.get_password_entry_by_id(kept).updated_at
+
+        self.db_manager.clear_previous_passwords([kept])
+        self.assertEqual(self.db_manager.get_password_entry_by_id(kept).updated_at, changed_at)
+
+        entry = self.db_manager.get_password_entry_by_id(edited)
+        entry.name = "B2"
+        self.db_manager.update_password_entry(entry)
+
+        self.assertEqual(self.db_manager.restore_previous_passwords([kept, edited]), 0)
+        entry = self.db_manager.get_password_entry_by_id(kept)
+        self.assertEqual(encryption_manager.decrypt(entry.encrypted_password), "Xy7!kP2#qR9$mL4&")
+
+    def test_backfill_rescores_outdated_estimator(self):
+        """Test that scores from an older strength estimator are recomputed once"""
+        entry_id = self.add_analyzed_entry("A", "Password1!")
+        self.db_manager.update_password_analytics(
+            [(entry_id, 90, encryption_manager.fingerprint("Password1!"))]
+        )
+        self.db_manager.set_meta("strength_estimator", "1")
+
+        self.assertEqual(backfill_password_analytics(self.db_manager), 1)
+        self.assertEqual(self.db_manager.get_meta("strength_estimator"), str(ESTIMATOR_VERSION))
+        self.assertEqual(self.db_manager.get_password_entry_by_id(entry_id).strength_score,
+                         analyze_password("Password1!")[0])
+        self.assertEqual(backfill_password_analytics(self.db_manager), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
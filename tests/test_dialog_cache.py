@@ -0,0 +1,149 @@
+"""
+Tests for the reusable dialog cache
+"""
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication, QDialog
+from src.core.encryption import encryption_manager
+from src.core.models import Category, PasswordEntry
+from src.gui.dialog_cache import DialogCache
+from src.gui.entry_dialog import PasswordEntryDialog
+from src.gui.themes import theme, ThemeMode
+
+app = QApplication.instance() or QApplication([])
+
+
+def flush_deletes():
+    """Processes pending deleteLater() calls"""
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+class TestDialogCache(unittest.TestCase):
+    """Tests for reuse, prewarming, theme changes and release"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = DialogCache()
+        self.built = []
+        self.cache.register("simple", self.create_dialog)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        theme.set_mode(ThemeMode.LIGHT)
+        self.cache.release()
+        flush_deletes()
+
+    def create_dialog(self) -> QDialog:
+        """Factory that records every construction"""
+        dialog = QDialog()
+        self.built.append(dialog)
+        return dialog
+
+    def test_reuse(self):
+        """Test that the dialog is built once and reused"""
+        first = self.cache.get("simple")
+        self.assertIs(self.cache.get("simple"), first)
+        self.assertEqual(len(self.built), 1)
+
+    def test_unregistered_fallback(self):
+        """Test that a fallback factory is used without caching"""
+        fallback = self.cache.get("other", QDialog)
+        self.assertIsNot(self.cache.get("other", QDialog), fallback)
+        self.assertFalse(self.cache.is_cached("other"))
+        with self.assertRaises(KeyError):
+            self.cache.get("missing")
+
+    def test_prewarm_during_idle(self):
+        """Test that prewarming builds one dialog per event loop pass"""
+        self.cache.register("second", self.create_dialog)
+        self.cache.prewarm()
+        self.assertEqual(self.built, [])
+
+        app.processEvents()
+        self.assertEqual(len(self.built), 1)
+        app.processEvents()
+        self.assertEqual(len(self.built), 2)
+        self.assertTrue(self.cache.is_cached("simple") and self.cache.is_cached("second"))
+
+        self.cache.get("simple")
+        self.assertEqual(len(self.built), 2)
+
+    def test_rebuild_after_theme_change(self):
+        """Test that dialogs built for another theme mode are rebuilt"""
+        light = self.cache.get("simple")
+        theme.set_mode(ThemeMode.DARK)
+        self.assertFalse(self.cache.is_cached("simple"))
+        self.assertIsNot(self.cache.get("simple"), light)
+
+    def test_discard_stale_before_theme_change(self):
+        """Test that hidden dialogs of the old theme are destroyed at once and visible ones kept"""
+        self.cache.register("visible", self.create_dialog)
+        hidden = self.cache.get("simple")
+        visible = self.cache.get("visible")
+        visible.show()
+        destroyed = []
+        hidden.destroyed.connect(lambda: destroyed.append(True))
+
+        self.cache.discard_stale(ThemeMode.LIGHT)
+        self.assertEqual(destroyed, [])
+
+        self.cache.discard_stale(ThemeMode.DARK)
+        self.assertEqual(destroyed, [True])
+        self.assertIs(self.cache.get("visible"), visible)
+        visible.hide()
+
+        theme.set_mode(ThemeMode.DARK)
+        self.cache.get("simple")
+        self.assertEqual(len(self.built), 3)
+
+    def test_release(self):
+        """Test that release drops hidden dialogs"""
+        self.cache.get("simple")
+        self.cache.release()
+        flush_deletes()
+        self.assertFalse(self.cache.is_cached("simple"))
+        self.cache.get("simple")
+        self.assertEqual(len(self.built), 2)
+
+
+class TestEntryDialogReset(unittest.TestCase):
+    """Tests that a reused entry dialog does not keep previous state"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        encryption_manager.set_session_key(os.urandom(32))
+        self.categories = [Category(id=1, name="Allgemein"), Category(id=2, name="Arbeit")]
+        self.dialog = PasswordEntryDialog(self.categories)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        encryption_manager.clear()
+        self.dialog.deleteLater()
+        flush_deletes()
+
+    def test_reset_between_entries(self):
+        """Test switching from editing an entry to a new entry"""
+        entry = PasswordEntry(
+            id=7, category_id=2, name="Mail", username="user",
+            encrypted_password=encryption_manager.encrypt("Geheim!123")
+        )
+        self.dialog.reset(self.categories, entry)
+        self.assertEqual(self.dialog.windowTitle(), "Eintrag bearbeiten")
+        self.assertEqual(self.dialog.password_input.text(), "Geheim!123")
+        self.assertEqual(self.dialog.category_combo.currentData(), 2)
+
+        self.dialog.reject()
+        self.assertEqual(self.dialog.password_input.text(), "")
+
+        self.dialog.reset(self.categories[:1])
+        self.assertEqual(self.dialog.windowTitle(), "Neuer Eintrag")
+        self.assertEqual(self.dialog.name_input.text(), "")
+        self.assertEqual(self.dialog.category_combo.count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
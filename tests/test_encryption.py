@@ -80,6 +80,22 @@ class TestEncryption(unittest.TestCase):
         # Different master passwords should produce different encrypted texts
         self.assertNotEqual(encrypted1, encrypted2)
 
+    def test_fingerprint_is_keyed(self):
+        """Test that reuse fingerprints are deterministic per key"""
+        self.encryption_manager.set_master_password(self.test_password)
+        first = self.encryption_manager.fingerprint("Secret123")
+        self.assertEqual(first, self.encryption_manager.fingerprint("Secret123"))
+        self.assertNotEqual(first, self.encryption_manager.fingerprint("Secret124"))
+
+        other = EncryptionManager()
+        other.set_master_password("AnotherMasterPassword!")
+        self.assertNotEqual(first, other.fingerprint("Secret123"))
+
+    def test_fingerprint_requires_key(self):
+        """Test that fingerprinting without a key fails"""
+        with self.assertRaises(RuntimeError):
+            self.encryption_manager.fingerprint("Secret123")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for the entry list model of the virtualized entry list
+"""
+import os
+import unittest
+from src.core.encryption import encryption_manager
+from src.core.models import PasswordEntry
+from src.gui.entry_list import EntryListModel, ENTRY_ROLE, PLACEHOLDER_ROLE, DECRYPT_ERROR
+
+
+def make_entry(entry_id: int, password: str = "Geheim!123", totp: bool = False) -> PasswordEntry:
+    """Creates an entry with an encrypted password"""
+    return PasswordEntry(
+        id=entry_id,
+        category_id=1,
+        name=f"Eintrag {entry_id}",
+        username="user",
+        encrypted_password=encryption_manager.encrypt(password),
+        encrypted_totp=encryption_manager.encrypt("JBSWY3DPEHPK3PXP") if totp else None
+    )
+
+
+class TestEntryListModel(unittest.TestCase):
+    """Tests for rows, placeholders and per-entry secrets"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        encryption_manager.set_session_key(os.urandom(32))
+        self.model = EntryListModel()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        encryption_manager.clear()
+
+    def test_streaming_with_placeholders(self):
+        """Test that appended entries go before the placeholder rows"""
+        self.model.set_entries([make_entry(1)], placeholders=3)
+        self.assertEqual(self.model.rowCount(), 4)
+
+        self.model.append_entries([make_entry(2), make_entry(3)])
+        self.assertEqual(self.model.rowCount(), 6)
+        self.assertEqual(self.model.index(2).data(ENTRY_ROLE).id, 3)
+        self.assertFalse(self.model.index(2).data(PLACEHOLDER_ROLE))
+        self.assertTrue(self.model.index(3).data(PLACEHOLDER_ROLE))
+        self.assertIsNone(self.model.entry_at(3))
+
+        self.model.set_placeholders(0)
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.entry_count(), 3)
+
+    def test_model_copies_entries(self):
+        """Test that later changes to the source list do not leak into the model"""
+        entries = [make_entry(1)]
+        self.model.set_entries(entries)
+        entries.append(make_entry(2))
+        self.assertEqual(self.model.rowCount(), 1)
+
+    def test_reveal_and_clear_secrets(self):
+        """Test revealing a password and dropping it when locking"""
+        self.model.set_entries([make_entry(1), make_entry(2, totp=True)])
+        self.assertTrue(self.model.has_totp())
+
+        self.assertTrue(self.model.toggle_revealed(0))
+        self.assertEqual(self.model.revealed_password(self.model.entry_at(0)), "Geheim!123")
+        self.assertIsNotNone(self.model.totp_for(self.model.entry_at(1)))
+
+        self.model.clear_secrets()
+        self.assertIsNone(self.model.revealed_password(self.model.entry_at(0)))
+        self.assertEqual(self.model._totp, {})
+
+        self.assertTrue(self.model.toggle_revealed(0))
+        self.assertFalse(self.model.toggle_revealed(0))
+        self.assertIsNone(self.model.revealed_password(self.model.entry_at(0)))
+
+    def test_reset_hides_passwords(self):
+        """Test that replacing the entries hides revealed passwords"""
+        self.model.set_entries([make_entry(1)])
+        self.model.toggle_revealed(0)
+        self.model.set_entries([make_entry(1)])
+        self.assertIsNone(self.model.revealed_password(self.model.entry_at(0)))
+
+    def test_decrypt_errors(self):
+        """Test that undecryptable passwords and secrets are reported, not raised"""
+        entry = make_entry(1, totp=True)
+        entry.encrypted_password = b"invalid"
+        entry.encrypted_totp = b"invalid"
+        self.model.set_entries([entry])
+
+        self.model.toggle_revealed(0)
+        self.assertEqual(self.model.revealed_password(entry), DECRYPT_ERROR)
+        self.assertIsNone(self.model.totp_for(entry))
+
+
+if __name__ == '__main__':
+    unittest.main()
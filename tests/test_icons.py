@@ -0,0 +1,70 @@
+"""
+Tests for the icon cache of the IconProvider
+"""
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+from src.gui.icons import IconProvider
+from src.gui.themes import Theme
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestIconCache(unittest.TestCase):
+    """Tests for cache keys, eviction and prewarming"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.provider = IconProvider()
+
+    def test_hits_and_misses(self):
+        """Test that repeated lookups are served from the cache"""
+        first = self.provider.get_pixmap("copy", "#123456", 18, 1.0)
+        second = self.provider.get_pixmap("copy", "#123456", 18, 1.0)
+        self.provider.get_pixmap("copy", "#654321", 18, 1.0)
+
+        info = self.provider.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 2, 2))
+        self.assertAlmostEqual(info.hit_rate, 1 / 3)
+        self.assertEqual(first.cacheKey(), second.cacheKey())
+
+    def test_device_pixel_ratio(self):
+        """Test that each pixel ratio is rendered at its physical size"""
+        normal = self.provider.get_pixmap("lock", "#000000", 20, 1.0)
+        retina = self.provider.get_pixmap("lock", "#000000", 20, 2.0)
+
+        self.assertEqual(self.provider.cache_info().misses, 2)
+        self.assertEqual(normal.width(), 20)
+        self.assertEqual(retina.width(), 40)
+        self.assertEqual(retina.deviceIndependentSize().width(), 20)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used pixmap is evicted"""
+        self.provider.CACHE_SIZE = 2
+        self.provider.get_pixmap("eye", "#000000", 18, 1.0)
+        self.provider.get_pixmap("edit", "#000000", 18, 1.0)
+        self.provider.get_pixmap("eye", "#000000", 18, 1.0)
+        self.provider.get_pixmap("trash", "#000000", 18, 1.0)
+
+        self.assertEqual(self.provider.cache_info().size, 2)
+        self.provider.get_pixmap("eye", "#000000", 18, 1.0)
+        self.provider.get_pixmap("edit", "#000000", 18, 1.0)
+        self.assertEqual(self.provider.cache_info().misses, 4)
+
+    def test_prewarm_both_themes(self):
+        """Test that prewarming covers both themes without counting as lookups"""
+        rendered = self.provider.prewarm(device_pixel_ratio=1.0)
+        self.assertGreater(rendered, 0)
+        self.assertEqual(self.provider.prewarm(device_pixel_ratio=1.0), 0)
+        self.assertEqual(self.provider.cache_info().hits, 0)
+
+        for colors in (Theme.LIGHT, Theme.DARK):
+            self.provider.get_pixmap("key", colors["primary"], 20, 1.0)
+        self.assertEqual(self.provider.cache_info().misses, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
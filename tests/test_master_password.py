@@ -1,8 +1,14 @@
 """
 Tests for master password hashing module
 """
+import os
 import unittest
-from src.auth.master_password import MasterPasswordManager
+from src.auth.master_password import (
+    MasterPasswordManager, Argon2Parameters, DEFAULT_PARAMETERS, CALIBRATION_SETTINGS_KEY,
+    TARGET_UNLOCK_MS, calibrate_parameters
+)
+
+WEAK_PARAMETERS = Argon2Parameters(time_cost=1, memory_cost=8192, parallelism=1)
 
 
 class TestMasterPassword(unittest.TestCase):
@@ -77,5 +83,101 @@ class TestMasterPassword(unittest.TestCase):
             self.manager.verify_password(self.test_password, "invalid_hash_format")
 
 
+class _MemorySettings:
+    """Minimal in-memory stand-in for AppSettings.get/set"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.writes = 0
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+        self.writes += 1
+
+
+class TestArgon2Calibration(unittest.TestCase):
+    """Tests for parameter calibration and opportunistic rehashing"""
+
+    def test_calibration_respects_floor(self):
+        """Test that a tiny target never goes below the default parameters"""
+        parameters = calibrate_parameters(target_ms=1)
+        self.assertTrue(parameters.is_at_least(DEFAULT_PARAMETERS))
+        self.assertEqual(parameters.parallelism, max(os.cpu_count(), DEFAULT_PARAMETERS.parallelism))
+
+    def test_calibration_memory_cap(self):
+        """Test that memory doubles only up to the cap"""
+        parameters = calibrate_parameters(target_ms=10_000, max_memory_cost=2 * DEFAULT_PARAMETERS.memory_cost)
+        self.assertLessEqual(parameters.memory_cost, 2 * DEFAULT_PARAMETERS.memory_cost)
+
+    def test_load_calibration_cached(self):
+        """Test that stored calibration for this machine is reused"""
+        stored = {
+            "time_cost": 5, "memory_cost": 131072, "parallelism": 8,
+            "cpu_count": os.cpu_count(), "target_ms": TARGET_UNLOCK_MS,
+        }
+        settings = _MemorySettings({CALIBRATION_SETTINGS_KEY: stored})
+        manager = MasterPasswordManager()
+
+        parameters = manager.load_calibration(settings)
+        self.assertEqual(parameters, Argon2Parameters(5, 131072, 8))
+        self.assertEqual(manager.parameters, parameters)
+        self.assertEqual(settings.writes, 0)
+
+    def test_load_calibration_recalibrates_on_other_machine(self):
+        """Test that a calibration from a different core count is replaced"""
+        stored = {"time_cost": 9, "memory_cost": 65536, "parallelism": 4,
+                  "cpu_count": -1, "target_ms": TARGET_UNLOCK_MS}
+        settings = _MemorySettings({CALIBRATION_SETTINGS_KEY: stored})
+
+        MasterPasswordManager().load_calibration(settings)
+        self.assertEqual(settings.writes, 1)
+        self.assertEqual(settings.values[CALIBRATION_SETTINGS_KEY]["cpu_count"], os.cpu_count())
+
+    def test_upgrade_only_weaker_hashes(self):
+        """Test that weaker hashes are upgraded and stronger ones kept"""
+        weak = MasterPasswordManager(WEAK_PARAMETERS)
+        strong = MasterPasswordManager(WEAK_PARAMETERS._replace(time_cost=2))
+        password = "MySecureMasterPassword123!"
+
+        weak_hash = weak.hash_password(password)
+        self.assertTrue(strong.needs_upgrade(weak_hash))
+        upgraded = strong.upgrade_hash(password, weak_hash)
+        self.assertTrue(strong.verify_password(password, upgraded))
+        self.assertIsNone(strong.upgrade_hash(password, upgraded))
+
+        # Stärkere Hashes werden nicht herabgestuft
+        self.assertFalse(weak.needs_upgrade(upgraded))
+
+    def test_mixed_parameters_are_not_upgraded(self):
+        """Test that parameters differing in both directions never replace each other"""
+        more_memory = Argon2Parameters(2, 131072, 4)
+        more_lanes = Argon2Parameters(2, 65536, 8)
+        self.assertFalse(more_memory.is_stronger_than(more_lanes))
+        self.assertFalse(more_lanes.is_stronger_than(more_memory))
+        self.assertFalse(more_memory.is_stronger_than(more_memory))
+        self.assertTrue(more_memory.is_stronger_than(DEFAULT_PARAMETERS))
+
+        password = "MySecureMasterPassword123!"
+        hash_value = MasterPasswordManager(WEAK_PARAMETERS._replace(memory_cost=16384)).hash_password(password)
+        other_machine = MasterPasswordManager(WEAK_PARAMETERS._replace(parallelism=2))
+        self.assertIsNone(other_machine.upgrade_hash(password, hash_value))
+
+    def test_unlock_does_not_calibrate(self):
+        """Test that calibrate=False keeps the parameters when nothing is stored"""
+        settings = _MemorySettings({})
+        manager = MasterPasswordManager(WEAK_PARAMETERS)
+
+        self.assertIsNone(manager.load_calibration(settings, calibrate=False))
+        self.assertEqual(manager.parameters, WEAK_PARAMETERS)
+        self.assertEqual(settings.writes, 0)
+
+        manager.save_calibration(DEFAULT_PARAMETERS, settings)
+        self.assertEqual(manager.load_calibration(settings, calibrate=False), DEFAULT_PARAMETERS)
+        self.assertEqual(MasterPasswordManager.stored_calibration(settings), DEFAULT_PARAMETERS)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for data models
+"""
+import unittest
+from datetime import datetime
+from src.core.models import PasswordEntry, Category, to_datetime
+
+
+class TestModels(unittest.TestCase):
+    """Tests for slotted models and lazy timestamp parsing"""
+
+    def _make_entry(self, **kwargs):
+        return PasswordEntry(
+            id=1,
+            category_id=1,
+            name="Test Entry",
+            username="testuser",
+            encrypted_password=b"token",
+            **kwargs
+        )
+
+    def test_entries_have_no_instance_dict(self):
+        """Test that models use __slots__ instead of a per-instance __dict__"""
+        self.assertFalse(hasattr(self._make_entry(), '__dict__'))
+        self.assertFalse(hasattr(Category(1, "Allgemein"), '__dict__'))
+
+    def test_timestamp_parsed_lazily_and_cached(self):
+        """Test that raw timestamps stay raw until first access"""
+        entry = self._make_entry(created_at="2025-01-01 12:00:00")
+        self.assertIsInstance(entry._created_at, str)
+
+        created = entry.created_at
+        self.assertIsInstance(created, datetime)
+        self.assertIs(entry.created_at, created)
+        self.assertIs(entry._created_at, created)
+
+    def test_epoch_timestamp(self):
+        """Test that integer epochs are converted to local datetimes"""
+        entry = self._make_entry(updated_at=1700000000)
+        self.assertEqual(entry.updated_at, datetime.fromtimestamp(1700000000))
+
+    def test_missing_timestamp_defaults_to_now(self):
+        """Test that new entries without timestamps get the current time"""
+        before = datetime.now()
+        entry = self._make_entry()
+        self.assertGreaterEqual(entry.created_at, before)
+
+    def test_default_fixed_at_construction(self):
+        """Test that the default does not depend on when the field is first read"""
+        entry = self._make_entry()
+        self.assertIsInstance(entry._created_at, datetime)
+        self.assertEqual(entry.created_at, entry.updated_at)
+
+    def test_invalid_timestamp(self):
+        """Test that unparsable timestamps become None and are logged"""
+        self.assertIsNone(to_datetime("kein Datum"))
+
+        entry = self._make_entry(created_at="kein Datum", updated_at=1700000000)
+        with self.assertLogs("src.core.models", level="WARNING"):
+            self.assertIsNone(entry.created_at)
+        self.assertIsNone(entry.created_at)
+
+    def test_equality(self):
+        """Test field-based equality like the former dataclasses"""
+        self.assertEqual(
+            self._make_entry(created_at=1700000000, updated_at=1700000000),
+            self._make_entry(created_at=1700000000, updated_at=1700000000)
+        )
+        self.assertNotEqual(Category(1, "A"), Category(2, "A"))
+
+
+if __name__ == '__main__':
+    unittest.main()
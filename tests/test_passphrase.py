@@ -0,0 +1,78 @@
+"""
+Tests for the diceware passphrase generator
+"""
+import math
+import os
+import tempfile
+import unittest
+from src.password.passphrase import PassphraseGenerator, MappedWordlist, WORDLISTS
+from src.password.strength import PasswordStrength
+
+
+class TestMappedWordlist(unittest.TestCase):
+    """Tests for the lazily memory-mapped wordlist"""
+
+    def test_lazy_index(self):
+        """Test that the file is only mapped on first access"""
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write("alpha\r\nbeta\n\ngamma")
+        try:
+            wordlist = MappedWordlist(path)
+            self.assertIsNone(wordlist._offsets)
+            self.assertEqual(len(wordlist), 3)
+            self.assertEqual([wordlist[i] for i in range(3)], ["alpha", "beta", "gamma"])
+            wordlist.close()
+        finally:
+            os.remove(path)
+
+    def test_bundled_wordlists(self):
+        """Test that all bundled lists have 7776 unique words"""
+        generator = PassphraseGenerator()
+        for name in WORDLISTS:
+            wordlist = generator.get_wordlist(name)
+            words = {wordlist[i] for i in range(len(wordlist))}
+            self.assertEqual(len(words), 7776, name)
+
+
+class TestPassphraseGenerator(unittest.TestCase):
+    """Tests for passphrase options and exact entropy"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = PassphraseGenerator()
+
+    def test_generate_defaults(self):
+        """Test six words and log2(7776) bits per word"""
+        passphrase = self.generator.generate()
+        self.assertEqual(len(passphrase.text.split("-")), 6)
+        self.assertAlmostEqual(passphrase.entropy_bits, 6 * math.log2(7776))
+
+        estimate = self.generator.estimate(passphrase)
+        self.assertEqual(estimate.strength, PasswordStrength.STRONG)
+        self.assertEqual(estimate.patterns, ("passphrase",))
+
+    def test_options(self):
+        """Test separator, capitalization and digit injection"""
+        passphrase = self.generator.generate(4, "en", separator=".", capitalize=True, add_digit=True)
+        words = passphrase.text.split(".")
+
+        self.assertEqual(len(words), 4)
+        self.assertTrue(all(word[0].isupper() for word in words))
+        self.assertEqual(sum(c.isdigit() for c in passphrase.text), 1)
+        self.assertAlmostEqual(passphrase.entropy_bits, 4 * math.log2(7776) + math.log2(40))
+
+    def test_invalid_arguments(self):
+        """Test validation of word count, separator and wordlist"""
+        with self.assertRaises(ValueError):
+            self.generator.generate(2)
+        with self.assertRaises(ValueError):
+            self.generator.generate(6, separator="")
+        with self.assertRaises(ValueError):
+            self.generator.generate(6, separator="x")
+        with self.assertRaises(ValueError):
+            self.generator.generate(6, wordlist="xx")
+
+
+if __name__ == '__main__':
+    unittest.main()
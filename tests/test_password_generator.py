@@ -107,6 +107,42 @@ class TestPasswordGenerator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.generator.generate(16, options)
 
+    def test_generate_many(self):
+        """Test bulk generation with required character groups"""
+        options = {"uppercase": True, "lowercase": False, "digits": True, "special": False}
+        passwords = self.generator.generate_many(500, 8, options)
+
+        self.assertEqual(len(passwords), 500)
+        self.assertEqual(len(set(passwords)), 500)
+        for password in passwords:
+            self.assertEqual(len(password), 8)
+            self.assertTrue(all(c.isupper() or c.isdigit() for c in password))
+            self.assertTrue(any(c.isupper() for c in password))
+            self.assertTrue(any(c.isdigit() for c in password))
+
+    def test_iter_generate_is_lazy(self):
+        """Test that streaming generation only produces what is consumed"""
+        stream = self.generator.iter_generate(10 ** 9, 16)
+        first = [next(stream) for _ in range(3)]
+        self.assertEqual(len(set(first)), 3)
+
+    def test_generate_many_is_unbiased(self):
+        """Test that digits are drawn uniformly (rejection sampling, no modulo bias)"""
+        options = {"uppercase": False, "lowercase": False, "digits": True, "special": False}
+        text = "".join(self.generator.generate_many(2000, 50, options))
+        counts = [text.count(d) for d in "0123456789"]
+        expected = len(text) / 10
+        # Chi-Quadrat mit 9 Freiheitsgraden, p < 0.001 bei > 27.9
+        chi_square = sum((count - expected) ** 2 / expected for count in counts)
+        self.assertLess(chi_square, 27.9)
+
+    def test_generate_many_invalid_arguments(self):
+        """Test validation of bulk generation arguments"""
+        with self.assertRaises(ValueError):
+            self.generator.generate_many(5, 7)
+        with self.assertRaises(ValueError):
+            self.generator.generate_many(5, 16, {"digits": False})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,7 @@
 Tests for password strength checker module
 """
 import unittest
-from src.password.strength import PasswordStrengthChecker, PasswordStrength
+from src.password.strength import PasswordStrengthChecker, PasswordStrength, estimate_strength
 
 
 class TestPasswordStrength(unittest.TestCase):
@@ -84,5 +84,49 @@ class TestPasswordStrength(unittest.TestCase):
         self.assertGreater(long_percentage, short_percentage)
 
 
+class TestEntropyEstimator(unittest.TestCase):
+    """Tests for pattern detection in the entropy estimator"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.checker = PasswordStrengthChecker()
+        self.checker.clear_cache()
+
+    def test_common_password_with_decoration_is_weak(self):
+        """Test that dictionary words with typical suffixes are weak"""
+        for password in ("Password1!", "p@ssw0rd", "iloveyou2024"):
+            estimate = estimate_strength(password)
+            self.assertEqual(estimate.strength, PasswordStrength.WEAK, password)
+
+    def test_patterns_are_detected(self):
+        """Test keyboard walks, sequences, repeats and dates"""
+        cases = {
+            "qwertzuiop": "keyboard",
+            "ölkjhgf": "keyboard",
+            "abcdefgh": "sequence",
+            "98765432": "sequence",
+            "aaaaaaaa": "repeat",
+            "24.12.1990": "date",
+        }
+        for password, pattern in cases.items():
+            estimate = estimate_strength(password)
+            self.assertIn(pattern, estimate.patterns, password)
+            self.assertEqual(estimate.strength, PasswordStrength.WEAK, password)
+
+    def test_random_password_uses_bruteforce(self):
+        """Test that random passwords are estimated per character"""
+        estimate = estimate_strength("Xy7!kP2#qR9$mL4&")
+        self.assertEqual(estimate.patterns, ())
+        self.assertGreater(estimate.entropy_bits, 80)
+        self.assertEqual(estimate.percentage, 100)
+
+    def test_cache_and_batch_agree(self):
+        """Test that the cached live path and the batch API return the same estimate"""
+        passwords = ["abc", "Password1!", "Xy7!kP2#qR9$mL4&"]
+        self.assertEqual(self.checker.estimate_many(passwords),
+                         [self.checker.estimate(p) for p in passwords])
+        self.assertIs(self.checker.estimate("abc"), self.checker.estimate("abc"))
+
+
 if __name__ == '__main__':
     unittest.main()
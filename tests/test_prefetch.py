@@ -0,0 +1,86 @@
+"""
+Tests for prefetching vault files before unlock
+"""
+import os
+import tempfile
+import time
+import unittest
+from src.core.database_file import DatabaseFile
+from src.core.prefetch import VaultPrefetcher
+
+MASTER_PASSWORD = "TestMasterPassword123!"
+
+
+class TestPreload(unittest.TestCase):
+    """Tests for DatabaseFile.preload and VaultPrefetcher"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_test_")
+        self.db_path = os.path.join(self.temp_dir, "test.spdb")
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def test_open_uses_preloaded_content(self):
+        """Test that open_database works from memory and drops the buffer"""
+        db_file = DatabaseFile(self.db_path)
+        db_file.preload()
+        self.assertTrue(db_file.is_preloaded())
+        self.assertIsNotNone(db_file.read_header())
+
+        db_file.open_database(MASTER_PASSWORD)
+        self.assertFalse(db_file.is_preloaded())
+        db_file.close_database()
+
+    def test_changed_file_is_not_used(self):
+        """Test that a file modified after preload is read again"""
+        db_file = DatabaseFile(self.db_path)
+        db_file.preload()
+
+        time.sleep(0.01)
+        DatabaseFile(self.db_path).change_master_password(MASTER_PASSWORD, "Neu!")
+        self.assertFalse(db_file.is_preloaded())
+        db_file.open_database("Neu!")
+        db_file.close_database()
+
+    def test_invalid_file(self):
+        """Test that preload validates the header"""
+        with open(self.db_path, "wb") as f:
+            f.write(b"not a vault")
+        with self.assertRaises(ValueError):
+            DatabaseFile(self.db_path).preload()
+
+    def test_prefetcher_take_once(self):
+        """Test that a prefetched file is handed out once"""
+        prefetcher = VaultPrefetcher()
+        prefetcher.prefetch(self.db_path)
+        prefetcher.prefetch(self.db_path)
+
+        db_file = prefetcher.take(self.db_path)
+        self.assertIsNotNone(db_file)
+        self.assertTrue(db_file.is_preloaded())
+        self.assertIsNone(prefetcher.take(self.db_path))
+
+    def test_prefetcher_failures_and_eviction(self):
+        """Test missing files and the limit on held files"""
+        prefetcher = VaultPrefetcher()
+        prefetcher.prefetch(os.path.join(self.temp_dir, "missing.spdb"))
+        self.assertIsNone(prefetcher.take(os.path.join(self.temp_dir, "missing.spdb")))
+
+        paths = [os.path.join(self.temp_dir, f"vault{i}.spdb") for i in range(VaultPrefetcher.MAX_FILES + 1)]
+        for path in paths:
+            DatabaseFile(path).create_new(MASTER_PASSWORD)
+            prefetcher.prefetch(path)
+        prefetcher.take(paths[-1])
+        # Älteste Datei wurde verworfen
+        self.assertIsNone(prefetcher.take(paths[0]))
+        prefetcher.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Regression tests for the startup import path of main.py
+
+Measured with `python -X importtime -c "import main"` (median of 9 runs,
+offscreen, single CPU):
+
+    before: ~162 ms (MainWindow with all dialogs, audit, argon2 at startup)
+    after:  ~106 ms (selector only; login and main window load on first use)
+
+Timings vary too much between machines to assert on, so the tests check the
+module set instead: nothing that is only needed after the selector may be
+imported by `import main`.
+"""
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Module, die erst nach dem Auswahl-Dialog geladen werden dürfen
+DEFERRED_MODULES = (
+    "src.gui.login_dialog",
+    "src.gui.main_window",
+    "src.gui.entry_dialog",
+    "src.gui.settings_dialog",
+    "src.gui.totp_setup_dialog",
+    "src.gui.generator_dialog",
+    "src.core.audit",
+    "src.core.statistics",
+    "src.core.unlock",
+    "src.password.strength",
+    "multiprocessing",
+    "argon2",
+    "pyotp",
+    "qrcode",
+    "PIL",
+    "psutil",
+)
+
+
+def import_main() -> dict:
+    """Imports main in a fresh interpreter, returns {module: cumulative µs}"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr[-2000:])
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestStartupImports(unittest.TestCase):
+    """Tests that startup only imports what the database selector needs"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the import once for all tests"""
+        cls.modules = import_main()
+
+    def test_main_imported(self):
+        """Test that the measurement contains main and the selector"""
+        self.assertIn("main", self.modules)
+        self.assertIn("src.gui.database_selector", self.modules)
+
+    def test_heavy_modules_deferred(self):
+        """Test that dialogs and heavy libraries are not imported at startup"""
+        imported = [
+            name for name in self.modules
+            if any(name == module or name.startswith(module + ".") for module in DEFERRED_MODULES)
+        ]
+        self.assertEqual(imported, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
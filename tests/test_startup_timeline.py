@@ -0,0 +1,100 @@
+"""
+Tests for the startup phase timeline
+"""
+import json
+import os
+import tempfile
+import unittest
+from src.testing.performance import StartupTimeline
+
+
+class TestStartupTimeline(unittest.TestCase):
+    """Tests for configuration, phase ordering and export formats"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_test_")
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def test_disabled_by_default(self):
+        """Test that marks are ignored unless the timeline is enabled"""
+        timeline = StartupTimeline()
+        argv = timeline.configure(["main.py", "--foo"], environ={})
+        timeline.mark("imports_done")
+
+        self.assertEqual(argv, ["main.py", "--foo"])
+        self.assertFalse(timeline.enabled)
+        self.assertEqual([phase["name"] for phase in timeline.phases()], ["interpreter_start"])
+
+    def test_configure(self):
+        """Test that the CLI flag is consumed and the env var is honoured"""
+        path = os.path.join(self.temp_dir, "timeline.json")
+        timeline = StartupTimeline()
+        argv = timeline.configure(["main.py", f"--startup-timeline={path}"], environ={})
+        self.assertEqual(argv, ["main.py"])
+        self.assertTrue(timeline.enabled)
+        self.assertEqual(str(timeline.output_path), path)
+
+        from_env = StartupTimeline()
+        from_env.configure(["main.py"], environ={StartupTimeline.ENV_VAR: path})
+        self.assertEqual(str(from_env.output_path), path)
+
+        default = StartupTimeline()
+        default.configure(["main.py", "--startup-timeline"], environ={})
+        self.assertEqual(default.output_path, StartupTimeline.DEFAULT_PATH)
+
+    def test_phases_are_monotonic(self):
+        """Test that phases are ordered with non-negative durations"""
+        timeline = StartupTimeline()
+        timeline.enable()
+        for phase in ("imports_done", "qapplication_created", "theme_applied"):
+            timeline.mark(phase)
+
+        phases = timeline.phases()
+        self.assertEqual([phase["name"] for phase in phases],
+                         ["interpreter_start", "imports_done", "qapplication_created", "theme_applied"])
+        at = [phase["at_ms"] for phase in phases]
+        self.assertEqual(at, sorted(at))
+        self.assertTrue(all(phase["duration_ms"] >= 0 for phase in phases))
+
+    def test_finish_writes_json(self):
+        """Test that finish() writes the configured file once"""
+        path = os.path.join(self.temp_dir, "timeline.json")
+        timeline = StartupTimeline()
+        timeline.enable(path)
+        timeline.mark("first_paint")
+        timeline.finish()
+
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["phases"][-1]["name"], "first_paint")
+        self.assertEqual(data["total_ms"], data["phases"][-1]["at_ms"])
+
+        os.remove(path)
+        timeline.finish()
+        self.assertFalse(os.path.exists(path))
+
+    def test_chrome_trace(self):
+        """Test that a .trace.json file contains complete events"""
+        path = os.path.join(self.temp_dir, "startup.trace.json")
+        timeline = StartupTimeline()
+        timeline.enable()
+        timeline.mark("imports_done")
+        timeline.mark("selector_shown")
+        timeline.dump(path)
+
+        with open(path) as f:
+            events = json.load(f)["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["imports_done", "selector_shown"])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        # Phasen schließen lückenlos aneinander an
+        self.assertAlmostEqual(events[0]["ts"] + events[0]["dur"], events[1]["ts"], delta=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
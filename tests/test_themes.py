@@ -0,0 +1,41 @@
+"""
+Tests for the per-mode stylesheet cache of the theme
+"""
+import unittest
+from src.gui.themes import Theme, ThemeMode
+
+
+class TestStylesheetCache(unittest.TestCase):
+    """Tests that stylesheets are built once per mode"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.theme = Theme()
+
+    def test_cached_per_mode(self):
+        """Test that repeated calls return the same string object"""
+        light = self.theme.get_stylesheet()
+        self.assertIs(self.theme.get_stylesheet(), light)
+
+        self.theme.set_mode(ThemeMode.DARK)
+        dark = self.theme.get_stylesheet()
+        self.assertIsNot(dark, light)
+        self.assertIs(self.theme.get_stylesheet(ThemeMode.LIGHT), light)
+        self.assertIs(self.theme.get_stylesheet(), dark)
+
+    def test_colors_of_mode(self):
+        """Test that each stylesheet uses the colors of its mode"""
+        self.assertIn(Theme.LIGHT["background"], self.theme.get_stylesheet(ThemeMode.LIGHT))
+        self.assertIn(Theme.DARK["background"], self.theme.get_stylesheet(ThemeMode.DARK))
+
+    def test_component_selectors(self):
+        """Test that the main window components are styled by the global stylesheet"""
+        stylesheet = self.theme.get_stylesheet()
+        for selector in ("QFrame#sidebar", "QPushButton#categoryButton:checked",
+                         "QLabel#passwordField[state=\"visible\"]",
+                         "QPushButton#entryAction[action=\"delete\"]:hover"):
+            self.assertIn(selector, stylesheet)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for cached TOTP code generation
+"""
+import hashlib
+import time
+import unittest
+import pyotp
+from src.core.totp_manager import TOTPManager, CachedTOTP
+
+
+class TestCachedTOTP(unittest.TestCase):
+    """Tests for the precomputed-HMAC TOTP generator"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.secret = pyotp.random_base32()
+        self.manager = TOTPManager()
+
+    def test_matches_pyotp(self):
+        """Test codes against pyotp for several points in time"""
+        totp = CachedTOTP(self.secret)
+        reference = pyotp.TOTP(self.secret)
+        for timestamp in (0, 59, 1111111109, 1234567890, 2000000000):
+            self.assertEqual(totp.at_counter(totp.counter(timestamp)), reference.at(timestamp))
+
+    def test_otpauth_uri(self):
+        """Test digits, period and algorithm from otpauth URIs"""
+        reference = pyotp.TOTP(self.secret, digits=8, interval=60, digest=hashlib.sha256)
+        uri = reference.provisioning_uri(name="user", issuer_name="Example")
+        totp = self.manager.get_totp(uri)
+        self.assertEqual(totp.interval, 60)
+        self.assertEqual(totp.at_counter(totp.counter(1234567890)), reference.at(1234567890))
+
+    def test_generators_are_cached(self):
+        """Test that one generator per secret is reused until the cache is cleared"""
+        first = self.manager.get_totp(self.secret)
+        self.assertIs(self.manager.get_totp(self.secret), first)
+        self.manager.clear_cache()
+        self.assertIsNot(self.manager.get_totp(self.secret), first)
+
+    def test_verify_code(self):
+        """Test verification with one window of tolerance"""
+        reference = pyotp.TOTP(self.secret)
+        self.assertTrue(self.manager.verify_code(self.secret, reference.now()))
+        self.assertTrue(self.manager.verify_code(self.secret, reference.at(time.time() - 30)))
+        self.assertFalse(self.manager.verify_code(self.secret, reference.at(time.time() - 300)))
+
+    def test_normalize_secret(self):
+        """Test cleanup of grouped lowercase input and rejection of invalid secrets"""
+        grouped = " ".join(self.secret[i:i + 4].lower() for i in range(0, len(self.secret), 4))
+        self.assertEqual(self.manager.normalize_secret(grouped), self.secret)
+        for invalid in ("", "not base32!", "otpauth://hotp/x?secret=" + self.secret + "&counter=1"):
+            with self.assertRaises(ValueError):
+                self.manager.normalize_secret(invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
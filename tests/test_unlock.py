@@ -0,0 +1,194 @@
+"""
+Tests for the unlock pipeline
+"""
+import os
+import tempfile
+import threading
+import unittest
+from src.auth.master_password import (
+    master_password_manager, DEFAULT_PARAMETERS, CALIBRATION_SETTINGS_KEY, TARGET_UNLOCK_MS
+)
+from src.core.database import DatabaseManager
+from src.core.database_file import DatabaseFile, WrongPasswordError
+from src.core.encryption import EncryptionManager
+from src.core.prefetch import vault_prefetcher
+from src.core.unlock import unlock_vault, UnlockCancelled, UNLOCK_STAGES, STAGE_TOTP
+
+MASTER_PASSWORD = "TestMasterPassword123!"
+
+
+class _MemorySettings:
+    """Minimal in-memory stand-in for AppSettings.get/set"""
+
+    def __init__(self):
+        self.values = {CALIBRATION_SETTINGS_KEY: {
+            **DEFAULT_PARAMETERS._asdict(), "cpu_count": os.cpu_count(), "target_ms": TARGET_UNLOCK_MS,
+        }}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+class TestUnlockVault(unittest.TestCase):
+    """Tests for the staged unlock of a vault file"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp(prefix="securepass_test_")
+        self.db_path = os.path.join(self.temp_dir, "test.spdb")
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD)
+        self.settings = _MemorySettings()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def test_unlock_reports_all_stages(self):
+        """Test a successful unlock with stage reporting and first-use hash"""
+        stages = []
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, stages.append, settings=self.settings)
+        try:
+            self.assertEqual(stages, [stage for stage, _ in UNLOCK_STAGES])
+            self.assertEqual(session.data_key, session.db_manager.data_key)
+            self.assertIsNone(session.totp_secret)
+            stored_hash = session.db_manager.get_master_password_hash()
+            self.assertTrue(master_password_manager.verify_password(MASTER_PASSWORD, stored_hash))
+        finally:
+            session.db_manager.close()
+
+        # Zweiter Login behält den ausreichend starken Hash
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        try:
+            self.assertEqual(session.db_manager.get_master_password_hash(), stored_hash)
+        finally:
+            session.db_manager.close()
+
+    def test_data_key_authenticates_without_hash_check(self):
+        """Test that the stored hash is not checked unless it is upgraded"""
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        foreign_hash = master_password_manager.hash_password("SomeOtherPassword")
+        session.db_manager.save_master_password_hash(foreign_hash)
+        session.db_manager.close()
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        try:
+            self.assertEqual(session.db_manager.get_master_password_hash(), foreign_hash)
+        finally:
+            session.db_manager.close()
+
+    def test_legacy_header_verifier_is_removed(self):
+        """Test that a plaintext hash copy from older versions is dropped on open"""
+        db_file = DatabaseFile(self.db_path)
+        magic, header, payload = db_file._read_file()
+        db_file._write_file(dict(header, verifier=master_password_manager.hash_password(MASTER_PASSWORD)), payload)
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.close()
+        self.assertNotIn("verifier", DatabaseFile(self.db_path).read_header())
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.close()
+
+    def test_uses_prefetched_file(self):
+        """Test that a prefetched file is consumed by the unlock"""
+        vault_prefetcher.prefetch(self.db_path)
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.close()
+        self.assertIsNone(vault_prefetcher.take(self.db_path))
+
+    def test_wrong_password(self):
+        """Test that a wrong password raises WrongPasswordError"""
+        with self.assertRaises(WrongPasswordError):
+            unlock_vault(self.db_path, "wrong", settings=self.settings)
+
+    def test_corrupt_file_is_not_a_wrong_password(self):
+        """Test that a damaged file is reported as an error, not as a wrong password"""
+        with open(self.db_path, "r+b") as f:
+            f.seek(-64, os.SEEK_END)
+            f.write(b"\x00" * 64)
+        with self.assertRaises(ValueError) as context:
+            unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        self.assertNotIsInstance(context.exception, WrongPasswordError)
+
+        with open(self.db_path, "wb") as f:
+            f.write(DatabaseFile.FILE_HEADER + b"\x00\x00\x00\x02{]")
+        with self.assertRaises(ValueError) as context:
+            unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        self.assertNotIsInstance(context.exception, WrongPasswordError)
+
+    def test_unlock_after_password_change(self):
+        """Test that only the new password unlocks the vault after a change"""
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.change_master_password(MASTER_PASSWORD, "NewMasterPassword456!")
+        session.db_manager.close()
+
+        with self.assertRaises(WrongPasswordError):
+            unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session = unlock_vault(self.db_path, "NewMasterPassword456!", settings=self.settings)
+        session.db_manager.close()
+
+    def test_unlock_without_upgrade_leaves_file_unchanged(self):
+        """Test that re-unlocking an open vault does not rewrite header or hash"""
+        weak = {"time_cost": 1, "memory_cost": 8192, "parallelism": 1}
+        os.remove(self.db_path)
+        DatabaseFile(self.db_path).create_new(MASTER_PASSWORD, weak)
+        with open(self.db_path, "rb") as f:
+            original = f.read()
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings, upgrade=False)
+        session.db_manager.close()
+        with open(self.db_path, "rb") as f:
+            self.assertEqual(f.read(), original)
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.close()
+        header = DatabaseFile(self.db_path).read_header()
+        self.assertEqual(header["memory_cost"], DEFAULT_PARAMETERS.memory_cost)
+
+    def test_totp_secret_is_decrypted(self):
+        """Test that the 2FA secret is decrypted with the vault data key"""
+        db_manager = DatabaseManager(self.db_path, MASTER_PASSWORD)
+        encryption = EncryptionManager()
+        encryption.set_session_key(db_manager.data_key)
+        db_manager.save_master_password_hash(master_password_manager.hash_password(MASTER_PASSWORD))
+        db_manager.save_totp_secret(encryption.encrypt("JBSWY3DPEHPK3PXP"))
+        db_manager.close()
+
+        session = unlock_vault(self.db_path, MASTER_PASSWORD, settings=self.settings)
+        session.db_manager.close()
+        self.assertEqual(session.totp_secret, "JBSWY3DPEHPK3PXP")
+
+    def test_cancel_closes_database(self):
+        """Test that cancelling between stages closes the opened database"""
+        cancel_event = threading.Event()
+        opened = []
+
+        def on_stage(stage):
+            if stage == STAGE_TOTP:
+                cancel_event.set()
+            opened.append(stage)
+
+        before = set(os.listdir(tempfile.gettempdir()))
+        with self.assertRaises(UnlockCancelled):
+            unlock_vault(self.db_path, MASTER_PASSWORD, on_stage, cancel_event, settings=self.settings)
+        self.assertEqual(opened[-1], STAGE_TOTP)
+        leftover = set(os.listdir(tempfile.gettempdir())) - before
+        self.assertFalse([name for name in leftover if name.endswith(".db")])
+
+    def test_cancel_before_start(self):
+        """Test that an already cancelled unlock does not decrypt anything"""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        stages = []
+        with self.assertRaises(UnlockCancelled):
+            unlock_vault(self.db_path, MASTER_PASSWORD, stages.append, cancel_event, settings=self.settings)
+        self.assertEqual(stages, [])
+
+
+if __name__ == '__main__':
+    unittest.main()